@@ -0,0 +1,27 @@
+"""store crawl content minhash signatures for near-duplicate detection
+
+Revision ID: 20260823_0210
+Revises: 20260822_0209
+Create Date: 2026-08-23 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260823_0210"
+down_revision = "20260822_0209"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("crawl_page_results") as batch_op:
+        batch_op.add_column(sa.Column("content_minhash", sa.String(512), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("crawl_page_results") as batch_op:
+        batch_op.drop_column("content_minhash")
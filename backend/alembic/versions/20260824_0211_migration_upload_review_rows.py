@@ -0,0 +1,102 @@
+"""store streamed migration upload review rows
+
+Revision ID: 20260824_0211
+Revises: 20260823_0210
+Create Date: 2026-08-24 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260824_0211"
+down_revision = "20260823_0210"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "migration_upload_review_rows",
+        sa.Column("id", sa.String(36), nullable=False),
+        sa.Column("upload_id", sa.String(36), nullable=False),
+        sa.Column("tenant_id", sa.String(36), nullable=False),
+        sa.Column("organization_id", sa.String(36), nullable=False),
+        sa.Column("row_number", sa.Integer(), nullable=False),
+        sa.Column("record_type", sa.String(30), nullable=False),
+        sa.Column("status", sa.String(24), nullable=False),
+        sa.Column("dedupe_key", sa.String(32), nullable=True),
+        sa.Column("keyword_key", sa.String(32), nullable=True),
+        sa.Column("review", sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["upload_id"], ["migration_upload_sessions.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["organization_id"], ["organizations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "upload_id",
+            "row_number",
+            name="uq_migration_upload_review_rows_upload_row",
+        ),
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_upload_id",
+        "migration_upload_review_rows",
+        ["upload_id"],
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_tenant_id",
+        "migration_upload_review_rows",
+        ["tenant_id"],
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_organization_id",
+        "migration_upload_review_rows",
+        ["organization_id"],
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_upload_status",
+        "migration_upload_review_rows",
+        ["upload_id", "status"],
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_upload_dedupe",
+        "migration_upload_review_rows",
+        ["upload_id", "dedupe_key"],
+    )
+    op.create_index(
+        "ix_migration_upload_review_rows_upload_keyword",
+        "migration_upload_review_rows",
+        ["upload_id", "keyword_key"],
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        expression = (
+            "current_setting('app.platform_access', true) = 'on' OR ("
+            "tenant_id::text = current_setting('app.current_tenant_id', true) AND "
+            "organization_id::text = current_setting('app.current_organization_id', true))"
+        )
+        table = "migration_upload_review_rows"
+        op.execute(
+            sa.text(f"GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.{table} TO lsos_app")
+        )
+        op.execute(sa.text(f"ALTER TABLE public.{table} ENABLE ROW LEVEL SECURITY"))
+        op.execute(
+            sa.text(
+                f"CREATE POLICY lsos_tenant_isolation ON public.{table} FOR ALL TO lsos_app "
+                f"USING ({expression}) WITH CHECK ({expression})"
+            )
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        table = "migration_upload_review_rows"
+        op.execute(sa.text(f"DROP POLICY IF EXISTS lsos_tenant_isolation ON public.{table}"))
+        op.execute(sa.text(f"ALTER TABLE public.{table} DISABLE ROW LEVEL SECURITY"))
+    op.drop_table("migration_upload_review_rows")
@@ -0,0 +1,40 @@
+"""store fleet item payloads on each item and index queued item order
+
+Revision ID: 20260825_0212
+Revises: 20260824_0211
+Create Date: 2026-08-25 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20260825_0212"
+down_revision = "20260824_0211"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("fleet_job_items") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "request_payload",
+                sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+                nullable=True,
+            )
+        )
+    op.create_index(
+        "ix_fleet_job_items_job_status_created_at",
+        "fleet_job_items",
+        ["fleet_job_id", "status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fleet_job_items_job_status_created_at", table_name="fleet_job_items")
+    with op.batch_alter_table("fleet_job_items") as batch_op:
+        batch_op.drop_column("request_payload")
@@ -0,0 +1,70 @@
+"""keep running platform cost exposure per organization and billing period
+
+Revision ID: 20260826_0213
+Revises: 20260825_0212
+Create Date: 2026-08-26 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260826_0213"
+down_revision = "20260825_0212"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows are seeded from the ledger the first time a period is touched, so
+    # existing ledger history needs no backfill here.
+    op.create_table(
+        "organization_cost_exposures",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("organization_id", sa.String(length=36), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("budget_impact_cost", sa.Numeric(18, 8), nullable=False, server_default="0"),
+        sa.Column("customer_credit_units", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("organization_id", "period_start", name="uq_org_cost_exposure_period"),
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                """
+                GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.organization_cost_exposures TO lsos_app;
+                ALTER TABLE public.organization_cost_exposures ENABLE ROW LEVEL SECURITY;
+                DROP POLICY IF EXISTS lsos_tenant_isolation ON public.organization_cost_exposures;
+                CREATE POLICY lsos_tenant_isolation ON public.organization_cost_exposures
+                    FOR ALL TO lsos_app
+                    USING (
+                        current_setting('app.platform_access', true) = 'on'
+                        OR organization_id::text =
+                            current_setting('app.current_organization_id', true)
+                    )
+                    WITH CHECK (
+                        current_setting('app.platform_access', true) = 'on'
+                        OR organization_id::text =
+                            current_setting('app.current_organization_id', true)
+                    );
+                """
+            )
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                """
+                DROP POLICY IF EXISTS lsos_tenant_isolation ON public.organization_cost_exposures;
+                ALTER TABLE public.organization_cost_exposures DISABLE ROW LEVEL SECURITY;
+                """
+            )
+        )
+    op.drop_table("organization_cost_exposures")
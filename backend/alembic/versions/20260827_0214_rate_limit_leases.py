@@ -0,0 +1,277 @@
+"""let API processes lease blocks of request-rate tokens
+
+Revision ID: 20260827_0214
+Revises: 20260826_0213
+Create Date: 2026-08-27 09:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260827_0214"
+down_revision = "20260826_0213"
+branch_labels = None
+depends_on = None
+
+TABLE = "request_rate_limit_counters"
+RESERVE_FUNCTION = "reserve_request_rate_limit"
+RESERVE_SIGNATURE = f"public.{RESERVE_FUNCTION}(text, text, integer, integer)"
+RELEASE_FUNCTION = "release_request_rate_limit"
+RELEASE_SIGNATURE = (
+    f"public.{RELEASE_FUNCTION}(text, text, integer, timestamp with time zone, integer)"
+)
+
+_VALIDATE_IDENTITY = """
+                IF p_scope_hash IS NULL
+                   OR pg_catalog.length(p_scope_hash) <> 64
+                   OR p_scope_hash !~ '^[0-9a-f]{64}$' THEN
+                    RAISE EXCEPTION 'scope_hash must be 64 lowercase hexadecimal characters'
+                        USING ERRCODE = '22023';
+                END IF;
+                IF p_policy_key IS NULL
+                   OR pg_catalog.length(p_policy_key) NOT BETWEEN 1 AND 64
+                   OR p_policy_key !~ '^[a-z0-9][a-z0-9_.:-]*$' THEN
+                    RAISE EXCEPTION 'policy_key contains unsupported characters'
+                        USING ERRCODE = '22023';
+                END IF;
+                IF p_request_limit IS NULL
+                   OR p_request_limit NOT BETWEEN 1 AND 1000000 THEN
+                    RAISE EXCEPTION 'request_limit must be between 1 and 1000000'
+                        USING ERRCODE = '22023';
+                END IF;
+                IF p_tokens IS NULL OR p_tokens NOT BETWEEN 1 AND 10000 THEN
+                    RAISE EXCEPTION 'tokens must be between 1 and 10000'
+                        USING ERRCODE = '22023';
+                END IF;
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _create_reserve_function()
+    _create_release_function()
+    for signature in (RESERVE_SIGNATURE, RELEASE_SIGNATURE):
+        op.execute(
+            sa.text(f"REVOKE ALL PRIVILEGES ON FUNCTION {signature} FROM PUBLIC")
+        )
+        op.execute(sa.text(f"GRANT EXECUTE ON FUNCTION {signature} TO lsos_app"))
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(sa.text(f"DROP FUNCTION IF EXISTS {RELEASE_SIGNATURE}"))
+    op.execute(sa.text(f"DROP FUNCTION IF EXISTS {RESERVE_SIGNATURE}"))
+
+
+def _create_reserve_function() -> None:
+    # Same bucket, window and clock rules as consume_request_rate_limit, but the
+    # counter advances by as many tokens as still fit under the limit. A
+    # saturated reservation records a denial exactly like consume does.
+    op.execute(
+        sa.text(
+            f"""
+            CREATE FUNCTION public.{RESERVE_FUNCTION}(
+                p_scope_hash text,
+                p_policy_key text,
+                p_request_limit integer,
+                p_tokens integer
+            )
+            RETURNS TABLE (
+                granted integer,
+                request_count bigint,
+                window_started_at timestamp with time zone,
+                reset_at timestamp with time zone,
+                retry_after_seconds integer
+            )
+            LANGUAGE plpgsql
+            SECURITY DEFINER
+            SET search_path = pg_catalog, public, pg_temp
+            SET statement_timeout = '2s'
+            SET lock_timeout = '750ms'
+            AS $rate_limit_reserve$
+            DECLARE
+                v_now timestamp with time zone;
+                v_current_window timestamp with time zone;
+                v_stored_window timestamp with time zone;
+                v_count bigint;
+                v_previous_count bigint;
+                v_window_rolled boolean;
+                v_granted integer;
+                v_reset_at timestamp with time zone;
+                v_retry_after integer;
+            BEGIN
+{_VALIDATE_IDENTITY}
+                LOOP
+                    v_now := pg_catalog.clock_timestamp();
+                    v_current_window := pg_catalog.date_trunc('minute', v_now);
+                    v_granted := least(p_tokens, p_request_limit);
+
+                    INSERT INTO public.{TABLE} AS counters (
+                        scope_hash,
+                        policy_key,
+                        window_started_at,
+                        request_count,
+                        last_seen_at
+                    )
+                    VALUES (
+                        p_scope_hash,
+                        p_policy_key,
+                        v_current_window,
+                        v_granted,
+                        v_now
+                    )
+                    ON CONFLICT (scope_hash, policy_key) DO NOTHING
+                    RETURNING counters.window_started_at, counters.request_count
+                    INTO v_stored_window, v_count;
+
+                    IF FOUND THEN
+                        v_now := pg_catalog.clock_timestamp();
+                        v_current_window := pg_catalog.date_trunc('minute', v_now);
+                        IF v_stored_window < v_current_window THEN
+                            v_stored_window := v_current_window;
+                            UPDATE public.{TABLE} AS counters
+                            SET window_started_at = v_stored_window,
+                                last_seen_at = v_now
+                            WHERE counters.scope_hash = p_scope_hash
+                              AND counters.policy_key = p_policy_key;
+                        END IF;
+                        EXIT;
+                    END IF;
+
+                    SELECT counters.window_started_at, counters.request_count
+                    INTO v_stored_window, v_count
+                    FROM public.{TABLE} AS counters
+                    WHERE counters.scope_hash = p_scope_hash
+                      AND counters.policy_key = p_policy_key
+                    FOR UPDATE;
+
+                    IF NOT FOUND THEN
+                        CONTINUE;
+                    END IF;
+
+                    v_now := pg_catalog.clock_timestamp();
+                    v_current_window := pg_catalog.date_trunc('minute', v_now);
+                    v_previous_count := v_count;
+                    v_window_rolled := false;
+                    IF v_stored_window < v_current_window THEN
+                        v_stored_window := v_current_window;
+                        v_count := 0;
+                        v_window_rolled := true;
+                    END IF;
+
+                    v_granted := least(
+                        p_tokens::bigint,
+                        greatest(0::bigint, p_request_limit::bigint - v_count)
+                    )::integer;
+                    IF v_granted > 0 THEN
+                        v_count := v_count + v_granted;
+                    ELSE
+                        v_count := least(v_count + 1, p_request_limit::bigint + 1);
+                    END IF;
+
+                    IF v_window_rolled THEN
+                        UPDATE public.{TABLE} AS counters
+                        SET window_started_at = v_stored_window,
+                            request_count = v_count,
+                            last_seen_at = v_now
+                        WHERE counters.scope_hash = p_scope_hash
+                          AND counters.policy_key = p_policy_key;
+                    ELSIF v_count <> v_previous_count THEN
+                        UPDATE public.{TABLE} AS counters
+                        SET request_count = v_count
+                        WHERE counters.scope_hash = p_scope_hash
+                          AND counters.policy_key = p_policy_key;
+                    END IF;
+                    EXIT;
+                END LOOP;
+
+                IF v_stored_window < v_now - pg_catalog.make_interval(mins => 1) THEN
+                    RAISE EXCEPTION 'rate-limit window is outside the active fixed window'
+                        USING ERRCODE = '22000';
+                END IF;
+
+                v_reset_at := v_stored_window + pg_catalog.make_interval(mins => 1);
+                v_retry_after := greatest(
+                    1,
+                    pg_catalog.ceil(
+                        extract(epoch FROM (v_reset_at - v_now))
+                    )::integer
+                );
+
+                RETURN QUERY SELECT
+                    v_granted,
+                    v_count,
+                    v_stored_window,
+                    v_reset_at,
+                    v_retry_after;
+            END
+            $rate_limit_reserve$;
+            """
+        )
+    )
+
+
+def _create_release_function() -> None:
+    op.execute(
+        sa.text(
+            f"""
+            CREATE FUNCTION public.{RELEASE_FUNCTION}(
+                p_scope_hash text,
+                p_policy_key text,
+                p_request_limit integer,
+                p_window_started_at timestamp with time zone,
+                p_tokens integer
+            )
+            RETURNS integer
+            LANGUAGE plpgsql
+            SECURITY DEFINER
+            SET search_path = pg_catalog, public, pg_temp
+            SET statement_timeout = '2s'
+            SET lock_timeout = '750ms'
+            AS $rate_limit_release$
+            DECLARE
+                v_stored_window timestamp with time zone;
+                v_count bigint;
+                v_released integer;
+            BEGIN
+{_VALIDATE_IDENTITY}
+                SELECT counters.window_started_at, counters.request_count
+                INTO v_stored_window, v_count
+                FROM public.{TABLE} AS counters
+                WHERE counters.scope_hash = p_scope_hash
+                  AND counters.policy_key = p_policy_key
+                FOR UPDATE;
+
+                -- Tokens belong to the window that granted them. After a roll
+                -- the unused allotment has already expired with that window.
+                IF NOT FOUND OR v_stored_window <> p_window_started_at THEN
+                    RETURN 0;
+                END IF;
+
+                -- A saturated bucket stores limit + 1; only admitted tokens
+                -- can be handed back.
+                v_count := least(v_count, p_request_limit::bigint);
+                v_released := least(p_tokens::bigint, v_count)::integer;
+                IF v_count - v_released < 1 THEN
+                    DELETE FROM public.{TABLE} AS counters
+                    WHERE counters.scope_hash = p_scope_hash
+                      AND counters.policy_key = p_policy_key;
+                ELSE
+                    UPDATE public.{TABLE} AS counters
+                    SET request_count = v_count - v_released
+                    WHERE counters.scope_hash = p_scope_hash
+                      AND counters.policy_key = p_policy_key;
+                END IF;
+                RETURN v_released;
+            END
+            $rate_limit_release$;
+            """
+        )
+    )
@@ -0,0 +1,31 @@
+"""keep sitemap lastmod, changefreq and priority on crawl frontier rows
+
+Revision ID: 20260828_0215
+Revises: 20260827_0214
+Create Date: 2026-08-28 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260828_0215"
+down_revision = "20260827_0214"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("crawl_frontier_urls") as batch_op:
+        batch_op.add_column(sa.Column("sitemap_lastmod", sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column("sitemap_changefreq", sa.String(length=16), nullable=True))
+        batch_op.add_column(sa.Column("sitemap_priority", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("crawl_frontier_urls") as batch_op:
+        batch_op.drop_column("sitemap_priority")
+        batch_op.drop_column("sitemap_changefreq")
+        batch_op.drop_column("sitemap_lastmod")
@@ -12,7 +12,13 @@ from app.schemas.crawl import (
     SiteIntegrityRefreshRequest,
     TechnicalIssueOut,
 )
-from app.services import crawl_metrics, crawl_service, infra_service, site_integrity_service
+from app.services import (
+    crawl_metrics,
+    crawl_service,
+    durable_job_service,
+    infra_service,
+    site_integrity_service,
+)
 from app.tasks.tasks import crawl_fetch_batch, crawl_schedule_campaign
 
 router = APIRouter(prefix="/crawl", tags=["crawl"])
@@ -156,3 +162,54 @@ def refresh_site_integrity(
             ),
         )
     return envelope(request, data)
+
+
+@router.post("/site-integrity/refresh-jobs")
+def queue_site_integrity_refresh(
+    request: Request,
+    body: SiteIntegrityRefreshRequest,
+    user: dict = Depends(require_roles({"tenant_admin"})),
+    db: Session = Depends(get_db),
+) -> dict:
+    try:
+        data = durable_job_service.enqueue_site_integrity_refresh(
+            db,
+            tenant_id=user["tenant_id"],
+            campaign_id=body.campaign_id,
+        )
+    except site_integrity_service.SiteIntegrityError as exc:
+        db.rollback()
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=envelope(
+                request,
+                data=None,
+                error={"message": str(exc), "details": {"reason_code": exc.reason_code}},
+            ),
+        )
+    return envelope(request, data)
+
+
+@router.get("/site-integrity/progress")
+def get_site_integrity_progress(
+    request: Request,
+    campaign_id: str = Query(...),
+    user: dict = Depends(require_roles({"tenant_admin"})),
+    db: Session = Depends(get_db),
+) -> dict:
+    try:
+        data = site_integrity_service.get_site_integrity_progress(
+            db,
+            tenant_id=user["tenant_id"],
+            campaign_id=campaign_id,
+        )
+    except site_integrity_service.SiteIntegrityError as exc:
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=envelope(
+                request,
+                data=None,
+                error={"message": str(exc), "details": {"reason_code": exc.reason_code}},
+            ),
+        )
+    return envelope(request, data)
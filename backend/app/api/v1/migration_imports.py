@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.api.deps import require_org_role
 from app.api.response import envelope
 from app.db.session import get_db
+from app.models.migration_import import MigrationUploadSession
 from app.schemas.migration_import import (
     MigrationApplyIn,
     MigrationDryRunIn,
@@ -14,6 +15,7 @@ from app.schemas.migration_import import (
     MigrationUploadChunkIn,
     MigrationUploadCreateIn,
 )
+from app.services import durable_job_service
 from app.services.migration_import_service import (
     MigrationImportError,
     apply_migration_csv,
@@ -131,6 +133,9 @@ def review_migration_upload(
             page=page,
             page_size=page_size,
         )
+        if result.get("upload", {}).get("status") == "reviewing":
+            upload = db.get(MigrationUploadSession, upload_id)
+            result["job_id"] = durable_job_service.create_migration_upload_review_job(db, upload=upload).id
         db.commit()
     except MigrationImportError as exc:
         db.rollback()
@@ -184,6 +189,9 @@ def apply_migration_upload(
             client_request_id=str(body.client_request_id),
             confirmed=body.confirmed,
         )
+        if result["upload"]["status"] == "applying":
+            upload = db.get(MigrationUploadSession, upload_id)
+            result["job_id"] = durable_job_service.create_migration_upload_apply_job(db, upload=upload).id
         db.commit()
     except MigrationImportError as exc:
         db.rollback()
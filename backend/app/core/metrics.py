@@ -23,12 +23,41 @@ provider_calls_total = Counter(
     ["provider", "success"],
 )
 
+provider_credential_cache_requests_total = Counter(
+    "provider_credential_cache_requests_total",
+    "Provider credential resolutions by cache outcome.",
+    ["outcome"],
+)
+
+crawl_robots_cache_requests_total = Counter(
+    "crawl_robots_cache_requests_total",
+    "robots.txt lookups by cache outcome.",
+    ["outcome"],
+)
+
 provider_call_duration_seconds = Histogram(
     "provider_call_duration_seconds",
     "Provider call duration in seconds.",
     ["provider"],
 )
 
+http_client_requests_total = Counter(
+    "http_client_requests_total",
+    "Outbound HTTP requests from pooled provider clients by connection reuse.",
+    ["provider", "connection"],
+)
+
+http_client_request_duration_seconds = Histogram(
+    "http_client_request_duration_seconds",
+    "Outbound HTTP time to response headers for pooled provider clients.",
+    ["provider"],
+)
+
+http_client_pools = Gauge(
+    "http_client_pools",
+    "Pooled HTTP clients currently open in this process.",
+)
+
 replay_executions_total = Counter(
     "replay_executions_total",
     "Total number of replay executions.",
@@ -47,6 +76,32 @@ slow_queries_total = Counter(
     ["band"],
 )
 
+sql_unit_of_work_queries = Histogram(
+    "sql_unit_of_work_queries",
+    "SQL statements executed per HTTP request, Celery task or durable job.",
+    ["kind", "name"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000),
+)
+
+sql_unit_of_work_query_seconds = Histogram(
+    "sql_unit_of_work_query_seconds",
+    "Total SQL execution time per HTTP request, Celery task or durable job.",
+    ["kind", "name"],
+)
+
+sql_unit_of_work_rows = Histogram(
+    "sql_unit_of_work_rows",
+    "Rows reported by the driver per HTTP request, Celery task or durable job.",
+    ["kind", "name"],
+    buckets=(0, 10, 100, 1000, 10_000, 100_000, 1_000_000),
+)
+
+sql_query_budget_violations_total = Counter(
+    "sql_query_budget_violations_total",
+    "Units of work that exceeded the SQL query budget.",
+    ["kind", "name", "reason"],
+)
+
 traffic_fact_stale_campaigns_total = Counter(
     "traffic_fact_stale_campaigns_total",
     "Total number of stale traffic fact campaign detections.",
@@ -99,6 +154,12 @@ worker_inflight_jobs = Gauge(
     ["worker_name"],
 )
 
+worker_queue_dropped_events_total = Counter(
+    "worker_queue_dropped_events_total",
+    "Worker events dropped after exhausting backpressure retries.",
+    ["worker_name"],
+)
+
 graph_write_batch_size = Gauge(
     "graph_write_batch_size",
     "Number of knowledge graph edge writes flushed per batch.",
@@ -110,6 +171,41 @@ event_batch_latency_seconds = Histogram(
     ["consumer_name"],
 )
 
+event_handler_duration_seconds = Histogram(
+    "event_handler_duration_seconds",
+    "Time spent in one in-process event bus handler call.",
+    ["event_type", "handler"],
+)
+
+event_handler_queue_lag_seconds = Histogram(
+    "event_handler_queue_lag_seconds",
+    "Delay between publishing an event and an asynchronous handler starting on it.",
+    ["event_type"],
+)
+
+event_handler_failures_total = Counter(
+    "event_handler_failures_total",
+    "Event bus handler calls that raised or outlived their timeout.",
+    ["event_type", "handler", "reason"],
+)
+
+event_bus_pending_deliveries = Gauge(
+    "event_bus_pending_deliveries",
+    "Asynchronous event bus deliveries queued or running.",
+)
+
+event_bus_overflow_total = Counter(
+    "event_bus_overflow_total",
+    "Asynchronous deliveries run inline because the event bus queue was full.",
+    ["event_type"],
+)
+
+report_pdf_section_render_seconds = Histogram(
+    "report_pdf_section_render_seconds",
+    "Time spent assembling or laying out one report PDF section.",
+    ["report_kind", "section"],
+)
+
 campaign_execution_lock_wait = Gauge(
     "campaign_execution_lock_wait",
     "Current campaign execution lock wait state.",
@@ -1,4 +1,5 @@
 from app.core.middleware.metrics import MetricsMiddleware
+from app.core.middleware.query_budget import QueryBudgetMiddleware
 from app.core.middleware.rate_limit import RateLimitMiddleware
 from app.core.middleware.request_logging import RequestLoggingMiddleware
 from app.core.middleware.request_size_limit import RequestSizeLimitMiddleware
@@ -7,6 +8,7 @@ from app.core.middleware.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
     "MetricsMiddleware",
+    "QueryBudgetMiddleware",
     "RateLimitMiddleware",
     "RequestLoggingMiddleware",
     "RequestSizeLimitMiddleware",
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.db.query_budget import begin_query_budget_scope, end_query_budget_scope
+
+
+class QueryBudgetMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        # Endpoints run in child tasks and threadpool workers that inherit a
+        # copy of this context, so they all feed the same scope object.
+        token = begin_query_budget_scope("http", "unmatched")
+        try:
+            response = await call_next(request)
+        except BaseException:
+            end_query_budget_scope(token, name=_route_path(request), enforce=False)
+            raise
+        end_query_budget_scope(token, name=_route_path(request))
+        return response
+
+
+def _route_path(request: Request) -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 from functools import partial
 import hashlib
 import hmac
@@ -15,6 +16,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.services.rate_limit_store import (
+    LeasedRateLimitStore,
     PostgresFixedWindowRateLimitStore,
     RateLimitDecision,
     RateLimitStoreUnavailable,
@@ -102,6 +104,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         redis_url: str,
         cron_secret: str = "",
         admission_timeout_seconds: float = _DEFAULT_ADMISSION_TIMEOUT_SECONDS,
+        lease_block_size: int = 0,
+        lease_idle_seconds: float = 5.0,
         store: _RateLimitStore | None = None,
     ) -> None:
         super().__init__(app)
@@ -128,6 +132,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 self._store = RedisFixedWindowRateLimitStore(redis_url=redis_url)
             else:
                 raise ValueError("Unsupported rate-limit backend")
+        if self._enabled and int(lease_block_size) > 0:
+            # Lease mode admits most requests from a per-process token block and
+            # only reaches the shared store to refill or return it.
+            self._store = LeasedRateLimitStore(
+                self._store,
+                block_size=int(lease_block_size),
+                idle_seconds=float(lease_idle_seconds),
+            )
+            atexit.register(self._store.close)
 
     def _is_exempt(self, request: Request) -> bool:
         if request.method.upper() == "OPTIONS":
@@ -173,16 +186,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         try:
             if self._store is None:
                 raise RateLimitStoreUnavailable("rate-limit store is not configured")
-            consume = partial(
-                self._store.consume,
-                scope_hash=hashed_identity,
-                policy_key=_POLICY_KEY,
-                limit=self._requests_per_minute,
-            )
-            decision = await asyncio.wait_for(
-                to_thread.run_sync(consume, abandon_on_cancel=True),
-                timeout=self._admission_timeout_seconds,
-            )
+            decision = None
+            if isinstance(self._store, LeasedRateLimitStore):
+                decision = self._store.consume_local(
+                    scope_hash=hashed_identity,
+                    policy_key=_POLICY_KEY,
+                    limit=self._requests_per_minute,
+                )
+            if decision is None:
+                consume = partial(
+                    self._store.consume,
+                    scope_hash=hashed_identity,
+                    policy_key=_POLICY_KEY,
+                    limit=self._requests_per_minute,
+                )
+                decision = await asyncio.wait_for(
+                    to_thread.run_sync(consume, abandon_on_cancel=True),
+                    timeout=self._admission_timeout_seconds,
+                )
         except TimeoutError:
             logger.warning(
                 "rate_limit_store_timeout",
@@ -41,6 +41,10 @@ class Settings(BaseSettings):
     db_max_overflow: int = 20
     db_pool_timeout_seconds: int = 30
     database_rls_enabled: bool = False
+    query_budget_enabled: bool = False
+    query_budget_max_queries: int = 0
+    query_budget_max_repeats: int = 25
+    query_budget_action: str = "log"
     redis_url: str = "redis://localhost:6379/0"
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/1"
@@ -53,6 +57,13 @@ class Settings(BaseSettings):
     crawl_max_pages_per_run: int = 200
     crawl_max_discovered_links_per_page: int = 50
     crawl_frontier_batch_size: int = 25
+    crawl_max_crawl_delay_seconds: float = 10.0
+    crawl_sitemap_max_files: int = 10
+    crawl_sitemap_max_bytes: int = 52_428_800
+    crawl_sitemap_concurrency: int = 4
+    crawl_robots_cache_default_ttl_seconds: float = 3600.0
+    crawl_robots_cache_max_ttl_seconds: float = 86400.0
+    crawl_robots_cache_max_entries: int = 10_000
     crawl_max_active_runs_per_tenant: int = 5
     crawl_max_active_runs_per_campaign: int = 2
     rank_provider_backend: str = "synthetic"
@@ -80,6 +91,8 @@ class Settings(BaseSettings):
     data_connection_sync_interval_hours: int = 24
     customer_app_base_url: str = ""
     google_oauth_access_token_skew_seconds: int = 60
+    provider_credential_cache_ttl_seconds: float = 30.0
+    provider_credential_cache_max_entries: int = 1024
     rank_provider_http_endpoint: str = ""
     rank_provider_http_timeout_seconds: float = 15.0
     rank_provider_http_auth_header: str = ""
@@ -142,6 +155,8 @@ class Settings(BaseSettings):
     rate_limit_backend: str = "redis"
     rate_limit_identity_source: str = "peer"
     rate_limit_hmac_secret: str = ""
+    rate_limit_lease_block_size: int = 0
+    rate_limit_lease_idle_seconds: float = 5.0
     max_concurrent_requests: int = 2000
     max_requests_per_tenant: int = 200
     max_queue_depth: int = 10000
@@ -149,12 +164,20 @@ class Settings(BaseSettings):
     knowledge_graph_batch_size: int = 100
     knowledge_graph_flush_interval_ms: int = 500
     event_stream_batch_size: int = 100
+    event_bus_dispatch_mode: str = "sync"
+    event_bus_max_workers: int = 8
+    event_bus_max_pending: int = 1000
+    event_bus_handler_max_concurrency: int = 2
+    event_bus_handler_timeout_seconds: float = 30.0
     campaign_execution_lock_timeout_seconds: int = 30
     queue_backpressure_threshold: int = 100
     queue_backpressure_enabled: bool = False
+    queue_admission_backend: str = "redis"
     shadow_replay_enabled: bool = True
     shadow_replay_backpressure_disable: bool = True
     shadow_replay_max_concurrency: int = 4
+    shadow_replay_process_workers: int = 2
+    shadow_replay_corpus_chunk_size: int = 25
     otel_exporter_endpoint: str = ""
     reference_library_loader_enabled: bool = True
     reference_library_hot_reload_enabled: bool = False
@@ -172,6 +195,14 @@ class Settings(BaseSettings):
     pagespeed_api_key: str = ""
     website_performance_collection_interval_hours: int = 168
     website_performance_http_timeout_seconds: float = 45.0
+    website_performance_max_concurrent_pagespeed_runs: int = 8
+    http_client_max_connections: int = 20
+    http_client_max_keepalive_connections: int = 10
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 5.0
+    http_client_timeout_seconds: float = 30.0
+    http_client_http2_enabled: bool = True
+    http_client_provider_max_connections: str = ""
     ai_provider_backend: str = "mistral"
     mistral_api_key: str = ""
     mistral_api_endpoint: str = "https://api.mistral.ai/v1/chat/completions"
@@ -268,6 +299,11 @@ class Settings(BaseSettings):
             raise ValueError("RATE_LIMIT_BACKEND must be redis or postgres.")
         self.rate_limit_backend = rate_limit_backend
 
+        queue_admission_backend = self.queue_admission_backend.strip().lower()
+        if queue_admission_backend not in {"redis", "local"}:
+            raise ValueError("QUEUE_ADMISSION_BACKEND must be redis or local.")
+        self.queue_admission_backend = queue_admission_backend
+
         identity_source = self.rate_limit_identity_source.strip().lower()
         if identity_source not in {"peer", "vercel"}:
             raise ValueError("RATE_LIMIT_IDENTITY_SOURCE must be peer or vercel.")
@@ -276,6 +312,43 @@ class Settings(BaseSettings):
             raise ValueError(
                 "RATE_LIMIT_REQUESTS_PER_MINUTE must be between 1 and 1000000."
             )
+        event_bus_dispatch_mode = self.event_bus_dispatch_mode.strip().lower()
+        if event_bus_dispatch_mode not in {"sync", "async"}:
+            raise ValueError("EVENT_BUS_DISPATCH_MODE must be sync or async.")
+        self.event_bus_dispatch_mode = event_bus_dispatch_mode
+        query_budget_action = self.query_budget_action.strip().lower()
+        if query_budget_action not in {"log", "raise"}:
+            raise ValueError("QUERY_BUDGET_ACTION must be log or raise.")
+        if query_budget_action == "raise" and self.app_env.lower() == "production":
+            raise ValueError("QUERY_BUDGET_ACTION=raise is not allowed in production.")
+        if self.query_budget_max_queries < 0 or self.query_budget_max_repeats < 0:
+            raise ValueError("Query budget limits must be zero (unbounded) or positive.")
+        self.query_budget_action = query_budget_action
+        if self.http_client_max_connections < 1 or self.http_client_max_keepalive_connections < 0:
+            raise ValueError(
+                "HTTP_CLIENT_MAX_CONNECTIONS must be at least 1 and "
+                "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS cannot be negative."
+            )
+        for entry in filter(None, (item.strip() for item in self.http_client_provider_max_connections.split(","))):
+            provider, _, limit = entry.partition("=")
+            if not provider.strip() or not limit.strip().isdigit() or int(limit) < 1:
+                raise ValueError(
+                    "HTTP_CLIENT_PROVIDER_MAX_CONNECTIONS must look like provider=connections,provider=connections."
+                )
+        if self.crawl_max_crawl_delay_seconds < 0 or self.crawl_robots_cache_max_entries < 0:
+            raise ValueError(
+                "CRAWL_MAX_CRAWL_DELAY_SECONDS and CRAWL_ROBOTS_CACHE_MAX_ENTRIES cannot be negative."
+            )
+        if self.crawl_sitemap_max_files < 1 or self.crawl_sitemap_max_bytes < 1 or self.crawl_sitemap_concurrency < 1:
+            raise ValueError(
+                "CRAWL_SITEMAP_MAX_FILES, CRAWL_SITEMAP_MAX_BYTES and CRAWL_SITEMAP_CONCURRENCY must be at least 1."
+            )
+        if not 0 <= self.crawl_robots_cache_default_ttl_seconds <= self.crawl_robots_cache_max_ttl_seconds:
+            raise ValueError(
+                "CRAWL_ROBOTS_CACHE_DEFAULT_TTL_SECONDS must be between 0 and CRAWL_ROBOTS_CACHE_MAX_TTL_SECONDS."
+            )
+        if not 0 <= self.rate_limit_lease_block_size <= 10_000:
+            raise ValueError("RATE_LIMIT_LEASE_BLOCK_SIZE must be between 0 and 10000.")
         if self.rate_limit_enabled and self.app_env.lower() != "test":
             if (
                 self.rate_limit_hmac_secret.strip() in self._WEAK_RATE_LIMIT_SECRET_VALUES
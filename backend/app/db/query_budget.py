@@ -0,0 +1,211 @@
+"""Per unit-of-work SQL accounting: query count, DB time, rows and N+1 hints.
+
+A scope is opened around one HTTP request, Celery task or durable job. The
+engine instrumentation in ``app.db.session`` feeds every cursor execution
+into the innermost open scope. Outside a scope the cost is a single
+``ContextVar`` lookup per statement.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+
+from app.core.config import get_settings
+from app.core.metrics import (
+    sql_query_budget_violations_total,
+    sql_unit_of_work_queries,
+    sql_unit_of_work_query_seconds,
+    sql_unit_of_work_rows,
+)
+
+logger = logging.getLogger("lsos.db.query_budget")
+
+_MAX_FINGERPRINT_CHARS = 240
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):[A-Za-z_]\w*|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a unit of work breaks its budget and the action is ``raise``."""
+
+
+@dataclass(slots=True)
+class QueryBudgetScope:
+    kind: str
+    name: str
+    max_queries: int
+    max_repeats: int
+    action: str
+    queries: int = 0
+    duration_seconds: float = 0.0
+    rows: int = 0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def record(self, *, statement: str, duration_seconds: float, rows: int) -> None:
+        self.queries += 1
+        self.duration_seconds += duration_seconds
+        self.rows += max(0, rows)
+        self.fingerprints[fingerprint_statement(statement)] += 1
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        if self.max_repeats <= 0:
+            return []
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.fingerprints.most_common()
+            if count > self.max_repeats
+        ]
+
+    def merge_into(self, parent: QueryBudgetScope) -> None:
+        parent.queries += self.queries
+        parent.duration_seconds += self.duration_seconds
+        parent.rows += self.rows
+        parent.fingerprints.update(self.fingerprints)
+
+
+_current_scope: ContextVar[QueryBudgetScope | None] = ContextVar("query_budget_scope", default=None)
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Collapse literals, bind parameters and IN lists so repeats compare equal."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PARAMETER_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()[:_MAX_FINGERPRINT_CHARS]
+
+
+def query_budget_enabled() -> bool:
+    return get_settings().query_budget_enabled
+
+
+def current_query_budget_scope() -> QueryBudgetScope | None:
+    return _current_scope.get()
+
+
+def record_query(*, statement: str, duration_seconds: float, rows: int) -> None:
+    scope = _current_scope.get()
+    if scope is None:
+        return
+    scope.record(statement=statement, duration_seconds=duration_seconds, rows=rows)
+
+
+def begin_query_budget_scope(
+    kind: str,
+    name: str,
+    *,
+    max_queries: int | None = None,
+    max_repeats: int | None = None,
+    action: str | None = None,
+) -> Token[QueryBudgetScope | None]:
+    settings = get_settings()
+    scope = QueryBudgetScope(
+        kind=kind,
+        name=name,
+        max_queries=settings.query_budget_max_queries if max_queries is None else max_queries,
+        max_repeats=settings.query_budget_max_repeats if max_repeats is None else max_repeats,
+        action=settings.query_budget_action if action is None else action,
+    )
+    return _current_scope.set(scope)
+
+
+def end_query_budget_scope(
+    token: Token[QueryBudgetScope | None],
+    *,
+    name: str | None = None,
+    enforce: bool = True,
+) -> QueryBudgetScope:
+    """Close a scope, export its totals and enforce its budget.
+
+    ``name`` replaces the provisional label once it is known, e.g. the route
+    template that only exists after routing. Totals are folded into the
+    enclosing scope so a Celery task still accounts for the jobs it drained.
+    """
+    scope = _current_scope.get()
+    _current_scope.reset(token)
+    if scope is None:
+        raise RuntimeError("Query budget scope was closed twice.")
+    if name:
+        scope.name = name
+    parent = _current_scope.get()
+    if parent is not None:
+        scope.merge_into(parent)
+
+    sql_unit_of_work_queries.labels(kind=scope.kind, name=scope.name).observe(scope.queries)
+    sql_unit_of_work_query_seconds.labels(kind=scope.kind, name=scope.name).observe(scope.duration_seconds)
+    sql_unit_of_work_rows.labels(kind=scope.kind, name=scope.name).observe(scope.rows)
+    if enforce:
+        _enforce_budget(scope)
+    return scope
+
+
+@contextmanager
+def query_budget_scope(
+    kind: str,
+    name: str,
+    *,
+    max_queries: int | None = None,
+    max_repeats: int | None = None,
+    action: str | None = None,
+) -> Iterator[QueryBudgetScope]:
+    token = begin_query_budget_scope(
+        kind,
+        name,
+        max_queries=max_queries,
+        max_repeats=max_repeats,
+        action=action,
+    )
+    scope = _current_scope.get()
+    assert scope is not None
+    try:
+        yield scope
+    except BaseException:
+        # The caller's error wins over a budget violation.
+        end_query_budget_scope(token, enforce=False)
+        raise
+    end_query_budget_scope(token)
+
+
+def _enforce_budget(scope: QueryBudgetScope) -> None:
+    violations: list[str] = []
+    if scope.max_queries > 0 and scope.queries > scope.max_queries:
+        violations.append("max_queries")
+        sql_query_budget_violations_total.labels(kind=scope.kind, name=scope.name, reason="max_queries").inc()
+    repeated = scope.repeated_statements()
+    if repeated:
+        violations.append("repeated_statement")
+        sql_query_budget_violations_total.labels(kind=scope.kind, name=scope.name, reason="repeated_statement").inc()
+    if not violations:
+        return
+
+    logger.warning(
+        "query_budget_exceeded",
+        extra={
+            "event": "query_budget_exceeded",
+            "unit_kind": scope.kind,
+            "unit_name": scope.name,
+            "violations": violations,
+            "queries": scope.queries,
+            "max_queries": scope.max_queries,
+            "db_time_ms": round(scope.duration_seconds * 1000.0, 2),
+            "rows": scope.rows,
+            "repeated_statements": [
+                {"count": count, "statement": fingerprint} for fingerprint, count in repeated[:3]
+            ],
+        },
+    )
+    if scope.action == "raise":
+        details = ", ".join(f"{count}x {fingerprint}" for fingerprint, count in repeated[:3])
+        raise QueryBudgetExceeded(
+            f"{scope.kind} {scope.name} ran {scope.queries} queries "
+            f"(budget {scope.max_queries}); repeated statements: {details or 'none'}"
+        )
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from app.core.config import get_settings
+from app.db.query_budget import record_query
 from app.services.operational_telemetry_service import record_query_duration
 
 _engine: Engine | None = None
@@ -167,12 +168,14 @@ def _attach_query_instrumentation(engine: Engine) -> None:
 
     @event.listens_for(engine, 'after_cursor_execute')
     def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
-        del cursor, statement, parameters, context, executemany
+        del statement, parameters, context, executemany
         started_at = conn.info.pop('_lsos_query_started_at', None)
         raw_statement = conn.info.pop('_lsos_query_statement', '')
         if started_at is None:
             return
-        duration_ms = (monotonic() - started_at) * 1000.0
-        record_query_duration(statement=str(raw_statement), duration_ms=duration_ms)
+        duration_seconds = monotonic() - started_at
+        record_query_duration(statement=str(raw_statement), duration_ms=duration_seconds * 1000.0)
+        # Drivers report -1 when the row count is unknown (e.g. SQLite SELECTs).
+        record_query(statement=str(raw_statement), duration_seconds=duration_seconds, rows=cursor.rowcount)
 
     engine._lsos_query_instrumented = True
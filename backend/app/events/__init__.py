@@ -1,4 +1,4 @@
-from app.events.emitter import emit_event, outbox_event_write
+from app.events.emitter import EventEmission, buffered_events, emit_event, emit_events, outbox_event_write
 from app.events.event_bus import publish_event, reset_subscribers, subscribe, unsubscribe
 from app.events.event_stream import (
     acknowledge_event,
@@ -11,7 +11,10 @@ from app.events.event_stream import (
 from app.events.event_types import EventType
 
 __all__ = [
+    'EventEmission',
+    'buffered_events',
     'emit_event',
+    'emit_events',
     'outbox_event_write',
     'EventType',
     'publish_event',
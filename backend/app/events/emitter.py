@@ -1,16 +1,25 @@
 import hashlib
 import json
 import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
+from sqlalchemy import event, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.correlation import get_correlation_id
 from app.events.outbox.event_outbox import EventOutbox
 from app.models.audit_log import AuditLog
 
+BULK_EMIT_CHUNK_SIZE = 500
+_EVENT_BUFFER_KEY = 'lsos_buffered_events'
+
 
 class EventEnvelope(BaseModel):
     event_id: str = Field(min_length=1)
@@ -21,7 +30,34 @@ class EventEnvelope(BaseModel):
     payload: dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class EventEmission:
+    tenant_id: str
+    event_type: str
+    payload: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedEvent:
+    envelope: EventEnvelope
+    payload_hash: str
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.envelope.event_type, self.payload_hash
+
+
 def emit_event(db: Session, tenant_id: str, event_type: str, payload: dict[str, Any]) -> EventEnvelope:
+    buffered = db.info.get(_EVENT_BUFFER_KEY)
+    if buffered is not None:
+        if not db.in_transaction():
+            # Tie the buffered event to a transaction, as the dedupe query
+            # of an unbuffered emit would, so commit and rollback see it.
+            db.begin()
+        prepared = _prepare_event(tenant_id=tenant_id, event_type=event_type, payload=payload)
+        buffered.append(prepared)
+        return prepared.envelope
+
     correlation_id = get_correlation_id()
     payload_with_correlation = dict(payload)
     if correlation_id and 'correlation_id' not in payload_with_correlation:
@@ -70,10 +106,178 @@ def emit_event(db: Session, tenant_id: str, event_type: str, payload: dict[str,
     return event
 
 
+def emit_events(db: Session, emissions: Iterable[EventEmission]) -> list[EventEnvelope]:
+    """Emit many events with one dedupe query and multi-row inserts per chunk.
+
+    Each event keeps ``emit_event`` semantics: an event whose type and payload
+    hash already exist in the outbox is not written again and the stored
+    envelope is returned in its place. Repeats inside the batch collapse onto
+    the first occurrence.
+    """
+    prepared = [
+        _prepare_event(tenant_id=item.tenant_id, event_type=item.event_type, payload=item.payload)
+        for item in emissions
+    ]
+    return _write_prepared_events(db, prepared)
+
+
+@contextmanager
+def buffered_events(db: Session) -> Iterator[None]:
+    """Collect ``emit_event`` calls on ``db`` and write them in bulk.
+
+    The buffer is written when the block exits or the session commits,
+    whichever comes first, and is discarded on rollback. A buffered
+    ``emit_event`` returns the envelope it will write; if an identical event
+    already exists, that stored event wins when the buffer is written.
+    """
+    if _EVENT_BUFFER_KEY in db.info:
+        yield
+        return
+    db.info[_EVENT_BUFFER_KEY] = []
+    try:
+        yield
+        flush_buffered_events(db)
+    finally:
+        db.info.pop(_EVENT_BUFFER_KEY, None)
+
+
+def flush_buffered_events(db: Session) -> list[EventEnvelope]:
+    buffered = db.info.get(_EVENT_BUFFER_KEY)
+    if not buffered:
+        return []
+    prepared = list(buffered)
+    buffered.clear()
+    return _write_prepared_events(db, prepared)
+
+
 def outbox_event_write(db: Session, tenant_id: str, event_type: str, payload: dict[str, Any]) -> EventEnvelope:
     return emit_event(db, tenant_id=tenant_id, event_type=event_type, payload=payload)
 
 
+@event.listens_for(Session, 'before_commit')
+def _flush_buffered_events_before_commit(session: Session) -> None:
+    flush_buffered_events(session)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_buffered_events(session: Session, previous_transaction) -> None:  # noqa: ANN001
+    del previous_transaction
+    buffered = session.info.get(_EVENT_BUFFER_KEY)
+    # Savepoint rollbacks keep the outer transaction, and its events, alive.
+    if buffered and not session.in_transaction():
+        buffered.clear()
+
+
+def _prepare_event(*, tenant_id: str, event_type: str, payload: dict[str, Any]) -> _PreparedEvent:
+    correlation_id = get_correlation_id()
+    payload_with_correlation = dict(payload)
+    if correlation_id and 'correlation_id' not in payload_with_correlation:
+        payload_with_correlation['correlation_id'] = correlation_id
+    envelope = EventEnvelope(
+        event_id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        event_type=event_type,
+        timestamp=datetime.now(UTC).isoformat(),
+        correlation_id=correlation_id,
+        payload=payload_with_correlation,
+    )
+    return _PreparedEvent(
+        envelope=envelope,
+        payload_hash=_payload_hash(tenant_id=tenant_id, payload=payload_with_correlation),
+    )
+
+
+def _write_prepared_events(db: Session, prepared: list[_PreparedEvent]) -> list[EventEnvelope]:
+    first_by_key: dict[tuple[str, str], _PreparedEvent] = {}
+    for item in prepared:
+        first_by_key.setdefault(item.key, item)
+    stored = _pending_outbox_envelopes(db, first_by_key)
+    unique = [item for key, item in first_by_key.items() if key not in stored]
+    for start in range(0, len(unique), BULK_EMIT_CHUNK_SIZE):
+        chunk = unique[start : start + BULK_EMIT_CHUNK_SIZE]
+        stored.update(_existing_outbox_envelopes(db, chunk))
+        stored.update(_insert_outbox_events(db, [item for item in chunk if item.key not in stored]))
+    return [stored.get(item.key, first_by_key[item.key].envelope) for item in prepared]
+
+
+def _pending_outbox_envelopes(
+    db: Session,
+    wanted: dict[tuple[str, str], _PreparedEvent],
+) -> dict[tuple[str, str], EventEnvelope]:
+    # Unbuffered emits that are not flushed yet are invisible to SELECT but
+    # would still collide on the unique key at flush time.
+    return {
+        (row.event_type, row.payload_hash): EventEnvelope.model_validate_json(row.payload_json)
+        for row in db.new
+        if isinstance(row, EventOutbox) and (row.event_type, row.payload_hash) in wanted
+    }
+
+
+def _existing_outbox_envelopes(db: Session, chunk: list[_PreparedEvent]) -> dict[tuple[str, str], EventEnvelope]:
+    wanted = {item.key for item in chunk}
+    rows = (
+        db.query(EventOutbox.event_type, EventOutbox.payload_hash, EventOutbox.payload_json)
+        .filter(EventOutbox.payload_hash.in_({item.payload_hash for item in chunk}))
+        .all()
+    )
+    return {
+        (row.event_type, row.payload_hash): EventEnvelope.model_validate_json(row.payload_json)
+        for row in rows
+        if (row.event_type, row.payload_hash) in wanted
+    }
+
+
+def _insert_outbox_events(db: Session, chunk: list[_PreparedEvent]) -> dict[tuple[str, str], EventEnvelope]:
+    if not chunk:
+        return {}
+    now = datetime.now(UTC)
+    dialect_insert = sqlite_insert if db.get_bind().dialect.name == 'sqlite' else pg_insert
+    inserted_ids = set(
+        db.execute(
+            dialect_insert(EventOutbox.__table__)
+            .values(
+                [
+                    {
+                        'id': item.envelope.event_id,
+                        'tenant_id': item.envelope.tenant_id,
+                        'event_type': item.envelope.event_type,
+                        'payload_json': item.envelope.model_dump_json(),
+                        'payload_hash': item.payload_hash,
+                        'status': 'pending',
+                        'created_at': now,
+                    }
+                    for item in chunk
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=['event_type', 'payload_hash'])
+            .returning(EventOutbox.__table__.c.id)
+        ).scalars()
+    )
+    written = [item for item in chunk if item.envelope.event_id in inserted_ids]
+    if written:
+        db.execute(
+            insert(AuditLog.__table__).values(
+                [
+                    {
+                        'id': str(uuid.uuid4()),
+                        'tenant_id': item.envelope.tenant_id,
+                        'event_type': item.envelope.event_type,
+                        'payload_json': item.envelope.model_dump_json(),
+                        'created_at': now,
+                    }
+                    for item in written
+                ]
+            )
+        )
+    stored = {item.key: item.envelope for item in written}
+    lost = [item for item in chunk if item.envelope.event_id not in inserted_ids]
+    if lost:
+        # A concurrent producer committed the same event between the dedupe
+        # read and the insert; return its envelope as emit_event would.
+        stored.update(_existing_outbox_envelopes(db, lost))
+    return stored
+
+
 def _payload_hash(*, tenant_id: str, payload: dict[str, Any]) -> str:
     canonical = json.dumps({'tenant_id': tenant_id, 'payload': payload}, sort_keys=True, default=str, separators=(',', ':'))
     return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
@@ -1,56 +1,360 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+import threading
+from collections import defaultdict, deque
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from threading import RLock
+from time import monotonic
 from typing import Any
 
+from app.core.config import get_settings
+from app.core.metrics import (
+    event_bus_overflow_total,
+    event_bus_pending_deliveries,
+    event_handler_duration_seconds,
+    event_handler_failures_total,
+    event_handler_queue_lag_seconds,
+)
 from app.events.event_stream import initialize_event_stream, publish_event as publish_to_stream
 
 logger = logging.getLogger('lsos.intelligence.event_bus')
 EventHandler = Callable[[dict[str, Any]], None]
+DISPATCH_MODES = frozenset({'sync', 'async'})
+
+
+@dataclass(slots=True)
+class _Delivery:
+    event_type: str
+    payload: dict[str, Any]
+    lane: str | None
+    queued_at: float
+    deadline: float | None = None
+    finished: bool = False
+
+
+@dataclass(slots=True)
+class _Subscription:
+    handler: EventHandler
+    dispatch: str | None
+    ordered: bool
+    max_concurrency: int | None
+    timeout_seconds: float | None
+    active: int = 0
+    busy_lanes: set[str | None] = field(default_factory=set)
+    backlog: deque[_Delivery] = field(default_factory=deque)
+
+    @property
+    def name(self) -> str:
+        module = getattr(self.handler, '__module__', None)
+        qualname = getattr(self.handler, '__qualname__', None)
+        return f'{module}.{qualname}' if module and qualname else repr(self.handler)
 
 
 class EventBus:
-    def __init__(self) -> None:
-        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+    """In-process fan-out of published events to subscribed handlers.
+
+    In ``sync`` mode handlers run in the publisher's thread, one after the
+    other, which keeps them inside the publisher's transaction. In ``async``
+    mode each delivery goes to a bounded thread pool: a handler runs at most
+    ``max_concurrency`` deliveries at once, a delivery that outlives its
+    timeout is logged and stops holding its slot, and one handler's errors
+    never reach another. ``ordered`` subscriptions get one lane per campaign
+    so deliveries of an event type for the same campaign run one at a time
+    in publish order; an overdue delivery keeps its lane until its handler
+    returns. When more than ``max_pending`` deliveries are queued, new
+    deliveries run inline in the publisher instead of queueing, ordered ones
+    once their lane's earlier deliveries have finished.
+    Subscriptions can pin ``dispatch='sync'`` to stay transactionally
+    coupled whatever the bus mode.
+    """
+
+    def __init__(
+        self,
+        *,
+        dispatch_mode: str | None = None,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        handler_max_concurrency: int | None = None,
+        handler_timeout_seconds: float | None = None,
+    ) -> None:
+        if dispatch_mode is not None and dispatch_mode not in DISPATCH_MODES:
+            raise ValueError(f'Unsupported event bus dispatch mode: {dispatch_mode}')
+        self._handlers: dict[str, list[_Subscription]] = defaultdict(list)
         self._lock = RLock()
+        self._changed = threading.Condition(self._lock)
+        self._dispatch_mode = dispatch_mode
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._handler_max_concurrency = handler_max_concurrency
+        self._handler_timeout_seconds = handler_timeout_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._watchdog: threading.Thread | None = None
+        self._inflight: dict[int, tuple[_Subscription, _Delivery]] = {}
+        self._pending = 0
+        self._closed = False
         initialize_event_stream()
 
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        dispatch: str | None = None,
+        ordered: bool = False,
+        max_concurrency: int | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        if dispatch is not None and dispatch not in DISPATCH_MODES:
+            raise ValueError(f'Unsupported event handler dispatch mode: {dispatch}')
         with self._lock:
             handlers = self._handlers[event_type]
-            if handler not in handlers:
-                handlers.append(handler)
+            if any(item.handler is handler for item in handlers):
+                return
+            handlers.append(
+                _Subscription(
+                    handler=handler,
+                    dispatch=dispatch,
+                    ordered=ordered,
+                    max_concurrency=max_concurrency,
+                    timeout_seconds=timeout_seconds,
+                )
+            )
 
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
         with self._lock:
             handlers = self._handlers.get(event_type)
             if not handlers:
                 return
-            self._handlers[event_type] = [item for item in handlers if item is not handler]
+            self._handlers[event_type] = [item for item in handlers if item.handler is not handler]
 
     def publish(self, event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
         envelope = publish_to_stream(event_type, payload)
         dispatch_payload = dict(payload)
         with self._lock:
-            handlers = list(self._handlers.get(event_type, []))
-        for handler in handlers:
-            try:
-                handler(dispatch_payload)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning(
-                    'intelligence_event_handler_failed',
-                    extra={'event_type': event_type, 'handler': getattr(handler, '__name__', repr(handler))},
-                    exc_info=exc,
-                )
+            subscriptions = list(self._handlers.get(event_type, []))
+        bus_mode = self._resolved_dispatch_mode()
+        for subscription in subscriptions:
+            if (subscription.dispatch or bus_mode) == 'async' and self._enqueue(
+                subscription, event_type, dispatch_payload
+            ):
+                continue
+            self._invoke(subscription, event_type, dispatch_payload)
         return envelope
 
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued asynchronous delivery has finished."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._changed:
+            while self._pending:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._changed:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            self._changed.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
     def reset(self) -> None:
         with self._lock:
             self._handlers.clear()
 
+    def _resolved_dispatch_mode(self) -> str:
+        return self._dispatch_mode or get_settings().event_bus_dispatch_mode
+
+    def _enqueue(self, subscription: _Subscription, event_type: str, payload: dict[str, Any]) -> bool:
+        lane = _ordering_lane(payload) if subscription.ordered else None
+        with self._changed:
+            if self._closed:
+                return False
+            if self._pending >= self._limit('max_pending'):
+                event_bus_overflow_total.labels(event_type=event_type).inc()
+                if not subscription.ordered:
+                    return False
+                self._run_ordered_inline(subscription, event_type, payload, lane)
+                return True
+            subscription.backlog.append(
+                _Delivery(event_type=event_type, payload=dict(payload), lane=lane, queued_at=monotonic())
+            )
+            self._pending += 1
+            event_bus_pending_deliveries.set(self._pending)
+            self._pump(subscription)
+        return True
+
+    def _run_ordered_inline(
+        self,
+        subscription: _Subscription,
+        event_type: str,
+        payload: dict[str, Any],
+        lane: str | None,
+    ) -> None:
+        # Called with the lock held. Running out of turn would reorder the lane,
+        # so the publisher first waits for the lane's earlier deliveries, for at
+        # most one handler timeout.
+        timeout_seconds = self._subscription_timeout(subscription)
+        deadline = monotonic() + timeout_seconds if timeout_seconds > 0 else None
+        while not self._closed and (
+            lane in subscription.busy_lanes or any(item.lane == lane for item in subscription.backlog)
+        ):
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            self._changed.wait(remaining)
+        held = lane not in subscription.busy_lanes
+        if held:
+            subscription.busy_lanes.add(lane)
+        self._changed.release()
+        try:
+            self._invoke(subscription, event_type, payload)
+        finally:
+            self._changed.acquire()
+            if held:
+                subscription.busy_lanes.discard(lane)
+                if not self._closed:
+                    self._pump(subscription)
+                self._changed.notify_all()
+
+    def _pump(self, subscription: _Subscription) -> None:
+        limit = subscription.max_concurrency or self._limit('handler_max_concurrency')
+        if not subscription.backlog or subscription.active >= limit:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._limit('max_workers'),
+                thread_name_prefix='event-bus',
+            )
+        waiting: deque[_Delivery] = deque()
+        while subscription.backlog:
+            delivery = subscription.backlog.popleft()
+            if subscription.active >= limit or (subscription.ordered and delivery.lane in subscription.busy_lanes):
+                waiting.append(delivery)
+                continue
+            subscription.active += 1
+            if subscription.ordered:
+                subscription.busy_lanes.add(delivery.lane)
+            timeout_seconds = self._subscription_timeout(subscription)
+            if timeout_seconds > 0:
+                delivery.deadline = monotonic() + timeout_seconds
+                self._ensure_watchdog()
+            self._inflight[id(delivery)] = (subscription, delivery)
+            self._executor.submit(self._run, subscription, delivery)
+        subscription.backlog = waiting
+        self._changed.notify_all()
+
+    def _run(self, subscription: _Subscription, delivery: _Delivery) -> None:
+        event_handler_queue_lag_seconds.labels(event_type=delivery.event_type).observe(
+            monotonic() - delivery.queued_at
+        )
+        try:
+            self._invoke(subscription, delivery.event_type, delivery.payload)
+        finally:
+            with self._changed:
+                if not delivery.finished:
+                    self._release_slot(subscription, delivery)
+                if subscription.ordered:
+                    subscription.busy_lanes.discard(delivery.lane)
+                if not self._closed:
+                    self._pump(subscription)
+                self._changed.notify_all()
+
+    def _release_slot(self, subscription: _Subscription, delivery: _Delivery) -> None:
+        delivery.finished = True
+        self._inflight.pop(id(delivery), None)
+        subscription.active -= 1
+        self._pending -= 1
+        event_bus_pending_deliveries.set(self._pending)
+
+    def _invoke(self, subscription: _Subscription, event_type: str, payload: dict[str, Any]) -> None:
+        started_at = monotonic()
+        try:
+            subscription.handler(payload)
+        except Exception as exc:  # noqa: BLE001
+            event_handler_failures_total.labels(
+                event_type=event_type,
+                handler=subscription.name,
+                reason='error',
+            ).inc()
+            logger.warning(
+                'intelligence_event_handler_failed',
+                extra={'event_type': event_type, 'handler': getattr(subscription.handler, '__name__', repr(subscription.handler))},
+                exc_info=exc,
+            )
+        finally:
+            event_handler_duration_seconds.labels(event_type=event_type, handler=subscription.name).observe(
+                monotonic() - started_at
+            )
+
+    def _ensure_watchdog(self) -> None:
+        if self._watchdog is not None and self._watchdog.is_alive():
+            return
+        self._watchdog = threading.Thread(target=self._expire_overdue, name='event-bus-watchdog', daemon=True)
+        self._watchdog.start()
+
+    def _expire_overdue(self) -> None:
+        # Threads cannot be interrupted, so an overdue handler keeps its
+        # worker. Releasing its slot lets other campaigns move; its ordered
+        # lane stays held until the handler returns so the campaign's next
+        # delivery cannot overtake it.
+        with self._changed:
+            while not self._closed:
+                now = monotonic()
+                next_deadline: float | None = None
+                for subscription, delivery in list(self._inflight.values()):
+                    if delivery.deadline is None:
+                        continue
+                    if delivery.deadline > now:
+                        if next_deadline is None or delivery.deadline < next_deadline:
+                            next_deadline = delivery.deadline
+                        continue
+                    event_handler_failures_total.labels(
+                        event_type=delivery.event_type,
+                        handler=subscription.name,
+                        reason='timeout',
+                    ).inc()
+                    logger.warning(
+                        'intelligence_event_handler_timed_out',
+                        extra={'event_type': delivery.event_type, 'handler': subscription.name},
+                    )
+                    self._release_slot(subscription, delivery)
+                    if not self._closed:
+                        self._pump(subscription)
+                    self._changed.notify_all()
+                if next_deadline is None and not self._inflight:
+                    self._watchdog = None
+                    return
+                self._changed.wait(None if next_deadline is None else max(0.0, next_deadline - now))
+
+    def _limit(self, name: str) -> int:
+        override = getattr(self, f'_{name}')
+        if override is not None:
+            return max(1, int(override))
+        return max(1, int(getattr(get_settings(), f'event_bus_{name}')))
+
+    def _subscription_timeout(self, subscription: _Subscription) -> float:
+        if subscription.timeout_seconds is not None:
+            return float(subscription.timeout_seconds)
+        return self._timeout_seconds()
+
+    def _timeout_seconds(self) -> float:
+        if self._handler_timeout_seconds is not None:
+            return float(self._handler_timeout_seconds)
+        return float(get_settings().event_bus_handler_timeout_seconds)
+
+
+def _ordering_lane(payload: dict[str, Any]) -> str | None:
+    campaign_id = payload.get('campaign_id')
+    if campaign_id is None and isinstance(payload.get('payload'), dict):
+        campaign_id = payload['payload'].get('campaign_id')
+    return None if campaign_id is None else str(campaign_id)
+
 
 event_bus = EventBus()
 
@@ -59,8 +363,23 @@ def publish_event(event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
     return event_bus.publish(event_type, payload)
 
 
-def subscribe(event_type: str, handler: EventHandler) -> None:
-    event_bus.subscribe(event_type, handler)
+def subscribe(
+    event_type: str,
+    handler: EventHandler,
+    *,
+    dispatch: str | None = None,
+    ordered: bool = False,
+    max_concurrency: int | None = None,
+    timeout_seconds: float | None = None,
+) -> None:
+    event_bus.subscribe(
+        event_type,
+        handler,
+        dispatch=dispatch,
+        ordered=ordered,
+        max_concurrency=max_concurrency,
+        timeout_seconds=timeout_seconds,
+    )
 
 
 def unsubscribe(event_type: str, handler: EventHandler) -> None:
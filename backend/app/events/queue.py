@@ -5,22 +5,59 @@ import time
 from itertools import count
 from threading import RLock
 from typing import Any
+from uuid import uuid4
 
 from app.core.config import get_settings
-from app.core.metrics import queue_depth, worker_inflight_jobs, worker_queue_depth
+from app.core.metrics import (
+    queue_depth,
+    worker_inflight_jobs,
+    worker_queue_depth,
+    worker_queue_dropped_events_total,
+)
 from app.events.event_types import EventType
+from app.events.queue_store import (
+    InMemoryWorkerQueueStore,
+    RedisWorkerQueueStore,
+    WorkerQueueAdmission,
+    WorkerQueueCounts,
+    WorkerQueueStoreUnavailable,
+)
 
 logger = logging.getLogger('lsos.intelligence.queue')
 
 _FAILED_JOBS: dict[str, dict[str, Any]] = {}
 _JOB_COUNTER = count(1)
 _QUEUE_LOCK = RLock()
-_QUEUE_DEPTH: dict[str, int] = {}
-_WORKER_INFLIGHT: dict[str, int] = {}
-_RETRY_BACKOFF_SECONDS = (0.01, 0.02, 0.04)
+# A lease outlives any healthy worker run; it only bounds how long a crashed
+# worker's job keeps counting against the fleet-wide limits.
+_LEASE_SECONDS = 900.0
+_RETRY_AFTER_BASE_SECONDS = 0.05
+_RETRY_AFTER_MAX_SECONDS = 5.0
+_SHARED_STORE_RETRY_SECONDS = 30.0
+# Rejected events are re-offered after the store's retry_after hint; past this
+# many attempts they are dropped and counted.
+_MAX_EVENT_DISPATCH_ATTEMPTS = 4
+_EVENT_WORKERS = {
+    EventType.OUTCOME_RECORDED.value: 'learning',
+    EventType.EXPERIMENT_COMPLETED.value: 'experiment',
+}
+
+_local_store = InMemoryWorkerQueueStore()
+_shared_store: RedisWorkerQueueStore | None = None
+_shared_store_retry_at = 0.0
 
 
 def _truth_scope() -> dict[str, Any]:
+    if _shared_queue_store() is not None:
+        return {
+            'mode': 'shared',
+            'durable': False,
+            'multi_instance_safe': True,
+            'warning': (
+                'Queue depth and inflight counts are fleet-wide; jobs from crashed workers '
+                f'stop counting once their {int(_LEASE_SECONDS)}s lease expires.'
+            ),
+        }
     return {
         'mode': 'process_local',
         'durable': False,
@@ -34,26 +71,36 @@ def dispatch_worker_job(worker_name: str, payload: dict[str, Any]) -> dict[str,
     max_queue_depth = max(1, int(settings.max_queue_depth))
     max_worker_inflight = max(1, int(settings.max_worker_inflight))
 
-    for attempt, delay in enumerate((0.0, *_RETRY_BACKOFF_SECONDS), start=1):
-        if delay:
-            time.sleep(delay)
-        if _can_dispatch(worker_name, max_queue_depth=max_queue_depth, max_worker_inflight=max_worker_inflight):
-            return _dispatch(worker_name, payload, settings.app_env.lower() == 'test')
-        logger.warning(
-            'worker_queue_backpressure',
-            extra={
-                'worker_name': worker_name,
-                'attempt': attempt,
-                'queue_depth': _QUEUE_DEPTH.get(worker_name, 0),
-                'worker_inflight': _WORKER_INFLIGHT.get(worker_name, 0),
-            },
-        )
-
+    lease_id = uuid4().hex
+    admission = _acquire(
+        worker_name,
+        lease_id,
+        max_queue_depth=max_queue_depth,
+        max_worker_inflight=max_worker_inflight,
+    )
+    if admission.admitted:
+        return _dispatch(worker_name, payload, lease_id, settings.app_env.lower() == 'test')
+
+    retry_after_seconds = _retry_after_seconds(
+        admission,
+        max_queue_depth=max_queue_depth,
+        max_worker_inflight=max_worker_inflight,
+    )
+    logger.warning(
+        'worker_queue_backpressure',
+        extra={
+            'worker_name': worker_name,
+            'queue_depth': admission.depth,
+            'worker_inflight': admission.inflight,
+            'retry_after_seconds': retry_after_seconds,
+        },
+    )
     return {
         'worker': worker_name,
         'mode': 'rejected',
         'status': 'failed',
         'error': 'backpressure_limit_exceeded',
+        'retry_after_seconds': retry_after_seconds,
     }
 
 
@@ -61,12 +108,28 @@ def dispatch_worker(worker_name: str, payload: dict[str, Any]) -> dict[str, Any]
     return dispatch_worker_job(worker_name, payload)
 
 
-def enqueue_event(event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
-    if event_type == EventType.OUTCOME_RECORDED.value:
-        return dispatch_worker_job('learning', payload)
-    if event_type == EventType.EXPERIMENT_COMPLETED.value:
-        return dispatch_worker_job('experiment', payload)
-    raise ValueError(f'Unsupported worker queue event: {event_type}')
+def enqueue_event(event_type: str, payload: dict[str, Any], *, attempt: int = 1) -> dict[str, Any]:
+    worker_name = _EVENT_WORKERS.get(event_type)
+    if worker_name is None:
+        raise ValueError(f'Unsupported worker queue event: {event_type}')
+    while True:
+        result = dispatch_worker_job(worker_name, payload)
+        if result.get('mode') != 'rejected':
+            return result
+        retry_after_seconds = float(result.get('retry_after_seconds') or _RETRY_AFTER_BASE_SECONDS)
+        if attempt >= _MAX_EVENT_DISPATCH_ATTEMPTS:
+            worker_queue_dropped_events_total.labels(worker_name=worker_name).inc()
+            logger.error(
+                'worker_queue_event_dropped',
+                extra={'worker_name': worker_name, 'event_type': event_type, 'attempts': attempt},
+            )
+            return {**result, 'attempts': attempt, 'dropped': True}
+        if get_settings().app_env.lower() == 'test':
+            # Inline workers have no broker to defer to, so wait out the hint here.
+            time.sleep(retry_after_seconds)
+            attempt += 1
+            continue
+        return _defer_event(event_type, payload, attempt=attempt + 1, countdown=retry_after_seconds)
 
 
 def enqueue_learning_event(payload: dict[str, Any]) -> dict[str, Any]:
@@ -77,6 +140,17 @@ def enqueue_experiment_event(payload: dict[str, Any]) -> dict[str, Any]:
     return enqueue_event(EventType.EXPERIMENT_COMPLETED.value, payload)
 
 
+def start_worker_job(worker_name: str, lease_id: str) -> None:
+    """Move a dispatched job's lease from the queue to the worker's inflight set."""
+    counts = _with_store(lambda store: store.start(worker_name, lease_id, lease_seconds=_LEASE_SECONDS))
+    _sync_metrics(worker_name, counts)
+
+
+def finish_worker_job(worker_name: str, lease_id: str) -> None:
+    counts = _with_store(lambda store: store.finish(worker_name, lease_id))
+    _sync_metrics(worker_name, counts)
+
+
 def list_failed_jobs() -> list[dict[str, Any]]:
     return [dict(item) for item in _FAILED_JOBS.values()]
 
@@ -85,7 +159,7 @@ def retry_failed_job(job_id: str) -> dict[str, Any]:
     record = _FAILED_JOBS.get(job_id)
     if record is None:
         raise KeyError(job_id)
-    result = _run_inline(str(record['worker']), dict(record['payload']))
+    result = _run_inline(str(record['worker']), dict(record['payload']), uuid4().hex)
     if result.get('status') == 'succeeded':
         _FAILED_JOBS.pop(job_id, None)
     return result
@@ -93,52 +167,92 @@ def retry_failed_job(job_id: str) -> dict[str, Any]:
 
 def reset_queue_state() -> None:
     _FAILED_JOBS.clear()
-    with _QUEUE_LOCK:
-        _QUEUE_DEPTH.clear()
-        _WORKER_INFLIGHT.clear()
+    _with_store(lambda store: store.reset())
     _sync_metrics()
 
 
 def queue_stats() -> dict[str, Any]:
-    with _QUEUE_LOCK:
-        return {
-            'queue_depth': {key: int(value) for key, value in _QUEUE_DEPTH.items()},
-            'worker_inflight_jobs': {key: int(value) for key, value in _WORKER_INFLIGHT.items()},
-            'truth_scope': _truth_scope(),
-        }
+    counts = _with_store(lambda store: store.counts())
+    return {
+        'queue_depth': {key: value.depth for key, value in counts.items()},
+        'worker_inflight_jobs': {key: value.inflight for key, value in counts.items()},
+        'truth_scope': _truth_scope(),
+    }
+
 
+def _dispatch(worker_name: str, payload: dict[str, Any], lease_id: str, use_inline: bool) -> dict[str, Any]:
+    if use_inline:
+        return _run_inline(worker_name, payload, lease_id)
+
+    from app.tasks.intelligence_tasks import run_intelligence_worker_task
 
-def _dispatch(worker_name: str, payload: dict[str, Any], use_inline: bool) -> dict[str, Any]:
-    _increment_queue(worker_name)
     try:
-        if use_inline:
-            return _run_inline(worker_name, payload)
+        task = run_intelligence_worker_task.delay(worker_name=worker_name, payload=payload, lease_id=lease_id)
+    except Exception:
+        finish_worker_job(worker_name, lease_id)
+        raise
+    return {
+        'worker': worker_name,
+        'mode': 'queued',
+        'status': 'queued',
+        'task_id': task.id,
+    }
 
-        from app.tasks.intelligence_tasks import run_intelligence_worker_task
 
-        task = run_intelligence_worker_task.delay(worker_name=worker_name, payload=payload)
-        return {
-            'worker': worker_name,
-            'mode': 'queued',
-            'status': 'queued',
-            'task_id': task.id,
-        }
-    finally:
-        _decrement_queue(worker_name)
+def _defer_event(event_type: str, payload: dict[str, Any], *, attempt: int, countdown: float) -> dict[str, Any]:
+    from app.tasks.intelligence_tasks import redispatch_worker_event_task
+
+    task = redispatch_worker_event_task.apply_async(
+        kwargs={'event_type': event_type, 'payload': payload, 'attempt': attempt},
+        countdown=countdown,
+    )
+    return {
+        'worker': _EVENT_WORKERS[event_type],
+        'mode': 'deferred',
+        'status': 'queued',
+        'task_id': task.id,
+        'attempt': attempt,
+        'retry_after_seconds': countdown,
+    }
 
 
-def _can_dispatch(worker_name: str, *, max_queue_depth: int, max_worker_inflight: int) -> bool:
-    with _QUEUE_LOCK:
-        depth = _QUEUE_DEPTH.get(worker_name, 0)
-        inflight = _WORKER_INFLIGHT.get(worker_name, 0)
-    return depth < max_queue_depth and inflight < max_worker_inflight
+def _acquire(
+    worker_name: str,
+    lease_id: str,
+    *,
+    max_queue_depth: int,
+    max_worker_inflight: int,
+) -> WorkerQueueAdmission:
+    admission = _with_store(
+        lambda store: store.acquire(
+            worker_name,
+            lease_id,
+            lease_seconds=_LEASE_SECONDS,
+            max_queue_depth=max_queue_depth,
+            max_worker_inflight=max_worker_inflight,
+        )
+    )
+    _sync_metrics(worker_name, WorkerQueueCounts(depth=admission.depth, inflight=admission.inflight))
+    return admission
+
+
+def _retry_after_seconds(
+    admission: WorkerQueueAdmission,
+    *,
+    max_queue_depth: int,
+    max_worker_inflight: int,
+) -> float:
+    # Scale the hint with how far over its limits the fleet is, so callers
+    # spread their retries out instead of returning together.
+    overflow = max(admission.depth - max_queue_depth, admission.inflight - max_worker_inflight, 0) + 1
+    return round(min(_RETRY_AFTER_MAX_SECONDS, _RETRY_AFTER_BASE_SECONDS * overflow), 3)
 
 
-def _run_inline(worker_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+def _run_inline(worker_name: str, payload: dict[str, Any], lease_id: str) -> dict[str, Any]:
     from app.intelligence.workers import run_worker
 
     job_id = f'job-{next(_JOB_COUNTER)}'
-    _increment_inflight(worker_name)
+    start_worker_job(worker_name, lease_id)
     try:
         result = run_worker(worker_name, payload)
     except Exception as exc:  # noqa: BLE001
@@ -158,7 +272,7 @@ def _run_inline(worker_name: str, payload: dict[str, Any]) -> dict[str, Any]:
             'error': str(exc),
         }
     finally:
-        _decrement_inflight(worker_name)
+        finish_worker_job(worker_name, lease_id)
     return {
         'job_id': job_id,
         'worker': worker_name,
@@ -168,36 +282,52 @@ def _run_inline(worker_name: str, payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _increment_queue(worker_name: str) -> None:
-    with _QUEUE_LOCK:
-        _QUEUE_DEPTH[worker_name] = _QUEUE_DEPTH.get(worker_name, 0) + 1
-    _sync_metrics()
-
+def _with_store(operation):  # noqa: ANN001, ANN202
+    store = _shared_queue_store()
+    if store is not None:
+        try:
+            return operation(store)
+        except WorkerQueueStoreUnavailable:
+            _mark_shared_store_unavailable()
+    return operation(_local_store)
 
-def _decrement_queue(worker_name: str) -> None:
-    with _QUEUE_LOCK:
-        _QUEUE_DEPTH[worker_name] = max(0, _QUEUE_DEPTH.get(worker_name, 0) - 1)
-    _sync_metrics()
 
+def _shared_queue_store() -> RedisWorkerQueueStore | None:
+    global _shared_store
 
-def _increment_inflight(worker_name: str) -> None:
+    settings = get_settings()
+    if (
+        settings.app_env.lower() == 'test'
+        or settings.hosted_serverless
+        or settings.queue_admission_backend != 'redis'
+    ):
+        return None
     with _QUEUE_LOCK:
-        _WORKER_INFLIGHT[worker_name] = _WORKER_INFLIGHT.get(worker_name, 0) + 1
-    _sync_metrics()
-
+        if _shared_store is None and time.monotonic() >= _shared_store_retry_at:
+            _shared_store = RedisWorkerQueueStore(settings.redis_url)
+        return _shared_store
 
-def _decrement_inflight(worker_name: str) -> None:
-    with _QUEUE_LOCK:
-        _WORKER_INFLIGHT[worker_name] = max(0, _WORKER_INFLIGHT.get(worker_name, 0) - 1)
-    _sync_metrics()
 
+def _mark_shared_store_unavailable() -> None:
+    global _shared_store, _shared_store_retry_at
 
-def _sync_metrics() -> None:
+    # Fall back to this process's own counters while Redis is down. Leases held
+    # in Redis expire on their own, so nothing needs reconciling on recovery.
+    logger.warning(
+        'worker_queue_shared_store_unavailable',
+        extra={'event': 'worker_queue_shared_store_unavailable', 'retry_seconds': _SHARED_STORE_RETRY_SECONDS},
+    )
     with _QUEUE_LOCK:
-        keys = set(_QUEUE_DEPTH) | set(_WORKER_INFLIGHT)
-        for worker_name in keys:
-            depth = _QUEUE_DEPTH.get(worker_name, 0)
-            inflight = _WORKER_INFLIGHT.get(worker_name, 0)
-            queue_depth.labels(queue_name=worker_name).set(depth)
-            worker_queue_depth.labels(worker_name=worker_name).set(depth)
-            worker_inflight_jobs.labels(worker_name=worker_name).set(inflight)
+        _shared_store = None
+        _shared_store_retry_at = time.monotonic() + _SHARED_STORE_RETRY_SECONDS
+
+
+def _sync_metrics(worker_name: str | None = None, counts: WorkerQueueCounts | None = None) -> None:
+    if worker_name is not None and counts is not None:
+        snapshot = {worker_name: counts}
+    else:
+        snapshot = _with_store(lambda store: store.counts())
+    for name, value in snapshot.items():
+        queue_depth.labels(queue_name=name).set(value.depth)
+        worker_queue_depth.labels(worker_name=name).set(value.depth)
+        worker_inflight_jobs.labels(worker_name=name).set(value.inflight)
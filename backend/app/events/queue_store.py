@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import redis
+from redis.exceptions import RedisError
+
+# Depth and inflight are sorted sets of job leases scored by expiry, so a
+# worker that dies mid-job stops counting once its lease lapses instead of
+# pinning the fleet-wide limit forever. Every script reads the Redis clock.
+#
+# KEYS[1] queued leases, KEYS[2] inflight leases, KEYS[3] known worker names
+_ACQUIRE_SCRIPT = """
+local current_time = redis.call('TIME')
+local now_ms = tonumber(current_time[1]) * 1000 + math.floor(tonumber(current_time[2]) / 1000)
+local lease_ms = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now_ms)
+local depth = redis.call('ZCARD', KEYS[1])
+local inflight = redis.call('ZCARD', KEYS[2])
+if depth >= tonumber(ARGV[3]) or inflight >= tonumber(ARGV[4]) then
+    return {0, depth, inflight}
+end
+redis.call('ZADD', KEYS[1], now_ms + lease_ms, ARGV[1])
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+redis.call('SADD', KEYS[3], ARGV[5])
+return {1, depth + 1, inflight}
+"""
+
+_START_SCRIPT = """
+local current_time = redis.call('TIME')
+local now_ms = tonumber(current_time[1]) * 1000 + math.floor(tonumber(current_time[2]) / 1000)
+local lease_ms = tonumber(ARGV[2])
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now_ms)
+redis.call('ZADD', KEYS[2], now_ms + lease_ms, ARGV[1])
+redis.call('PEXPIRE', KEYS[2], lease_ms)
+redis.call('SADD', KEYS[3], ARGV[3])
+return {redis.call('ZCARD', KEYS[1]), redis.call('ZCARD', KEYS[2])}
+"""
+
+_FINISH_SCRIPT = """
+local current_time = redis.call('TIME')
+local now_ms = tonumber(current_time[1]) * 1000 + math.floor(tonumber(current_time[2]) / 1000)
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now_ms)
+return {redis.call('ZCARD', KEYS[1]), redis.call('ZCARD', KEYS[2])}
+"""
+
+
+class WorkerQueueStoreUnavailable(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class WorkerQueueCounts:
+    depth: int
+    inflight: int
+
+
+@dataclass(frozen=True)
+class WorkerQueueAdmission:
+    admitted: bool
+    depth: int
+    inflight: int
+
+
+class InMemoryWorkerQueueStore:
+    """Process-local stand-in with the same lease semantics as the Redis store."""
+
+    shared = False
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queued: dict[str, dict[str, float]] = {}
+        self._inflight: dict[str, dict[str, float]] = {}
+
+    def acquire(
+        self,
+        worker_name: str,
+        lease_id: str,
+        *,
+        lease_seconds: float,
+        max_queue_depth: int,
+        max_worker_inflight: int,
+    ) -> WorkerQueueAdmission:
+        with self._lock:
+            queued, inflight = self._live(worker_name)
+            if len(queued) >= max_queue_depth or len(inflight) >= max_worker_inflight:
+                return WorkerQueueAdmission(admitted=False, depth=len(queued), inflight=len(inflight))
+            queued[lease_id] = self._clock() + lease_seconds
+            return WorkerQueueAdmission(admitted=True, depth=len(queued), inflight=len(inflight))
+
+    def start(self, worker_name: str, lease_id: str, *, lease_seconds: float) -> WorkerQueueCounts:
+        with self._lock:
+            queued, inflight = self._live(worker_name)
+            queued.pop(lease_id, None)
+            inflight[lease_id] = self._clock() + lease_seconds
+            return WorkerQueueCounts(depth=len(queued), inflight=len(inflight))
+
+    def finish(self, worker_name: str, lease_id: str) -> WorkerQueueCounts:
+        with self._lock:
+            queued, inflight = self._live(worker_name)
+            queued.pop(lease_id, None)
+            inflight.pop(lease_id, None)
+            return WorkerQueueCounts(depth=len(queued), inflight=len(inflight))
+
+    def counts(self) -> dict[str, WorkerQueueCounts]:
+        with self._lock:
+            names = set(self._queued) | set(self._inflight)
+            return {
+                name: WorkerQueueCounts(depth=len(queued), inflight=len(inflight))
+                for name in sorted(names)
+                for queued, inflight in (self._live(name),)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._queued.clear()
+            self._inflight.clear()
+
+    def _live(self, worker_name: str) -> tuple[dict[str, float], dict[str, float]]:
+        now = self._clock()
+        queued = self._queued.setdefault(worker_name, {})
+        inflight = self._inflight.setdefault(worker_name, {})
+        for leases in (queued, inflight):
+            for lease_id in [lease_id for lease_id, expires_at in leases.items() if expires_at <= now]:
+                del leases[lease_id]
+        return queued, inflight
+
+
+class RedisWorkerQueueStore:
+    shared = True
+
+    def __init__(self, redis_url: str, *, key_prefix: str = "worker_queue:v1") -> None:
+        if not redis_url.strip():
+            raise ValueError("redis_url is required")
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_connect_timeout=0.2,
+            socket_timeout=0.2,
+            retry_on_timeout=False,
+        )
+        self._acquire_script = self._redis.register_script(_ACQUIRE_SCRIPT)
+        self._start_script = self._redis.register_script(_START_SCRIPT)
+        self._finish_script = self._redis.register_script(_FINISH_SCRIPT)
+        self._key_prefix = key_prefix
+
+    def acquire(
+        self,
+        worker_name: str,
+        lease_id: str,
+        *,
+        lease_seconds: float,
+        max_queue_depth: int,
+        max_worker_inflight: int,
+    ) -> WorkerQueueAdmission:
+        try:
+            result = self._acquire_script(
+                keys=self._keys(worker_name),
+                args=[lease_id, int(lease_seconds * 1000), max_queue_depth, max_worker_inflight, worker_name],
+            )
+            admitted, depth, inflight = int(result[0]), int(result[1]), int(result[2])
+        except (RedisError, TypeError, ValueError, IndexError) as exc:
+            raise WorkerQueueStoreUnavailable("Redis worker queue store is unavailable") from exc
+        return WorkerQueueAdmission(admitted=admitted == 1, depth=depth, inflight=inflight)
+
+    def start(self, worker_name: str, lease_id: str, *, lease_seconds: float) -> WorkerQueueCounts:
+        return self._counts_from(
+            self._start_script,
+            keys=self._keys(worker_name),
+            args=[lease_id, int(lease_seconds * 1000), worker_name],
+        )
+
+    def finish(self, worker_name: str, lease_id: str) -> WorkerQueueCounts:
+        return self._counts_from(self._finish_script, keys=self._keys(worker_name), args=[lease_id])
+
+    def counts(self) -> dict[str, WorkerQueueCounts]:
+        try:
+            seconds, microseconds = self._redis.time()
+            now_ms = int(seconds) * 1000 + int(microseconds) // 1000
+            names = sorted(
+                name.decode("utf-8") if isinstance(name, bytes) else str(name)
+                for name in self._redis.smembers(self._workers_key())
+            )
+            pipeline = self._redis.pipeline(transaction=False)
+            for name in names:
+                queued_key, inflight_key, _ = self._keys(name)
+                pipeline.zcount(queued_key, f"({now_ms}", "+inf")
+                pipeline.zcount(inflight_key, f"({now_ms}", "+inf")
+            values = pipeline.execute()
+        except (RedisError, TypeError, ValueError) as exc:
+            raise WorkerQueueStoreUnavailable("Redis worker queue store is unavailable") from exc
+        return {
+            name: WorkerQueueCounts(depth=int(values[index * 2]), inflight=int(values[index * 2 + 1]))
+            for index, name in enumerate(names)
+        }
+
+    def reset(self) -> None:
+        try:
+            names = list(self._redis.smembers(self._workers_key()))
+            keys = [self._workers_key()]
+            for name in names:
+                keys.extend(self._keys(name.decode("utf-8") if isinstance(name, bytes) else str(name))[:2])
+            self._redis.delete(*keys)
+        except RedisError as exc:
+            raise WorkerQueueStoreUnavailable("Redis worker queue store is unavailable") from exc
+
+    def _counts_from(self, script, *, keys: list[str], args: list[object]) -> WorkerQueueCounts:  # noqa: ANN001
+        try:
+            result = script(keys=keys, args=args)
+            return WorkerQueueCounts(depth=int(result[0]), inflight=int(result[1]))
+        except (RedisError, TypeError, ValueError, IndexError) as exc:
+            raise WorkerQueueStoreUnavailable("Redis worker queue store is unavailable") from exc
+
+    def _keys(self, worker_name: str) -> list[str]:
+        return [
+            f"{self._key_prefix}:queued:{worker_name}",
+            f"{self._key_prefix}:inflight:{worker_name}",
+            self._workers_key(),
+        ]
+
+    def _workers_key(self) -> str:
+        return f"{self._key_prefix}:workers"
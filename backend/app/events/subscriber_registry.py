@@ -24,14 +24,16 @@ def register_default_subscribers(force_reset: bool = False) -> None:
     if _INITIALIZED:
         return
 
-    subscribe(EventType.SIGNAL_UPDATED.value, signal_processor.process)
-    subscribe(EventType.FEATURE_UPDATED.value, pattern_processor.process)
-    subscribe(EventType.PATTERN_DISCOVERED.value, recommendation_processor.process)
-    subscribe(EventType.RECOMMENDATION_GENERATED.value, simulation_processor.process)
-    subscribe(EventType.SIMULATION_COMPLETED.value, execution_processor.process)
-    subscribe(EventType.EXECUTION_COMPLETED.value, outcome_processor.process)
-    subscribe(EventType.OUTCOME_RECORDED.value, enqueue_learning_event)
-    subscribe(EventType.EXPERIMENT_COMPLETED.value, enqueue_experiment_event)
+    # The intelligence pipeline advances one campaign at a time, so each
+    # stage keeps per-campaign publish order when the bus dispatches async.
+    subscribe(EventType.SIGNAL_UPDATED.value, signal_processor.process, ordered=True)
+    subscribe(EventType.FEATURE_UPDATED.value, pattern_processor.process, ordered=True)
+    subscribe(EventType.PATTERN_DISCOVERED.value, recommendation_processor.process, ordered=True)
+    subscribe(EventType.RECOMMENDATION_GENERATED.value, simulation_processor.process, ordered=True)
+    subscribe(EventType.SIMULATION_COMPLETED.value, execution_processor.process, ordered=True)
+    subscribe(EventType.EXECUTION_COMPLETED.value, outcome_processor.process, ordered=True)
+    subscribe(EventType.OUTCOME_RECORDED.value, enqueue_learning_event, ordered=True)
+    subscribe(EventType.EXPERIMENT_COMPLETED.value, enqueue_experiment_event, ordered=True)
 
     _INITIALIZED = True
 
@@ -47,4 +47,6 @@ class ReplayReport(BaseModel):
     passed_cases: int
     failed_cases: int
     drift_events: list[DriftEvent]
+    elapsed_seconds: float | None = None
+    cases_per_second: float | None = None
     generated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-from collections.abc import Awaitable, Callable
+import inspect
+import multiprocessing
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from threading import Lock
+from time import perf_counter
 from typing import Any
 
 from app.core.config import get_settings
 from app.governance.replay.comparator import compare_confidence_bands, compare_hashes, compare_ordering, diff_payload
-from app.governance.replay.schema import DriftEvent, ReplayCase
+from app.governance.replay.schema import DriftEvent, ReplayCase, ReplayReport
 from app.services.queue_admission_service import shadow_replay_allowed
 
 DriftEmitter = Callable[[DriftEvent], Awaitable[None]]
 ReplayExecutor = Callable[[ReplayCase], Awaitable[dict[str, Any]]]
+# Plain module-level functions such as executor_strategy_engine.execute_case; they
+# are pickled by reference and run entirely inside the replay process pool.
+ProcessReplayExecutor = Callable[[ReplayCase], dict[str, Any]]
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
 
 _VOLATILE_KEYS = {
     "generated_at",
@@ -23,6 +33,8 @@ _VOLATILE_KEYS = {
 }
 
 _LOOP_SEMAPHORES: dict[int, tuple[int, asyncio.Semaphore]] = {}
+_PROCESS_POOL_LOCK = Lock()
+_PROCESS_POOL: tuple[int, ProcessPoolExecutor] | None = None
 
 
 def should_sample_shadow(*, stable_key: str, sample_rate_percent: float) -> bool:
@@ -60,15 +72,34 @@ def _strip_volatile_fields(payload: Any) -> Any:
     return payload
 
 
-async def _run_shadow_replay_worker(
-    case: ReplayCase,
-    *,
-    executor: ReplayExecutor,
-    emit_drift: DriftEmitter,
-) -> list[DriftEvent]:
-    async with _get_shadow_semaphore():
-        actual_output = await executor(case)
+def _new_process_pool(workers: int) -> ProcessPoolExecutor:
+    # Spawned workers avoid inheriting locks or sockets from a threaded parent process.
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _get_shadow_process_pool() -> ProcessPoolExecutor | None:
+    global _PROCESS_POOL
+    workers = max(0, int(get_settings().shadow_replay_process_workers))
+    if workers == 0:
+        return None
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None or _PROCESS_POOL[0] != workers:
+            previous = _PROCESS_POOL
+            _PROCESS_POOL = (workers, _new_process_pool(workers))
+            if previous is not None:
+                previous[1].shutdown(wait=False)
+        return _PROCESS_POOL[1]
+
 
+def shutdown_shadow_replay_pool() -> None:
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        entry, _PROCESS_POOL = _PROCESS_POOL, None
+    if entry is not None:
+        entry[1].shutdown(wait=True)
+
+
+def compare_replay_output(case: ReplayCase, actual_output: dict[str, Any]) -> list[DriftEvent]:
     expected_sanitized = _strip_volatile_fields(case.expected_output)
     actual_sanitized = _strip_volatile_fields(actual_output)
     drift_events: list[DriftEvent] = []
@@ -112,6 +143,36 @@ async def _run_shadow_replay_worker(
                 actual=actual_bands,
             )
         )
+    return drift_events
+
+
+def _execute_and_compare(case: ReplayCase, executor: ProcessReplayExecutor) -> list[DriftEvent]:
+    return compare_replay_output(case, executor(case))
+
+
+def _replay_chunk(cases: list[ReplayCase], executor: ProcessReplayExecutor) -> list[list[DriftEvent]]:
+    return [_execute_and_compare(case, executor) for case in cases]
+
+
+async def _run_shadow_replay_worker(
+    case: ReplayCase,
+    *,
+    executor: ReplayExecutor | ProcessReplayExecutor,
+    emit_drift: DriftEmitter,
+) -> list[DriftEvent]:
+    pool = _get_shadow_process_pool()
+    loop = asyncio.get_running_loop()
+    async with _get_shadow_semaphore():
+        if inspect.iscoroutinefunction(executor):
+            actual_output = await executor(case)
+            if pool is None:
+                drift_events = compare_replay_output(case, actual_output)
+            else:
+                drift_events = await loop.run_in_executor(pool, compare_replay_output, case, actual_output)
+        elif pool is None:
+            drift_events = _execute_and_compare(case, executor)
+        else:
+            drift_events = await loop.run_in_executor(pool, _execute_and_compare, case, executor)
 
     if drift_events:
         await asyncio.gather(*(emit_drift(event) for event in drift_events))
@@ -119,11 +180,86 @@ async def _run_shadow_replay_worker(
     return drift_events
 
 
+def _throughput(totals: dict[str, int], started: float) -> dict[str, Any]:
+    elapsed = perf_counter() - started
+    return {
+        **totals,
+        "elapsed_seconds": round(elapsed, 3),
+        "cases_per_second": round(totals["cases"] / elapsed, 2) if elapsed > 0 else None,
+    }
+
+
+async def replay_corpus(
+    cases: Iterable[ReplayCase],
+    *,
+    executor: ProcessReplayExecutor,
+    emit_drift: DriftEmitter,
+    corpus_version: str,
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> ReplayReport:
+    """Replay a stored corpus on a dedicated process pool.
+
+    Cases are read lazily in chunks with at most two chunks per worker in flight.
+    Drift events are emitted as each chunk finishes, so their order follows
+    completion rather than corpus order; ``on_progress`` receives running totals
+    and throughput after every chunk.
+    """
+    settings = get_settings()
+    workers = max(1, int(max_workers or settings.shadow_replay_process_workers or 1))
+    size = max(1, int(chunk_size or settings.shadow_replay_corpus_chunk_size))
+    loop = asyncio.get_running_loop()
+    started = perf_counter()
+    totals = {"cases": 0, "passed": 0, "failed": 0, "drift_events": 0}
+    drift_events: list[DriftEvent] = []
+    remaining = iter(cases)
+    exhausted = False
+    pending: set[asyncio.Future[list[list[DriftEvent]]]] = set()
+    pool = _new_process_pool(workers)
+    try:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < workers * 2:
+                chunk = list(islice(remaining, size))
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.add(loop.run_in_executor(pool, _replay_chunk, chunk, executor))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                for case_events in future.result():
+                    totals["cases"] += 1
+                    totals["failed" if case_events else "passed"] += 1
+                    totals["drift_events"] += len(case_events)
+                    drift_events.extend(case_events)
+                    for event in case_events:
+                        await emit_drift(event)
+                if on_progress is not None:
+                    await on_progress(_throughput(totals, started))
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    metrics = _throughput(totals, started)
+    return ReplayReport(
+        corpus_version=corpus_version,
+        total_cases=totals["cases"],
+        passed_cases=totals["passed"],
+        failed_cases=totals["failed"],
+        drift_events=drift_events,
+        elapsed_seconds=metrics["elapsed_seconds"],
+        cases_per_second=metrics["cases_per_second"],
+    )
+
+
 def schedule_shadow_replay(
     case: ReplayCase,
     *,
     sample_rate_percent: float,
-    executor: ReplayExecutor,
+    executor: ReplayExecutor | ProcessReplayExecutor,
     emit_drift: DriftEmitter,
 ) -> asyncio.Task[list[DriftEvent]] | None:
     stable_key = f"{case.tenant_id}:{case.campaign_id}:{case.case_id}"
@@ -143,7 +279,7 @@ async def run_shadow_replay(
     case: ReplayCase,
     *,
     sample_rate_percent: float,
-    executor: ReplayExecutor,
+    executor: ReplayExecutor | ProcessReplayExecutor,
     emit_drift: DriftEmitter,
 ) -> list[DriftEvent]:
     task = schedule_shadow_replay(
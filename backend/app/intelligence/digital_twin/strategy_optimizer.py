@@ -5,6 +5,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.intelligence.digital_twin.models.model_registry import get_model_parameters
 from app.intelligence.digital_twin.strategy_simulation_engine import simulate_strategy
 from app.intelligence.digital_twin.twin_state_model import DigitalTwinState
 from app.models.digital_twin_simulation import DigitalTwinSimulation
@@ -15,8 +16,11 @@ def optimize_strategy(
     candidate_strategies: Iterable[dict[str, Any]],
     *,
     db: Session | None = None,
+    model_parameters: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     best: dict[str, Any] | None = None
+    if model_parameters is None:
+        model_parameters = get_model_parameters()
 
     for index, strategy in enumerate(candidate_strategies):
         strategy_id = str(strategy.get('strategy_id', strategy.get('scenario_id', f'strategy_{index}')))
@@ -26,6 +30,7 @@ def optimize_strategy(
             strategy_actions,
             db=db,
             strategy_id=strategy_id,
+            model_parameters=model_parameters,
         )
         expected_value = float(simulation.get('expected_value', 0.0))
 
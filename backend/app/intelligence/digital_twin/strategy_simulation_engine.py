@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
 
 from sqlalchemy.orm import Session
 
@@ -18,18 +19,21 @@ def simulate_strategy(
     *,
     db: Session | None = None,
     strategy_id: str | None = None,
+    model_parameters: dict[str, Any] | None = None,
 ) -> dict[str, float | str | None]:
     actions = list(strategy_actions)
     features = _build_feature_payload(twin_state, actions)
 
-    rank_model = RankPredictionModel()
-    traffic_model = TrafficPredictionModel()
-    confidence_estimator = ConfidenceEstimator()
+    # One registry read feeds all three models; callers simulating many
+    # strategies can pass the snapshot in and skip the read entirely.
+    registry = model_parameters if model_parameters is not None else get_model_parameters()
+    rank_model = RankPredictionModel(coefficients=dict(registry.get('coefficients', {})))
+    traffic_model = TrafficPredictionModel(traffic_factor=float(registry.get('traffic_factor', 0.07)))
+    confidence_estimator = ConfidenceEstimator(parameters=dict(registry.get('confidence_parameters', {})))
 
     predicted_rank_delta = rank_model.predict_rank_delta(features, actions)
     predicted_traffic_delta = traffic_model.predict_traffic_delta(predicted_rank_delta, twin_state.traffic_estimate)
 
-    registry = get_model_parameters()
     confidence_defaults = dict(registry.get('confidence_parameters', {}))
     confidence = confidence_estimator.compute_confidence(
         pattern_support_count=_sum_int_field(actions, 'pattern_support_count') or _sample_size(actions),
@@ -25,7 +25,7 @@ class DigitalTwinState:
     @classmethod
     def from_campaign_data(cls, db: Session, campaign_id: str) -> 'DigitalTwinState':
         signals = assemble_signals(campaign_id, db=db, publish=False)
-        features = compute_features(campaign_id, db=db, persist=False, publish=False)
+        features = compute_features(campaign_id, db=db, persist=False, publish=False, signals=signals)
 
         crawl_page_count = int(
             db.query(func.count(CrawlPageResult.id))
@@ -25,6 +25,7 @@ from app.core.logging_config import configure_logging
 from app.core.metrics import internal_metrics_snapshot, render_metrics
 from app.core.middleware import (
     MetricsMiddleware,
+    QueryBudgetMiddleware,
     RateLimitMiddleware,
     RequestLoggingMiddleware,
     RequestSizeLimitMiddleware,
@@ -35,8 +36,10 @@ from app.core.tracing import setup_tracing
 from app.db.redis_client import get_redis_client
 from app.events import initialize_event_stream
 from app.events.subscriber_registry import register_default_subscribers
+from app.governance.replay.shadow_runner import shutdown_shadow_replay_pool
 from app.governance.startup_invariants import run_startup_invariants
 from app.intelligence.model_registry import initialize_default_models
+from app.providers.http_clients import close_http_clients
 import app.db.session as db_session
 from app.services.auth_service import seed_local_admin
 from app.middleware.correlation_id import CorrelationIdMiddleware
@@ -123,16 +126,18 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     if settings.app_env.lower() != "test" and not settings.hosted_serverless:
         # Fail startup loudly when Redis is unavailable.
         get_redis_client()
-    if not inspect(db_session.get_engine()).has_table("users"):
-        yield
-    else:
+    if inspect(db_session.get_engine()).has_table("users"):
         db = db_session.SessionLocal()
         try:
             if settings.app_env.lower() == "local" and settings.local_admin_bootstrap_enabled:
                 seed_local_admin(db)
         finally:
             db.close()
+    try:
         yield
+    finally:
+        close_http_clients()
+        shutdown_shadow_replay_pool()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -146,6 +151,8 @@ if settings.app_env.lower() != "test":
         hmac_secret=settings.rate_limit_hmac_secret,
         redis_url=settings.redis_url,
         cron_secret=settings.cron_secret,
+        lease_block_size=settings.rate_limit_lease_block_size,
+        lease_idle_seconds=settings.rate_limit_lease_idle_seconds,
     )
     app.add_middleware(RequestSizeLimitMiddleware, max_request_body_bytes=settings.max_request_body_bytes)
     app.add_middleware(
@@ -153,6 +160,8 @@ if settings.app_env.lower() != "test":
         max_concurrent_requests=settings.max_concurrent_requests,
         max_requests_per_tenant=settings.max_requests_per_tenant,
     )
+    if settings.query_budget_enabled:
+        app.add_middleware(QueryBudgetMiddleware)
     app.add_middleware(MetricsMiddleware)
     app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(CorrelationIdMiddleware)
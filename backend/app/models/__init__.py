@@ -103,7 +103,12 @@ from app.models.content import (
     EditorialCalendar,
     InternalLinkMap,
 )
-from app.models.cost_economics import CostLedgerEntry, OrganizationCostAllocation, ProviderPriceCard
+from app.models.cost_economics import (
+    CostLedgerEntry,
+    OrganizationCostAllocation,
+    OrganizationCostExposure,
+    ProviderPriceCard,
+)
 from app.models.governed_ai import GovernedAIRun
 from app.models.governed_experiment import (
     GovernedExperimentGuardrailCheck,
@@ -265,6 +270,7 @@ from app.models.migration_import import (
     MigrationImportBatch,
     MigrationImportRecord,
     MigrationUploadChunk,
+    MigrationUploadReviewRow,
     MigrationUploadSession,
 )
 
@@ -361,6 +367,7 @@ __all__ = [
     "ContentQcEvent",
     "CostLedgerEntry",
     "OrganizationCostAllocation",
+    "OrganizationCostExposure",
     "ProviderPriceCard",
     "GovernedAIRun",
     "GovernedAIProviderConnection",
@@ -507,5 +514,6 @@ __all__ = [
     "MigrationImportBatch",
     "MigrationImportRecord",
     "MigrationUploadChunk",
+    "MigrationUploadReviewRow",
     "MigrationUploadSession",
 ]
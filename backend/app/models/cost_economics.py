@@ -149,6 +149,38 @@ class CostLedgerEntry(Base):
     )
 
 
+class OrganizationCostExposure(Base):
+    """Running platform exposure per organization and billing period.
+
+    Updated in the same transaction as every platform ledger event so that
+    reservations read one row instead of summing the period's ledger.
+    """
+
+    __tablename__ = "organization_cost_exposures"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "period_start",
+            name="uq_org_cost_exposure_period",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    organization_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    period_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    budget_impact_cost: Mapped[Decimal] = mapped_column(Numeric(18, 8), nullable=False, default=Decimal("0"))
+    customer_credit_units: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+
+
 class OrganizationCostAllocation(Base):
     """Versioned monthly non-provider COGS entered by platform operators."""
 
@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -53,6 +53,7 @@ class CrawlPageResult(Base):
     redirect_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     canonical_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    content_minhash: Mapped[str | None] = mapped_column(String(512), nullable=True)
     word_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     internal_link_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     structured_data_types: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
@@ -91,6 +92,9 @@ class CrawlFrontierUrl(Base):
     depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     discovered_from_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sitemap_lastmod: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    sitemap_changefreq: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    sitemap_priority: Mapped[float | None] = mapped_column(Float, nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
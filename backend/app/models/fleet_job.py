@@ -74,7 +74,11 @@ class FleetJob(Base):
     )
     idempotency_key: Mapped[str] = mapped_column(String(120), nullable=False)
     requested_by: Mapped[str | None] = mapped_column(String(36), nullable=True)
-    request_payload: Mapped[dict] = mapped_column(JSON().with_variant(JSONB, "postgresql"), nullable=False, default=dict)
+    # Deferred: it holds every item seed, and item processing reads the seed
+    # stored on its own item instead.
+    request_payload: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"), nullable=False, default=dict, deferred=True
+    )
     summary_json: Mapped[dict] = mapped_column(JSON().with_variant(JSONB, "postgresql"), nullable=False, default=dict)
     total_items: Mapped[int] = mapped_column(nullable=False, default=0)
     queued_items: Mapped[int] = mapped_column(nullable=False, default=0)
@@ -157,3 +157,39 @@ class MigrationUploadChunk(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
     )
+
+
+class MigrationUploadReviewRow(Base):
+    __tablename__ = "migration_upload_review_rows"
+    __table_args__ = (
+        UniqueConstraint(
+            "upload_id",
+            "row_number",
+            name="uq_migration_upload_review_rows_upload_row",
+        ),
+        Index("ix_migration_upload_review_rows_upload_status", "upload_id", "status"),
+        Index("ix_migration_upload_review_rows_upload_dedupe", "upload_id", "dedupe_key"),
+        Index("ix_migration_upload_review_rows_upload_keyword", "upload_id", "keyword_key"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    upload_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("migration_upload_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    tenant_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    organization_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    row_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    record_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    status: Mapped[str] = mapped_column(String(24), nullable=False)
+    # Digests of the in-file duplicate key and keyword reference, so the
+    # streamed review can answer "seen earlier in the file" with an index.
+    dedupe_key: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    keyword_key: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    review: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
@@ -10,6 +10,7 @@ from typing import Any, Protocol
 import httpx
 
 from app.core.config import get_settings
+from app.providers.http_clients import get_http_client
 
 
 class AuthorityProvider(Protocol):
@@ -207,21 +208,13 @@ class DataForSeoAuthorityProvider:
             "Content-Type": "application/json",
         }
         try:
-            if self._client is not None:
-                response = self._client.post(
-                    f"{self.BASE_URL}{path}",
-                    json=payload,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
-            else:
-                with httpx.Client() as client:
-                    response = client.post(
-                        f"{self.BASE_URL}{path}",
-                        json=payload,
-                        headers=headers,
-                        timeout=self.timeout_seconds,
-                    )
+            client = self._client or get_http_client("dataforseo")
+            response = client.post(
+                f"{self.BASE_URL}{path}",
+                json=payload,
+                headers=headers,
+                timeout=self.timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ValueError("Link research timed out. Try again in a moment.") from exc
         except httpx.HTTPError as exc:
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Protocol
 
-import httpx
+from app.providers.http_clients import get_http_client
 
 logger = logging.getLogger("lsos.providers.crawl")
 
@@ -99,8 +99,7 @@ class DefaultCrawlAdapter:
                     except Exception as exc:  # noqa: BLE001
                         logger.warning("Playwright crawl attempt failed; falling back to HTTP client.", exc_info=exc)
 
-                with httpx.Client(follow_redirects=True) as client:
-                    response = client.get(url, timeout=timeout_seconds)
+                response = get_http_client("crawl").get(url, timeout=timeout_seconds)
                 content_type = response.headers.get("content-type", "")
                 html = response.text if "text/html" in content_type else ""
                 redirect_chain = [
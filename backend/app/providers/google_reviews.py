@@ -6,6 +6,8 @@ from typing import Any
 
 import httpx
 
+from app.providers.http_clients import get_http_client
+
 
 _PARENT_PATTERN = re.compile(r"^accounts/[^/]+/locations/[^/]+$")
 _REVIEW_PATTERN = re.compile(r"^accounts/[^/]+/locations/[^/]+/reviews/[^/]+$")
@@ -124,21 +126,13 @@ class GoogleBusinessProfileReviewsProvider:
     def _get(self, url: str, *, params: dict[str, str | int]) -> dict[str, Any]:
         headers = {"Authorization": f"Bearer {self.access_token}", "Accept": "application/json"}
         try:
-            if self._client is not None:
-                response = self._client.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
-            else:
-                with httpx.Client() as client:
-                    response = client.get(
-                        url,
-                        params=params,
-                        headers=headers,
-                        timeout=self.timeout_seconds,
-                    )
+            client = self._client or get_http_client("google_reviews")
+            response = client.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise ValueError("The review connection timed out. Try again shortly.") from exc
         except httpx.HTTPError as exc:
@@ -164,21 +158,13 @@ class GoogleBusinessProfileReviewsProvider:
             "Content-Type": "application/json",
         }
         try:
-            if self._client is not None:
-                response = self._client.put(
-                    url,
-                    json=json_body,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
-            else:
-                with httpx.Client() as client:
-                    response = client.put(
-                        url,
-                        json=json_body,
-                        headers=headers,
-                        timeout=self.timeout_seconds,
-                    )
+            client = self._client or get_http_client("google_reviews")
+            response = client.put(
+                url,
+                json=json_body,
+                headers=headers,
+                timeout=self.timeout_seconds,
+            )
         except httpx.TimeoutException as exc:
             raise GoogleReviewsProviderError(
                 "Google did not confirm the reply before the request timed out.",
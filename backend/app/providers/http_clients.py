@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from importlib.util import find_spec
+from time import perf_counter
+from typing import Any
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.metrics import (
+    http_client_pools,
+    http_client_request_duration_seconds,
+    http_client_requests_total,
+)
+
+logger = logging.getLogger("lsos.providers.http_clients")
+
+
+@dataclass(frozen=True)
+class HttpClientProfile:
+    max_connections: int | Callable[[Any], int] | None = None
+    follow_redirects: bool = False
+
+
+# Providers not listed here share HTTP_CLIENT_MAX_CONNECTIONS and do not follow
+# redirects. HTTP_CLIENT_PROVIDER_MAX_CONNECTIONS overrides either default.
+_PROVIDER_PROFILES: dict[str, HttpClientProfile] = {
+    "crawl": HttpClientProfile(max_connections=50, follow_redirects=True),
+    # One connection per PageSpeed slot plus the four CrUX lookup workers
+    # (website_performance_service.CRUX_LOOKUP_WORKERS).
+    "website_performance": HttpClientProfile(
+        max_connections=lambda settings: int(settings.website_performance_max_concurrent_pagespeed_runs) + 4,
+        follow_redirects=True,
+    ),
+}
+
+_lock = threading.Lock()
+_clients: dict[tuple[str, str | None], httpx.Client] = {}
+_owner_pid = os.getpid()
+
+
+def get_http_client(provider: str, *, proxy: str | None = None) -> httpx.Client:
+    """Return this process's pooled client for ``provider``.
+
+    The client keeps connections alive between calls and is shared by every
+    thread in the process, so callers must not close it or use it as a context
+    manager. A provider's ``<provider>_http_timeout_seconds`` setting, when
+    there is one, replaces HTTP_CLIENT_TIMEOUT_SECONDS for its pool.
+    """
+    key = (provider, proxy or None)
+    with _lock:
+        if os.getpid() != _owner_pid:
+            _forget_inherited_clients()
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = _build_client(provider, proxy=proxy or None)
+            _clients[key] = client
+            http_client_pools.set(len(_clients))
+        return client
+
+
+def http_client_max_connections(provider: str) -> int:
+    """Connection limit of ``provider``'s pool, for callers that size worker pools to it."""
+    return _provider_max_connections(provider, _PROVIDER_PROFILES.get(provider, HttpClientProfile()), get_settings())
+
+
+def close_http_clients() -> None:
+    with _lock:
+        clients = list(_clients.values()) if os.getpid() == _owner_pid else []
+        _clients.clear()
+        http_client_pools.set(0)
+    for client in clients:
+        try:
+            client.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("http_client_close_failed", exc_info=exc)
+
+
+def _forget_inherited_clients() -> None:
+    global _lock, _owner_pid
+
+    # A forked child shares its parent's sockets and TLS state. Dropping the
+    # inherited clients without closing them leaves the parent's connections
+    # intact; the child opens its own pools on first use.
+    _lock = threading.Lock()
+    _clients.clear()
+    _owner_pid = os.getpid()
+    http_client_pools.set(0)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_clients)
+
+
+def _build_client(provider: str, *, proxy: str | None) -> httpx.Client:
+    settings = get_settings()
+    profile = _PROVIDER_PROFILES.get(provider, HttpClientProfile())
+    max_connections = _provider_max_connections(provider, profile, settings)
+    timeout_seconds = getattr(settings, f"{provider}_http_timeout_seconds", None)
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, settings.http_client_max_keepalive_connections),
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            float(timeout_seconds or settings.http_client_timeout_seconds),
+            connect=settings.http_client_connect_timeout_seconds,
+        ),
+        http2=settings.http_client_http2_enabled and _http2_installed(),
+        proxy=proxy,
+        # The pool is shared by every tenant in the process, so cookies set by
+        # one customer site or token exchange must never ride along on the next
+        # call. A policy with no allowed domains keeps the jar empty.
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        follow_redirects=profile.follow_redirects,
+        event_hooks={
+            "request": [_start_request_trace],
+            "response": [_response_observer(provider)],
+        },
+    )
+
+
+def _provider_max_connections(provider: str, profile: HttpClientProfile, settings: Any) -> int:
+    for entry in settings.http_client_provider_max_connections.split(","):
+        name, _, limit = entry.partition("=")
+        if name.strip() == provider and limit.strip().isdigit():
+            return max(1, int(limit))
+    limit = profile.max_connections(settings) if callable(profile.max_connections) else profile.max_connections
+    return max(1, limit or settings.http_client_max_connections)
+
+
+@lru_cache
+def _http2_installed() -> bool:
+    return find_spec("h2") is not None
+
+
+class _RequestTrace:
+    """httpcore trace hook noting whether a request had to open a connection."""
+
+    __slots__ = ("started_at", "opened_connection")
+
+    def __init__(self) -> None:
+        self.started_at = perf_counter()
+        self.opened_connection = False
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:  # noqa: ARG002
+        if event_name.startswith("connection.connect_tcp."):
+            self.opened_connection = True
+
+
+def _start_request_trace(request: httpx.Request) -> None:
+    if "trace" not in request.extensions:
+        request.extensions["trace"] = _RequestTrace()
+
+
+def _response_observer(provider: str):  # noqa: ANN202
+    def observe(response: httpx.Response) -> None:
+        trace = response.request.extensions.get("trace")
+        if not isinstance(trace, _RequestTrace):
+            return
+        http_client_request_duration_seconds.labels(provider=provider).observe(perf_counter() - trace.started_at)
+        http_client_requests_total.labels(
+            provider=provider,
+            connection="new" if trace.opened_connection else "reused",
+        ).inc()
+
+    return observe
@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 import httpx
 
 from app.core.config import get_settings
+from app.providers.http_clients import get_http_client
 
 
 @dataclass(frozen=True)
@@ -94,15 +95,8 @@ class DataForSeoLocalRankGridProvider:
 
     def _request(self, method: str, url: str, **kwargs: Any) -> dict[str, Any]:
         try:
-            if self._client is not None:
-                response = self._client.request(
-                    method, url, headers=self._headers(), timeout=self.timeout, **kwargs
-                )
-            else:
-                with httpx.Client() as client:
-                    response = client.request(
-                        method, url, headers=self._headers(), timeout=self.timeout, **kwargs
-                    )
+            client = self._client or get_http_client("dataforseo")
+            response = client.request(method, url, headers=self._headers(), timeout=self.timeout, **kwargs)
         except httpx.TimeoutException as exc:
             raise ValueError("The map search check timed out. Try again shortly.") from exc
         except httpx.HTTPError as exc:
@@ -7,23 +7,14 @@ import time
 from typing import Protocol
 from urllib.parse import urlparse
 
-import httpx
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.providers.http_clients import get_http_client
 from app.providers.proxy import get_proxy_rotation_adapter
 from app.services.provider_credentials_service import resolve_provider_credentials
 
 
-def _build_http_client(proxy: str | None):
-    if proxy:
-        try:
-            return httpx.Client(proxy=proxy)
-        except TypeError:
-            return httpx.Client()
-    return httpx.Client()
-
-
 class RankProvider(Protocol):
     def collect_keyword_snapshot(self, keyword: str, location_code: str, target_domain: str | None = None) -> dict:
         ...
@@ -101,13 +92,12 @@ class HttpJsonRankProvider:
         while attempts < 3:
             attempts += 1
             try:
-                with _build_http_client(proxy) as client:
-                    response = client.post(
-                        self.endpoint,
-                        json=payload,
-                        headers=headers,
-                        timeout=self.timeout_seconds,
-                    )
+                response = get_http_client("rank_http", proxy=proxy).post(
+                    self.endpoint,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout_seconds,
+                )
                 self._record_success()
                 break
             except Exception:
@@ -202,8 +192,9 @@ class SerpApiRankProvider:
         while attempts < 3:
             attempts += 1
             try:
-                with _build_http_client(proxy) as client:
-                    response = client.get(self.endpoint, params=params, timeout=self.timeout_seconds)
+                response = get_http_client("serpapi", proxy=proxy).get(
+                    self.endpoint, params=params, timeout=self.timeout_seconds
+                )
                 self._record_success()
                 break
             except Exception:
@@ -290,13 +281,12 @@ class DataForSeoRankProvider:
         response = None
         for attempt in range(3):
             try:
-                with _build_http_client(proxy) as client:
-                    response = client.post(
-                        self.endpoint,
-                        json=payload,
-                        headers=headers,
-                        timeout=self.timeout_seconds,
-                    )
+                response = get_http_client("dataforseo", proxy=proxy).post(
+                    self.endpoint,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout_seconds,
+                )
                 break
             except Exception:
                 if attempt < 2:
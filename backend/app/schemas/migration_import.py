@@ -25,7 +25,7 @@ class MigrationRollbackIn(BaseModel):
 class MigrationUploadCreateIn(BaseModel):
     source_system: Literal["semrush", "brightlocal", "other"] = "other"
     source_filename: str | None = Field(default=None, max_length=255)
-    total_chunks: int = Field(ge=1, le=100)
+    total_chunks: int = Field(ge=1, le=1_000)
     expected_sha256: str | None = Field(default=None, pattern=r"^[a-f0-9]{64}$")
     client_request_id: UUID
 
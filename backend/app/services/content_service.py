@@ -1,11 +1,14 @@
 import hashlib
+import heapq
 import json
+import math
 import re
+from collections import Counter, defaultdict
 from datetime import UTC, datetime
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from fastapi import HTTPException, status
-from sqlalchemy import inspect
+from sqlalchemy import insert, inspect
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import aliased
 
@@ -1736,6 +1739,11 @@ def _structured_data_recommendation(
     }
 
 
+INTERNAL_LINK_MAP_TOP_K = 5
+INTERNAL_LINK_MAP_MIN_SIMILARITY = 0.1
+INTERNAL_LINK_MAP_COMMON_TERM_SHARE = 0.5
+INTERNAL_LINK_MAP_COMMON_TERM_MIN_ASSETS = 20
+
 _INTERNAL_LINK_STOP_WORDS = frozenset(
     {
         "and",
@@ -2169,7 +2177,68 @@ def run_qc_checks(db: Session, tenant_id: str, asset_id: str) -> dict:
     return {"asset_id": asset.id, "checks": len(checks), "passed": passed_count}
 
 
-def refresh_internal_link_map(db: Session, tenant_id: str, campaign_id: str) -> dict:
+def _internal_link_map_vectors(assets: list[ContentAsset]) -> list[dict[str, float]]:
+    term_counts = [
+        Counter([*_internal_link_terms(asset.title), *_internal_link_terms(asset.cluster_name)])
+        for asset in assets
+    ]
+    document_frequency: Counter[str] = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+    asset_count = len(assets)
+    # Terms shared by most of a large campaign (the brand, the trade) would pull every asset into
+    # every other asset's candidate list while saying nothing about which pages belong together.
+    common_term_limit = (
+        asset_count * INTERNAL_LINK_MAP_COMMON_TERM_SHARE
+        if asset_count >= INTERNAL_LINK_MAP_COMMON_TERM_MIN_ASSETS
+        else asset_count
+    )
+    vectors: list[dict[str, float]] = []
+    for counts in term_counts:
+        weights = {
+            term: count * (math.log((1 + asset_count) / (1 + document_frequency[term])) + 1.0)
+            for term, count in counts.items()
+            if document_frequency[term] <= common_term_limit
+        }
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        vectors.append({term: weight / norm for term, weight in weights.items()} if norm else {})
+    return vectors
+
+
+def _top_similar_internal_link_targets(
+    vectors: list[dict[str, float]],
+    *,
+    top_k: int,
+    min_similarity: float,
+) -> list[list[tuple[int, float]]]:
+    postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+    for index, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings[term].append((index, weight))
+
+    neighbours: list[list[tuple[int, float]]] = []
+    for source_index, vector in enumerate(vectors):
+        scores: dict[int, float] = defaultdict(float)
+        for term, weight in vector.items():
+            for target_index, target_weight in postings[term]:
+                scores[target_index] += weight * target_weight
+        scores.pop(source_index, None)
+        ranked = heapq.nsmallest(
+            top_k,
+            ((-score, target_index) for target_index, score in scores.items() if score >= min_similarity),
+        )
+        neighbours.append([(target_index, -negative_score) for negative_score, target_index in ranked])
+    return neighbours
+
+
+def refresh_internal_link_map(
+    db: Session,
+    tenant_id: str,
+    campaign_id: str,
+    *,
+    top_k: int = INTERNAL_LINK_MAP_TOP_K,
+    min_similarity: float = INTERNAL_LINK_MAP_MIN_SIMILARITY,
+) -> dict:
     published_assets = (
         db.query(ContentAsset)
         .filter(
@@ -2177,7 +2246,7 @@ def refresh_internal_link_map(db: Session, tenant_id: str, campaign_id: str) ->
             ContentAsset.campaign_id == campaign_id,
             ContentAsset.status == "published",
         )
-        .order_by(ContentAsset.updated_at.desc())
+        .order_by(ContentAsset.updated_at.desc(), ContentAsset.id)
         .all()
     )
     db.query(InternalLinkMap).filter(
@@ -2185,25 +2254,27 @@ def refresh_internal_link_map(db: Session, tenant_id: str, campaign_id: str) ->
         InternalLinkMap.campaign_id == campaign_id,
     ).delete()
 
-    link_count = 0
-    for i, source in enumerate(published_assets):
-        for j, target in enumerate(published_assets):
-            if i == j:
-                continue
-            anchor = target.cluster_name.lower()
-            db.add(
-                InternalLinkMap(
-                    tenant_id=tenant_id,
-                    campaign_id=campaign_id,
-                    source_asset_id=source.id,
-                    target_asset_id=target.id,
-                    anchor_text=anchor[:255],
-                    confidence=0.8,
-                )
-            )
-            link_count += 1
+    neighbours = _top_similar_internal_link_targets(
+        _internal_link_map_vectors(published_assets),
+        top_k=max(0, top_k),
+        min_similarity=min_similarity,
+    )
+    rows = [
+        {
+            "tenant_id": tenant_id,
+            "campaign_id": campaign_id,
+            "source_asset_id": source.id,
+            "target_asset_id": published_assets[target_index].id,
+            "anchor_text": published_assets[target_index].cluster_name.lower()[:255],
+            "confidence": round(similarity, 4),
+        }
+        for source, targets in zip(published_assets, neighbours)
+        for target_index, similarity in targets
+    ]
+    if rows:
+        db.execute(insert(InternalLinkMap), rows)
     db.commit()
-    return {"campaign_id": campaign_id, "link_recommendations": link_count}
+    return {"campaign_id": campaign_id, "link_recommendations": len(rows)}
 
 
 def get_link_recommendations(db: Session, tenant_id: str, campaign_id: str) -> list[dict]:
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_UP
+import logging
+from threading import Lock
+from time import monotonic
 from typing import Any
+import uuid
 
-from sqlalchemy import func
+from sqlalchemy import event, func, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.cost_economics import CostLedgerEntry, OrganizationCostAllocation, ProviderPriceCard
+from app.models.cost_economics import (
+    CostLedgerEntry,
+    OrganizationCostAllocation,
+    OrganizationCostExposure,
+    ProviderPriceCard,
+)
 from app.models.organization import Organization
 from app.providers.keyword_research import MAX_COMPETITOR_DOMAINS_PER_REFRESH
 
@@ -19,6 +31,11 @@ DISPLAY_MONEY = Decimal("0.01")
 ONE_MILLION = Decimal("1000000")
 CREDIT_COST_QUANTUM = Decimal("0.01")
 CREDIT_POLICY_VERSION = "insight-credits-2026-08-v1"
+# Price cards change by migration or operator edit; ORM writes in this process
+# clear the cache immediately and the TTL bounds staleness from other writers.
+PRICE_CARD_CACHE_TTL_SECONDS = 300.0
+
+logger = logging.getLogger("lsos.cost_economics")
 
 CREDIT_ACTION_CATALOG: dict[tuple[str, str], tuple[str, str]] = {
     ("directory_listing_discovery", "business_listings_live_limit_20"): (
@@ -122,6 +139,39 @@ PLAN_ALIASES = {
 }
 
 
+@dataclass(frozen=True)
+class _PriceCard:
+    """Session-independent copy of a price card row, safe to share across requests."""
+
+    version: str
+    unit: str
+    unit_cost: Decimal
+    input_token_cost_per_million: Decimal | None
+    cached_input_token_cost_per_million: Decimal | None
+    output_token_cost_per_million: Decimal | None
+    currency: str
+    effective_from: datetime
+    effective_to: datetime | None
+
+    @classmethod
+    def from_row(cls, row: ProviderPriceCard) -> _PriceCard:
+        return cls(
+            version=row.version,
+            unit=row.unit,
+            unit_cost=row.unit_cost,
+            input_token_cost_per_million=row.input_token_cost_per_million,
+            cached_input_token_cost_per_million=row.cached_input_token_cost_per_million,
+            output_token_cost_per_million=row.output_token_cost_per_million,
+            currency=row.currency,
+            effective_from=_as_utc(row.effective_from),
+            effective_to=_as_utc(row.effective_to) if row.effective_to is not None else None,
+        )
+
+
+_PRICE_CARD_CACHE: dict[tuple[str, str, str, str, str], tuple[float, list[_PriceCard]]] = {}
+_PRICE_CARD_CACHE_LOCK = Lock()
+
+
 class CostEconomicsError(RuntimeError):
     def __init__(self, message: str, *, reason_code: str, status_code: int) -> None:
         super().__init__(message)
@@ -158,6 +208,14 @@ def resolve_plan_economics(plan_type: str) -> PlanEconomics:
     return PLAN_ECONOMICS[normalized]
 
 
+@dataclass(frozen=True)
+class ProviderCostUnit:
+    """One unit of provider work reserved by ``reserve_provider_cost_batch``."""
+
+    idempotency_key: str
+    quantity: Decimal | int | float | str
+
+
 def reserve_provider_cost(
     db: Session,
     *,
@@ -176,6 +234,82 @@ def reserve_provider_cost(
     output_tokens: int | None = None,
     now: datetime | None = None,
 ) -> CostLedgerEntry:
+    return _reserve_units(
+        db,
+        organization_id=organization_id,
+        provider_name=provider_name,
+        capability=capability,
+        operation=operation,
+        credential_owner=credential_owner,
+        units=[ProviderCostUnit(idempotency_key=idempotency_key, quantity=quantity)],
+        business_location_id=business_location_id,
+        campaign_id=campaign_id,
+        model_name=model_name,
+        input_tokens=input_tokens,
+        cached_input_tokens=cached_input_tokens,
+        output_tokens=output_tokens,
+        now=now,
+    )[0]
+
+
+def reserve_provider_cost_batch(
+    db: Session,
+    *,
+    organization_id: str,
+    provider_name: str,
+    capability: str,
+    operation: str,
+    credential_owner: str,
+    units: Sequence[ProviderCostUnit],
+    business_location_id: str | None = None,
+    campaign_id: str | None = None,
+    model_name: str | None = None,
+    now: datetime | None = None,
+) -> list[CostLedgerEntry]:
+    """Reserve many units of one provider operation under one lock and one commit.
+
+    Returns one reservation per unit in input order. Units whose idempotency
+    key was already reserved return the existing row and add no exposure. The
+    allowance is checked against the batch total, so either every new unit is
+    reserved or none is.
+    """
+    if not units:
+        return []
+    return _reserve_units(
+        db,
+        organization_id=organization_id,
+        provider_name=provider_name,
+        capability=capability,
+        operation=operation,
+        credential_owner=credential_owner,
+        units=list(units),
+        business_location_id=business_location_id,
+        campaign_id=campaign_id,
+        model_name=model_name,
+        input_tokens=None,
+        cached_input_tokens=None,
+        output_tokens=None,
+        now=now,
+    )
+
+
+def _reserve_units(
+    db: Session,
+    *,
+    organization_id: str,
+    provider_name: str,
+    capability: str,
+    operation: str,
+    credential_owner: str,
+    units: list[ProviderCostUnit],
+    business_location_id: str | None,
+    campaign_id: str | None,
+    model_name: str | None,
+    input_tokens: int | None,
+    cached_input_tokens: int | None,
+    output_tokens: int | None,
+    now: datetime | None,
+) -> list[CostLedgerEntry]:
     if credential_owner not in {"platform", "organization"}:
         raise CostEconomicsError(
             "credential_owner must be platform or organization.",
@@ -217,17 +351,14 @@ def reserve_provider_cost(
             status_code=409,
         ) from exc
 
-    existing = (
-        db.query(CostLedgerEntry)
-        .filter(
-            CostLedgerEntry.organization_id == organization_id,
-            CostLedgerEntry.idempotency_key == idempotency_key,
-            CostLedgerEntry.event_type == "reservation",
-        )
-        .first()
-    )
-    if existing is not None:
-        return existing
+    keys = [unit.idempotency_key for unit in units]
+    existing = _reservations_by_key(db, organization_id=organization_id, idempotency_keys=keys)
+    pending: dict[str, ProviderCostUnit] = {}
+    for unit in units:
+        if unit.idempotency_key not in existing:
+            pending.setdefault(unit.idempotency_key, unit)
+    if not pending:
+        return [existing[key] for key in keys]
 
     plan = resolve_plan_economics(org.plan_type)
     price_card = _find_price_card(
@@ -238,94 +369,108 @@ def reserve_provider_cost(
         model_name=model_name,
         now=occurred_at,
     )
-    normalized_quantity = Decimal(str(quantity))
-    estimated_cost = _estimate_cost(
-        price_card,
-        quantity=normalized_quantity,
-        input_tokens=input_tokens,
-        cached_input_tokens=cached_input_tokens,
-        output_tokens=output_tokens,
-    )
-    budget_impact = estimated_cost if credential_owner == "platform" else Decimal("0")
-    requested_credit_units = (
-        _credits_for_cost(estimated_cost) if credential_owner == "platform" else 0
-    )
-
-    if credential_owner == "platform":
-        period_start, period_end = period_bounds(occurred_at)
-        current_exposure = _platform_exposure(
-            db,
-            organization_id=organization_id,
-            period_start=period_start,
-            period_end=period_end,
+    priced: list[tuple[ProviderCostUnit, Decimal, Decimal, Decimal, int]] = []
+    for unit in pending.values():
+        normalized_quantity = Decimal(str(unit.quantity))
+        estimated_cost = _estimate_cost(
+            price_card,
+            quantity=normalized_quantity,
+            input_tokens=input_tokens,
+            cached_input_tokens=cached_input_tokens,
+            output_tokens=output_tokens,
         )
-        current_credit_exposure = _platform_credit_exposure(
-            db,
-            organization_id=organization_id,
-            period_start=period_start,
-            period_end=period_end,
+        budget_impact = estimated_cost if credential_owner == "platform" else Decimal("0")
+        requested_credit_units = (
+            _credits_for_cost(estimated_cost) if credential_owner == "platform" else 0
         )
-        if current_credit_exposure + requested_credit_units > _plan_credit_allowance(plan):
+        priced.append((unit, normalized_quantity, estimated_cost, budget_impact, requested_credit_units))
+
+    if credential_owner == "platform":
+        requested_cost = _money(sum((item[3] for item in priced), Decimal("0")))
+        requested_credits = sum(item[4] for item in priced)
+        exposure = _locked_exposure(db, organization_id=organization_id, occurred_at=occurred_at)
+        current_exposure = _money(Decimal(exposure.budget_impact_cost))
+        current_credit_exposure = max(0, int(exposure.customer_credit_units))
+        if current_credit_exposure + requested_credits > _plan_credit_allowance(plan):
             raise CostAllowanceExceeded(
                 budget=plan.initial_api_budget,
                 current_exposure=current_exposure,
-                requested_cost=budget_impact,
+                requested_cost=requested_cost,
             )
-        if current_exposure + budget_impact > plan.initial_api_budget:
+        if current_exposure + requested_cost > plan.initial_api_budget:
             raise CostAllowanceExceeded(
                 budget=plan.initial_api_budget,
                 current_exposure=current_exposure,
-                requested_cost=budget_impact,
+                requested_cost=requested_cost,
             )
+        _add_exposure(
+            exposure,
+            budget_impact=requested_cost,
+            credit_units=requested_credits,
+            occurred_at=occurred_at,
+        )
 
-    row = CostLedgerEntry(
-        organization_id=organization_id,
-        business_location_id=business_location_id,
-        campaign_id=campaign_id,
-        provider_name=provider_name,
-        capability=capability,
-        operation=operation,
-        credential_owner=credential_owner,
-        quantity=normalized_quantity,
-        unit=price_card.unit,
-        estimated_cost=estimated_cost,
-        provider_reported_cost=None,
-        budget_impact_cost=budget_impact,
-        customer_credit_units=requested_credit_units,
-        credit_policy_version=CREDIT_POLICY_VERSION,
-        currency=price_card.currency,
-        status="reserved",
-        event_type="reservation",
-        idempotency_key=idempotency_key,
-        reservation_id=None,
-        price_card_version=price_card.version,
-        plan_code=plan.code,
-        plan_revenue_snapshot=plan.monthly_revenue,
-        model_name=model_name,
-        input_tokens=_nonnegative_int(input_tokens),
-        cached_input_tokens=_nonnegative_int(cached_input_tokens),
-        output_tokens=_nonnegative_int(output_tokens),
-        created_at=occurred_at,
-    )
-    db.add(row)
+    rows: dict[str, CostLedgerEntry] = {}
+    for unit, normalized_quantity, estimated_cost, budget_impact, requested_credit_units in priced:
+        rows[unit.idempotency_key] = CostLedgerEntry(
+            organization_id=organization_id,
+            business_location_id=business_location_id,
+            campaign_id=campaign_id,
+            provider_name=provider_name,
+            capability=capability,
+            operation=operation,
+            credential_owner=credential_owner,
+            quantity=normalized_quantity,
+            unit=price_card.unit,
+            estimated_cost=estimated_cost,
+            provider_reported_cost=None,
+            budget_impact_cost=budget_impact,
+            customer_credit_units=requested_credit_units,
+            credit_policy_version=CREDIT_POLICY_VERSION,
+            currency=price_card.currency,
+            status="reserved",
+            event_type="reservation",
+            idempotency_key=unit.idempotency_key,
+            reservation_id=None,
+            price_card_version=price_card.version,
+            plan_code=plan.code,
+            plan_revenue_snapshot=plan.monthly_revenue,
+            model_name=model_name,
+            input_tokens=_nonnegative_int(input_tokens),
+            cached_input_tokens=_nonnegative_int(cached_input_tokens),
+            output_tokens=_nonnegative_int(output_tokens),
+            created_at=occurred_at,
+        )
+    db.add_all(rows.values())
     try:
         db.commit()
     except IntegrityError:
         db.rollback()
-        concurrent = (
-            db.query(CostLedgerEntry)
-            .filter(
-                CostLedgerEntry.organization_id == organization_id,
-                CostLedgerEntry.idempotency_key == idempotency_key,
-                CostLedgerEntry.event_type == "reservation",
-            )
-            .first()
-        )
-        if concurrent is not None:
-            return concurrent
+        concurrent = _reservations_by_key(db, organization_id=organization_id, idempotency_keys=keys)
+        if all(key in concurrent for key in keys):
+            return [concurrent[key] for key in keys]
         raise
-    db.refresh(row)
-    return row
+    # One query reloads every committed row instead of a refresh per unit.
+    reserved = _reservations_by_key(db, organization_id=organization_id, idempotency_keys=list(rows))
+    return [existing.get(key) or reserved[key] for key in keys]
+
+
+def _reservations_by_key(
+    db: Session,
+    *,
+    organization_id: str,
+    idempotency_keys: list[str],
+) -> dict[str, CostLedgerEntry]:
+    rows = (
+        db.query(CostLedgerEntry)
+        .filter(
+            CostLedgerEntry.organization_id == organization_id,
+            CostLedgerEntry.idempotency_key.in_(set(idempotency_keys)),
+            CostLedgerEntry.event_type == "reservation",
+        )
+        .all()
+    )
+    return {row.idempotency_key: row for row in rows}
 
 
 def authorize_reserved_provider_dispatch(
@@ -442,6 +587,108 @@ def reconcile_provider_cost(
     if existing is not None:
         return existing
     occurred_at = _as_utc(now or datetime.now(UTC))
+    row = _reconciliation_event(
+        reservation_row,
+        provider_reported_cost=provider_reported_cost,
+        occurred_at=occurred_at,
+    )
+    _record_terminal_exposure(db, reservation_row, row)
+    db.add(row)
+    db.commit()
+    db.refresh(row)
+    return row
+
+
+def reconcile_provider_cost_batch(
+    db: Session,
+    *,
+    reconciliations: Sequence[tuple[CostLedgerEntry | str, Decimal | int | float | str | None]],
+    now: datetime | None = None,
+) -> list[CostLedgerEntry]:
+    """Reconcile many reservations with one exposure lock per organization and one commit.
+
+    The counterpart of ``reserve_provider_cost_batch``. Returns one
+    reconciliation per input in order; reservations that were already
+    reconciled return the existing row and add no exposure.
+    """
+    if not reconciliations:
+        return []
+    occurred_at = _as_utc(now or datetime.now(UTC))
+    reservation_ids = [
+        reservation if isinstance(reservation, str) else str(inspect(reservation).identity[0])
+        for reservation, _cost in reconciliations
+    ]
+    # Reservations expired by earlier commits are reloaded together, not one by one.
+    loaded = {
+        row.id: row
+        for row in db.query(CostLedgerEntry)
+        .filter(
+            CostLedgerEntry.id.in_(set(reservation_ids)),
+            CostLedgerEntry.event_type == "reservation",
+        )
+        .all()
+    }
+    missing = [reservation_id for reservation_id in reservation_ids if reservation_id not in loaded]
+    if missing:
+        raise CostEconomicsError(
+            "Cost reservation not found.",
+            reason_code="cost_reservation_not_found",
+            status_code=404,
+        )
+    terminal = {
+        row.reservation_id: row
+        for row in db.query(CostLedgerEntry)
+        .filter(
+            CostLedgerEntry.reservation_id.in_(set(reservation_ids)),
+            CostLedgerEntry.event_type == "reconciliation",
+        )
+        .all()
+    }
+    created: dict[str, CostLedgerEntry] = {}
+    for reservation_id, (_reservation, provider_reported_cost) in zip(reservation_ids, reconciliations):
+        if reservation_id in terminal or reservation_id in created:
+            continue
+        created[reservation_id] = _reconciliation_event(
+            loaded[reservation_id],
+            provider_reported_cost=provider_reported_cost,
+            occurred_at=occurred_at,
+        )
+    exposure_deltas: dict[str, tuple[Decimal, int]] = {}
+    for reservation_id, row in created.items():
+        if loaded[reservation_id].credential_owner != "platform":
+            continue
+        budget, credits = exposure_deltas.get(str(row.organization_id), (Decimal("0"), 0))
+        exposure_deltas[str(row.organization_id)] = (
+            budget + Decimal(row.budget_impact_cost),
+            credits + int(row.customer_credit_units or 0),
+        )
+    # Counters are locked in organization order, as the counter reconcile takes them.
+    for organization_id in sorted(exposure_deltas):
+        budget, credits = exposure_deltas[organization_id]
+        if not budget and not credits:
+            continue
+        exposure = _locked_exposure(db, organization_id=organization_id, occurred_at=occurred_at)
+        _add_exposure(exposure, budget_impact=_money(budget), credit_units=credits, occurred_at=occurred_at)
+    db.add_all(created.values())
+    db.flush()
+    created_ids = {reservation_id: row.id for reservation_id, row in created.items()}
+    db.commit()
+    reloaded = {
+        row.id: row
+        for row in db.query(CostLedgerEntry).filter(CostLedgerEntry.id.in_(list(created_ids.values()))).all()
+    }
+    return [
+        terminal.get(reservation_id) or reloaded[created_ids[reservation_id]]
+        for reservation_id in reservation_ids
+    ]
+
+
+def _reconciliation_event(
+    reservation_row: CostLedgerEntry,
+    *,
+    provider_reported_cost: Decimal | int | float | str | None,
+    occurred_at: datetime,
+) -> CostLedgerEntry:
     actual_cost = (
         _money(Decimal(str(provider_reported_cost)))
         if provider_reported_cost is not None
@@ -463,7 +710,7 @@ def reconcile_provider_cost(
         _credits_for_cost(actual_cost) if reservation_row.credential_owner == "platform" else 0
     )
     credit_delta = actual_credit_units - int(reservation_row.customer_credit_units or 0)
-    row = _terminal_ledger_event(
+    return _terminal_ledger_event(
         reservation_row,
         event_type="reconciliation",
         status="reconciled",
@@ -472,10 +719,6 @@ def reconcile_provider_cost(
         customer_credit_units=credit_delta,
         occurred_at=occurred_at,
     )
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return row
 
 
 def release_provider_cost(
@@ -511,6 +754,7 @@ def release_provider_cost(
         customer_credit_units=credit_delta,
         occurred_at=occurred_at,
     )
+    _record_terminal_exposure(db, reservation_row, row)
     db.add(row)
     db.commit()
     db.refresh(row)
@@ -906,32 +1150,70 @@ def _find_price_card(
     operation: str,
     model_name: str | None,
     now: datetime,
-) -> ProviderPriceCard:
-    row = (
+) -> _PriceCard:
+    moment = _as_utc(now)
+    for card in _active_price_cards(
+        db,
+        provider_name=provider_name,
+        capability=capability,
+        operation=operation,
+        model_name=model_name or "",
+    ):
+        if card.effective_from <= moment and (card.effective_to is None or card.effective_to > moment):
+            return card
+    raise CostEconomicsError(
+        f"No active price card exists for {provider_name}/{capability}/{operation}.",
+        reason_code="provider_price_card_missing",
+        status_code=409,
+    )
+
+
+def _active_price_cards(
+    db: Session,
+    *,
+    provider_name: str,
+    capability: str,
+    operation: str,
+    model_name: str,
+) -> list[_PriceCard]:
+    cache_key = (str(db.get_bind().url), provider_name, capability, operation, model_name)
+    with _PRICE_CARD_CACHE_LOCK:
+        cached = _PRICE_CARD_CACHE.get(cache_key)
+    if cached is not None and monotonic() - cached[0] < PRICE_CARD_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    rows = (
         db.query(ProviderPriceCard)
         .filter(
             ProviderPriceCard.provider_name == provider_name,
             ProviderPriceCard.capability == capability,
             ProviderPriceCard.operation == operation,
-            ProviderPriceCard.model_name == (model_name or ""),
+            ProviderPriceCard.model_name == model_name,
             ProviderPriceCard.active.is_(True),
-            ProviderPriceCard.effective_from <= now,
-            (ProviderPriceCard.effective_to.is_(None) | (ProviderPriceCard.effective_to > now)),
         )
         .order_by(ProviderPriceCard.effective_from.desc(), ProviderPriceCard.created_at.desc())
-        .first()
+        .all()
     )
-    if row is None:
-        raise CostEconomicsError(
-            f"No active price card exists for {provider_name}/{capability}/{operation}.",
-            reason_code="provider_price_card_missing",
-            status_code=409,
-        )
-    return row
+    cards = [_PriceCard.from_row(row) for row in rows]
+    with _PRICE_CARD_CACHE_LOCK:
+        _PRICE_CARD_CACHE[cache_key] = (monotonic(), cards)
+    return cards
+
+
+def invalidate_price_card_cache() -> None:
+    with _PRICE_CARD_CACHE_LOCK:
+        _PRICE_CARD_CACHE.clear()
+
+
+@event.listens_for(ProviderPriceCard, "after_insert")
+@event.listens_for(ProviderPriceCard, "after_update")
+@event.listens_for(ProviderPriceCard, "after_delete")
+def _invalidate_price_cards_on_write(_mapper: Any, _connection: Any, _target: ProviderPriceCard) -> None:
+    invalidate_price_card_cache()
 
 
 def _estimate_cost(
-    price_card: ProviderPriceCard,
+    price_card: _PriceCard | ProviderPriceCard,
     *,
     quantity: Decimal,
     input_tokens: int | None,
@@ -983,24 +1265,170 @@ def _platform_exposure(
     return _money(Decimal(str(value or 0)))
 
 
-def _platform_credit_exposure(
+def _ledger_exposure_totals(
     db: Session,
     *,
-    organization_id: str,
     period_start: datetime,
     period_end: datetime,
-) -> int:
-    value = (
-        db.query(func.coalesce(func.sum(CostLedgerEntry.customer_credit_units), 0))
-        .filter(
-            CostLedgerEntry.organization_id == organization_id,
-            CostLedgerEntry.credential_owner == "platform",
-            CostLedgerEntry.created_at >= period_start,
-            CostLedgerEntry.created_at < period_end,
+    organization_ids: list[str] | None = None,
+) -> dict[str, tuple[Decimal, int]]:
+    query = db.query(
+        CostLedgerEntry.organization_id,
+        func.coalesce(func.sum(CostLedgerEntry.budget_impact_cost), 0),
+        func.coalesce(func.sum(CostLedgerEntry.customer_credit_units), 0),
+    ).filter(
+        CostLedgerEntry.credential_owner == "platform",
+        CostLedgerEntry.created_at >= period_start,
+        CostLedgerEntry.created_at < period_end,
+    )
+    if organization_ids is not None:
+        query = query.filter(CostLedgerEntry.organization_id.in_(organization_ids))
+    return {
+        str(organization_id): (_money(Decimal(str(budget or 0))), int(credits or 0))
+        for organization_id, budget, credits in query.group_by(CostLedgerEntry.organization_id).all()
+    }
+
+
+def _locked_exposure(db: Session, *, organization_id: str, occurred_at: datetime) -> OrganizationCostExposure:
+    """Lock the period's running exposure, seeding it from the ledger on first use.
+
+    Callers must update the counter before adding their own ledger row, so the
+    seed never counts that row twice.
+    """
+    period_start, period_end = period_bounds(occurred_at)
+
+    def _select() -> OrganizationCostExposure | None:
+        return (
+            db.query(OrganizationCostExposure)
+            .filter(
+                OrganizationCostExposure.organization_id == organization_id,
+                OrganizationCostExposure.period_start == period_start,
+            )
+            .populate_existing()
+            .with_for_update()
+            .one_or_none()
         )
-        .scalar()
+
+    exposure = _select()
+    if exposure is not None:
+        return exposure
+    budget, credits = _ledger_exposure_totals(
+        db,
+        period_start=period_start,
+        period_end=period_end,
+        organization_ids=[organization_id],
+    ).get(organization_id, (Decimal("0"), 0))
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    db.execute(
+        insert(OrganizationCostExposure)
+        .values(
+            id=str(uuid.uuid4()),
+            organization_id=organization_id,
+            period_start=period_start,
+            budget_impact_cost=budget,
+            customer_credit_units=credits,
+            updated_at=datetime.now(UTC),
+        )
+        .on_conflict_do_nothing(index_elements=["organization_id", "period_start"])
     )
-    return max(0, int(value or 0))
+    return _select()
+
+
+def _add_exposure(
+    exposure: OrganizationCostExposure,
+    *,
+    budget_impact: Decimal,
+    credit_units: int,
+    occurred_at: datetime,
+) -> None:
+    exposure.budget_impact_cost = _money(Decimal(exposure.budget_impact_cost) + budget_impact)
+    exposure.customer_credit_units = int(exposure.customer_credit_units) + int(credit_units)
+    exposure.updated_at = occurred_at
+
+
+def _record_terminal_exposure(db: Session, reservation: CostLedgerEntry, row: CostLedgerEntry) -> None:
+    if reservation.credential_owner != "platform":
+        return
+    budget_impact = Decimal(row.budget_impact_cost)
+    credit_units = int(row.customer_credit_units or 0)
+    if not budget_impact and not credit_units:
+        return
+    exposure = _locked_exposure(db, organization_id=str(row.organization_id), occurred_at=row.created_at)
+    _add_exposure(exposure, budget_impact=budget_impact, credit_units=credit_units, occurred_at=row.created_at)
+
+
+def reconcile_cost_exposure_counters(
+    db: Session,
+    *,
+    now: datetime | None = None,
+    repair: bool = True,
+) -> dict[str, Any]:
+    """Verify the current period's running exposure counters against the ledger.
+
+    Responsibility: safety net for the counters maintained by reservation,
+    reconciliation and release (for example after a manual ledger repair).
+    Inputs: caller-managed DB session; ``now`` selects the billing period.
+    Side effects: when ``repair`` is set, each organization's counter is
+    locked, recounted, rewritten if it drifted and committed on its own.
+    Idempotency: repeated runs are no-ops once counters match.
+    """
+    period_start, period_end = period_bounds(now or datetime.now(UTC))
+    organization_ids = [
+        str(organization_id)
+        for (organization_id,) in db.query(OrganizationCostExposure.organization_id)
+        .filter(OrganizationCostExposure.period_start == period_start)
+        .order_by(OrganizationCostExposure.organization_id.asc())
+        .all()
+    ]
+    if repair:
+        db.commit()
+    drifted: list[dict[str, Any]] = []
+    for organization_id in organization_ids:
+        # Reservations update their locked counter before adding their ledger
+        # row, so the counter is locked before its ledger is summed. Otherwise a
+        # reservation committing between the sum and the rewrite would be lost.
+        query = db.query(OrganizationCostExposure).filter(
+            OrganizationCostExposure.organization_id == organization_id,
+            OrganizationCostExposure.period_start == period_start,
+        )
+        if repair:
+            query = query.populate_existing().with_for_update()
+        counter = query.one_or_none()
+        if counter is None:
+            continue
+        budget, credits = _ledger_exposure_totals(
+            db,
+            period_start=period_start,
+            period_end=period_end,
+            organization_ids=[organization_id],
+        ).get(organization_id, (Decimal("0"), 0))
+        counter_budget = _money(Decimal(counter.budget_impact_cost))
+        counter_credits = int(counter.customer_credit_units)
+        if counter_budget != budget or counter_credits != credits:
+            drifted.append(
+                {
+                    "organization_id": organization_id,
+                    "budget_drift": float(counter_budget - budget),
+                    "credit_drift": counter_credits - credits,
+                }
+            )
+            if repair:
+                counter.budget_impact_cost = budget
+                counter.customer_credit_units = credits
+                counter.updated_at = datetime.now(UTC)
+        if repair:
+            db.commit()
+    if drifted:
+        logger.warning(
+            "cost_exposure_counter_drift",
+            extra={"period_start": period_start.isoformat(), "drift": drifted, "repaired": repair},
+        )
+    return {
+        "period_start": period_start.isoformat(),
+        "counters_checked": len(organization_ids),
+        "counters_drifted": len(drifted),
+        "repaired": repair and bool(drifted),
+    }
 
 
 def _reservation_or_error(db: Session, reservation: CostLedgerEntry | str) -> CostLedgerEntry:
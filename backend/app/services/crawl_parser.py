@@ -1,9 +1,21 @@
 import html as html_lib
 import hashlib
 import json
+import math
 import re
+import struct
+from collections.abc import Sequence
 from urllib.parse import urljoin, urlparse
 
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+MINHASH_SHINGLE_WORDS = 3
+# Pages sharing at least this estimated share of word shingles are reported as
+# near-duplicates; a changed date or sidebar on a templated page stays well above it.
+NEAR_DUPLICATE_MIN_SIMILARITY = 0.7
+
+_MINHASH_STRUCT = struct.Struct(f">{MINHASH_PERMUTATIONS}I")
+
 
 def parse_signals(url: str, html: str) -> dict:
     lower = html.lower()
@@ -48,11 +60,13 @@ def parse_signals(url: str, html: str) -> dict:
     body_text_excerpt = body_text[:2000] if body_text else None
     normalized_body = re.sub(r"\s+", " ", (body_text or "").lower()).strip()
     word_count = len(normalized_body.split()) if normalized_body else 0
+    fingerprint_eligible = len(normalized_body) >= 100 and word_count >= 20
     content_hash = (
         hashlib.sha256(normalized_body.encode("utf-8")).hexdigest()
-        if len(normalized_body) >= 100 and word_count >= 20
+        if fingerprint_eligible
         else None
     )
+    content_minhash = content_minhash_for_text(normalized_body) if fingerprint_eligible else None
     structured_data_types, structured_data_errors = _structured_data(html)
     origin = urlparse(url)
     internal_links = len(
@@ -72,6 +86,7 @@ def parse_signals(url: str, html: str) -> dict:
         "heading_text": heading_text,
         "body_text_excerpt": body_text_excerpt,
         "content_hash": content_hash,
+        "content_minhash": content_minhash,
         "word_count": word_count,
         "h1_count": h1_count,
         "internal_links": internal_links,
@@ -81,6 +96,106 @@ def parse_signals(url: str, html: str) -> dict:
     }
 
 
+def content_minhash_for_text(text: str) -> str | None:
+    """Return a MinHash signature of the text's word shingles as hex."""
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return None
+    width = min(MINHASH_SHINGLE_WORDS, len(words))
+    shingles = {" ".join(words[index : index + width]) for index in range(len(words) - width + 1)}
+    # One extendable-output digest per shingle supplies an independent 32-bit hash
+    # for every permutation, so the per-slot minimum is taken column by column.
+    hashed = [
+        _MINHASH_STRUCT.unpack(hashlib.shake_128(shingle.encode("utf-8")).digest(_MINHASH_STRUCT.size))
+        for shingle in shingles
+    ]
+    return b"".join(value.to_bytes(4, "big") for value in map(min, zip(*hashed))).hex()
+
+
+def minhash_similarity(left: str, right: str) -> float:
+    """Estimate the Jaccard similarity of two pages from their MinHash signatures."""
+    return _shared_minhashes(_minhash_values(left), _minhash_values(right)) / MINHASH_PERMUTATIONS
+
+
+def near_duplicate_clusters(
+    signatures: Sequence[str],
+    *,
+    min_similarity: float = NEAR_DUPLICATE_MIN_SIMILARITY,
+) -> list[list[int]]:
+    """Group signature positions whose estimated similarity reaches min_similarity.
+
+    Signatures are split into bands and only pages sharing an identical band become
+    candidates, so unrelated pages are never compared. Within a bucket each page is
+    compared with the first page of every cluster already found there, which keeps
+    large template families linear instead of pairwise.
+
+    Earlier positions are preferred: each returned cluster starts with its lowest
+    position and every other member reaches min_similarity against that page, so a
+    chain of pairwise matches never pulls in a page that is not a near duplicate of
+    the page it is reported against.
+    """
+    values = [_minhash_values(signature) for signature in signatures]
+    rows_per_band = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    required_matches = math.ceil(min_similarity * MINHASH_PERMUTATIONS)
+    parent = list(range(len(values)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for band in range(MINHASH_BANDS):
+        start = band * rows_per_band
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        for index, value in enumerate(values):
+            buckets.setdefault(value[start : start + rows_per_band], []).append(index)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            representatives: list[int] = []
+            for index in members:
+                matched = False
+                for representative in representatives:
+                    if find(index) == find(representative):
+                        matched = True
+                        continue
+                    if _shared_minhashes(values[index], values[representative]) >= required_matches:
+                        matched = True
+                        left, right = find(index), find(representative)
+                        parent[max(left, right)] = min(left, right)
+                if not matched:
+                    representatives.append(index)
+
+    components: dict[int, list[int]] = {}
+    for index in range(len(values)):
+        components.setdefault(find(index), []).append(index)
+
+    clusters: list[list[int]] = []
+    for members in components.values():
+        remaining = members
+        while len(remaining) > 1:
+            preferred, *others = remaining
+            cluster = [preferred]
+            remaining = []
+            for index in others:
+                if _shared_minhashes(values[index], values[preferred]) >= required_matches:
+                    cluster.append(index)
+                else:
+                    remaining.append(index)
+            if len(cluster) > 1:
+                clusters.append(cluster)
+    return clusters
+
+
+def _shared_minhashes(left: tuple[int, ...], right: tuple[int, ...]) -> int:
+    return sum(1 for a, b in zip(left, right) if a == b)
+
+
+def _minhash_values(signature: str) -> tuple[int, ...]:
+    return _MINHASH_STRUCT.unpack(bytes.fromhex(signature))
+
+
 def _clean_visible_text(value: str, *, limit: int) -> str | None:
     without_tags = re.sub(r"<[^>]+>", " ", str(value))
     cleaned = re.sub(r"\s+", " ", html_lib.unescape(without_tags)).strip()
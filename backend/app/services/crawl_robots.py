@@ -0,0 +1,302 @@
+"""Robots Exclusion Protocol (RFC 9309) parsing, matching and caching."""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, time
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.metrics import crawl_robots_cache_requests_total
+
+# RFC 9309 2.5: crawlers must parse at least the first 500 KiB.
+ROBOTS_MAX_BYTES = 500 * 1024
+ROBOTS_FETCH_TIMEOUT_SECONDS = 5.0
+# How long a complete disallow from an unreachable robots.txt is kept before
+# the file is tried again.
+UNREACHABLE_RETRY_SECONDS = 300.0
+
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_PERCENT_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_PRODUCT_TOKEN = re.compile(r"[A-Za-z_-]+")
+# Rules are bucketed by this many leading characters of their literal prefix
+# so a path is only tested against rules that could match it.
+_BUCKET_KEY_LENGTH = 4
+_MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class _Rule:
+    allow: bool
+    pattern: str
+    prefix: str
+    matches: Callable[[str], bool]
+
+
+@dataclass(slots=True)
+class _Group:
+    agents: list[str] = field(default_factory=list)
+    rules: list[tuple[bool, str]] = field(default_factory=list)
+    crawl_delay: float | None = None
+
+
+class RobotsPolicy:
+    """Compiled allow/disallow rules for one user agent.
+
+    Rules are ordered by specificity (pattern length, Allow before Disallow on
+    a tie), so the first rule that matches a path is the one RFC 9309 says
+    wins. Patterns without ``*`` compile to prefix or exact comparisons; only
+    wildcard patterns use a regular expression.
+    """
+
+    __slots__ = ("_buckets", "_rules", "crawl_delay")
+
+    def __init__(self, rules: list[tuple[bool, str]], *, crawl_delay: float | None = None) -> None:
+        unique = {(allow, _normalize_pattern(pattern)) for allow, pattern in rules if pattern}
+        ordered = sorted(unique, key=lambda item: (-len(item[1]), not item[0]))
+        self._rules = tuple(
+            _Rule(
+                allow=allow,
+                pattern=pattern,
+                prefix=pattern.split("*", 1)[0].rstrip("$"),
+                matches=_compile_pattern(pattern),
+            )
+            for allow, pattern in ordered
+        )
+        self._buckets: dict[str, tuple[_Rule, ...]] = {}
+        self.crawl_delay = crawl_delay
+
+    def allows(self, path: str) -> bool:
+        target = _normalize_path(path)
+        if target == "/robots.txt":
+            return True
+        key = target[:_BUCKET_KEY_LENGTH]
+        rules = self._buckets.get(key)
+        if rules is None:
+            rules = tuple(rule for rule in self._rules if key.startswith(rule.prefix[: len(key)]))
+            self._buckets[key] = rules
+        for rule in rules:
+            if rule.matches(target):
+                return rule.allow
+        return True
+
+
+class RobotsTxt:
+    """A parsed robots.txt: its groups and the sitemaps it declares."""
+
+    __slots__ = ("_groups", "_policies", "sitemaps")
+
+    def __init__(self, groups: list[_Group], sitemaps: list[str]) -> None:
+        self._groups = groups
+        self._policies: dict[str, RobotsPolicy] = {}
+        self.sitemaps = sitemaps
+
+    @classmethod
+    def allow_all(cls) -> RobotsTxt:
+        return cls([], [])
+
+    @classmethod
+    def disallow_all(cls) -> RobotsTxt:
+        return cls([_Group(agents=["*"], rules=[(False, "/")])], [])
+
+    def policy_for(self, user_agent: str = "*") -> RobotsPolicy:
+        token = _product_token(user_agent)
+        policy = self._policies.get(token)
+        if policy is None:
+            matched = [group for group in self._groups if token != "*" and token in group.agents]
+            if not matched:
+                matched = [group for group in self._groups if "*" in group.agents]
+            delays = [group.crawl_delay for group in matched if group.crawl_delay is not None]
+            policy = RobotsPolicy(
+                [rule for group in matched for rule in group.rules],
+                crawl_delay=min(delays) if delays else None,
+            )
+            self._policies[token] = policy
+        return policy
+
+    def allows(self, path: str, user_agent: str = "*") -> bool:
+        return self.policy_for(user_agent).allows(path)
+
+    def crawl_delay(self, user_agent: str = "*") -> float | None:
+        return self.policy_for(user_agent).crawl_delay
+
+
+def parse_robots_txt(text: str) -> RobotsTxt:
+    groups: list[_Group] = []
+    sitemaps: list[str] = []
+    current: _Group | None = None
+    collecting_agents = False
+    for raw_line in text[:ROBOTS_MAX_BYTES].splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+        if key == "user-agent":
+            if current is None or not collecting_agents:
+                current = _Group()
+                groups.append(current)
+                collecting_agents = True
+            current.agents.append(_product_token(value))
+        elif key in {"allow", "disallow"}:
+            collecting_agents = False
+            if current is not None and value:
+                current.rules.append((key == "allow", value))
+        elif key == "crawl-delay":
+            collecting_agents = False
+            if current is not None:
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                if delay >= 0:
+                    current.crawl_delay = delay
+        elif key == "sitemap" and value:
+            sitemaps.append(value)
+    return RobotsTxt(groups, sitemaps)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedRobots:
+    robots: RobotsTxt
+    expires_at: float
+    reachable: bool
+
+
+_ROBOTS_CACHE: OrderedDict[str, _CachedRobots] = OrderedDict()
+_ROBOTS_CACHE_LOCK = Lock()
+
+
+def fetch_robots_txt(client: httpx.Client, url: str) -> RobotsTxt:
+    """Return the robots.txt that governs ``url``, cached per origin across runs.
+
+    A 2xx body is parsed, a 3xx or 4xx that the client could not resolve means
+    no restrictions, and a 5xx or network failure means complete disallow
+    (RFC 9309 2.3.1). Fetched files are kept
+    for their Cache-Control/Expires lifetime, capped at
+    CRAWL_ROBOTS_CACHE_MAX_TTL_SECONDS; while the file is unreachable a
+    previously fetched copy keeps being used.
+    """
+    parsed = urlparse(url)
+    origin = f"{parsed.scheme}://{parsed.netloc}".lower()
+    with _ROBOTS_CACHE_LOCK:
+        cached = _ROBOTS_CACHE.get(origin)
+        if cached is not None:
+            _ROBOTS_CACHE.move_to_end(origin)
+    if cached is not None and cached.expires_at > monotonic():
+        crawl_robots_cache_requests_total.labels(outcome="hit").inc()
+        return cached.robots
+    crawl_robots_cache_requests_total.labels(outcome="miss").inc()
+
+    settings = get_settings()
+    max_ttl = float(settings.crawl_robots_cache_max_ttl_seconds)
+    try:
+        response = client.get(f"{origin}/robots.txt", timeout=ROBOTS_FETCH_TIMEOUT_SECONDS)
+    except httpx.HTTPError:
+        response = None
+    now = monotonic()
+    if response is not None and 200 <= response.status_code < 300:
+        ttl = _cache_ttl(
+            response.headers,
+            default=float(settings.crawl_robots_cache_default_ttl_seconds),
+            maximum=max_ttl,
+        )
+        entry = _CachedRobots(parse_robots_txt(response.text), expires_at=now + ttl, reachable=True)
+    elif response is not None and response.status_code < 500:
+        entry = _CachedRobots(RobotsTxt.allow_all(), expires_at=now + max_ttl, reachable=True)
+    else:
+        retry_at = now + min(UNREACHABLE_RETRY_SECONDS, max_ttl)
+        if cached is not None and cached.reachable:
+            entry = _CachedRobots(cached.robots, expires_at=retry_at, reachable=True)
+        else:
+            entry = _CachedRobots(RobotsTxt.disallow_all(), expires_at=retry_at, reachable=False)
+    _store_robots(origin, entry, max_entries=int(settings.crawl_robots_cache_max_entries))
+    return entry.robots
+
+
+def clear_robots_cache() -> None:
+    with _ROBOTS_CACHE_LOCK:
+        _ROBOTS_CACHE.clear()
+
+
+def _store_robots(origin: str, entry: _CachedRobots, *, max_entries: int) -> None:
+    if max_entries <= 0:
+        return
+    with _ROBOTS_CACHE_LOCK:
+        _ROBOTS_CACHE[origin] = entry
+        _ROBOTS_CACHE.move_to_end(origin)
+        while len(_ROBOTS_CACHE) > max_entries:
+            _ROBOTS_CACHE.popitem(last=False)
+
+
+def _cache_ttl(headers: Any, *, default: float, maximum: float) -> float:
+    cache_control = str(headers.get("cache-control") or "")
+    directives = {part.strip().split("=", 1)[0].lower() for part in cache_control.split(",")}
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    max_age = _MAX_AGE.search(cache_control)
+    if max_age is not None:
+        return min(float(max_age.group(1)), maximum)
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0.0, min(parsedate_to_datetime(str(expires)).timestamp() - time(), maximum))
+        except (TypeError, ValueError):
+            return 0.0
+    return min(default, maximum)
+
+
+def _product_token(user_agent: str) -> str:
+    value = user_agent.strip().strip('"')
+    if value.startswith("*"):
+        return "*"
+    match = _PRODUCT_TOKEN.match(value)
+    return match.group(0).lower() if match else value.lower()
+
+
+def _normalize_path(path: str) -> str:
+    # RFC 9309 2.2.2: compare percent-encoded octets, with unreserved
+    # characters decoded so /%62az and /baz are the same path.
+    if not path:
+        return "/"
+    if path.isascii() and "%" not in path:
+        return path
+    encoded = "".join(
+        char if char.isascii() else "".join(f"%{byte:02X}" for byte in char.encode("utf-8"))
+        for char in path
+    )
+    return _PERCENT_ESCAPE.sub(_normalize_escape, encoded)
+
+
+def _normalize_escape(match: re.Match[str]) -> str:
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else f"%{match.group(1).upper()}"
+
+
+def _normalize_pattern(pattern: str) -> str:
+    anchored = pattern.endswith("$")
+    body = re.sub(r"\*+", "*", pattern[:-1] if anchored else pattern)
+    if body.endswith("*") and not anchored:
+        body = body.rstrip("*")
+    normalized = "*".join(_normalize_path(part) if part else "" for part in body.split("*"))
+    return f"{normalized}$" if anchored else normalized
+
+
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    anchored = pattern.endswith("$")
+    body = pattern[:-1] if anchored else pattern
+    if "*" not in body:
+        if anchored:
+            return body.__eq__
+        return lambda path: path.startswith(body)
+    expression = ".*".join(re.escape(part) for part in body.split("*"))
+    compiled = re.compile(expression + ("$" if anchored else ""), re.DOTALL)
+    return lambda path: compiled.match(path) is not None
@@ -1,8 +1,9 @@
-import html as html_lib
 import json
-import re
 import time
 from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from dataclasses import replace
 from datetime import UTC, datetime
 from urllib.parse import urlparse, urlunparse
 
@@ -28,8 +29,17 @@ from app.models.crawl import (
 from app.providers import get_crawl_adapter
 from app.providers.crawl import CrawlFetchResult
 from app.services import crawl_parser, observability_service
+from app.services.crawl_robots import RobotsPolicy, fetch_robots_txt
+from app.services.crawl_sitemaps import SitemapEntry, SitemapWalk
 from app.services.entitlement_service import EntitlementNotFoundError, check_and_consume
 
+# Rows per multi-row INSERT. Each row binds at most one parameter per column,
+# so a chunk stays within the Postgres limit of 65,535 bind parameters.
+_POSTGRES_MAX_BIND_PARAMETERS = 65_535
+_FRONTIER_INSERT_CHUNK_SIZE = _POSTGRES_MAX_BIND_PARAMETERS // len(
+    CrawlFrontierUrl.__table__.columns
+)
+
 
 def schedule_crawl(db: Session, tenant_id: str, campaign_id: str, crawl_type: str, seed_url: str) -> CrawlRun:
     settings = get_settings()
@@ -131,109 +141,57 @@ def _ensure_page(db: Session, tenant_id: str, campaign_id: str, url: str) -> Pag
     return page
 
 
-def _robots_txt_allows(robots_txt: str, path: str) -> bool:
-    lines = [line.strip() for line in robots_txt.splitlines()]
-    disallowed_prefixes: list[str] = []
-    in_global_agent = False
-    for line in lines:
-        if not line or line.startswith("#"):
-            continue
-        lower = line.lower()
-        if lower.startswith("user-agent:"):
-            agent = lower.split(":", 1)[1].strip()
-            in_global_agent = agent in {"*", '"*"'}
-            continue
-        if in_global_agent and lower.startswith("disallow:"):
-            value = line.split(":", 1)[1].strip()
-            if value:
-                disallowed_prefixes.append(value)
-    return not any(path.startswith(prefix) for prefix in disallowed_prefixes)
-
-
-def _fetch_robots(client: httpx.Client, url: str, cache: dict[str, str]) -> str:
-    parsed = urlparse(url)
-    key = f"{parsed.scheme}://{parsed.netloc}"
-    if key in cache:
-        return cache[key]
-    robots_url = f"{key}/robots.txt"
-    try:
-        response = client.get(robots_url, timeout=5.0)
-        cache[key] = response.text if response.status_code == 200 else ""
-    except httpx.HTTPError:
-        cache[key] = ""
-    return cache[key]
+def _sitemap_walk(
+    client: httpx.Client,
+    seed_url: str,
+    declared_sitemaps: list[str],
+    *,
+    max_sitemaps: int = 10,
+    max_bytes: int = 52_428_800,
+    concurrency: int = 4,
+) -> SitemapWalk:
+    origin = urlparse(seed_url)
+    return SitemapWalk(
+        client,
+        declared_sitemaps or [f"{origin.scheme}://{origin.netloc}/sitemap.xml"],
+        accept_sitemap=lambda url: _same_site_url(url, origin.netloc.lower()),
+        max_sitemaps=max_sitemaps,
+        max_bytes=max_bytes,
+        concurrency=concurrency,
+    )
 
 
 def _discover_sitemap_inventory(
-    client: httpx.Client,
+    walk: SitemapWalk,
     seed_url: str,
-    robots_txt: str,
     *,
     max_urls: int,
-) -> tuple[list[str], bool]:
-    origin = urlparse(seed_url)
-    origin_host = origin.netloc.lower()
-    declared = [
-        line.split(":", 1)[1].strip()
-        for line in robots_txt.splitlines()
-        if line.lower().startswith("sitemap:") and line.split(":", 1)[1].strip()
-    ]
-    queue = deque(declared or [f"{origin.scheme}://{origin.netloc}/sitemap.xml"])
-    seen_sitemaps: set[str] = set()
-    inventory: list[str] = []
-    inventory_seen: set[str] = set()
-    loaded_urlset = False
+) -> Iterator[SitemapEntry]:
+    """Yield the first ``max_urls`` distinct same-site pages ``walk`` lists.
 
-    while queue and len(seen_sitemaps) < 10 and len(inventory) < max_urls:
-        sitemap_url = _normalize_url(queue.popleft())
-        if sitemap_url is None or sitemap_url in seen_sitemaps:
-            continue
-        if urlparse(sitemap_url).netloc.lower() != origin_host:
-            continue
-        seen_sitemaps.add(sitemap_url)
-        try:
-            response = client.get(sitemap_url, timeout=8.0)
-        except httpx.HTTPError:
-            continue
-        if response.status_code != 200 or len(response.text) > 5_000_000:
-            continue
-        root_match = re.search(
-            r"<(?:[\w.-]+:)?(sitemapindex|urlset)\b",
-            response.text,
-            re.IGNORECASE,
-        )
-        if root_match is None:
-            continue
-        root_name = root_match.group(1).lower()
-        locations = [
-            html_lib.unescape(value).strip()
-            for value in re.findall(
-                r"<(?:[\w.-]+:)?loc\b[^>]*>(.*?)</(?:[\w.-]+:)?loc>",
-                response.text,
-                re.IGNORECASE | re.DOTALL,
-            )
-            if value.strip()
-        ]
-        if root_name == "sitemapindex":
-            queue.extend(locations)
-            continue
-        if root_name != "urlset":
-            continue
-        loaded_urlset = True
-        for location in locations:
-            normalized = _normalize_url(location)
-            if (
-                normalized is None
-                or urlparse(normalized).netloc.lower() != origin_host
-                or normalized in inventory_seen
-            ):
+    Entries are deduplicated and counted as they arrive, so nothing beyond the
+    seen URLs is held; the walk is cancelled once the budget is spent.
+    """
+    origin_host = urlparse(seed_url).netloc.lower()
+    inventory_seen: set[str] = set()
+    if max_urls <= 0:
+        return
+    with closing(iter(walk)) as entries:
+        for entry in entries:
+            normalized = _same_site_url(entry.url, origin_host)
+            if normalized is None or normalized in inventory_seen:
                 continue
             inventory_seen.add(normalized)
-            inventory.append(normalized)
-            if len(inventory) >= max_urls:
-                break
+            yield replace(entry, url=normalized)
+            if len(inventory_seen) >= max_urls:
+                return
+
 
-    return inventory, loaded_urlset
+def _same_site_url(url: str, origin_host: str) -> str | None:
+    normalized = _normalize_url(url)
+    if normalized is None or urlparse(normalized).netloc.lower() != origin_host:
+        return None
+    return normalized
 
 
 def _fetch_url(url: str, use_playwright: bool, timeout_seconds: float) -> CrawlFetchResult:
@@ -284,11 +242,33 @@ def enqueue_frontier_urls(
     depth: int = 0,
     discovered_from_url: str | None = None,
 ) -> int:
+    return enqueue_sitemap_entries(
+        db,
+        run,
+        (SitemapEntry(url=url) for url in urls),
+        depth=depth,
+        discovered_from_url=discovered_from_url,
+    )
+
+
+def enqueue_sitemap_entries(
+    db: Session,
+    run: CrawlRun,
+    entries: Iterable[SitemapEntry],
+    *,
+    depth: int = 0,
+    discovered_from_url: str | None = "sitemap",
+) -> int:
+    """Insert frontier rows for ``entries`` in multi-row statements of bounded size.
+
+    ``entries`` is consumed lazily, so only one chunk of rows is held at a time.
+    """
+    inserted = 0
     payload_rows: list[dict[str, object]] = []
     seen_normalized: set[str] = set()
     now = datetime.now(UTC)
-    for raw_url in urls:
-        normalized = _normalize_url(raw_url)
+    for entry in entries:
+        normalized = _normalize_url(entry.url)
         if normalized is None or normalized in seen_normalized:
             continue
         seen_normalized.add(normalized)
@@ -302,15 +282,26 @@ def enqueue_frontier_urls(
                 "status": "pending",
                 "depth": depth,
                 "discovered_from_url": discovered_from_url,
+                "sitemap_lastmod": entry.lastmod,
+                "sitemap_changefreq": entry.changefreq,
+                "sitemap_priority": entry.priority,
                 "updated_at": now,
             }
         )
-    if not payload_rows:
-        return 0
+        if len(payload_rows) >= _FRONTIER_INSERT_CHUNK_SIZE:
+            inserted += _insert_frontier_rows(db, payload_rows)
+            payload_rows = []
+    if payload_rows:
+        inserted += _insert_frontier_rows(db, payload_rows)
+    if inserted:
+        db.flush()
+    return inserted
+
+
+def _insert_frontier_rows(db: Session, payload_rows: list[dict[str, object]]) -> int:
     stmt = pg_insert(CrawlFrontierUrl.__table__).values(payload_rows)
     stmt = stmt.on_conflict_do_nothing(index_elements=["crawl_run_id", "normalized_url"])
     result = db.execute(stmt)
-    db.flush()
     return int(result.rowcount or 0)
 
 
@@ -380,6 +371,7 @@ def record_page_result(
         redirect_count=len(resolved_redirect_chain),
         canonical_url=signals["canonical"],
         content_hash=signals["content_hash"],
+        content_minhash=signals["content_minhash"],
         word_count=signals["word_count"],
         internal_link_count=signals["internal_links"],
         structured_data_types=signals["structured_data_types"],
@@ -552,10 +544,13 @@ def finalize_run_integrity(
             and result.word_count >= 20
         ):
             duplicate_groups.setdefault(result.content_hash, []).append((result, page))
+    near_duplicate_candidates: list[tuple[CrawlPageResult, Page]] = []
     for group in duplicate_groups.values():
+        ordered = sorted(group, key=lambda item: (len(item[1].url), item[1].url))
+        if ordered[0][0].content_minhash:
+            near_duplicate_candidates.append(ordered[0])
         if len(group) < 2:
             continue
-        ordered = sorted(group, key=lambda item: (len(item[1].url), item[1].url))
         preferred_url = ordered[0][1].url
         for _result, duplicate_page in ordered[1:]:
             issues.append(
@@ -577,6 +572,43 @@ def finalize_run_integrity(
                     },
                 )
             )
+    # Byte-identical copies are already reported above, so only the preferred page of
+    # each exact group takes part in near-duplicate clustering. Candidates go in
+    # preference order so each cluster is built around, and reported against, its
+    # preferred page.
+    near_duplicate_candidates.sort(key=lambda item: (len(item[1].url), item[1].url))
+    for cluster in crawl_parser.near_duplicate_clusters(
+        [result.content_minhash for result, _page in near_duplicate_candidates]
+    ):
+        ordered = [near_duplicate_candidates[index] for index in cluster]
+        preferred_result, preferred_page = ordered[0]
+        for duplicate_result, duplicate_page in ordered[1:]:
+            issues.append(
+                _derived_issue(
+                    run,
+                    page_id=duplicate_page.id,
+                    code="duplicate_content",
+                    severity="medium",
+                    details={
+                        "page_url": duplicate_page.url,
+                        "duplicate_with": preferred_page.url,
+                        "match_type": "near_duplicate_visible_text",
+                        "similarity": round(
+                            crawl_parser.minhash_similarity(
+                                duplicate_result.content_minhash,
+                                preferred_result.content_minhash,
+                            ),
+                            3,
+                        ),
+                        "confidence": "likely",
+                        "source": "InsightOS website scan",
+                        "action": (
+                            "Keep one useful version, then merge, redirect, or clearly "
+                            "differentiate the other page."
+                        ),
+                    },
+                )
+            )
 
     for result, page in joined_rows:
         canonical = _normalize_url(result.canonical_url or "")
@@ -772,8 +804,10 @@ def execute_run(
             queued.add(normalized)
 
     domain_last_hit: dict[str, float] = {}
-    robots_cache: dict[str, str] = {}
+    robots_policies: dict[str, RobotsPolicy] = {}
     min_interval = max(0.0, getattr(settings, "crawl_min_request_interval_seconds", 0.2))
+    max_crawl_delay = max(0.0, float(getattr(settings, "crawl_max_crawl_delay_seconds", 10.0)))
+    next_batch_delay = 0.0
     use_playwright = bool(getattr(settings, "crawl_use_playwright", False))
     timeout_seconds = float(getattr(settings, "crawl_timeout_seconds", 10.0))
 
@@ -783,20 +817,22 @@ def execute_run(
     with httpx.Client(follow_redirects=True) as client:
         if provided_urls is None:
             seed_frontier_for_run(db, run)
-            seed_robots = _fetch_robots(client, run.seed_url, robots_cache)
-            sitemap_inventory, sitemap_inventory_loaded = _discover_sitemap_inventory(
+            seed_robots = fetch_robots_txt(client, run.seed_url)
+            sitemap_walk = _sitemap_walk(
                 client,
                 run.seed_url,
-                seed_robots,
-                max_urls=max_pages + 1,
+                seed_robots.sitemaps,
+                max_sitemaps=int(getattr(settings, "crawl_sitemap_max_files", 10)),
+                max_bytes=int(getattr(settings, "crawl_sitemap_max_bytes", 52_428_800)),
+                concurrency=int(getattr(settings, "crawl_sitemap_concurrency", 4)),
             )
-            enqueue_frontier_urls(
+            enqueue_sitemap_entries(
                 db,
                 run,
-                sitemap_inventory,
+                _discover_sitemap_inventory(sitemap_walk, run.seed_url, max_urls=max_pages + 1),
                 depth=0,
-                discovered_from_url="sitemap",
             )
+            sitemap_inventory_loaded = sitemap_walk.urlset_loaded
             frontier_rows = _dequeue_frontier_batch(db, run, frontier_batch_size)
             for row in frontier_rows:
                 if row.normalized_url in queued:
@@ -829,17 +865,27 @@ def execute_run(
                 continue
             seen.add(url)
             parsed = urlparse(url)
-            robots = _fetch_robots(client, url, robots_cache)
-            if robots and not _robots_txt_allows(robots, parsed.path or "/"):
+            robots_key = f"{parsed.scheme}://{parsed.netloc}"
+            robots = robots_policies.get(robots_key)
+            if robots is None:
+                robots = fetch_robots_txt(client, url).policy_for("*")
+                robots_policies[robots_key] = robots
+            robots_target = f"{parsed.path or '/'}?{parsed.query}" if parsed.query else parsed.path or "/"
+            if not robots.allows(robots_target):
                 if frontier_row is not None:
                     _mark_frontier_entry(db, frontier_row, "blocked_robots")
                 continue
 
+            # A site's Crawl-delay only ever slows us down, and is capped so one
+            # robots.txt cannot park a worker indefinitely.
+            crawl_delay = min(robots.crawl_delay or 0.0, max_crawl_delay)
+            next_batch_delay = max(next_batch_delay, crawl_delay)
+            interval = max(min_interval, crawl_delay)
             domain_key = parsed.netloc
             now = time.time()
             last_hit = domain_last_hit.get(domain_key)
             if last_hit is not None:
-                sleep_for = min_interval - (now - last_hit)
+                sleep_for = interval - (now - last_hit)
                 if sleep_for > 0:
                     time.sleep(sleep_for)
 
@@ -977,6 +1023,7 @@ def execute_run(
         "processed_urls": processed,
         "total_processed_urls": run.pages_discovered,
         "pending_urls": pending_count,
+        "next_batch_delay_seconds": next_batch_delay,
     }
 
 
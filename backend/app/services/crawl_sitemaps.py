@@ -0,0 +1,243 @@
+"""Streaming sitemaps.org parsing and bounded-concurrency sitemap index walking."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_FETCH_TIMEOUT_SECONDS = 8.0
+_READ_CHUNK_BYTES = 64 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+_ROOTS = frozenset({"urlset", "sitemapindex"})
+_CHANGEFREQS = frozenset({"always", "hourly", "daily", "weekly", "monthly", "yearly", "never"})
+# Entries parsed ahead of the consumer. Readers block once it is full, which
+# is what keeps memory flat when the frontier writer is slower than parsing.
+_QUEUE_SIZE = 512
+_FINISHED = "finished"
+
+
+@dataclass(frozen=True, slots=True)
+class SitemapEntry:
+    url: str
+    lastmod: datetime | None = None
+    changefreq: str | None = None
+    priority: float | None = None
+
+
+class _SitemapTooLarge(Exception):
+    pass
+
+
+def iter_sitemap(
+    client: httpx.Client,
+    url: str,
+    *,
+    max_bytes: int,
+) -> Iterator[tuple[str, SitemapEntry | None]]:
+    """Yield ``(root, entry)`` pairs from one sitemap or sitemap index as it downloads.
+
+    ``root`` is ``"urlset"`` or ``"sitemapindex"``; the first pair carries no
+    entry and only announces which one the file is. The body is read in
+    chunks, gunzipped when it is gzip data, and fed to an incremental parser
+    that drops each element once it has been read. Reading stops at
+    ``max_bytes`` of uncompressed XML or at the first parse error, keeping
+    whatever was yielded before it.
+    """
+    try:
+        with client.stream("GET", url, timeout=SITEMAP_FETCH_TIMEOUT_SECONDS) as response:
+            if response.status_code != 200:
+                return
+            parser = XMLPullParser(events=("start", "end"))
+            root: Element | None = None
+            root_name = ""
+            for chunk in _xml_chunks(response.iter_bytes(_READ_CHUNK_BYTES), max_bytes=max_bytes):
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    name = _local_name(element.tag)
+                    if root is None:
+                        if name not in _ROOTS:
+                            return
+                        root, root_name = element, name
+                        yield root_name, None
+                        continue
+                    if event != "end" or name not in {"url", "sitemap"}:
+                        continue
+                    entry = _entry(element)
+                    root.clear()
+                    if entry is not None:
+                        yield root_name, entry
+    except _SitemapTooLarge:
+        logger.info("sitemap_truncated", extra={"sitemap_url": url, "max_bytes": max_bytes})
+    except (httpx.HTTPError, ParseError, zlib.error) as exc:
+        logger.info("sitemap_read_failed", extra={"sitemap_url": url, "error": type(exc).__name__})
+
+
+class SitemapWalk:
+    """Page entries from every urlset reachable from ``sitemap_urls``.
+
+    Sitemap indexes are followed breadth first, with at most ``concurrency``
+    files downloading at once and at most ``max_sitemaps`` read in total.
+    ``accept_sitemap`` returns the URL to fetch for a declared or indexed
+    sitemap, or None to skip it. Stop iterating, or close the iterator, to
+    cancel the downloads still in flight.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        sitemap_urls: Iterable[str],
+        *,
+        accept_sitemap: Callable[[str], str | None],
+        max_sitemaps: int,
+        max_bytes: int,
+        concurrency: int,
+    ) -> None:
+        self._client = client
+        self._sitemap_urls = list(sitemap_urls)
+        self._accept_sitemap = accept_sitemap
+        self._max_sitemaps = max(1, max_sitemaps)
+        self._max_bytes = max_bytes
+        self._concurrency = max(1, concurrency)
+        self.urlset_loaded = False
+
+    def __iter__(self) -> Iterator[SitemapEntry]:
+        items: queue.Queue[tuple[str, SitemapEntry | None]] = queue.Queue(maxsize=_QUEUE_SIZE)
+        stop = threading.Event()
+        pending = deque(self._sitemap_urls)
+        seen: set[str] = set()
+        active = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self._concurrency,
+            thread_name_prefix="crawl-sitemap",
+        )
+        try:
+            while True:
+                while pending and active < self._concurrency and len(seen) < self._max_sitemaps:
+                    sitemap_url = self._accept_sitemap(pending.popleft())
+                    if sitemap_url is None or sitemap_url in seen:
+                        continue
+                    seen.add(sitemap_url)
+                    executor.submit(self._read, sitemap_url, items, stop)
+                    active += 1
+                if active == 0:
+                    return
+                kind, entry = items.get()
+                if kind == _FINISHED:
+                    active -= 1
+                elif entry is None:
+                    self.urlset_loaded = self.urlset_loaded or kind == "urlset"
+                elif kind == "sitemapindex":
+                    pending.append(entry.url)
+                else:
+                    yield entry
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _read(
+        self,
+        sitemap_url: str,
+        items: queue.Queue[tuple[str, SitemapEntry | None]],
+        stop: threading.Event,
+    ) -> None:
+        try:
+            stream = iter_sitemap(self._client, sitemap_url, max_bytes=self._max_bytes)
+            with closing(stream):
+                for item in stream:
+                    if not _put(items, item, stop):
+                        return
+        finally:
+            _put(items, (_FINISHED, None), stop)
+
+
+def _put(
+    items: queue.Queue[tuple[str, SitemapEntry | None]],
+    item: tuple[str, SitemapEntry | None],
+    stop: threading.Event,
+) -> bool:
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.05)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _xml_chunks(chunks: Iterable[bytes], *, max_bytes: int) -> Iterator[bytes]:
+    decompressor: zlib._Decompress | None = None
+    first = True
+    total = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if first:
+            first = False
+            # .xml.gz files arrive as gzip data without a Content-Encoding
+            # header, so httpx hands them over still compressed.
+            if chunk.startswith(_GZIP_MAGIC):
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        for piece in [chunk] if decompressor is None else _gunzip(decompressor, chunk):
+            total += len(piece)
+            if total > max_bytes:
+                raise _SitemapTooLarge
+            yield piece
+
+
+def _gunzip(decompressor: zlib._Decompress, data: bytes) -> Iterator[bytes]:
+    # Bounded output per call so a small, highly compressed chunk cannot
+    # inflate into one huge buffer before the size limit sees it.
+    while data and not decompressor.eof:
+        piece = decompressor.decompress(data, _READ_CHUNK_BYTES)
+        data = decompressor.unconsumed_tail
+        if piece:
+            yield piece
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def _entry(element: Element) -> SitemapEntry | None:
+    fields = {_local_name(child.tag): (child.text or "").strip() for child in element}
+    location = fields.get("loc")
+    if not location:
+        return None
+    changefreq = fields.get("changefreq", "").lower()
+    return SitemapEntry(
+        url=location,
+        lastmod=_lastmod(fields.get("lastmod")),
+        changefreq=changefreq if changefreq in _CHANGEFREQS else None,
+        priority=_priority(fields.get("priority")),
+    )
+
+
+def _lastmod(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed.astimezone(UTC)
+
+
+def _priority(value: str | None) -> float | None:
+    try:
+        priority = float(value) if value else None
+    except ValueError:
+        return None
+    return priority if priority is not None and 0.0 <= priority <= 1.0 else None
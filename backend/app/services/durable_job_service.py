@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import nullcontext
 from datetime import UTC, date, datetime, timedelta
+import hashlib
 import json
 from time import monotonic
 from typing import Any
@@ -10,6 +12,7 @@ import uuid
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.db.query_budget import query_budget_enabled, query_budget_scope
 from app.intelligence.intelligence_orchestrator import run_campaign_cycle
 from app.intelligence.workers.outbox_worker import process as process_outbox_events
 from app.intelligence.lexicon.loader import get_builtin_lexicon
@@ -17,6 +20,7 @@ from app.intelligence.lexicon.standards import run_and_record_crux_standards_che
 from app.models.action_plan import ActionPlanMeasurement, ActionPlanOccurrence
 from app.models.campaign import Campaign
 from app.models.data_connection import DataConnection
+from app.models.migration_import import MigrationUploadSession
 from app.models.platform_job import PlatformJob
 from app.models.reporting import ReportSchedule
 from app.models.website_performance import WebsitePerformanceMeasurement
@@ -29,9 +33,11 @@ from app.services import (
     job_service,
     listing_discovery_service,
     local_rank_grid_service,
+    migration_upload_service,
     reporting_service,
     reputation_inventory_service,
     reputation_response_execution_service,
+    site_integrity_service,
     standards_source_service,
     traffic_fact_service,
     website_performance_service,
@@ -48,6 +54,10 @@ BUSINESS_PROFILE_SYNC_JOB_TYPE = "data_connections.google_business_profile_sync"
 CWV_STANDARDS_CHECK_JOB_TYPE = "reference_library.cwv_standards_check"
 STANDARDS_SOURCE_CHECK_JOB_TYPE = "reference_library.standards_source_check"
 WEBSITE_PERFORMANCE_COLLECTION_JOB_TYPE = "website_performance.collect"
+WEBSITE_PERFORMANCE_BATCH_COLLECTION_JOB_TYPE = "website_performance.collect_batch"
+SITE_INTEGRITY_REFRESH_JOB_TYPE = "site_integrity.refresh"
+MIGRATION_UPLOAD_REVIEW_JOB_TYPE = "migration_imports.review_upload"
+MIGRATION_UPLOAD_APPLY_JOB_TYPE = "migration_imports.apply_upload"
 LOCAL_RANK_GRID_DISPATCH_JOB_TYPE = "local.rank_grid.dispatch"
 DIRECTORY_LISTING_DISCOVERY_JOB_TYPE = "directory_listings.discover"
 OWNED_REVIEW_SYNC_JOB_TYPE = "reputation.owned_reviews_sync"
@@ -332,6 +342,117 @@ def _website_performance_collection_handler(
     }
 
 
+def _website_performance_batch_collection_handler(
+    db: Session,
+    job: PlatformJob,
+) -> dict[str, Any]:
+    form_factor = str(job.payload.get("form_factor") or "").strip().lower()
+    campaign_ids = [str(value) for value in job.payload.get("campaign_ids") or [] if value]
+    if not campaign_ids:
+        raise ValueError("Website performance sweep job has no campaigns.")
+    campaigns_by_id = {
+        campaign.id: campaign
+        for campaign in db.query(Campaign).filter(Campaign.id.in_(campaign_ids)).all()
+    }
+    # Campaigns paused or removed since the sweep was queued are skipped, not failed.
+    campaigns = [
+        campaigns_by_id[campaign_id]
+        for campaign_id in campaign_ids
+        if campaign_id in campaigns_by_id
+        and campaigns_by_id[campaign_id].setup_state.lower() == "active"
+    ]
+    collected = (
+        website_performance_service.collect_performance_batch(
+            db,
+            campaigns=campaigns,
+            form_factor=form_factor,
+            idempotency_scope=str(job.payload.get("measurement_scope") or "").strip() or None,
+        )
+        if campaigns
+        else {}
+    )
+    return {
+        "form_factor": form_factor,
+        "campaigns": [
+            {
+                "campaign_id": campaign.id,
+                "business_location_id": campaign.business_location_id,
+                "measurements": [
+                    website_performance_service.serialize_measurement(row)
+                    for row in collected[campaign.id]
+                ],
+            }
+            for campaign in campaigns
+        ],
+        "skipped_campaign_ids": [
+            campaign_id for campaign_id in campaign_ids if campaign_id not in collected
+        ],
+    }
+
+
+def _site_integrity_refresh_handler(
+    db: Session,
+    job: PlatformJob,
+) -> dict[str, Any]:
+    tenant_id = str(job.tenant_id or job.payload.get("tenant_id") or "").strip()
+    campaign_id = str(job.payload.get("campaign_id") or job.entity_id or "").strip()
+    campaign = db.get(Campaign, campaign_id) if campaign_id else None
+    if not tenant_id or campaign is None or campaign.tenant_id != tenant_id:
+        raise ValueError("Google page check job has no tenant-scoped campaign.")
+    result = site_integrity_service.run_site_integrity_batch(
+        db,
+        tenant_id=tenant_id,
+        campaign_id=campaign.id,
+        job_id=job.id,
+    )
+    if result["resume_at"]:
+        follow_up = create_site_integrity_refresh_job(
+            db,
+            campaign=campaign,
+            idempotency_suffix=f"resume:{result['resume_at']}",
+            available_at=datetime.fromisoformat(result["resume_at"]),
+        )
+        result["next_job_id"] = follow_up.id
+    return result
+
+
+def _migration_upload_review_handler(
+    db: Session,
+    job: PlatformJob,
+) -> dict[str, Any]:
+    upload = _job_migration_upload(db, job)
+    return migration_upload_service.run_upload_review(db, upload=upload)
+
+
+def _migration_upload_apply_handler(
+    db: Session,
+    job: PlatformJob,
+) -> dict[str, Any]:
+    upload = _job_migration_upload(db, job)
+    result = migration_upload_service.continue_upload_apply(db, upload=upload, commit=True)
+    if not result["finished"]:
+        progress = result["progress"] or {}
+        follow_up = create_migration_upload_apply_job(
+            db,
+            upload=upload,
+            idempotency_suffix=(
+                f"resume:{progress.get('phase')}:{progress.get('rows_staged')}:"
+                f"{progress.get('rows_applied')}"
+            ),
+        )
+        result["next_job_id"] = follow_up.id
+    return result
+
+
+def _job_migration_upload(db: Session, job: PlatformJob) -> MigrationUploadSession:
+    tenant_id = str(job.tenant_id or job.payload.get("tenant_id") or "").strip()
+    upload_id = str(job.payload.get("upload_id") or job.entity_id or "").strip()
+    upload = db.get(MigrationUploadSession, upload_id) if upload_id else None
+    if not tenant_id or upload is None or upload.tenant_id != tenant_id:
+        raise ValueError("Migration import job has no tenant-scoped upload.")
+    return upload
+
+
 def _local_rank_grid_dispatch_handler(
     db: Session,
     job: PlatformJob,
@@ -487,6 +608,10 @@ DEFAULT_HANDLERS: dict[str, JobHandler] = {
     CWV_STANDARDS_CHECK_JOB_TYPE: _cwv_standards_check_handler,
     STANDARDS_SOURCE_CHECK_JOB_TYPE: _standards_source_check_handler,
     WEBSITE_PERFORMANCE_COLLECTION_JOB_TYPE: _website_performance_collection_handler,
+    WEBSITE_PERFORMANCE_BATCH_COLLECTION_JOB_TYPE: _website_performance_batch_collection_handler,
+    SITE_INTEGRITY_REFRESH_JOB_TYPE: _site_integrity_refresh_handler,
+    MIGRATION_UPLOAD_REVIEW_JOB_TYPE: _migration_upload_review_handler,
+    MIGRATION_UPLOAD_APPLY_JOB_TYPE: _migration_upload_apply_handler,
     LOCAL_RANK_GRID_DISPATCH_JOB_TYPE: _local_rank_grid_dispatch_handler,
     DIRECTORY_LISTING_DISCOVERY_JOB_TYPE: _directory_listing_discovery_handler,
     OWNED_REVIEW_SYNC_JOB_TYPE: _owned_review_sync_handler,
@@ -1164,6 +1289,154 @@ def create_website_performance_job(
     )
 
 
+def create_website_performance_batch_job(
+    db: Session,
+    *,
+    campaigns: list[Campaign],
+    form_factor: str,
+    collection_date: date,
+    available_at: datetime | None = None,
+) -> PlatformJob:
+    if form_factor not in {"mobile", "desktop"}:
+        raise ValueError("form_factor must be mobile or desktop.")
+    campaign_ids = sorted({campaign.id for campaign in campaigns})
+    if not campaign_ids:
+        raise ValueError("Website performance sweep needs at least one campaign.")
+    campaign_digest = hashlib.sha256(",".join(campaign_ids).encode("utf-8")).hexdigest()[:16]
+    return job_service.create_job(
+        db,
+        tenant_id=None,
+        job_type=WEBSITE_PERFORMANCE_BATCH_COLLECTION_JOB_TYPE,
+        entity_type="website_performance_sweep",
+        entity_id=None,
+        idempotency_key=(
+            f"website-performance-sweep:{form_factor}:"
+            f"{collection_date.isoformat()}:{campaign_digest}"
+        ),
+        payload={
+            "campaign_ids": campaign_ids,
+            "form_factor": form_factor,
+            "collection_date": collection_date.isoformat(),
+            "measurement_scope": collection_date.isoformat(),
+        },
+        available_at=available_at or datetime.now(UTC),
+        max_retries=2,
+    )
+
+
+def create_site_integrity_refresh_job(
+    db: Session,
+    *,
+    campaign: Campaign,
+    idempotency_suffix: str,
+    available_at: datetime | None = None,
+) -> PlatformJob:
+    return job_service.create_job(
+        db,
+        tenant_id=campaign.tenant_id,
+        job_type=SITE_INTEGRITY_REFRESH_JOB_TYPE,
+        entity_type="campaign",
+        entity_id=campaign.id,
+        idempotency_key=f"site-integrity:{campaign.id}:{idempotency_suffix}",
+        payload={
+            "tenant_id": campaign.tenant_id,
+            "organization_id": campaign.organization_id,
+            "campaign_id": campaign.id,
+        },
+        available_at=available_at or datetime.now(UTC),
+        max_retries=3,
+    )
+
+
+def enqueue_site_integrity_refresh(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign_id: str,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    resolved_now = now or datetime.now(UTC)
+    # Validates the campaign and connection before anything is queued.
+    site_integrity_service.get_site_integrity_progress(
+        db,
+        tenant_id=tenant_id,
+        campaign_id=campaign_id,
+        now=resolved_now,
+    )
+    campaign = db.get(Campaign, campaign_id)
+    manual_bucket = (
+        f"manual:{resolved_now.date().isoformat()}:"
+        f"{resolved_now.hour:02d}:{resolved_now.minute // 15}"
+    )
+    idempotency_key = f"site-integrity:{campaign_id}:{manual_bucket}"
+    existing = db.query(PlatformJob).filter(PlatformJob.idempotency_key == idempotency_key).first()
+    job = create_site_integrity_refresh_job(
+        db,
+        campaign=campaign,
+        idempotency_suffix=manual_bucket,
+        available_at=resolved_now,
+    )
+    db.commit()
+    db.refresh(job)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "created": existing is None,
+        **site_integrity_service.get_site_integrity_progress(
+            db,
+            tenant_id=tenant_id,
+            campaign_id=campaign_id,
+            now=resolved_now,
+        ),
+    }
+
+
+def create_migration_upload_review_job(
+    db: Session,
+    *,
+    upload: MigrationUploadSession,
+) -> PlatformJob:
+    return job_service.create_job(
+        db,
+        tenant_id=upload.tenant_id,
+        job_type=MIGRATION_UPLOAD_REVIEW_JOB_TYPE,
+        entity_type="migration_upload",
+        entity_id=upload.id,
+        idempotency_key=f"migration-upload-review:{upload.id}",
+        payload={
+            "tenant_id": upload.tenant_id,
+            "organization_id": upload.organization_id,
+            "upload_id": upload.id,
+        },
+        available_at=datetime.now(UTC),
+        max_retries=3,
+    )
+
+
+def create_migration_upload_apply_job(
+    db: Session,
+    *,
+    upload: MigrationUploadSession,
+    idempotency_suffix: str = "start",
+) -> PlatformJob:
+    return job_service.create_job(
+        db,
+        tenant_id=upload.tenant_id,
+        job_type=MIGRATION_UPLOAD_APPLY_JOB_TYPE,
+        entity_type="migration_upload",
+        entity_id=upload.id,
+        idempotency_key=f"migration-upload-apply:{upload.applied_batch_id}:{idempotency_suffix}",
+        payload={
+            "tenant_id": upload.tenant_id,
+            "organization_id": upload.organization_id,
+            "upload_id": upload.id,
+            "batch_id": upload.applied_batch_id,
+        },
+        available_at=datetime.now(UTC),
+        max_retries=3,
+    )
+
+
 def create_action_plan_measurement_job(
     db: Session,
     *,
@@ -1271,7 +1544,7 @@ def enqueue_due_website_performance_jobs(
         .limit(max(1, min(int(limit), 100)))
         .all()
     )
-    created = 0
+    due_by_form_factor: dict[str, list[Campaign]] = {"mobile": [], "desktop": []}
     for campaign in rows:
         for form_factor in ("mobile", "desktop"):
             latest = (
@@ -1289,14 +1562,21 @@ def enqueue_due_website_performance_jobs(
                     captured_at = captured_at.replace(tzinfo=UTC)
                 if captured_at >= refresh_after:
                     continue
-            create_website_performance_job(
-                db,
-                campaign=campaign,
-                form_factor=form_factor,
-                collection_date=resolved_now.date(),
-                available_at=resolved_now,
-            )
-            created += 1
+            due_by_form_factor[form_factor].append(campaign)
+    # One job per form factor lets the collector overlap provider calls and share
+    # CrUX lookups across every due campaign instead of one campaign per job.
+    created = 0
+    for form_factor, campaigns in due_by_form_factor.items():
+        if not campaigns:
+            continue
+        create_website_performance_batch_job(
+            db,
+            campaigns=campaigns,
+            form_factor=form_factor,
+            collection_date=resolved_now.date(),
+            available_at=resolved_now,
+        )
+        created += len(campaigns)
     db.flush()
     return created
 
@@ -1702,8 +1982,10 @@ def execute_claimed_job(
     job_type = job.job_type
     tenant_id = job.tenant_id
     payload = dict(job.payload or {})
+    query_budget = query_budget_scope("job", job_type) if query_budget_enabled() else nullcontext()
     try:
-        result = _json_safe(handler(db, job))
+        with query_budget:
+            result = _json_safe(handler(db, job))
         completed = job_service.complete_job(
             db,
             job.id,
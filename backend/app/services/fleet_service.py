@@ -12,7 +12,9 @@ Concurrency and transaction guarantees:
 - Item processors acquire row locks (`SELECT ... FOR UPDATE SKIP LOCKED`) before
   state transitions to reduce duplicate execution across workers.
 - State transitions and aggregate counter updates are committed atomically per
-  processing phase; stale-write conflicts raise HTTP 409.
+  processing phase; stale-write conflicts raise HTTP 409. Job counters move by
+  in-database increments on each item transition, and
+  `reconcile_fleet_job_counters` periodically recounts open jobs to fix drift.
 - Queue dispatch is best-effort and happens after job/item commits.
 
 Retry/session/queue/telemetry notes:
@@ -30,15 +32,17 @@ delegates to provider-task infrastructure, which may emit provider telemetry.
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from uuid import UUID
 
 from celery import current_app
 from fastapi import HTTPException, status
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import StaleDataError
 
 from app.core.config import get_settings
@@ -69,6 +73,17 @@ FLEET_TOKEN_BUCKET_LIMIT = 50
 FLEET_TOKEN_BUCKET_WINDOW_SECONDS = 60
 FLEET_CIRCUIT_BREAKER_THRESHOLD = 5
 FLEET_PROVIDER_CALL_SEARCH_CONSOLE = "google_search_console_query"
+FLEET_RECONCILE_BATCH_SIZE = 500
+
+_ITEM_STATUS_COUNTERS: dict[str, str] = {
+    FleetJobItemStatus.QUEUED.value: "queued_items",
+    FleetJobItemStatus.RUNNING.value: "running_items",
+    FleetJobItemStatus.SUCCEEDED.value: "succeeded_items",
+    FleetJobItemStatus.FAILED.value: "failed_items",
+}
+_JOB_COUNTERS = ("total_items", "queued_items", "running_items", "succeeded_items", "failed_items", "cancelled_items")
+
+logger = logging.getLogger("lsos.fleet")
 
 FLEET_JOB_TRANSITIONS: dict[str, set[str]] = {
     FleetJobStatus.QUEUED.value: {FleetJobStatus.RUNNING.value},
@@ -316,29 +331,47 @@ def enqueue_pending_items_for_portfolio(*, db: Session, organization_id: str, po
     if available_slots == 0:
         return 0
 
-    items = (
-        db.query(FleetJobItem)
-        .options(joinedload(FleetJobItem.fleet_job))
-        .join(FleetJob, FleetJob.id == FleetJobItem.fleet_job_id)
-        .outerjoin(
-            PortfolioFleetRunItem,
-            PortfolioFleetRunItem.fleet_job_id == FleetJob.id,
-        )
-        .outerjoin(
-            PortfolioFleetRun,
-            PortfolioFleetRun.id == PortfolioFleetRunItem.portfolio_fleet_run_id,
+    # Oldest open jobs first, then each job's oldest queued items by index, so
+    # dispatch cost follows the free slots rather than the size of the jobs.
+    job_ids = [
+        row[0]
+        for row in (
+            db.query(FleetJob.id)
+            .outerjoin(
+                PortfolioFleetRunItem,
+                PortfolioFleetRunItem.fleet_job_id == FleetJob.id,
+            )
+            .outerjoin(
+                PortfolioFleetRun,
+                PortfolioFleetRun.id == PortfolioFleetRunItem.portfolio_fleet_run_id,
+            )
+            .filter(
+                FleetJob.portfolio_id == portfolio_id,
+                FleetJob.organization_id == organization_id,
+                FleetJob.status.in_([FleetJobStatus.QUEUED, FleetJobStatus.RUNNING]),
+                or_(PortfolioFleetRun.id.is_(None), PortfolioFleetRun.status != "paused"),
+            )
+            .order_by(FleetJob.created_at.asc())
+            .all()
         )
-        .filter(
-            FleetJob.portfolio_id == portfolio_id,
-            FleetJob.organization_id == organization_id,
-            FleetJob.status.in_([FleetJobStatus.QUEUED, FleetJobStatus.RUNNING]),
-            FleetJobItem.status == FleetJobItemStatus.QUEUED,
-            or_(PortfolioFleetRun.id.is_(None), PortfolioFleetRun.status != "paused"),
+    ]
+    items: list[str] = []
+    for job_id in job_ids:
+        items.extend(
+            row[0]
+            for row in (
+                db.query(FleetJobItem.id)
+                .filter(
+                    FleetJobItem.fleet_job_id == job_id,
+                    FleetJobItem.status == FleetJobItemStatus.QUEUED,
+                )
+                .order_by(FleetJobItem.created_at.asc())
+                .limit(available_slots - len(items))
+                .all()
+            )
         )
-        .order_by(FleetJob.created_at.asc(), FleetJobItem.created_at.asc())
-        .limit(available_slots)
-        .all()
-    )
+        if len(items) >= available_slots:
+            break
 
     if not items:
         return 0
@@ -348,8 +381,8 @@ def enqueue_pending_items_for_portfolio(*, db: Session, organization_id: str, po
 
 
     dispatched = 0
-    for item in items:
-        current_app.send_task("fleet.process_fleet_job_item_task", args=[item.id], queue="default")
+    for item_id in items:
+        current_app.send_task("fleet.process_fleet_job_item_task", args=[item_id], queue="default")
         dispatched += 1
     return dispatched
 
@@ -463,7 +496,12 @@ def process_fleet_job_item(*, db: Session, fleet_job_item_id: str) -> dict:
             job.started_at = datetime.now(UTC)
     item.started_at = datetime.now(UTC)
     db.flush()
-    _refresh_job_counters(db=db, job=job)
+    _shift_job_counters(
+        db=db,
+        job=job,
+        from_status=FleetJobItemStatus.QUEUED.value,
+        to_status=FleetJobItemStatus.RUNNING.value,
+    )
     db.commit()
 
     failed = False
@@ -487,18 +525,19 @@ def process_fleet_job_item(*, db: Session, fleet_job_item_id: str) -> dict:
         db.rollback()
         return {"status": "ignored", "fleet_job_item_id": fleet_job_item_id, "reason": "already_finalized"}
 
-    if failed:
-        _transition_item(item=item, next_status=FleetJobItemStatus.FAILED.value)
-        item.error_code = error_code
-        item.error_detail = error_detail
-    else:
-        _transition_item(item=item, next_status=FleetJobItemStatus.SUCCEEDED.value)
-        item.error_code = None
-        item.error_detail = None
+    finished_status = FleetJobItemStatus.FAILED.value if failed else FleetJobItemStatus.SUCCEEDED.value
+    _transition_item(item=item, next_status=finished_status)
+    item.error_code = error_code
+    item.error_detail = error_detail
     item.finished_at = datetime.now(UTC)
 
     db.flush()
-    _refresh_job_counters(db=db, job=job)
+    _shift_job_counters(
+        db=db,
+        job=job,
+        from_status=FleetJobItemStatus.RUNNING.value,
+        to_status=finished_status,
+    )
     _advance_job_terminal_state(job=job)
     fleet_job_id = str(job.id)
     job_status = _normalize_job_status(job.status)
@@ -559,12 +598,79 @@ def retry_failed_items(*, db: Session, organization_id: str, fleet_job_id: str,
         if _normalize_job_status(job.status) in {FleetJobStatus.FAILED.value, FleetJobStatus.PARTIAL.value}:
             job.status = FleetJobStatus.RUNNING
             job.finished_at = None
-        _refresh_job_counters(db=db, job=job)
+        _shift_job_counters(
+            db=db,
+            job=job,
+            from_status=FleetJobItemStatus.FAILED.value,
+            to_status=FleetJobItemStatus.QUEUED.value,
+            count=len(rows),
+        )
         db.commit()
         enqueue_pending_items_for_portfolio(db=db, organization_id=job.organization_id, portfolio_id=job.portfolio_id)
     return len(rows)
 
 
+def reconcile_fleet_job_counters(*, db: Session, limit: int = FLEET_RECONCILE_BATCH_SIZE) -> dict:
+    """Recount the items of open Fleet jobs and correct drifted counters.
+
+    Responsibility: safety net for the incremental counters maintained on each
+    item transition (for example after a manual status repair in the database).
+    Inputs: caller-managed DB session and the maximum number of jobs to check,
+    least recently updated first.
+    Side effects: rewrites drifted counters and finishes jobs whose items are
+    all terminal.
+    Transactions: each job row is locked before its items are counted, so an
+    item transition (which shifts the counters under the same row lock)
+    cannot commit between the count and the rewrite; commits once per job;
+    stale-write conflicts roll back that job and leave it for the next run.
+    Idempotency: repeated runs are no-ops once counters match.
+    """
+    job_ids = [
+        job_id
+        for (job_id,) in db.query(FleetJob.id)
+        .filter(FleetJob.status.in_([FleetJobStatus.QUEUED, FleetJobStatus.RUNNING]))
+        .order_by(FleetJob.updated_at.asc())
+        .limit(limit)
+        .all()
+    ]
+    db.commit()
+    corrected = 0
+    for job_id in job_ids:
+        job = (
+            db.query(FleetJob)
+            .filter(
+                FleetJob.id == job_id,
+                FleetJob.status.in_([FleetJobStatus.QUEUED, FleetJobStatus.RUNNING]),
+            )
+            .populate_existing()
+            .with_for_update()
+            .one_or_none()
+        )
+        if job is None:
+            db.commit()
+            continue
+        counts = _count_job_items(db=db, job=job)
+        drift = {name: value for name, value in counts.items() if getattr(job, name) != value}
+        if not drift:
+            db.commit()
+            continue
+        logger.warning(
+            "fleet_job_counter_drift_corrected",
+            extra={"fleet_job_id": job.id, "drift": {name: getattr(job, name) - value for name, value in drift.items()}},
+        )
+        for name, value in counts.items():
+            setattr(job, name, value)
+        if _normalize_job_status(job.status) == FleetJobStatus.RUNNING.value:
+            _advance_job_terminal_state(job=job)
+        try:
+            db.commit()
+        except StaleDataError:
+            db.rollback()
+            continue
+        corrected += 1
+    return {"jobs_checked": len(job_ids), "jobs_corrected": corrected}
+
+
 def prepare_portfolio_review_job(
     *,
     db: Session,
@@ -693,6 +799,7 @@ def _prepare_bulk_job(
                 fleet_job_id=job.id,
                 item_key=str(item["item_key"]).strip(),
                 status=FleetJobItemStatus.QUEUED,
+                request_payload=item,
                 error_code=None,
                 error_detail=None,
                 retries=0,
@@ -732,9 +839,7 @@ def _run_stub_handler(*, job: FleetJob, item: FleetJobItem) -> None:
     if not _breaker_allow(redis_client, breaker_key):
         raise RuntimeError("circuit breaker placeholder open")
 
-    payload_items = job.request_payload.get("items", []) if isinstance(job.request_payload, dict) else []
-    payload_by_key = {str(entry.get("item_key")): entry for entry in payload_items if isinstance(entry, dict)}
-    payload = payload_by_key.get(item.item_key, {})
+    payload = _item_seed(job=job, item=item)
     if payload.get("force_fail") is True or "fail" in item.item_key.lower():
         _breaker_record_failure(redis_client, breaker_key)
         raise RuntimeError("stub handler forced failure")
@@ -761,12 +866,19 @@ def _run_portfolio_review_handler(*, job: FleetJob, item: FleetJobItem) -> None:
         raise RuntimeError("Portfolio review job is missing its governed location scope")
 
 
-def _resolve_item_payload(*, job: FleetJob, item: FleetJobItem) -> dict:
+def _item_seed(*, job: FleetJob, item: FleetJobItem) -> dict:
+    if isinstance(item.request_payload, dict):
+        return item.request_payload
+    # Items created before seeds were stored per item.
     payload_items = job.request_payload.get("items", []) if isinstance(job.request_payload, dict) else []
-    payload_by_key = {str(entry.get("item_key")): entry for entry in payload_items if isinstance(entry, dict)}
-    payload = payload_by_key.get(item.item_key, {})
-    if not isinstance(payload, dict):
-        return {}
+    for entry in payload_items:
+        if isinstance(entry, dict) and str(entry.get("item_key")) == item.item_key:
+            return entry
+    return {}
+
+
+def _resolve_item_payload(*, job: FleetJob, item: FleetJobItem) -> dict:
+    payload = _item_seed(job=job, item=item)
     raw_payload = payload.get("payload", payload)
     if not isinstance(raw_payload, dict):
         return {}
@@ -989,7 +1101,36 @@ def _breaker_record_success(client, key: str) -> None:
         return
 
 
-def _refresh_job_counters(*, db: Session, job: FleetJob) -> None:
+def _shift_job_counters(
+    *,
+    db: Session,
+    job: FleetJob,
+    from_status: str,
+    to_status: str,
+    count: int = 1,
+) -> None:
+    """Move `count` items between two job status counters in one UPDATE.
+
+    The arithmetic runs in the database, so concurrent workers finishing items
+    of the same job cannot lose each other's updates, and no worker recounts
+    the job's items. The returned values are loaded into `job` without marking
+    it dirty; the version column is left alone because counters are not part of
+    the job's optimistic-lock state.
+    """
+    from_column = getattr(FleetJob, _ITEM_STATUS_COUNTERS[from_status])
+    to_column = getattr(FleetJob, _ITEM_STATUS_COUNTERS[to_status])
+    row = db.execute(
+        update(FleetJob)
+        .where(FleetJob.id == job.id)
+        .values({from_column: from_column - count, to_column: to_column + count, FleetJob.updated_at: datetime.now(UTC)})
+        .returning(*(getattr(FleetJob, name) for name in _JOB_COUNTERS))
+        .execution_options(synchronize_session=False)
+    ).one()
+    for name, value in zip(_JOB_COUNTERS, row):
+        set_committed_value(job, name, int(value))
+
+
+def _count_job_items(*, db: Session, job: FleetJob) -> dict[str, int]:
     counts = (
         db.query(FleetJobItem.status, func.count(FleetJobItem.id))
         .filter(FleetJobItem.fleet_job_id == job.id)
@@ -997,14 +1138,14 @@ def _refresh_job_counters(*, db: Session, job: FleetJob) -> None:
         .all()
     )
     by_status = {_normalize_item_status(key): int(value) for key, value in counts}
-    total = int(sum(by_status.values()))
-    job.total_items = total
-    job.queued_items = by_status.get(FleetJobItemStatus.QUEUED.value, 0)
-    job.running_items = by_status.get(FleetJobItemStatus.RUNNING.value, 0)
-    job.succeeded_items = by_status.get(FleetJobItemStatus.SUCCEEDED.value, 0)
-    job.failed_items = by_status.get(FleetJobItemStatus.FAILED.value, 0)
-    job.cancelled_items = by_status.get(FleetJobStatus.CANCELLED.value, 0)
-    job.updated_at = datetime.now(UTC)
+    return {
+        "total_items": int(sum(by_status.values())),
+        "queued_items": by_status.get(FleetJobItemStatus.QUEUED.value, 0),
+        "running_items": by_status.get(FleetJobItemStatus.RUNNING.value, 0),
+        "succeeded_items": by_status.get(FleetJobItemStatus.SUCCEEDED.value, 0),
+        "failed_items": by_status.get(FleetJobItemStatus.FAILED.value, 0),
+        "cancelled_items": by_status.get(FleetJobStatus.CANCELLED.value, 0),
+    }
 
 
 def _advance_job_terminal_state(*, job: FleetJob) -> None:
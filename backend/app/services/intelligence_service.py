@@ -7,7 +7,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.settings import get_settings
-from app.events import emit_event
+from app.events import buffered_events, emit_event
 from app.intelligence.lexicon import get_active_lexicon
 from app.intelligence.recommendation_execution_engine import schedule_execution
 from app.models.action_plan import ActionPlanOccurrence, ActionPlanStep
@@ -770,15 +770,16 @@ def upsert_recommendations(db: Session, tenant_id: str, campaign_id: str) -> lis
         )
     for rec in recommendations:
         _validate_recommendation_payload(rec)
-    for rec in recommendations:
-        db.add(rec)
-        db.flush()
-        emit_event(
-            db,
-            tenant_id=tenant_id,
-            event_type="recommendation.generated",
-            payload={"campaign_id": campaign_id, "recommendation_id": rec.id, "status": rec.status},
-        )
+    with buffered_events(db):
+        for rec in recommendations:
+            db.add(rec)
+            db.flush()
+            emit_event(
+                db,
+                tenant_id=tenant_id,
+                event_type="recommendation.generated",
+                payload={"campaign_id": campaign_id, "recommendation_id": rec.id, "status": rec.status},
+            )
     db.commit()
     return recommendations
 
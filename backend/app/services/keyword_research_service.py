@@ -1808,12 +1808,67 @@ def _keyword_governed_actions(
     return result
 
 
+class _TargetPageIndex:
+    """Per-run page index for target page matching.
+
+    Each page is tokenized once and an inverted index maps every token to the
+    pages that contain it, so a keyword is only scored against candidate pages
+    instead of re-tokenizing and scoring every page.
+    """
+
+    def __init__(self, pages: list[dict[str, Any]]) -> None:
+        self.pages = pages
+        self.texts: list[str] = []
+        self.tokens: list[set[str]] = []
+        self.postings: dict[str, list[int]] = {}
+        self._phrase_hits: dict[str, tuple[int, ...]] = {}
+        for position, page in enumerate(pages):
+            page_text = " ".join(
+                str(page.get(field) or "")
+                for field in ("url", "title", "meta_description", "heading_text")
+            ).casefold()
+            page_tokens = _meaningful_tokens(page_text)
+            self.texts.append(page_text)
+            self.tokens.append(page_tokens)
+            for token in page_tokens:
+                self.postings.setdefault(token, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def phrase_hits(self, phrase: str) -> tuple[int, ...]:
+        """Pages whose text contains ``phrase``; computed once per distinct phrase."""
+        if not phrase:
+            return ()
+        normalized = phrase.casefold()
+        hits = self._phrase_hits.get(normalized)
+        if hits is None:
+            hits = tuple(position for position, text in enumerate(self.texts) if normalized in text)
+            self._phrase_hits[normalized] = hits
+        return hits
+
+    def candidates(self, tokens: set[str], phrases: tuple[str, ...]) -> list[int]:
+        positions: set[int] = set()
+        for token in tokens:
+            positions.update(self.postings.get(token, ()))
+        for phrase in phrases:
+            positions.update(self.phrase_hits(phrase))
+        # Page order is the tie-breaker, so candidates are scored in their original order.
+        return sorted(positions)
+
+
+def _target_page_index(target_pages: _TargetPageIndex | list[dict[str, Any]]) -> _TargetPageIndex:
+    if isinstance(target_pages, _TargetPageIndex):
+        return target_pages
+    return _TargetPageIndex(list(target_pages))
+
+
 def _load_target_pages(
     db: Session,
     *,
     tenant_id: str,
     campaign_id: str,
-) -> list[dict[str, Any]]:
+) -> _TargetPageIndex:
     rows = (
         db.query(Page, CrawlPageResult)
         .join(CrawlPageResult, CrawlPageResult.page_id == Page.id)
@@ -1849,13 +1904,13 @@ def _load_target_pages(
         )
         if len(pages) >= 100:
             break
-    return pages
+    return _TargetPageIndex(pages)
 
 
 def _add_planning_context(
     item: dict[str, Any],
     *,
-    target_pages: list[dict[str, Any]],
+    target_pages: _TargetPageIndex | list[dict[str, Any]],
 ) -> dict[str, Any]:
     service_name = _text(item.get("matched_service_name"))
     area_name = _text(item.get("matched_service_area_name"))
@@ -1907,7 +1962,7 @@ def _cluster_key(service_name: str, problem_key: str, location_name: str) -> str
 def _target_page_for_item(
     item: dict[str, Any],
     *,
-    target_pages: list[dict[str, Any]],
+    target_pages: _TargetPageIndex | list[dict[str, Any]],
 ) -> dict[str, Any]:
     relevance_status = str(item.get("relevance_status") or "needs_review")
     if relevance_status == "unrelated":
@@ -1941,14 +1996,16 @@ def _target_page_for_item(
     keyword_tokens = _meaningful_tokens(keyword)
     service_tokens = _meaningful_tokens(service_name)
     area_tokens = _meaningful_tokens(area_name)
+    index = _target_page_index(target_pages)
     best_page: dict[str, Any] | None = None
     best_score = 0
-    for page in target_pages:
-        page_text = " ".join(
-            str(page.get(field) or "")
-            for field in ("url", "title", "meta_description", "heading_text")
-        ).casefold()
-        page_tokens = _meaningful_tokens(page_text)
+    # Area matches add at most 3 points and a page needs 6 to be chosen, so only pages
+    # matching a keyword/service token or the service phrase can win. Scoring them in
+    # page order keeps the same first-best tie-breaking as scoring every page.
+    for position in index.candidates(keyword_tokens | service_tokens, (service_name,)):
+        page = index.pages[position]
+        page_text = index.texts[position]
+        page_tokens = index.tokens[position]
         score = 0
         if service_name and service_name.casefold() in page_text:
             score += 8
@@ -6,11 +6,13 @@ import io
 import json
 import re
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import urlsplit
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401  # Register every mapped table for rollback dependency checks.
@@ -19,7 +21,11 @@ from app.models.authority import DirectoryListing, DirectoryListingObservation
 from app.models.business_location import BusinessLocation
 from app.models.campaign import Campaign
 from app.models.competitor import Competitor
-from app.models.migration_import import MigrationImportBatch, MigrationImportRecord
+from app.models.migration_import import (
+    MigrationImportBatch,
+    MigrationImportRecord,
+    MigrationUploadReviewRow,
+)
 from app.models.organization import Organization
 from app.models.portfolio import Portfolio
 from app.models.rank import CampaignKeyword, KeywordCluster, RankingSnapshot
@@ -38,6 +44,17 @@ from app.services.listing_inventory_service import compare_listing_fields
 
 MAX_IMPORT_ROWS = 2_500
 MAX_CELL_LENGTH = 1_000
+REVIEW_BATCH_SIZE = 1_000
+APPLY_BATCH_SIZE = 500
+# Rows are applied in dependency order: searches need their location and
+# ranking history needs its search.
+APPLY_PHASES = (
+    ("location",),
+    ("keyword", "competitor"),
+    ("ranking",),
+    ("listing",),
+    ("report_recipient",),
+)
 RECORD_TYPES = {
     "location",
     "keyword",
@@ -148,7 +165,8 @@ def dry_run_migration_csv(
     max_rows: int = MAX_IMPORT_ROWS,
 ) -> dict[str, Any]:
     reader, field_mapping, ignored_headers, adapter_name = _reader(
-        csv_text,
+        io.StringIO(csv_text.lstrip("\ufeff")),
+        sample=csv_text[:8_192],
         source_system=source_system,
     )
     raw_rows: list[dict[str, str]] = []
@@ -176,111 +194,19 @@ def dry_run_migration_csv(
             reason_code="migration_csv_empty",
         )
 
-    existing_locations = (
-        db.query(BusinessLocation)
-        .filter(BusinessLocation.organization_id == organization_id)
-        .order_by(BusinessLocation.created_at.asc(), BusinessLocation.id.asc())
-        .all()
-    )
-    locations_by_name: dict[str, list[BusinessLocation]] = defaultdict(list)
-    locations_by_domain: dict[str, list[BusinessLocation]] = defaultdict(list)
-    for location in existing_locations:
-        locations_by_name[_text_key(location.name)].append(location)
-        domain = _domain(location.domain)
-        if domain:
-            locations_by_domain[domain].append(location)
-
-    campaigns = (
-        db.query(Campaign)
-        .filter(
-            Campaign.organization_id == organization_id,
-            Campaign.tenant_id == tenant_id,
-            Campaign.business_location_id.is_not(None),
-        )
-        .all()
+    lookups = _load_review_lookups(db, organization_id=organization_id, tenant_id=tenant_id)
+    lookups.existing_rankings = _existing_rankings(
+        db,
+        tenant_id=tenant_id,
+        campaign_ids=[campaign.id for campaign in lookups.campaign_by_location.values()],
     )
-    campaign_by_location = {
-        str(row.business_location_id): row for row in campaigns if row.business_location_id
-    }
-    campaign_ids = [row.id for row in campaigns]
-    existing_keywords: dict[str, set[str]] = defaultdict(set)
-    existing_competitors: dict[str, set[str]] = defaultdict(set)
-    existing_rankings: dict[tuple[str, str, str], set[int]] = defaultdict(set)
-    existing_listing_evidence: set[tuple[str, str, str, str]] = set()
-    existing_recipients: dict[str, set[str]] = defaultdict(set)
-    if campaign_ids:
-        for row in (
-            db.query(CampaignKeyword)
-            .filter(
-                CampaignKeyword.tenant_id == tenant_id,
-                CampaignKeyword.campaign_id.in_(campaign_ids),
-            )
-            .all()
-        ):
-            existing_keywords[row.campaign_id].add(_text_key(row.keyword))
-        for row in (
-            db.query(Competitor)
-            .filter(
-                Competitor.tenant_id == tenant_id,
-                Competitor.campaign_id.in_(campaign_ids),
-            )
-            .all()
-        ):
-            domain = _domain(row.domain)
-            if domain:
-                existing_competitors[row.campaign_id].add(domain)
-        for snapshot, keyword in (
-            db.query(RankingSnapshot, CampaignKeyword)
-            .join(CampaignKeyword, CampaignKeyword.id == RankingSnapshot.keyword_id)
-            .filter(
-                RankingSnapshot.tenant_id == tenant_id,
-                RankingSnapshot.campaign_id.in_(campaign_ids),
-            )
-            .all()
-        ):
-            captured = _as_utc(snapshot.captured_at)
-            existing_rankings[
-                (snapshot.campaign_id, _text_key(keyword.keyword), captured.isoformat())
-            ].add(int(snapshot.position))
-        for listing in (
-            db.query(DirectoryListing)
-            .filter(
-                DirectoryListing.tenant_id == tenant_id,
-                DirectoryListing.campaign_id.in_(campaign_ids),
-                DirectoryListing.source_type == "imported",
-            )
-            .all()
-        ):
-            existing_listing_evidence.add(
-                _listing_evidence_key(
-                    location_id=listing.business_location_id,
-                    directory_name=listing.source_name,
-                    captured_at=_as_utc(listing.last_seen_at),
-                    source_record_id=listing.source_record_id,
-                    listing_url=listing.listing_url,
-                )
-            )
-        for recipient in (
-            db.query(ReportRecipient)
-            .filter(
-                ReportRecipient.tenant_id == tenant_id,
-                ReportRecipient.campaign_id.in_(campaign_ids),
-            )
-            .all()
-        ):
-            existing_recipients[recipient.campaign_id].add(recipient.email.strip().lower())
-
-    file_locations: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    file_keywords: dict[tuple[str, str], list[int]] = defaultdict(list)
-    for index, row in enumerate(raw_rows, start=2):
+    file_locations: Counter[str] = Counter()
+    file_keywords: Counter[tuple[str, str]] = Counter()
+    for row in raw_rows:
         if _record_type(row.get("record_type")) == "location" and row.get("location_name"):
-            file_locations[_text_key(row["location_name"])].append(
-                {"row_number": index, "domain": _domain(row.get("website"))}
-            )
+            file_locations[_text_key(row["location_name"])] += 1
         if _record_type(row.get("record_type")) == "keyword" and row.get("location_name"):
-            file_keywords[
-                (_text_key(row["location_name"]), _text_key(row.get("phrase")))
-            ].append(index)
+            file_keywords[(_text_key(row["location_name"]), _text_key(row.get("phrase")))] += 1
 
     seen: set[tuple[str, ...]] = set()
     results: list[dict[str, Any]] = []
@@ -292,53 +218,23 @@ def dry_run_migration_csv(
                 seen=seen,
                 file_locations=file_locations,
                 file_keywords=file_keywords,
-                locations_by_name=locations_by_name,
-                locations_by_domain=locations_by_domain,
-                campaign_by_location=campaign_by_location,
-                existing_keywords=existing_keywords,
-                existing_competitors=existing_competitors,
-                existing_rankings=existing_rankings,
-                existing_listing_evidence=existing_listing_evidence,
-                existing_recipients=existing_recipients,
+                lookups=lookups,
             )
         )
 
     statuses = Counter(str(row["status"]) for row in results)
-    types = Counter(str(row["record_type"]) for row in results if row["record_type"] in RECORD_TYPES)
-    result = {
-        "mode": "dry_run",
-        "source_system": source_system,
-        "adapter": adapter_name,
-        "source_sha256": _source_hash(csv_text),
-        "writes_performed": 0,
-        "field_mapping": field_mapping,
-        "ignored_columns": [
-            {
-                "column": header,
-                "populated_rows": ignored_column_counts[header],
-                "reason": reason,
-            }
-            for header, reason in ignored_headers
-        ],
-        "summary": {
-            "total_rows": len(results),
-            "ready": statuses["ready"],
-            "already_saved": statuses["already_saved"],
-            "duplicates_in_file": statuses["duplicate"],
-            "needs_attention": statuses["needs_attention"],
-            "locations": types["location"],
-            "keywords": types["keyword"],
-            "competitors": types["competitor"],
-            "ranking_history": types["ranking"],
-            "listing_history": types["listing"],
-            "report_recipients": types["report_recipient"],
-        },
-        "rows": results,
-        "next_step": (
-            "Fix the rows marked Needs attention, then review the ready rows before importing. "
-            "Nothing has been changed yet."
-        ),
-    }
+    types = Counter(str(row["record_type"]) for row in results)
+    result = _review_result(
+        source_system=source_system,
+        adapter_name=adapter_name,
+        source_sha256=_source_hash(csv_text),
+        field_mapping=field_mapping,
+        ignored_headers=ignored_headers,
+        ignored_column_counts=ignored_column_counts,
+        statuses=statuses,
+        types=types,
+    )
+    result["rows"] = results
     result["review_hash"] = _review_hash(result)
     return result
 
@@ -413,18 +309,7 @@ def apply_migration_csv(
         for reviewed_row in review["rows"]
         if reviewed_row["status"] == "ready" and reviewed_row["record_type"] == "location"
     )
-    if ready_location_count:
-        try:
-            assert_active_location_capacity(
-                db,
-                organization_id=organization_id,
-                requested_delta=ready_location_count,
-            )
-        except ActiveLocationAllowanceError as exc:
-            raise MigrationImportError(
-                str(exc),
-                reason_code=exc.reason_code,
-            ) from exc
+    _assert_location_capacity(db, organization_id=organization_id, requested_delta=ready_location_count)
 
     now = datetime.now(UTC)
     batch = MigrationImportBatch(
@@ -447,620 +332,1414 @@ def apply_migration_csv(
 
     records: dict[int, MigrationImportRecord] = {}
     for reviewed_row in review["rows"]:
-        row_status = "pending" if reviewed_row["status"] == "ready" else "skipped"
-        record = MigrationImportRecord(
-            batch_id=batch.id,
-            tenant_id=tenant_id,
-            organization_id=organization_id,
-            row_number=int(reviewed_row["row_number"]),
-            record_type=str(reviewed_row["record_type"]),
-            status=row_status,
-            source_values=dict(reviewed_row["values"]),
-            result={
-                "review_status": reviewed_row["status"],
-                "detail": reviewed_row["detail"],
-                "issues": reviewed_row["issues"],
-                "matched_location_id": reviewed_row["matched_location_id"],
-                "matched_location_name": reviewed_row["matched_location_name"],
-            },
-            created_entities=[],
-            created_at=now,
-        )
+        record = MigrationImportRecord(**_import_record_values(batch, reviewed_row, now))
         db.add(record)
         records[int(reviewed_row["row_number"])] = record
 
+    context = _ApplyContext(
+        organization_id=organization_id,
+        tenant_id=tenant_id,
+        source_system=source_system,
+        batch_id=batch.id,
+        now=now,
+    )
     created_entities: list[dict[str, str]] = []
-    new_locations: dict[str, BusinessLocation] = {}
-    campaign_cache: dict[str, Campaign] = {}
-    cluster_cache: dict[tuple[str, str], KeywordCluster] = {}
-    keyword_cache: dict[tuple[str, str], CampaignKeyword] = {}
+    for record_types in APPLY_PHASES:
+        for reviewed_row in review["rows"]:
+            if reviewed_row["status"] != "ready" or reviewed_row["record_type"] not in record_types:
+                continue
+            record = records[int(reviewed_row["row_number"])]
+            row_entities = _apply_reviewed_row(db, context, reviewed_row, record)
+            created_entities.extend(row_entities)
 
-    for reviewed_row in review["rows"]:
-        if reviewed_row["status"] != "ready" or reviewed_row["record_type"] != "location":
-            continue
-        values = reviewed_row["values"]
-        try:
-            payload = create_business_location_with_portfolio(
-                db,
-                organization_id=organization_id,
-                name=values["location_name"],
-                domain=_domain(values.get("website")) or None,
-                primary_city=values.get("city") or None,
-                city=values.get("city") or None,
-                region=values.get("region") or None,
-                country_code=(values.get("country_code") or "US")[:2].upper(),
-                postal_code=values.get("postal_code") or None,
+    created_entities = _deduplicate_entities(created_entities)
+    counts = Counter(item["entity_type"] for item in created_entities)
+    batch.created_entities = created_entities
+    batch.summary = {
+        **review["summary"],
+        "records_applied": sum(1 for row in records.values() if row.status == "applied"),
+        **{summary_key: counts[entity_type] for entity_type, summary_key in _APPLIED_COUNTS.items()},
+    }
+    _write_applied_audit_log(db, batch)
+    db.flush()
+    return serialize_migration_batch(db, batch, include_records=True)
+
+
+def review_migration_upload(
+    db: Session,
+    *,
+    upload_id: str,
+    organization_id: str,
+    tenant_id: str,
+    source_system: str,
+    lines: Iterable[str],
+    sample: str,
+    source_sha256: str,
+    max_rows: int,
+) -> dict[str, Any]:
+    """Review an uploaded file into ``migration_upload_review_rows``.
+
+    The first pass parses ``lines`` once and stages every row; the second
+    reviews the staged rows in keyset batches, answering "seen earlier in the
+    file" from indexed digests so memory stays flat however large the file is.
+    The returned review carries a digest of the rows instead of the rows.
+    """
+    reader, field_mapping, ignored_headers, adapter_name = _reader(
+        lines,
+        sample=sample,
+        source_system=source_system,
+    )
+    db.query(MigrationUploadReviewRow).filter(
+        MigrationUploadReviewRow.upload_id == upload_id
+    ).delete(synchronize_session=False)
+    ignored_column_counts = {header: 0 for header, _reason in ignored_headers}
+    file_locations: Counter[str] = Counter()
+    staged: list[dict[str, Any]] = []
+    row_count = 0
+    try:
+        for row_number, raw_row in enumerate(reader, start=2):
+            if row_count >= max_rows:
+                raise MigrationImportError(
+                    f"Review no more than {max_rows:,} rows at one time.",
+                    reason_code="migration_row_limit_exceeded",
+                )
+            row_count += 1
+            for header in ignored_column_counts:
+                if str(raw_row.get(header) or "").strip():
+                    ignored_column_counts[header] += 1
+            row = _canonical_row(raw_row, field_mapping)
+            record_type = _record_type(row.get("record_type"))
+            keyword_key = None
+            if record_type == "location" and row.get("location_name"):
+                file_locations[_text_key(row["location_name"])] += 1
+            if record_type == "keyword" and row.get("location_name"):
+                keyword_key = _key_digest((_text_key(row["location_name"]), _text_key(row.get("phrase"))))
+            staged.append(
+                {
+                    "upload_id": upload_id,
+                    "tenant_id": tenant_id,
+                    "organization_id": organization_id,
+                    "row_number": row_number,
+                    "record_type": record_type[:30],
+                    "status": "staged",
+                    "keyword_key": keyword_key,
+                    "review": {"values": row},
+                }
             )
-        except BusinessLocationConflictError as exc:
-            raise MigrationImportError(
-                "A location changed while the import was starting. Review the file again.",
-                reason_code="migration_location_changed",
-            ) from exc
-        db.flush()
-        location = db.get(BusinessLocation, str(payload["id"]))
-        if location is None:
-            raise MigrationImportError(
-                "The new location could not be verified.",
-                reason_code="migration_location_create_failed",
+            if len(staged) >= REVIEW_BATCH_SIZE:
+                db.execute(insert(MigrationUploadReviewRow), staged)
+                staged = []
+    except csv.Error as exc:
+        raise MigrationImportError(
+            "The file could not be read as a CSV.",
+            reason_code="migration_csv_invalid",
+        ) from exc
+    if staged:
+        db.execute(insert(MigrationUploadReviewRow), staged)
+    if not row_count:
+        raise MigrationImportError(
+            "The file has headings but no data rows.",
+            reason_code="migration_csv_empty",
+        )
+
+    lookups = _load_review_lookups(db, organization_id=organization_id, tenant_id=tenant_id)
+    campaign_ids = [campaign.id for campaign in lookups.campaign_by_location.values()]
+    statuses: Counter[str] = Counter()
+    types: Counter[str] = Counter()
+    rows_digest = hashlib.sha256()
+    after_row = 0
+    while True:
+        batch = (
+            db.query(
+                MigrationUploadReviewRow.id,
+                MigrationUploadReviewRow.row_number,
+                MigrationUploadReviewRow.review,
             )
-        portfolio = _portfolio_for_location(db, organization_id, location.id)
-        if portfolio is None:
-            raise MigrationImportError(
-                "The new location workspace could not be verified.",
-                reason_code="migration_location_portfolio_missing",
+            .filter(
+                MigrationUploadReviewRow.upload_id == upload_id,
+                MigrationUploadReviewRow.row_number > after_row,
             )
-        location_entities = [
-            _entity("business_location", location.id),
-            _entity("portfolio", portfolio.id),
-        ]
-        campaign, campaign_created = _ensure_campaign(
-            db,
-            organization_id=organization_id,
-            tenant_id=tenant_id,
-            location=location,
+            .order_by(MigrationUploadReviewRow.row_number.asc())
+            .limit(REVIEW_BATCH_SIZE)
+            .all()
         )
-        campaign_cache[location.id] = campaign
-        if campaign_created:
-            location_entities.append(_entity("campaign", campaign.id))
-        new_locations[_text_key(location.name)] = location
-        _mark_record_applied(records[int(reviewed_row["row_number"])], location_entities)
-        created_entities.extend(location_entities)
-
-    for reviewed_row in review["rows"]:
-        if (
-            reviewed_row["status"] != "ready"
-            or reviewed_row["record_type"] not in {"keyword", "competitor"}
-        ):
-            continue
-        values = reviewed_row["values"]
-        location = _location_for_reviewed_row(
+        if not batch:
+            break
+        rows = [(row_id, row_number, review["values"]) for row_id, row_number, review in batch]
+        keys = {row_number: _row_key(row_number, values) for _row_id, row_number, values in rows}
+        seen = _seen_before(db, upload_id=upload_id, before_row=batch[0][1], keys=keys.values())
+        file_keywords, captured = _ranking_references(db, upload_id=upload_id, rows=rows)
+        lookups.existing_rankings = _existing_rankings(
             db,
-            organization_id=organization_id,
-            reviewed_row=reviewed_row,
-            new_locations=new_locations,
+            tenant_id=tenant_id,
+            campaign_ids=campaign_ids,
+            captured_at=captured,
         )
-        if location is None:
-            raise MigrationImportError(
-                "A reviewed location could not be found while applying the import.",
-                reason_code="migration_location_changed",
-            )
-        campaign = campaign_cache.get(location.id)
-        campaign_created = False
-        if campaign is None:
-            campaign, campaign_created = _ensure_campaign(
-                db,
-                organization_id=organization_id,
-                tenant_id=tenant_id,
-                location=location,
-            )
-            campaign_cache[location.id] = campaign
-        row_entities: list[dict[str, str]] = []
-        if campaign_created:
-            row_entities.append(_entity("campaign", campaign.id))
-
-        if reviewed_row["record_type"] == "keyword":
-            group_name = (values.get("keyword_group") or "Imported searches")[:120]
-            cluster_key = (campaign.id, _text_key(group_name))
-            cluster = cluster_cache.get(cluster_key)
-            cluster_created = False
-            if cluster is None:
-                cluster = (
-                    db.query(KeywordCluster)
-                    .filter(
-                        KeywordCluster.tenant_id == tenant_id,
-                        KeywordCluster.campaign_id == campaign.id,
-                    )
-                    .all()
-                )
-                cluster = next(
-                    (item for item in cluster if _text_key(item.name) == _text_key(group_name)),
-                    None,
-                )
-                if cluster is None:
-                    cluster = KeywordCluster(
-                        tenant_id=tenant_id,
-                        campaign_id=campaign.id,
-                        name=group_name,
-                    )
-                    db.add(cluster)
-                    db.flush()
-                    cluster_created = True
-                cluster_cache[cluster_key] = cluster
-            if cluster_created:
-                row_entities.append(_entity("keyword_cluster", cluster.id))
-            keyword = CampaignKeyword(
-                tenant_id=tenant_id,
-                campaign_id=campaign.id,
-                cluster_id=cluster.id,
-                keyword=values["phrase"],
-                location_code=(location.provider_location_code or location.country_code or "US")[:64],
+        updates: list[dict[str, Any]] = []
+        for row_id, row_number, values in rows:
+            key = keys[row_number]
+            first_occurrence = key not in seen
+            result = _review_row(
+                row_number=row_number,
+                row=values,
+                seen=seen,
+                file_locations=file_locations,
+                file_keywords=file_keywords,
+                lookups=lookups,
             )
-            db.add(keyword)
-            db.flush()
-            row_entities.append(_entity("campaign_keyword", keyword.id))
-            keyword_cache[(campaign.id, _text_key(keyword.keyword))] = keyword
-        else:
-            competitor = Competitor(
-                tenant_id=tenant_id,
-                campaign_id=campaign.id,
-                domain=_domain(values.get("competitor_domain")),
-                label=None,
-                discovery_source=f"migration_{source_system}"[:40],
-                review_status="confirmed",
+            statuses[str(result["status"])] += 1
+            types[str(result["record_type"])] += 1
+            rows_digest.update(json.dumps(result, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+            updates.append(
+                {
+                    "id": row_id,
+                    "status": result["status"],
+                    "dedupe_key": _key_digest(key) if first_occurrence and key in seen else None,
+                    "review": result,
+                }
             )
-            db.add(competitor)
-            db.flush()
-            row_entities.append(_entity("competitor", competitor.id))
+        db.execute(update(MigrationUploadReviewRow), updates)
+        after_row = batch[-1][1]
 
-        _mark_record_applied(records[int(reviewed_row["row_number"])], row_entities)
-        created_entities.extend(row_entities)
+    result = _review_result(
+        source_system=source_system,
+        adapter_name=adapter_name,
+        source_sha256=source_sha256,
+        field_mapping=field_mapping,
+        ignored_headers=ignored_headers,
+        ignored_column_counts=ignored_column_counts,
+        statuses=statuses,
+        types=types,
+    )
+    result["rows_sha256"] = rows_digest.hexdigest()
+    result["setup_sha256"] = _setup_fingerprint(lookups)
+    result["review_hash"] = _review_hash(result)
+    return result
 
-    for reviewed_row in review["rows"]:
-        if reviewed_row["status"] != "ready" or reviewed_row["record_type"] != "ranking":
-            continue
-        values = reviewed_row["values"]
-        location = _location_for_reviewed_row(
-            db,
-            organization_id=organization_id,
-            reviewed_row=reviewed_row,
-            new_locations=new_locations,
+
+def review_setup_changed(
+    db: Session,
+    *,
+    organization_id: str,
+    tenant_id: str,
+    review: Mapping[str, Any],
+) -> bool:
+    """Whether the saved setup a streamed review was checked against has changed since.
+
+    Reviews saved before the setup fingerprint existed report ``False``.
+    """
+    if "setup_sha256" not in review:
+        return False
+    lookups = _load_review_lookups(db, organization_id=organization_id, tenant_id=tenant_id)
+    return _setup_fingerprint(lookups) != review["setup_sha256"]
+
+
+def start_upload_apply(
+    db: Session,
+    *,
+    organization_id: str,
+    tenant_id: str,
+    actor_user_id: str,
+    upload_id: str,
+    source_system: str,
+    source_filename: str | None,
+    source_sha256: str,
+    review: dict[str, Any],
+    client_request_id: str,
+    confirmed: bool,
+) -> MigrationImportBatch:
+    """Open an ``applying`` batch for a streamed review.
+
+    Rows are applied later by ``apply_upload_rows`` in committed batches, so
+    the organization lock is only held while the batch is created.
+    """
+    if not confirmed:
+        raise MigrationImportError(
+            "Confirm that you reviewed the rows before importing them.",
+            reason_code="migration_confirmation_required",
+        )
+    review_hash = str(review["review_hash"])
+    db.query(Organization).filter(Organization.id == organization_id).with_for_update().one()
+    existing_batch = (
+        db.query(MigrationImportBatch)
+        .filter(
+            MigrationImportBatch.organization_id == organization_id,
+            MigrationImportBatch.client_request_id == client_request_id,
         )
-        if location is None:
+        .first()
+    )
+    if existing_batch is not None:
+        if (
+            existing_batch.source_sha256 != source_sha256
+            or existing_batch.review_hash != review_hash
+        ):
             raise MigrationImportError(
-                "A reviewed location could not be found while importing ranking history.",
-                reason_code="migration_location_changed",
-            )
-        campaign = campaign_cache.get(location.id)
-        if campaign is None:
-            campaign, _created = _ensure_campaign(
-                db,
-                organization_id=organization_id,
-                tenant_id=tenant_id,
-                location=location,
-            )
-            campaign_cache[location.id] = campaign
-        keyword_key = (campaign.id, _text_key(values.get("phrase")))
-        keyword = keyword_cache.get(keyword_key)
-        if keyword is None:
-            keyword = next(
-                (
-                    item
-                    for item in db.query(CampaignKeyword)
-                    .filter(
-                        CampaignKeyword.tenant_id == tenant_id,
-                        CampaignKeyword.campaign_id == campaign.id,
-                    )
-                    .all()
-                    if _text_key(item.keyword) == keyword_key[1]
-                ),
-                None,
+                "This import request was already used for a different reviewed file.",
+                reason_code="migration_idempotency_conflict",
             )
-        captured_at = _parse_import_datetime(values.get("captured_at"))
-        position = _parse_position(values.get("position"))
-        if keyword is None or captured_at is None or position is None:
-            raise MigrationImportError(
-                "The reviewed ranking history no longer matches a tracked search.",
-                reason_code="migration_ranking_reference_changed",
+        return existing_batch
+    if review_setup_changed(db, organization_id=organization_id, tenant_id=tenant_id, review=review):
+        raise MigrationImportError(
+            "The file or saved setup changed after review. Review the file again before importing.",
+            reason_code="migration_review_changed",
+        )
+    if review["summary"]["needs_attention"]:
+        raise MigrationImportError(
+            "Fix every row marked Needs attention before importing.",
+            reason_code="migration_rows_need_attention",
+        )
+    if not review["summary"]["ready"]:
+        raise MigrationImportError(
+            "There are no new rows to import.",
+            reason_code="migration_nothing_to_import",
+        )
+    if "rows" in review:
+        # Reviews saved before review rows moved into their own table.
+        ready_location_count = sum(
+            1
+            for reviewed_row in review["rows"]
+            if reviewed_row["status"] == "ready" and reviewed_row["record_type"] == "location"
+        )
+    else:
+        ready_location_count = (
+            db.query(func.count(MigrationUploadReviewRow.id))
+            .filter(
+                MigrationUploadReviewRow.upload_id == upload_id,
+                MigrationUploadReviewRow.status == "ready",
+                MigrationUploadReviewRow.record_type == "location",
             )
-        snapshot = RankingSnapshot(
-            tenant_id=tenant_id,
-            campaign_id=campaign.id,
-            keyword_id=keyword.id,
-            position=position,
-            confidence=0.7,
-            captured_at=captured_at,
-            month_partition=captured_at.strftime("%Y-%m"),
-            source_type="imported",
-            source_system=source_system,
-            source_record_id=(values.get("source_record_id") or None),
-            import_batch_id=batch.id,
+            .scalar()
+            or 0
         )
-        db.add(snapshot)
+    _assert_location_capacity(db, organization_id=organization_id, requested_delta=ready_location_count)
+
+    now = datetime.now(UTC)
+    batch = MigrationImportBatch(
+        tenant_id=tenant_id,
+        organization_id=organization_id,
+        source_system=source_system,
+        source_filename=_safe_filename(source_filename),
+        source_sha256=source_sha256,
+        review_hash=review_hash,
+        client_request_id=client_request_id,
+        status="applying",
+        summary={
+            **review["summary"],
+            **{key: 0 for key in _APPLIED_COUNTS.values()},
+            "records_applied": 0,
+            "progress": {
+                "phase": "staging",
+                "after_row": 0,
+                "rows_staged": 0,
+                "rows_applied": 0,
+                "total_rows": review["summary"]["total_rows"],
+                "ready_rows": review["summary"]["ready"],
+            },
+        },
+        created_entities=[],
+        applied_by=actor_user_id,
+        applied_at=now,
+        created_at=now,
+    )
+    db.add(batch)
+    db.flush()
+    return batch
+
+
+def apply_upload_rows(
+    db: Session,
+    *,
+    batch: MigrationImportBatch,
+    upload_id: str,
+    max_rows: int,
+    commit: bool = False,
+    legacy_rows: list[dict[str, Any]] | None = None,
+) -> bool:
+    """Apply up to ``max_rows`` rows of an ``applying`` batch.
+
+    Import records are staged from the review table first, then applied phase
+    by phase in ``APPLY_BATCH_SIZE`` slices. Progress is kept in the batch
+    summary, so a run can stop after any slice and the next one resumes there.
+    Reviews saved before the review table existed pass their rows as
+    ``legacy_rows`` and are staged from those instead.
+    Returns ``True`` once the batch is applied.
+    """
+    if batch.status != "applying":
+        return batch.status == "applied"
+    context = _resume_apply_context(db, batch)
+    handled = 0
+    while handled < max_rows:
+        summary = dict(batch.summary)
+        progress = dict(summary["progress"])
+        limit = min(APPLY_BATCH_SIZE, max_rows - handled)
+        if progress["phase"] == "staging":
+            staged = _stage_import_records(
+                db,
+                batch=batch,
+                upload_id=upload_id,
+                after_row=int(progress["after_row"]),
+                limit=limit,
+                legacy_rows=legacy_rows,
+            )
+            if staged:
+                progress["after_row"] = staged[-1]
+                progress["rows_staged"] += len(staged)
+            else:
+                progress.update(phase=0, after_row=0)
+            handled += len(staged)
+        elif progress["phase"] < len(APPLY_PHASES):
+            record_types = APPLY_PHASES[progress["phase"]]
+            records = (
+                db.query(MigrationImportRecord)
+                .filter(
+                    MigrationImportRecord.batch_id == batch.id,
+                    MigrationImportRecord.status == "pending",
+                    MigrationImportRecord.record_type.in_(record_types),
+                    MigrationImportRecord.row_number > int(progress["after_row"]),
+                )
+                .order_by(MigrationImportRecord.row_number.asc())
+                .limit(limit)
+                .all()
+            )
+            if not records:
+                progress.update(phase=progress["phase"] + 1, after_row=0)
+            else:
+                # Serialize with other imports for the organization, one slice at a time.
+                db.query(Organization).filter(
+                    Organization.id == batch.organization_id
+                ).with_for_update().one()
+                if "location" in record_types:
+                    _assert_location_capacity(
+                        db,
+                        organization_id=batch.organization_id,
+                        requested_delta=len(records),
+                    )
+                created = Counter()
+                for record in records:
+                    entities = _apply_reviewed_row(db, context, _reviewed_row_from_record(record), record)
+                    created.update(item["entity_type"] for item in entities)
+                for entity_type, summary_key in _APPLIED_COUNTS.items():
+                    summary[summary_key] += created[entity_type]
+                summary["records_applied"] += len(records)
+                progress["after_row"] = records[-1].row_number
+                progress["rows_applied"] += len(records)
+                handled += len(records)
+        else:
+            summary["progress"] = {**progress, "phase": "applied"}
+            batch.summary = summary
+            batch.status = "applied"
+            _write_applied_audit_log(db, batch)
+            db.flush()
+            if commit:
+                db.commit()
+            return True
+        summary["progress"] = progress
+        batch.summary = summary
         db.flush()
-        snapshot_entities = [_entity("ranking_snapshot", snapshot.id)]
-        _mark_record_applied(records[int(reviewed_row["row_number"])], snapshot_entities)
-        created_entities.extend(snapshot_entities)
+        if commit:
+            db.commit()
+    return False
+
+
+# Created entity types counted in an applied batch summary.
+_APPLIED_COUNTS = {
+    "business_location": "locations_created",
+    "campaign_keyword": "keywords_created",
+    "competitor": "competitors_created",
+    "ranking_snapshot": "ranking_history_created",
+    "directory_listing": "listing_history_created",
+    "report_recipient": "report_recipients_created",
+}
 
-    for reviewed_row in review["rows"]:
-        if reviewed_row["status"] != "ready" or reviewed_row["record_type"] != "listing":
-            continue
-        values = reviewed_row["values"]
-        location = _location_for_reviewed_row(
-            db,
-            organization_id=organization_id,
-            reviewed_row=reviewed_row,
-            new_locations=new_locations,
+
+def list_migration_batches(
+    db: Session,
+    *,
+    organization_id: str,
+    tenant_id: str,
+) -> list[dict[str, Any]]:
+    rows = (
+        db.query(MigrationImportBatch)
+        .filter(
+            MigrationImportBatch.organization_id == organization_id,
+            MigrationImportBatch.tenant_id == tenant_id,
         )
-        if location is None:
-            raise MigrationImportError(
-                "A reviewed location could not be found while importing listing history.",
-                reason_code="migration_location_changed",
+        .order_by(MigrationImportBatch.created_at.desc(), MigrationImportBatch.id.desc())
+        .limit(50)
+        .all()
+    )
+    return [serialize_migration_batch(db, row, include_records=False) for row in rows]
+
+
+def rollback_migration_batch(
+    db: Session,
+    *,
+    organization_id: str,
+    tenant_id: str,
+    actor_user_id: str,
+    batch_id: str,
+    confirmed: bool,
+) -> dict[str, Any]:
+    if not confirmed:
+        raise MigrationImportError(
+            "Confirm that you want to remove the records created by this import.",
+            reason_code="migration_rollback_confirmation_required",
+        )
+    batch = (
+        db.query(MigrationImportBatch)
+        .filter(
+            MigrationImportBatch.id == batch_id,
+            MigrationImportBatch.organization_id == organization_id,
+            MigrationImportBatch.tenant_id == tenant_id,
+        )
+        .with_for_update()
+        .first()
+    )
+    if batch is None:
+        raise MigrationImportError(
+            "Import batch not found.",
+            reason_code="migration_batch_not_found",
+        )
+    if batch.status == "rolled_back":
+        return serialize_migration_batch(db, batch, include_records=True)
+    if batch.status != "applied":
+        raise MigrationImportError(
+            "Only an applied import can be rolled back.",
+            reason_code="migration_batch_not_applied",
+        )
+
+    entities = _entities_by_type(
+        [
+            *batch.created_entities,
+            *(
+                item
+                for (record_entities,) in db.query(MigrationImportRecord.created_entities).filter(
+                    MigrationImportRecord.batch_id == batch.id,
+                    MigrationImportRecord.status == "applied",
+                )
+                for item in record_entities or []
+            ),
+        ]
+    )
+    blockers = _rollback_blockers(db, entities)
+    if blockers:
+        raise MigrationImportError(
+            "This import now has newer work attached to it. Remove that work first or keep the import.",
+            reason_code="migration_rollback_blocked_by_new_work",
+        )
+
+    _delete_created_entities(db, organization_id, tenant_id, entities)
+    rolled_back_at = datetime.now(UTC)
+    batch.status = "rolled_back"
+    batch.rolled_back_by = actor_user_id
+    batch.rolled_back_at = rolled_back_at
+    (
+        db.query(MigrationImportRecord)
+        .filter(
+            MigrationImportRecord.batch_id == batch.id,
+            MigrationImportRecord.status == "applied",
+        )
+        .update({MigrationImportRecord.status: "rolled_back"}, synchronize_session=False)
+    )
+    write_audit_log(
+        db,
+        tenant_id=tenant_id,
+        actor_user_id=actor_user_id,
+        event_type="migration.import.rolled_back",
+        payload={
+            "batch_id": batch.id,
+            "organization_id": organization_id,
+            "source_sha256": batch.source_sha256,
+            "review_hash": batch.review_hash,
+            "removed_entities": sum(len(values) for values in entities.values()),
+        },
+    )
+    db.flush()
+    return serialize_migration_batch(db, batch, include_records=True)
+
+
+def serialize_migration_batch(
+    db: Session,
+    batch: MigrationImportBatch,
+    *,
+    include_records: bool,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "id": batch.id,
+        "source_system": batch.source_system,
+        "source_filename": batch.source_filename,
+        "source_sha256": batch.source_sha256,
+        "review_hash": batch.review_hash,
+        "client_request_id": batch.client_request_id,
+        "status": batch.status,
+        "summary": batch.summary,
+        "created_entities": batch.created_entities,
+        "applied_by": batch.applied_by,
+        "applied_at": batch.applied_at.isoformat(),
+        "rolled_back_by": batch.rolled_back_by,
+        "rolled_back_at": batch.rolled_back_at.isoformat() if batch.rolled_back_at else None,
+        "created_at": batch.created_at.isoformat(),
+        "rollback_available": batch.status == "applied",
+    }
+    if include_records:
+        records = (
+            db.query(MigrationImportRecord)
+            .filter(MigrationImportRecord.batch_id == batch.id)
+            .order_by(MigrationImportRecord.row_number.asc())
+            .all()
+        )
+        payload["records"] = [
+            {
+                "row_number": row.row_number,
+                "record_type": row.record_type,
+                "status": row.status,
+                "source_values": row.source_values,
+                "result": row.result,
+                "created_entities": row.created_entities,
+            }
+            for row in records
+        ]
+    return payload
+
+
+@dataclass
+class _ReviewLookups:
+    locations_by_name: dict[str, list[BusinessLocation]]
+    locations_by_domain: dict[str, list[BusinessLocation]]
+    campaign_by_location: dict[str, Campaign]
+    existing_keywords: dict[str, set[str]]
+    existing_competitors: dict[str, set[str]]
+    existing_listing_evidence: set[tuple[str, str, str, str]]
+    existing_recipients: dict[str, set[str]]
+    existing_rankings: dict[tuple[str, str, str], set[int]] = field(default_factory=dict)
+
+
+def _load_review_lookups(
+    db: Session,
+    *,
+    organization_id: str,
+    tenant_id: str,
+) -> _ReviewLookups:
+    existing_locations = (
+        db.query(BusinessLocation)
+        .filter(BusinessLocation.organization_id == organization_id)
+        .order_by(BusinessLocation.created_at.asc(), BusinessLocation.id.asc())
+        .all()
+    )
+    locations_by_name: dict[str, list[BusinessLocation]] = defaultdict(list)
+    locations_by_domain: dict[str, list[BusinessLocation]] = defaultdict(list)
+    for location in existing_locations:
+        locations_by_name[_text_key(location.name)].append(location)
+        domain = _domain(location.domain)
+        if domain:
+            locations_by_domain[domain].append(location)
+
+    campaigns = (
+        db.query(Campaign)
+        .filter(
+            Campaign.organization_id == organization_id,
+            Campaign.tenant_id == tenant_id,
+            Campaign.business_location_id.is_not(None),
+        )
+        .all()
+    )
+    campaign_by_location = {
+        str(row.business_location_id): row for row in campaigns if row.business_location_id
+    }
+    campaign_ids = [row.id for row in campaigns]
+    existing_keywords: dict[str, set[str]] = defaultdict(set)
+    existing_competitors: dict[str, set[str]] = defaultdict(set)
+    existing_listing_evidence: set[tuple[str, str, str, str]] = set()
+    existing_recipients: dict[str, set[str]] = defaultdict(set)
+    if campaign_ids:
+        for campaign_id, keyword in (
+            db.query(CampaignKeyword.campaign_id, CampaignKeyword.keyword)
+            .filter(
+                CampaignKeyword.tenant_id == tenant_id,
+                CampaignKeyword.campaign_id.in_(campaign_ids),
             )
-        campaign = campaign_cache.get(location.id)
-        if campaign is None:
-            campaign, _created = _ensure_campaign(
-                db,
-                organization_id=organization_id,
-                tenant_id=tenant_id,
-                location=location,
+            .all()
+        ):
+            existing_keywords[campaign_id].add(_text_key(keyword))
+        for campaign_id, competitor_domain in (
+            db.query(Competitor.campaign_id, Competitor.domain)
+            .filter(
+                Competitor.tenant_id == tenant_id,
+                Competitor.campaign_id.in_(campaign_ids),
             )
-            campaign_cache[location.id] = campaign
-        captured_at = _parse_import_datetime(values.get("captured_at"))
-        claimed_status = _listing_claim_status(values.get("listing_status"))
-        if captured_at is None or claimed_status is None:
-            raise MigrationImportError(
-                "The reviewed listing history is no longer valid.",
-                reason_code="migration_listing_reference_changed",
+            .all()
+        ):
+            domain = _domain(competitor_domain)
+            if domain:
+                existing_competitors[campaign_id].add(domain)
+        for listing in (
+            db.query(DirectoryListing)
+            .filter(
+                DirectoryListing.tenant_id == tenant_id,
+                DirectoryListing.campaign_id.in_(campaign_ids),
+                DirectoryListing.source_type == "imported",
             )
-        directory_name = str(values.get("directory_name") or "").strip()[:160]
-        listing_url = _safe_public_url(values.get("listing_url")) or None
-        observed_fields = {
-            key: value
-            for key, value in {
-                "business_name": values.get("listing_business_name"),
-                "address_line1": values.get("listing_address"),
-                "city": values.get("listing_city"),
-                "region": values.get("listing_region"),
-                "postal_code": values.get("listing_postal_code"),
-                "country_code": values.get("country_code"),
-                "phone": values.get("listing_phone"),
-                "website_url": values.get("listing_website"),
-                "primary_category": values.get("primary_category"),
-                "listing_url": listing_url,
-            }.items()
-            if value not in (None, "")
-        }
-        differences, comparable_fields = compare_listing_fields(
-            location=location,
-            observed_fields=observed_fields,
+            .all()
+        ):
+            existing_listing_evidence.add(
+                _listing_evidence_key(
+                    location_id=listing.business_location_id,
+                    directory_name=listing.source_name,
+                    captured_at=_as_utc(listing.last_seen_at),
+                    source_record_id=listing.source_record_id,
+                    listing_url=listing.listing_url,
+                )
+            )
+        for campaign_id, email in (
+            db.query(ReportRecipient.campaign_id, ReportRecipient.email)
+            .filter(
+                ReportRecipient.tenant_id == tenant_id,
+                ReportRecipient.campaign_id.in_(campaign_ids),
+            )
+            .all()
+        ):
+            existing_recipients[campaign_id].add(email.strip().lower())
+    return _ReviewLookups(
+        locations_by_name=locations_by_name,
+        locations_by_domain=locations_by_domain,
+        campaign_by_location=campaign_by_location,
+        existing_keywords=existing_keywords,
+        existing_competitors=existing_competitors,
+        existing_listing_evidence=existing_listing_evidence,
+        existing_recipients=existing_recipients,
+    )
+
+
+def _setup_fingerprint(lookups: _ReviewLookups) -> str:
+    """Digest of the saved setup a review matches rows against."""
+    setup = {
+        "locations": sorted(
+            [location.id, _text_key(location.name), _domain(location.domain) or ""]
+            for locations in lookups.locations_by_name.values()
+            for location in locations
+        ),
+        "campaigns": sorted(
+            [location_id, campaign.id] for location_id, campaign in lookups.campaign_by_location.items()
+        ),
+        "keywords": sorted([key, sorted(values)] for key, values in lookups.existing_keywords.items()),
+        "competitors": sorted([key, sorted(values)] for key, values in lookups.existing_competitors.items()),
+        "listings": sorted(list(key) for key in lookups.existing_listing_evidence),
+        "recipients": sorted([key, sorted(values)] for key, values in lookups.existing_recipients.items()),
+    }
+    encoded = json.dumps(setup, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _existing_rankings(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign_ids: list[str],
+    captured_at: set[datetime] | None = None,
+) -> dict[tuple[str, str, str], set[int]]:
+    """Saved ranking positions keyed like reviewed ranking rows.
+
+    Ranking history is the largest saved table an import touches, so the
+    streamed review narrows it to the capture dates of one row batch.
+    """
+    existing: dict[tuple[str, str, str], set[int]] = defaultdict(set)
+    if not campaign_ids or (captured_at is not None and not captured_at):
+        return existing
+    query = (
+        db.query(
+            RankingSnapshot.campaign_id,
+            RankingSnapshot.captured_at,
+            RankingSnapshot.position,
+            CampaignKeyword.keyword,
         )
-        confidence = (
-            round(max(0.0, (comparable_fields - len(differences)) / comparable_fields), 4)
-            if comparable_fields
-            else 0.0
+        .join(CampaignKeyword, CampaignKeyword.id == RankingSnapshot.keyword_id)
+        .filter(
+            RankingSnapshot.tenant_id == tenant_id,
+            RankingSnapshot.campaign_id.in_(campaign_ids),
         )
-        source_identity = str(values.get("source_record_id") or listing_url or "").strip()
-        external_seed = "|".join(
-            (
-                location.id,
-                source_system,
-                directory_name.casefold(),
-                captured_at.isoformat(),
-                source_identity.casefold(),
+    )
+    if captured_at is not None:
+        query = query.filter(RankingSnapshot.captured_at.in_(list(captured_at)))
+    for campaign_id, snapshot_captured_at, position, keyword in query.all():
+        existing[
+            (campaign_id, _text_key(keyword), _as_utc(snapshot_captured_at).isoformat())
+        ].add(int(position))
+    return existing
+
+
+def _review_result(
+    *,
+    source_system: str,
+    adapter_name: str,
+    source_sha256: str,
+    field_mapping: dict[str, str],
+    ignored_headers: list[tuple[str, str]],
+    ignored_column_counts: dict[str, int],
+    statuses: Counter[str],
+    types: Counter[str],
+) -> dict[str, Any]:
+    return {
+        "mode": "dry_run",
+        "source_system": source_system,
+        "adapter": adapter_name,
+        "source_sha256": source_sha256,
+        "writes_performed": 0,
+        "field_mapping": field_mapping,
+        "ignored_columns": [
+            {
+                "column": header,
+                "populated_rows": ignored_column_counts[header],
+                "reason": reason,
+            }
+            for header, reason in ignored_headers
+        ],
+        "summary": {
+            "total_rows": sum(statuses.values()),
+            "ready": statuses["ready"],
+            "already_saved": statuses["already_saved"],
+            "duplicates_in_file": statuses["duplicate"],
+            "needs_attention": statuses["needs_attention"],
+            "locations": types["location"],
+            "keywords": types["keyword"],
+            "competitors": types["competitor"],
+            "ranking_history": types["ranking"],
+            "listing_history": types["listing"],
+            "report_recipients": types["report_recipient"],
+        },
+        "next_step": (
+            "Fix the rows marked Needs attention, then review the ready rows before importing. "
+            "Nothing has been changed yet."
+        ),
+    }
+
+
+@dataclass
+class _ApplyContext:
+    organization_id: str
+    tenant_id: str
+    source_system: str
+    batch_id: str
+    now: datetime
+    new_locations: dict[str, BusinessLocation] = field(default_factory=dict)
+    campaigns: dict[str, Campaign] = field(default_factory=dict)
+    clusters: dict[tuple[str, str], KeywordCluster] = field(default_factory=dict)
+    keyword_ids: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+def _apply_reviewed_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+    record: MigrationImportRecord,
+) -> list[dict[str, str]]:
+    record_type = reviewed_row["record_type"]
+    result_details: dict[str, Any] = {}
+    if record_type == "location":
+        entities = _apply_location_row(db, context, reviewed_row)
+    elif record_type in {"keyword", "competitor"}:
+        entities = _apply_search_row(db, context, reviewed_row)
+    elif record_type == "ranking":
+        entities = _apply_ranking_row(db, context, reviewed_row)
+    elif record_type == "listing":
+        entities, result_details = _apply_listing_row(db, context, reviewed_row)
+    else:
+        entities, result_details = _apply_recipient_row(db, context, reviewed_row)
+    if result_details:
+        record.result = {**record.result, **result_details}
+    _mark_record_applied(record, entities)
+    return entities
+
+
+def _apply_location_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+) -> list[dict[str, str]]:
+    values = reviewed_row["values"]
+    try:
+        payload = create_business_location_with_portfolio(
+            db,
+            organization_id=context.organization_id,
+            name=values["location_name"],
+            domain=_domain(values.get("website")) or None,
+            primary_city=values.get("city") or None,
+            city=values.get("city") or None,
+            region=values.get("region") or None,
+            country_code=(values.get("country_code") or "US")[:2].upper(),
+            postal_code=values.get("postal_code") or None,
+        )
+    except BusinessLocationConflictError as exc:
+        raise MigrationImportError(
+            "A location changed while the import was starting. Review the file again.",
+            reason_code="migration_location_changed",
+        ) from exc
+    db.flush()
+    location = db.get(BusinessLocation, str(payload["id"]))
+    if location is None:
+        raise MigrationImportError(
+            "The new location could not be verified.",
+            reason_code="migration_location_create_failed",
+        )
+    portfolio = _portfolio_for_location(db, context.organization_id, location.id)
+    if portfolio is None:
+        raise MigrationImportError(
+            "The new location workspace could not be verified.",
+            reason_code="migration_location_portfolio_missing",
+        )
+    location_entities = [
+        _entity("business_location", location.id),
+        _entity("portfolio", portfolio.id),
+    ]
+    campaign, campaign_created = _ensure_campaign(
+        db,
+        organization_id=context.organization_id,
+        tenant_id=context.tenant_id,
+        location=location,
+    )
+    context.campaigns[location.id] = campaign
+    if campaign_created:
+        location_entities.append(_entity("campaign", campaign.id))
+    context.new_locations[_text_key(location.name)] = location
+    return location_entities
+
+
+def _apply_search_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+) -> list[dict[str, str]]:
+    values = reviewed_row["values"]
+    location = _location_for_reviewed_row(
+        db,
+        organization_id=context.organization_id,
+        reviewed_row=reviewed_row,
+        new_locations=context.new_locations,
+    )
+    if location is None:
+        raise MigrationImportError(
+            "A reviewed location could not be found while applying the import.",
+            reason_code="migration_location_changed",
+        )
+    campaign, campaign_created = _campaign_for_location(db, context, location)
+    row_entities: list[dict[str, str]] = []
+    if campaign_created:
+        row_entities.append(_entity("campaign", campaign.id))
+    if reviewed_row["record_type"] == "keyword":
+        group_name = (values.get("keyword_group") or "Imported searches")[:120]
+        cluster_key = (campaign.id, _text_key(group_name))
+        cluster = context.clusters.get(cluster_key)
+        if cluster is None:
+            cluster = next(
+                (
+                    item
+                    for item in db.query(KeywordCluster).filter(
+                        KeywordCluster.tenant_id == context.tenant_id,
+                        KeywordCluster.campaign_id == campaign.id,
+                    )
+                    if _text_key(item.name) == _text_key(group_name)
+                ),
+                None,
             )
+            if cluster is None:
+                cluster = KeywordCluster(
+                    tenant_id=context.tenant_id,
+                    campaign_id=campaign.id,
+                    name=group_name,
+                )
+                db.add(cluster)
+                db.flush()
+                row_entities.append(_entity("keyword_cluster", cluster.id))
+            context.clusters[cluster_key] = cluster
+        keyword = CampaignKeyword(
+            tenant_id=context.tenant_id,
+            campaign_id=campaign.id,
+            cluster_id=cluster.id,
+            keyword=values["phrase"],
+            location_code=(location.provider_location_code or location.country_code or "US")[:64],
         )
-        external_id = hashlib.sha256(external_seed.encode("utf-8")).hexdigest()
-        source_key = re.sub(r"[^a-z0-9]+", "-", directory_name.casefold()).strip("-")
-        source_key = (source_key or f"imported-{external_id[:12]}")[:100]
-        importance = _text_key(values.get("directory_importance")) or "unknown"
-        listing = DirectoryListing(
-            tenant_id=tenant_id,
-            organization_id=organization_id,
+        db.add(keyword)
+        db.flush()
+        row_entities.append(_entity("campaign_keyword", keyword.id))
+        if campaign.id in context.keyword_ids:
+            context.keyword_ids[campaign.id][_text_key(keyword.keyword)] = keyword.id
+    else:
+        competitor = Competitor(
+            tenant_id=context.tenant_id,
             campaign_id=campaign.id,
-            business_location_id=location.id,
-            source_key=source_key,
-            source_name=directory_name,
-            provider_name="migration",
-            external_id=external_id,
-            listing_url=listing_url,
-            status="unavailable",
-            business_name=observed_fields.get("business_name"),
-            address_line1=observed_fields.get("address_line1"),
-            city=observed_fields.get("city"),
-            region=observed_fields.get("region"),
-            postal_code=observed_fields.get("postal_code"),
-            country_code=observed_fields.get("country_code"),
-            phone=observed_fields.get("phone"),
-            website_url=observed_fields.get("website_url"),
-            primary_category=observed_fields.get("primary_category"),
-            observed_fields=observed_fields,
-            field_differences=differences,
-            directory_importance=importance,
-            confidence=confidence,
-            first_seen_at=captured_at,
-            last_seen_at=captured_at,
-            last_verified_at=None,
-            source_type="imported",
-            source_system=source_system,
-            source_record_id=(values.get("source_record_id") or None),
-            source_claimed_status=claimed_status,
-            import_batch_id=batch.id,
-            created_at=now,
-            updated_at=now,
+            domain=_domain(values.get("competitor_domain")),
+            label=None,
+            discovery_source=f"migration_{context.source_system}"[:40],
+            review_status="confirmed",
+        )
+        db.add(competitor)
+        db.flush()
+        row_entities.append(_entity("competitor", competitor.id))
+    return row_entities
+
+
+def _apply_ranking_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+) -> list[dict[str, str]]:
+    values = reviewed_row["values"]
+    location = _location_for_reviewed_row(
+        db,
+        organization_id=context.organization_id,
+        reviewed_row=reviewed_row,
+        new_locations=context.new_locations,
+    )
+    if location is None:
+        raise MigrationImportError(
+            "A reviewed location could not be found while importing ranking history.",
+            reason_code="migration_location_changed",
+        )
+    campaign, _created = _campaign_for_location(db, context, location)
+    keyword_id = _campaign_keyword_ids(db, context, campaign.id).get(
+        _text_key(values.get("phrase"))
+    )
+    captured_at = _parse_import_datetime(values.get("captured_at"))
+    position = _parse_position(values.get("position"))
+    if keyword_id is None or captured_at is None or position is None:
+        raise MigrationImportError(
+            "The reviewed ranking history no longer matches a tracked search.",
+            reason_code="migration_ranking_reference_changed",
+        )
+    snapshot = RankingSnapshot(
+        tenant_id=context.tenant_id,
+        campaign_id=campaign.id,
+        keyword_id=keyword_id,
+        position=position,
+        confidence=0.7,
+        captured_at=captured_at,
+        month_partition=captured_at.strftime("%Y-%m"),
+        source_type="imported",
+        source_system=context.source_system,
+        source_record_id=(values.get("source_record_id") or None),
+        import_batch_id=context.batch_id,
+    )
+    db.add(snapshot)
+    db.flush()
+    return [_entity("ranking_snapshot", snapshot.id)]
+
+
+def _apply_listing_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+) -> tuple[list[dict[str, str]], dict[str, Any]]:
+    values = reviewed_row["values"]
+    location = _location_for_reviewed_row(
+        db,
+        organization_id=context.organization_id,
+        reviewed_row=reviewed_row,
+        new_locations=context.new_locations,
+    )
+    if location is None:
+        raise MigrationImportError(
+            "A reviewed location could not be found while importing listing history.",
+            reason_code="migration_location_changed",
         )
-        db.add(listing)
-        db.flush()
-        evidence_payload = json.dumps(
-            {
-                "source_type": "imported",
-                "claimed_status": claimed_status,
-                "observed_fields": observed_fields,
-                "field_differences": differences,
-                "observed_at": captured_at.isoformat(),
-            },
-            separators=(",", ":"),
-            sort_keys=True,
+    campaign, _created = _campaign_for_location(db, context, location)
+    captured_at = _parse_import_datetime(values.get("captured_at"))
+    claimed_status = _listing_claim_status(values.get("listing_status"))
+    if captured_at is None or claimed_status is None:
+        raise MigrationImportError(
+            "The reviewed listing history is no longer valid.",
+            reason_code="migration_listing_reference_changed",
         )
-        observation = DirectoryListingObservation(
-            tenant_id=tenant_id,
-            organization_id=organization_id,
-            campaign_id=campaign.id,
-            business_location_id=location.id,
-            listing_id=listing.id,
-            status="unavailable",
-            observed_fields=observed_fields,
-            field_differences=differences,
-            confidence=confidence,
-            evidence_digest=hashlib.sha256(evidence_payload.encode("utf-8")).hexdigest(),
-            observed_at=captured_at,
-            source_type="imported",
-            source_system=source_system,
-            source_record_id=(values.get("source_record_id") or None),
-            source_claimed_status=claimed_status,
-            import_batch_id=batch.id,
+    directory_name = str(values.get("directory_name") or "").strip()[:160]
+    listing_url = _safe_public_url(values.get("listing_url")) or None
+    observed_fields = {
+        key: value
+        for key, value in {
+            "business_name": values.get("listing_business_name"),
+            "address_line1": values.get("listing_address"),
+            "city": values.get("listing_city"),
+            "region": values.get("listing_region"),
+            "postal_code": values.get("listing_postal_code"),
+            "country_code": values.get("country_code"),
+            "phone": values.get("listing_phone"),
+            "website_url": values.get("listing_website"),
+            "primary_category": values.get("primary_category"),
+            "listing_url": listing_url,
+        }.items()
+        if value not in (None, "")
+    }
+    differences, comparable_fields = compare_listing_fields(
+        location=location,
+        observed_fields=observed_fields,
+    )
+    confidence = (
+        round(max(0.0, (comparable_fields - len(differences)) / comparable_fields), 4)
+        if comparable_fields
+        else 0.0
+    )
+    source_identity = str(values.get("source_record_id") or listing_url or "").strip()
+    external_seed = "|".join(
+        (
+            location.id,
+            context.source_system,
+            directory_name.casefold(),
+            captured_at.isoformat(),
+            source_identity.casefold(),
         )
-        db.add(observation)
-        db.flush()
-        listing_entities = [
+    )
+    external_id = hashlib.sha256(external_seed.encode("utf-8")).hexdigest()
+    source_key = re.sub(r"[^a-z0-9]+", "-", directory_name.casefold()).strip("-")
+    source_key = (source_key or f"imported-{external_id[:12]}")[:100]
+    importance = _text_key(values.get("directory_importance")) or "unknown"
+    listing = DirectoryListing(
+        tenant_id=context.tenant_id,
+        organization_id=context.organization_id,
+        campaign_id=campaign.id,
+        business_location_id=location.id,
+        source_key=source_key,
+        source_name=directory_name,
+        provider_name="migration",
+        external_id=external_id,
+        listing_url=listing_url,
+        status="unavailable",
+        business_name=observed_fields.get("business_name"),
+        address_line1=observed_fields.get("address_line1"),
+        city=observed_fields.get("city"),
+        region=observed_fields.get("region"),
+        postal_code=observed_fields.get("postal_code"),
+        country_code=observed_fields.get("country_code"),
+        phone=observed_fields.get("phone"),
+        website_url=observed_fields.get("website_url"),
+        primary_category=observed_fields.get("primary_category"),
+        observed_fields=observed_fields,
+        field_differences=differences,
+        directory_importance=importance,
+        confidence=confidence,
+        first_seen_at=captured_at,
+        last_seen_at=captured_at,
+        last_verified_at=None,
+        source_type="imported",
+        source_system=context.source_system,
+        source_record_id=(values.get("source_record_id") or None),
+        source_claimed_status=claimed_status,
+        import_batch_id=context.batch_id,
+        created_at=context.now,
+        updated_at=context.now,
+    )
+    db.add(listing)
+    db.flush()
+    evidence_payload = json.dumps(
+        {
+            "source_type": "imported",
+            "claimed_status": claimed_status,
+            "observed_fields": observed_fields,
+            "field_differences": differences,
+            "observed_at": captured_at.isoformat(),
+        },
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    observation = DirectoryListingObservation(
+        tenant_id=context.tenant_id,
+        organization_id=context.organization_id,
+        campaign_id=campaign.id,
+        business_location_id=location.id,
+        listing_id=listing.id,
+        status="unavailable",
+        observed_fields=observed_fields,
+        field_differences=differences,
+        confidence=confidence,
+        evidence_digest=hashlib.sha256(evidence_payload.encode("utf-8")).hexdigest(),
+        observed_at=captured_at,
+        source_type="imported",
+        source_system=context.source_system,
+        source_record_id=(values.get("source_record_id") or None),
+        source_claimed_status=claimed_status,
+        import_batch_id=context.batch_id,
+    )
+    db.add(observation)
+    db.flush()
+    return (
+        [
             _entity("directory_listing_observation", observation.id),
             _entity("directory_listing", listing.id),
-        ]
-        record = records[int(reviewed_row["row_number"])]
-        record.result = {
-            **record.result,
+        ],
+        {
             "source_qualification": "imported_history_not_freshly_verified",
             "source_claimed_status": claimed_status,
-        }
-        _mark_record_applied(record, listing_entities)
-        created_entities.extend(listing_entities)
+        },
+    )
 
-    for reviewed_row in review["rows"]:
-        if (
-            reviewed_row["status"] != "ready"
-            or reviewed_row["record_type"] != "report_recipient"
-        ):
-            continue
-        values = reviewed_row["values"]
-        location = _location_for_reviewed_row(
-            db,
-            organization_id=organization_id,
-            reviewed_row=reviewed_row,
-            new_locations=new_locations,
+
+def _apply_recipient_row(
+    db: Session,
+    context: _ApplyContext,
+    reviewed_row: dict[str, Any],
+) -> tuple[list[dict[str, str]], dict[str, Any]]:
+    values = reviewed_row["values"]
+    location = _location_for_reviewed_row(
+        db,
+        organization_id=context.organization_id,
+        reviewed_row=reviewed_row,
+        new_locations=context.new_locations,
+    )
+    if location is None:
+        raise MigrationImportError(
+            "A reviewed location could not be found while importing report recipients.",
+            reason_code="migration_location_changed",
         )
-        if location is None:
-            raise MigrationImportError(
-                "A reviewed location could not be found while importing report recipients.",
-                reason_code="migration_location_changed",
-            )
-        campaign = campaign_cache.get(location.id)
-        if campaign is None:
-            campaign, _created = _ensure_campaign(
-                db,
-                organization_id=organization_id,
-                tenant_id=tenant_id,
-                location=location,
-            )
-            campaign_cache[location.id] = campaign
-        email = _normalized_email(values.get("recipient_email"))
-        role = _recipient_role(values.get("recipient_role"))
-        if email is None or role is None:
-            raise MigrationImportError(
-                "The reviewed report recipient is no longer valid.",
-                reason_code="migration_recipient_changed",
+    campaign, _created = _campaign_for_location(db, context, location)
+    email = _normalized_email(values.get("recipient_email"))
+    role = _recipient_role(values.get("recipient_role"))
+    if email is None or role is None:
+        raise MigrationImportError(
+            "The reviewed report recipient is no longer valid.",
+            reason_code="migration_recipient_changed",
+        )
+    recipient = ReportRecipient(
+        tenant_id=context.tenant_id,
+        organization_id=context.organization_id,
+        campaign_id=campaign.id,
+        email=email,
+        display_name=(str(values.get("recipient_name") or "").strip()[:160] or None),
+        recipient_role=role,
+        enabled=False,
+        source_type="imported",
+        source_system=context.source_system,
+        source_record_id=(values.get("source_record_id") or None),
+        import_batch_id=context.batch_id,
+        created_at=context.now,
+        updated_at=context.now,
+    )
+    db.add(recipient)
+    db.flush()
+    return (
+        [_entity("report_recipient", recipient.id)],
+        {"delivery_state": "disabled_until_owner_review"},
+    )
+
+
+def _campaign_for_location(
+    db: Session,
+    context: _ApplyContext,
+    location: BusinessLocation,
+) -> tuple[Campaign, bool]:
+    campaign = context.campaigns.get(location.id)
+    if campaign is not None:
+        return campaign, False
+    campaign, created = _ensure_campaign(
+        db,
+        organization_id=context.organization_id,
+        tenant_id=context.tenant_id,
+        location=location,
+    )
+    context.campaigns[location.id] = campaign
+    return campaign, created
+
+
+def _campaign_keyword_ids(
+    db: Session,
+    context: _ApplyContext,
+    campaign_id: str,
+) -> dict[str, str]:
+    keyword_ids = context.keyword_ids.get(campaign_id)
+    if keyword_ids is None:
+        keyword_ids = {
+            _text_key(keyword): keyword_id
+            for keyword_id, keyword in db.query(CampaignKeyword.id, CampaignKeyword.keyword).filter(
+                CampaignKeyword.tenant_id == context.tenant_id,
+                CampaignKeyword.campaign_id == campaign_id,
             )
-        recipient = ReportRecipient(
-            tenant_id=tenant_id,
+        }
+        context.keyword_ids[campaign_id] = keyword_ids
+    return keyword_ids
+
+
+def _assert_location_capacity(
+    db: Session,
+    *,
+    organization_id: str,
+    requested_delta: int,
+) -> None:
+    if not requested_delta:
+        return
+    try:
+        assert_active_location_capacity(
+            db,
             organization_id=organization_id,
-            campaign_id=campaign.id,
-            email=email,
-            display_name=(str(values.get("recipient_name") or "").strip()[:160] or None),
-            recipient_role=role,
-            enabled=False,
-            source_type="imported",
-            source_system=source_system,
-            source_record_id=(values.get("source_record_id") or None),
-            import_batch_id=batch.id,
-            created_at=now,
-            updated_at=now,
+            requested_delta=requested_delta,
         )
-        db.add(recipient)
-        db.flush()
-        recipient_entities = [_entity("report_recipient", recipient.id)]
-        record = records[int(reviewed_row["row_number"])]
-        record.result = {
-            **record.result,
-            "delivery_state": "disabled_until_owner_review",
-        }
-        _mark_record_applied(record, recipient_entities)
-        created_entities.extend(recipient_entities)
+    except ActiveLocationAllowanceError as exc:
+        raise MigrationImportError(
+            str(exc),
+            reason_code=exc.reason_code,
+        ) from exc
 
-    created_entities = _deduplicate_entities(created_entities)
-    counts = Counter(item["entity_type"] for item in created_entities)
-    batch.created_entities = created_entities
-    batch.summary = {
-        **review["summary"],
-        "records_applied": sum(1 for row in records.values() if row.status == "applied"),
-        "locations_created": counts["business_location"],
-        "keywords_created": counts["campaign_keyword"],
-        "competitors_created": counts["competitor"],
-        "ranking_history_created": counts["ranking_snapshot"],
-        "listing_history_created": counts["directory_listing"],
-        "report_recipients_created": counts["report_recipient"],
-    }
+
+def _write_applied_audit_log(db: Session, batch: MigrationImportBatch) -> None:
     write_audit_log(
         db,
-        tenant_id=tenant_id,
-        actor_user_id=actor_user_id,
+        tenant_id=batch.tenant_id,
+        actor_user_id=batch.applied_by,
         event_type="migration.import.applied",
         payload={
             "batch_id": batch.id,
-            "organization_id": organization_id,
-            "source_system": source_system,
-            "source_sha256": source_sha256,
-            "review_hash": review_hash,
+            "organization_id": batch.organization_id,
+            "source_system": batch.source_system,
+            "source_sha256": batch.source_sha256,
+            "review_hash": batch.review_hash,
             "summary": batch.summary,
         },
     )
-    db.flush()
-    return serialize_migration_batch(db, batch, include_records=True)
 
 
-def list_migration_batches(
+def _import_record_values(
+    batch: MigrationImportBatch,
+    reviewed_row: dict[str, Any],
+    now: datetime,
+) -> dict[str, Any]:
+    return {
+        "batch_id": batch.id,
+        "tenant_id": batch.tenant_id,
+        "organization_id": batch.organization_id,
+        "row_number": int(reviewed_row["row_number"]),
+        "record_type": str(reviewed_row["record_type"]),
+        "status": "pending" if reviewed_row["status"] == "ready" else "skipped",
+        "source_values": dict(reviewed_row["values"]),
+        "result": {
+            "review_status": reviewed_row["status"],
+            "detail": reviewed_row["detail"],
+            "issues": reviewed_row["issues"],
+            "matched_location_id": reviewed_row["matched_location_id"],
+            "matched_location_name": reviewed_row["matched_location_name"],
+        },
+        "created_entities": [],
+        "created_at": now,
+    }
+
+
+def _reviewed_row_from_record(record: MigrationImportRecord) -> dict[str, Any]:
+    return {
+        "row_number": record.row_number,
+        "record_type": record.record_type,
+        "location_name": record.source_values.get("location_name", ""),
+        "matched_location_id": record.result.get("matched_location_id"),
+        "values": record.source_values,
+    }
+
+
+def _stage_import_records(
     db: Session,
     *,
-    organization_id: str,
-    tenant_id: str,
-) -> list[dict[str, Any]]:
-    rows = (
-        db.query(MigrationImportBatch)
-        .filter(
-            MigrationImportBatch.organization_id == organization_id,
-            MigrationImportBatch.tenant_id == tenant_id,
+    batch: MigrationImportBatch,
+    upload_id: str,
+    after_row: int,
+    limit: int,
+    legacy_rows: list[dict[str, Any]] | None = None,
+) -> list[int]:
+    if legacy_rows is not None:
+        reviewed_rows = [row for row in legacy_rows if int(row["row_number"]) > after_row][:limit]
+    else:
+        reviewed_rows = [
+            review
+            for (review,) in (
+                db.query(MigrationUploadReviewRow.review)
+                .filter(
+                    MigrationUploadReviewRow.upload_id == upload_id,
+                    MigrationUploadReviewRow.row_number > after_row,
+                )
+                .order_by(MigrationUploadReviewRow.row_number.asc())
+                .limit(limit)
+            )
+        ]
+    if reviewed_rows:
+        now = datetime.now(UTC)
+        db.execute(
+            insert(MigrationImportRecord),
+            [_import_record_values(batch, reviewed_row, now) for reviewed_row in reviewed_rows],
         )
-        .order_by(MigrationImportBatch.created_at.desc(), MigrationImportBatch.id.desc())
-        .limit(50)
-        .all()
+    return [int(reviewed_row["row_number"]) for reviewed_row in reviewed_rows]
+
+
+def _resume_apply_context(db: Session, batch: MigrationImportBatch) -> _ApplyContext:
+    """Rebuild what earlier runs of a batch learned about its new locations."""
+    context = _ApplyContext(
+        organization_id=batch.organization_id,
+        tenant_id=batch.tenant_id,
+        source_system=batch.source_system,
+        batch_id=batch.id,
+        now=datetime.now(UTC),
     )
-    return [serialize_migration_batch(db, row, include_records=False) for row in rows]
+    location_ids = [
+        item["entity_id"]
+        for (entities,) in db.query(MigrationImportRecord.created_entities).filter(
+            MigrationImportRecord.batch_id == batch.id,
+            MigrationImportRecord.record_type == "location",
+            MigrationImportRecord.status == "applied",
+        )
+        for item in entities or []
+        if item.get("entity_type") == "business_location"
+    ]
+    if location_ids:
+        for location in db.query(BusinessLocation).filter(BusinessLocation.id.in_(location_ids)):
+            context.new_locations[_text_key(location.name)] = location
+    return context
 
 
-def rollback_migration_batch(
+def _seen_before(
     db: Session,
     *,
-    organization_id: str,
-    tenant_id: str,
-    actor_user_id: str,
-    batch_id: str,
-    confirmed: bool,
-) -> dict[str, Any]:
-    if not confirmed:
-        raise MigrationImportError(
-            "Confirm that you want to remove the records created by this import.",
-            reason_code="migration_rollback_confirmation_required",
-        )
-    batch = (
-        db.query(MigrationImportBatch)
+    upload_id: str,
+    before_row: int,
+    keys: Iterable[tuple[str, ...]],
+) -> set[tuple[str, ...]]:
+    """Duplicate keys of a review batch that earlier rows in the file already used."""
+    by_digest = {_key_digest(key): key for key in keys}
+    if not by_digest:
+        return set()
+    earlier = (
+        db.query(MigrationUploadReviewRow.dedupe_key)
         .filter(
-            MigrationImportBatch.id == batch_id,
-            MigrationImportBatch.organization_id == organization_id,
-            MigrationImportBatch.tenant_id == tenant_id,
+            MigrationUploadReviewRow.upload_id == upload_id,
+            MigrationUploadReviewRow.row_number < before_row,
+            MigrationUploadReviewRow.dedupe_key.in_(list(by_digest)),
         )
-        .with_for_update()
-        .first()
+        .distinct()
     )
-    if batch is None:
-        raise MigrationImportError(
-            "Import batch not found.",
-            reason_code="migration_batch_not_found",
-        )
-    if batch.status == "rolled_back":
-        return serialize_migration_batch(db, batch, include_records=True)
-    if batch.status != "applied":
-        raise MigrationImportError(
-            "Only an applied import can be rolled back.",
-            reason_code="migration_batch_not_applied",
-        )
+    return {by_digest[digest] for (digest,) in earlier}
 
-    entities = _entities_by_type(batch.created_entities)
-    blockers = _rollback_blockers(db, entities)
-    if blockers:
-        raise MigrationImportError(
-            "This import now has newer work attached to it. Remove that work first or keep the import.",
-            reason_code="migration_rollback_blocked_by_new_work",
-        )
 
-    _delete_created_entities(db, organization_id, tenant_id, entities)
-    rolled_back_at = datetime.now(UTC)
-    batch.status = "rolled_back"
-    batch.rolled_back_by = actor_user_id
-    batch.rolled_back_at = rolled_back_at
-    (
-        db.query(MigrationImportRecord)
+def _ranking_references(
+    db: Session,
+    *,
+    upload_id: str,
+    rows: list[tuple[str, int, dict[str, str]]],
+) -> tuple[dict[tuple[str, str], int], set[datetime]]:
+    """Keyword rows in the whole file and capture dates for a batch's ranking rows."""
+    references: dict[str, tuple[str, str]] = {}
+    captured: set[datetime] = set()
+    for _row_id, _row_number, values in rows:
+        if _record_type(values.get("record_type")) != "ranking":
+            continue
+        reference = (_text_key(values.get("location_name", "").strip()), _text_key(values.get("phrase")))
+        references[_key_digest(reference)] = reference
+        captured_at = _parse_import_datetime(values.get("captured_at"))
+        if captured_at is not None:
+            captured.add(captured_at)
+    if not references:
+        return {}, captured
+    counts = (
+        db.query(MigrationUploadReviewRow.keyword_key, func.count(MigrationUploadReviewRow.id))
         .filter(
-            MigrationImportRecord.batch_id == batch.id,
-            MigrationImportRecord.status == "applied",
+            MigrationUploadReviewRow.upload_id == upload_id,
+            MigrationUploadReviewRow.keyword_key.in_(list(references)),
         )
-        .update({MigrationImportRecord.status: "rolled_back"}, synchronize_session=False)
-    )
-    write_audit_log(
-        db,
-        tenant_id=tenant_id,
-        actor_user_id=actor_user_id,
-        event_type="migration.import.rolled_back",
-        payload={
-            "batch_id": batch.id,
-            "organization_id": organization_id,
-            "source_sha256": batch.source_sha256,
-            "review_hash": batch.review_hash,
-            "removed_entities": sum(len(values) for values in entities.values()),
-        },
+        .group_by(MigrationUploadReviewRow.keyword_key)
     )
-    db.flush()
-    return serialize_migration_batch(db, batch, include_records=True)
+    return {references[digest]: int(count) for digest, count in counts}, captured
 
 
-def serialize_migration_batch(
-    db: Session,
-    batch: MigrationImportBatch,
-    *,
-    include_records: bool,
-) -> dict[str, Any]:
-    payload: dict[str, Any] = {
-        "id": batch.id,
-        "source_system": batch.source_system,
-        "source_filename": batch.source_filename,
-        "source_sha256": batch.source_sha256,
-        "review_hash": batch.review_hash,
-        "client_request_id": batch.client_request_id,
-        "status": batch.status,
-        "summary": batch.summary,
-        "created_entities": batch.created_entities,
-        "applied_by": batch.applied_by,
-        "applied_at": batch.applied_at.isoformat(),
-        "rolled_back_by": batch.rolled_back_by,
-        "rolled_back_at": batch.rolled_back_at.isoformat() if batch.rolled_back_at else None,
-        "created_at": batch.created_at.isoformat(),
-        "rollback_available": batch.status == "applied",
-    }
-    if include_records:
-        records = (
-            db.query(MigrationImportRecord)
-            .filter(MigrationImportRecord.batch_id == batch.id)
-            .order_by(MigrationImportRecord.row_number.asc())
-            .all()
-        )
-        payload["records"] = [
-            {
-                "row_number": row.row_number,
-                "record_type": row.record_type,
-                "status": row.status,
-                "source_values": row.source_values,
-                "result": row.result,
-                "created_entities": row.created_entities,
-            }
-            for row in records
-        ]
-    return payload
+def _key_digest(key: tuple[str, ...]) -> str:
+    encoded = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 def _ensure_campaign(
@@ -1285,8 +1964,14 @@ def _review_hash(review: dict[str, Any]) -> str:
         "source_sha256": review["source_sha256"],
         "field_mapping": review["field_mapping"],
         "summary": review["summary"],
-        "rows": review["rows"],
     }
+    # Streamed reviews keep their rows in a table and govern them by digest.
+    if "rows" in review:
+        governed["rows"] = review["rows"]
+    else:
+        governed["rows_sha256"] = review["rows_sha256"]
+    if "setup_sha256" in review:
+        governed["setup_sha256"] = review["setup_sha256"]
     encoded = json.dumps(governed, separators=(",", ":"), sort_keys=True).encode("utf-8")
     return hashlib.sha256(encoded).hexdigest()
 
@@ -1298,16 +1983,16 @@ def _safe_filename(value: str | None) -> str | None:
 
 
 def _reader(
-    csv_text: str,
+    lines: Iterable[str],
     *,
+    sample: str,
     source_system: str,
 ) -> tuple[csv.DictReader, dict[str, str], list[tuple[str, str]], str]:
-    sample = csv_text[:8_192]
     try:
         dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
     except csv.Error:
         dialect = csv.excel
-    reader = csv.DictReader(io.StringIO(csv_text.lstrip("\ufeff")), dialect=dialect)
+    reader = csv.DictReader(lines, dialect=dialect)
     headers = [str(value or "").strip() for value in (reader.fieldnames or [])]
     if not headers:
         raise MigrationImportError(
@@ -1369,22 +2054,22 @@ def _review_row(
     row_number: int,
     row: dict[str, str],
     seen: set[tuple[str, ...]],
-    file_locations: dict[str, list[dict[str, Any]]],
-    file_keywords: dict[tuple[str, str], list[int]],
-    locations_by_name: dict[str, list[BusinessLocation]],
-    locations_by_domain: dict[str, list[BusinessLocation]],
-    campaign_by_location: dict[str, Campaign],
-    existing_keywords: dict[str, set[str]],
-    existing_competitors: dict[str, set[str]],
-    existing_rankings: dict[tuple[str, str, str], set[int]],
-    existing_listing_evidence: set[tuple[str, str, str, str]],
-    existing_recipients: dict[str, set[str]],
+    file_locations: Mapping[str, int],
+    file_keywords: Mapping[tuple[str, str], int],
+    lookups: _ReviewLookups,
 ) -> dict[str, Any]:
     record_type = _record_type(row.get("record_type"))
     location_name = row.get("location_name", "").strip()
     location_key = _text_key(location_name)
     website = _domain(row.get("website"))
     issues: list[dict[str, str]] = []
+    campaign_by_location = lookups.campaign_by_location
+    existing_keywords = lookups.existing_keywords
+    existing_competitors = lookups.existing_competitors
+    existing_rankings = lookups.existing_rankings
+    existing_listing_evidence = lookups.existing_listing_evidence
+    existing_recipients = lookups.existing_recipients
+    key = _row_key(row_number, row)
 
     if record_type not in RECORD_TYPES:
         _issue(
@@ -1407,24 +2092,22 @@ def _review_row(
     matched, match_issue = _match_existing_location(
         location_key=location_key,
         domain=website,
-        locations_by_name=locations_by_name,
-        locations_by_domain=locations_by_domain,
+        locations_by_name=lookups.locations_by_name,
+        locations_by_domain=lookups.locations_by_domain,
     )
     if match_issue:
         _issue(issues, match_issue[0], match_issue[1])
 
-    key: tuple[str, ...]
     detail = ""
     if record_type == "location":
         if not website and matched is None:
             _issue(issues, "website_missing", "Add the website for a new location.")
-        if location_key and len(file_locations.get(location_key, [])) > 1:
+        if location_key and file_locations.get(location_key, 0) > 1:
             _issue(
                 issues,
                 "location_name_repeated",
                 "More than one location row uses this name. Give each location a unique name.",
             )
-        key = ("location", location_key, website)
         detail = "Match this row to the saved location." if matched else "Create this location after final review."
     elif record_type == "keyword":
         phrase = row.get("phrase", "").strip()
@@ -1432,7 +2115,6 @@ def _review_row(
             _issue(issues, "keyword_missing", "Add the search phrase to track.")
         elif len(phrase) > 255:
             _issue(issues, "keyword_too_long", "Keep the search phrase under 256 characters.")
-        key = ("keyword", location_key, _text_key(phrase))
         detail = "Add this search phrase to the matched location."
         _assert_location_reference(issues, location_key, matched, file_locations)
         if matched is not None and not matched.domain:
@@ -1448,7 +2130,6 @@ def _review_row(
         competitor_domain = _domain(row.get("competitor_domain"))
         if not competitor_domain:
             _issue(issues, "competitor_missing", "Add a competitor website such as competitor.com.")
-        key = ("competitor", location_key, competitor_domain)
         detail = "Add this competitor to the matched location."
         _assert_location_reference(issues, location_key, matched, file_locations)
         if matched is not None and not matched.domain:
@@ -1477,22 +2158,21 @@ def _review_row(
         existing_keyword = bool(
             campaign and _text_key(phrase) in existing_keywords.get(campaign.id, set())
         )
-        keyword_rows = file_keywords.get((location_key, _text_key(phrase)), [])
+        keyword_rows = file_keywords.get((location_key, _text_key(phrase)), 0)
         if not existing_keyword:
-            if len(keyword_rows) == 0:
+            if keyword_rows == 0:
                 _issue(
                     issues,
                     "ranking_keyword_missing",
                     "Add a keyword row for this exact search phrase before its ranking history.",
                 )
-            elif len(keyword_rows) > 1:
+            elif keyword_rows > 1:
                 _issue(
                     issues,
                     "ranking_keyword_ambiguous",
                     "More than one keyword row uses this phrase for the location. Keep one.",
                 )
         captured_key = captured_at.isoformat() if captured_at else ""
-        key = ("ranking", location_key, _text_key(phrase), captured_key)
         detail = "Add this as imported ranking history, separate from newly collected rankings."
         if not issues and campaign and captured_at and position is not None:
             saved_positions = existing_rankings.get(
@@ -1542,9 +2222,6 @@ def _review_row(
                 "Use essential, important, standard, or unknown for directory importance.",
             )
         _assert_location_reference(issues, location_key, matched, file_locations)
-        captured_key = captured_at.isoformat() if captured_at else ""
-        identity = row.get("source_record_id") or listing_url or ""
-        key = ("listing", location_key, _text_key(directory_name), captured_key, identity)
         detail = (
             "Save this as imported listing history. It will not count as a fresh public listing check."
         )
@@ -1576,7 +2253,6 @@ def _review_row(
         if len(row.get("recipient_name", "")) > 160:
             _issue(issues, "recipient_name_too_long", "Keep the recipient name under 161 characters.")
         _assert_location_reference(issues, location_key, matched, file_locations)
-        key = ("report_recipient", location_key, email or "")
         detail = (
             "Save this report recipient in the off position. No report will be sent until an owner turns it on."
         )
@@ -1591,8 +2267,6 @@ def _review_row(
                 issues,
                 "This report recipient is already saved for the location.",
             )
-    else:
-        key = ("invalid", str(row_number))
 
     if key in seen:
         return _result(row_number, record_type, row, "duplicate", matched, issues, "This row repeats an earlier row in the file.")
@@ -1604,18 +2278,46 @@ def _review_row(
     return _result(row_number, record_type, row, "ready", matched, issues, detail)
 
 
+def _row_key(row_number: int, row: dict[str, str]) -> tuple[str, ...]:
+    """The identity two rows must share to count as duplicates in one file."""
+    record_type = _record_type(row.get("record_type"))
+    location_key = _text_key(row.get("location_name", "").strip())
+    if record_type == "location":
+        return ("location", location_key, _domain(row.get("website")))
+    if record_type == "keyword":
+        return ("keyword", location_key, _text_key(row.get("phrase", "").strip()))
+    if record_type == "competitor":
+        return ("competitor", location_key, _domain(row.get("competitor_domain")))
+    if record_type in {"ranking", "listing"}:
+        captured_at = _parse_import_datetime(row.get("captured_at"))
+        captured_key = captured_at.isoformat() if captured_at else ""
+        if record_type == "ranking":
+            return ("ranking", location_key, _text_key(row.get("phrase", "").strip()), captured_key)
+        identity = row.get("source_record_id") or _safe_public_url(row.get("listing_url")) or ""
+        return (
+            "listing",
+            location_key,
+            _text_key(row.get("directory_name", "").strip()),
+            captured_key,
+            identity,
+        )
+    if record_type == "report_recipient":
+        return ("report_recipient", location_key, _normalized_email(row.get("recipient_email")) or "")
+    return ("invalid", str(row_number))
+
+
 def _assert_location_reference(
     issues: list[dict[str, str]],
     location_key: str,
     matched: BusinessLocation | None,
-    file_locations: dict[str, list[dict[str, Any]]],
+    file_locations: Mapping[str, int],
 ) -> None:
     if matched is not None:
         return
-    matches = file_locations.get(location_key, [])
-    if len(matches) == 1:
+    matches = file_locations.get(location_key, 0)
+    if matches == 1:
         return
-    if len(matches) > 1:
+    if matches > 1:
         _issue(issues, "location_reference_ambiguous", "More than one location row uses this name. Make each location name unique.")
     else:
         _issue(issues, "location_reference_missing", "Add a location row with this exact location name first.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -8,20 +9,31 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app.models.migration_import import (
+    MigrationImportBatch,
     MigrationUploadChunk,
+    MigrationUploadReviewRow,
     MigrationUploadSession,
 )
 from app.services.migration_import_service import (
+    MAX_IMPORT_ROWS,
     MigrationImportError,
-    apply_migration_csv,
-    dry_run_migration_csv,
+    apply_upload_rows,
+    review_migration_upload,
+    review_setup_changed,
+    serialize_migration_batch,
+    start_upload_apply,
 )
 
 
-MAX_UPLOAD_BYTES = 20 * 1024 * 1024
-MAX_UPLOAD_CHUNKS = 100
+MAX_UPLOAD_BYTES = 512 * 1024 * 1024
+MAX_UPLOAD_CHUNKS = 1_000
 MAX_CHUNK_BYTES = 600 * 1024
-MAX_UPLOAD_ROWS = 25_000
+MAX_UPLOAD_ROWS = 1_000_000
+# Uploads this small are reviewed in the request; larger ones by a background job.
+INLINE_REVIEW_BYTES = 5 * 1024 * 1024
+# Reviews this small are applied in the request; larger ones in the background.
+INLINE_APPLY_ROWS = MAX_IMPORT_ROWS
+APPLY_ROWS_PER_RUN = 5_000
 UPLOAD_TTL = timedelta(days=7)
 DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 250
@@ -161,7 +173,7 @@ def save_upload_chunk(
         }
     if upload.total_bytes + len(encoded) > MAX_UPLOAD_BYTES:
         raise MigrationImportError(
-            "Choose a CSV file smaller than 20 MB.",
+            "Choose a CSV file smaller than 512 MB.",
             reason_code="migration_upload_too_large",
         )
     db.add(
@@ -204,29 +216,45 @@ def review_upload(
         for_update=True,
     )
     _assert_active(upload)
+    _assert_review_not_failed(upload)
+    if upload.status == "reviewed" and review_setup_changed(
+        db,
+        organization_id=upload.organization_id,
+        tenant_id=upload.tenant_id,
+        review=upload.review_payload or {},
+    ):
+        # Rows were matched against locations or setup that has since changed.
+        upload.review_payload = None
+        upload.review_hash = None
     if upload.review_payload is None:
-        csv_text = _assemble(db, upload)
-        source_sha256 = hashlib.sha256(csv_text.encode("utf-8")).hexdigest()
-        if upload.expected_sha256 and source_sha256 != upload.expected_sha256:
-            raise MigrationImportError(
-                "The completed upload does not match the file you selected. Start the upload again.",
-                reason_code="migration_upload_file_hash_mismatch",
-            )
-        review = dry_run_migration_csv(
-            db,
-            organization_id=organization_id,
-            tenant_id=tenant_id,
-            source_system=upload.source_system,
-            csv_text=csv_text,
-            max_rows=MAX_UPLOAD_ROWS,
-        )
-        upload.review_payload = review
-        upload.review_hash = review["review_hash"]
-        upload.source_sha256 = source_sha256
-        upload.status = "reviewed"
+        _assert_complete(db, upload)
+        if upload.total_bytes > INLINE_REVIEW_BYTES:
+            if upload.status != "reviewing":
+                upload.status = "reviewing"
+                upload.updated_at = datetime.now(UTC)
+                db.flush()
+            return {"upload": serialize_upload_session(db, upload)}
+        _review(db, upload)
+    return _paged_review(db, upload, page=page, page_size=page_size)
+
+
+def run_upload_review(db: Session, *, upload: MigrationUploadSession) -> dict[str, Any]:
+    """Review an upload that ``review_upload`` handed to a background job.
+
+    A file the review rejects is marked ``review_failed`` with the reason,
+    which the next review request reports instead of reviewing it again.
+    """
+    if upload.status != "reviewing":
+        return {"upload_id": upload.id, "status": upload.status}
+    try:
+        with db.begin_nested():
+            _review(db, upload)
+    except MigrationImportError as exc:
+        upload.status = "review_failed"
+        upload.review_payload = {"error": {"message": str(exc), "reason_code": exc.reason_code}}
         upload.updated_at = datetime.now(UTC)
         db.flush()
-    return _paged_review(upload.review_payload, page=page, page_size=page_size)
+    return {"upload_id": upload.id, "status": upload.status}
 
 
 def get_upload_review_page(
@@ -240,12 +268,18 @@ def get_upload_review_page(
 ) -> dict[str, Any]:
     upload = _session(db, organization_id=organization_id, tenant_id=tenant_id, upload_id=upload_id)
     _assert_active(upload)
+    _assert_review_not_failed(upload)
+    if upload.status == "reviewing":
+        raise MigrationImportError(
+            "This upload is still being reviewed. Try again in a moment.",
+            reason_code="migration_upload_review_pending",
+        )
     if upload.review_payload is None:
         raise MigrationImportError(
             "Review the completed upload before opening its rows.",
             reason_code="migration_upload_not_reviewed",
         )
-    return _paged_review(upload.review_payload, page=page, page_size=page_size)
+    return _paged_review(db, upload, page=page, page_size=page_size)
 
 
 def apply_upload(
@@ -277,25 +311,75 @@ def apply_upload(
             "The reviewed upload changed. Review it again before importing.",
             reason_code="migration_review_changed",
         )
-    csv_text = _assemble(db, upload)
-    batch = apply_migration_csv(
+    if upload.applied_batch_id:
+        applied_batch = db.get(MigrationImportBatch, upload.applied_batch_id)
+        if applied_batch is not None and applied_batch.client_request_id != client_request_id:
+            raise MigrationImportError(
+                "This upload was already imported.",
+                reason_code="migration_upload_already_applied",
+            )
+    batch = start_upload_apply(
         db,
         organization_id=organization_id,
         tenant_id=tenant_id,
         actor_user_id=actor_user_id,
+        upload_id=upload.id,
         source_system=upload.source_system,
         source_filename=upload.source_filename,
-        csv_text=csv_text,
-        review_hash=review_hash,
+        source_sha256=str(upload.source_sha256),
+        review=upload.review_payload,
         client_request_id=client_request_id,
         confirmed=confirmed,
-        max_rows=MAX_UPLOAD_ROWS,
     )
-    upload.applied_batch_id = str(batch["id"])
-    upload.status = "applied"
+    upload.applied_batch_id = batch.id
+    upload.status = "applied" if batch.status == "applied" else "applying"
     upload.updated_at = datetime.now(UTC)
     db.flush()
-    return {"batch": batch, "upload": serialize_upload_session(db, upload)}
+    if upload.status == "applying" and upload.review_payload["summary"]["total_rows"] <= INLINE_APPLY_ROWS:
+        continue_upload_apply(db, upload=upload, max_rows=INLINE_APPLY_ROWS * 2)
+    return {
+        "batch": serialize_migration_batch(db, batch, include_records=False),
+        "upload": serialize_upload_session(db, upload),
+    }
+
+
+def continue_upload_apply(
+    db: Session,
+    *,
+    upload: MigrationUploadSession,
+    max_rows: int = APPLY_ROWS_PER_RUN,
+    commit: bool = False,
+) -> dict[str, Any]:
+    """Apply the next rows of an upload that is being imported.
+
+    Each call stages or applies at most ``max_rows`` rows; with ``commit``
+    every slice is committed, so an interrupted run loses no applied work.
+    """
+    batch = db.get(MigrationImportBatch, upload.applied_batch_id) if upload.applied_batch_id else None
+    if batch is None:
+        raise MigrationImportError(
+            "This upload has not been started as an import.",
+            reason_code="migration_upload_not_applying",
+        )
+    finished = apply_upload_rows(
+        db,
+        batch=batch,
+        upload_id=upload.id,
+        max_rows=max_rows,
+        commit=commit,
+        legacy_rows=(upload.review_payload or {}).get("rows"),
+    )
+    if finished and upload.status != "applied":
+        upload.status = "applied"
+        upload.updated_at = datetime.now(UTC)
+        db.flush()
+        if commit:
+            db.commit()
+    return {
+        "finished": finished,
+        "batch_id": batch.id,
+        "progress": batch.summary.get("progress"),
+    }
 
 
 def purge_expired_upload_sessions(
@@ -313,7 +397,12 @@ def purge_expired_upload_sessions(
         )
     ]
     if not session_ids:
-        return {"sessions_deleted": 0, "chunks_deleted": 0}
+        return {"sessions_deleted": 0, "chunks_deleted": 0, "review_rows_deleted": 0}
+    review_rows_deleted = (
+        db.query(MigrationUploadReviewRow)
+        .filter(MigrationUploadReviewRow.upload_id.in_(session_ids))
+        .delete(synchronize_session=False)
+    )
     chunks_deleted = (
         db.query(MigrationUploadChunk)
         .filter(MigrationUploadChunk.session_id.in_(session_ids))
@@ -328,6 +417,7 @@ def purge_expired_upload_sessions(
     return {
         "sessions_deleted": int(sessions_deleted or 0),
         "chunks_deleted": int(chunks_deleted or 0),
+        "review_rows_deleted": int(review_rows_deleted or 0),
     }
 
 
@@ -353,7 +443,9 @@ def serialize_upload_session(db: Session, upload: MigrationUploadSession) -> dic
         "expected_sha256": upload.expected_sha256,
         "source_sha256": upload.source_sha256,
         "review_hash": upload.review_hash,
+        "review_error": (upload.review_payload or {}).get("error") if upload.status == "review_failed" else None,
         "applied_batch_id": upload.applied_batch_id,
+        "apply_progress": _apply_progress(db, upload),
         "created_at": upload.created_at.isoformat(),
         "updated_at": upload.updated_at.isoformat(),
         "expires_at": upload.expires_at.isoformat(),
@@ -374,7 +466,8 @@ def _session(
         MigrationUploadSession.tenant_id == tenant_id,
     )
     if for_update:
-        query = query.with_for_update()
+        # Locked reads must see the committed review, not a copy cached earlier in the session.
+        query = query.populate_existing().with_for_update()
     upload = query.first()
     if upload is None:
         raise MigrationImportError(
@@ -395,14 +488,25 @@ def _assert_active(upload: MigrationUploadSession, *, allow_applied: bool = Fals
         )
 
 
-def _assemble(db: Session, upload: MigrationUploadSession) -> str:
-    chunks = (
-        db.query(MigrationUploadChunk)
-        .filter(MigrationUploadChunk.session_id == upload.id)
-        .order_by(MigrationUploadChunk.chunk_index.asc())
-        .all()
-    )
-    indexes = [chunk.chunk_index for chunk in chunks]
+def _assert_review_not_failed(upload: MigrationUploadSession) -> None:
+    if upload.status == "review_failed":
+        error = (upload.review_payload or {}).get("error") or {}
+        raise MigrationImportError(
+            str(error.get("message") or "The upload could not be reviewed. Start a new upload."),
+            reason_code=str(error.get("reason_code") or "migration_upload_review_failed"),
+        )
+
+
+def _assert_complete(db: Session, upload: MigrationUploadSession) -> None:
+    indexes = [
+        int(row[0])
+        for row in (
+            db.query(MigrationUploadChunk.chunk_index)
+            .filter(MigrationUploadChunk.session_id == upload.id)
+            .order_by(MigrationUploadChunk.chunk_index.asc())
+            .all()
+        )
+    ]
     expected = list(range(upload.total_chunks))
     if indexes != expected:
         missing = [str(index + 1) for index in expected if index not in set(indexes)]
@@ -410,26 +514,130 @@ def _assemble(db: Session, upload: MigrationUploadSession) -> str:
             f"Upload the remaining file parts first: {', '.join(missing[:10])}.",
             reason_code="migration_upload_incomplete",
         )
-    return "".join(chunk.content for chunk in chunks)
 
 
-def _paged_review(review: dict[str, Any], *, page: int, page_size: int) -> dict[str, Any]:
+def _review(db: Session, upload: MigrationUploadSession) -> None:
+    digest = hashlib.sha256()
+    for content in _chunk_texts(db, upload):
+        digest.update(content.encode("utf-8"))
+    source_sha256 = digest.hexdigest()
+    if upload.expected_sha256 and source_sha256 != upload.expected_sha256:
+        raise MigrationImportError(
+            "The completed upload does not match the file you selected. Start the upload again.",
+            reason_code="migration_upload_file_hash_mismatch",
+        )
+    review = review_migration_upload(
+        db,
+        upload_id=upload.id,
+        organization_id=upload.organization_id,
+        tenant_id=upload.tenant_id,
+        source_system=upload.source_system,
+        lines=_csv_lines(_chunk_texts(db, upload)),
+        sample=_sample(db, upload),
+        source_sha256=source_sha256,
+        max_rows=MAX_UPLOAD_ROWS,
+    )
+    upload.review_payload = review
+    upload.review_hash = review["review_hash"]
+    upload.source_sha256 = source_sha256
+    upload.status = "reviewed"
+    upload.updated_at = datetime.now(UTC)
+    db.flush()
+
+
+def _chunk_texts(db: Session, upload: MigrationUploadSession) -> Iterator[str]:
+    """Stored chunk contents in order, loading one chunk at a time."""
+    for chunk_index in range(upload.total_chunks):
+        content = (
+            db.query(MigrationUploadChunk.content)
+            .filter(
+                MigrationUploadChunk.session_id == upload.id,
+                MigrationUploadChunk.chunk_index == chunk_index,
+            )
+            .scalar()
+        )
+        yield content or ""
+
+
+def _csv_lines(texts: Iterable[str]) -> Iterator[str]:
+    """Split chunk contents into lines, joining lines cut at a chunk boundary.
+
+    Line endings are kept so the CSV reader still sees quoted newlines.
+    """
+    pending = ""
+    first = True
+    for text in texts:
+        if first:
+            text = text.lstrip("\ufeff")
+            first = False
+        parts = (pending + text).split("\n")
+        pending = parts.pop()
+        for part in parts:
+            yield f"{part}\n"
+    if pending:
+        yield pending
+
+
+def _sample(db: Session, upload: MigrationUploadSession, size: int = 8_192) -> str:
+    sample = ""
+    for content in _chunk_texts(db, upload):
+        sample += content
+        if len(sample) >= size:
+            break
+    return sample[:size]
+
+
+def _paged_review(
+    db: Session,
+    upload: MigrationUploadSession,
+    *,
+    page: int,
+    page_size: int,
+) -> dict[str, Any]:
+    review = upload.review_payload or {}
     safe_page = max(1, page)
     safe_page_size = min(max(1, page_size), MAX_PAGE_SIZE)
-    rows = list(review.get("rows") or [])
     start = (safe_page - 1) * safe_page_size
     result = {key: value for key, value in review.items() if key != "rows"}
-    result["rows"] = rows[start : start + safe_page_size]
+    if "rows" in review:
+        # Reviews saved before review rows moved into their own table.
+        rows = list(review["rows"] or [])
+        total_rows = len(rows)
+        result["rows"] = rows[start : start + safe_page_size]
+    else:
+        # Data rows are numbered from 2, after the heading row.
+        total_rows = int(review["summary"]["total_rows"])
+        result["rows"] = [
+            row_review
+            for (row_review,) in (
+                db.query(MigrationUploadReviewRow.review)
+                .filter(
+                    MigrationUploadReviewRow.upload_id == upload.id,
+                    MigrationUploadReviewRow.row_number >= start + 2,
+                    MigrationUploadReviewRow.row_number < start + safe_page_size + 2,
+                )
+                .order_by(MigrationUploadReviewRow.row_number.asc())
+            )
+        ]
     result["pagination"] = {
         "page": safe_page,
         "page_size": safe_page_size,
-        "total_rows": len(rows),
-        "total_pages": max(1, (len(rows) + safe_page_size - 1) // safe_page_size),
-        "has_more": start + safe_page_size < len(rows),
+        "total_rows": total_rows,
+        "total_pages": max(1, (total_rows + safe_page_size - 1) // safe_page_size),
+        "has_more": start + safe_page_size < total_rows,
     }
     return result
 
 
+def _apply_progress(db: Session, upload: MigrationUploadSession) -> dict[str, Any] | None:
+    if not upload.applied_batch_id:
+        return None
+    batch = db.get(MigrationImportBatch, upload.applied_batch_id)
+    if batch is None:
+        return None
+    return (batch.summary or {}).get("progress")
+
+
 def _safe_filename(value: str | None) -> str | None:
     if not value:
         return None
@@ -20,6 +20,7 @@ from app.models.platform_job import PlatformJob
 from app.models.reporting import ReportSchedule, ReportShareLink
 from app.models.wordpress_site_connection import WordPressSiteConnection
 from app.services.audit_service import write_audit_log
+from app.services.provider_credentials_service import invalidate_provider_credential_cache
 from app.services.provider_disconnect_service import disconnect_google_provider
 
 
@@ -610,6 +611,7 @@ def _finalize_workspace_closure(
     credentials_deleted = db.query(OrganizationProviderCredential).filter(
         OrganizationProviderCredential.organization_id == row.organization_id,
     ).delete(synchronize_session=False)
+    invalidate_provider_credential_cache(organization_id=row.organization_id)
     oauth_clients_deleted = db.query(OrganizationOAuthClient).filter(
         OrganizationOAuthClient.organization_id == row.organization_id,
     ).delete(synchronize_session=False)
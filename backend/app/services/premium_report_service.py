@@ -22,6 +22,7 @@ from app.models.crawl import CrawlRun, TechnicalIssue
 from app.models.intelligence import StrategyRecommendation
 from app.models.local import ReviewVelocitySnapshot
 from app.models.rank import CampaignKeyword, RankingSnapshot
+from app.models.reporting import MonthlyReport
 from app.models.search_console_daily_metric import SearchConsoleDailyMetric
 from app.services import intelligence_service
 from app.services import enterprise_branding_service
@@ -30,6 +31,14 @@ from app.services.strategy_engine.thresholds import version_id as strategy_thres
 
 REPORT_SNAPSHOT_VERSION = "rpt1-owner-v2"
 REPORT_PERIOD_DAYS = 30
+# How many recent saved reports are checked for a reusable comparison window.
+PREVIOUS_SNAPSHOT_LOOKBACK = 6
+DAILY_WINDOW_METRIC_KEYS = (
+    "google_visits",
+    "google_appearances",
+    "average_google_position",
+    "visibility_health",
+)
 
 
 def _report_copy(
@@ -359,6 +368,145 @@ def _snapshot_hash(snapshot: dict[str, Any]) -> str:
     return sha256(json.dumps(hashable, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()
 
 
+def _daily_window_digest(
+    db: Session,
+    *,
+    campaign: Campaign,
+    start: date,
+    end: date,
+    search_source: str,
+) -> dict[str, Any]:
+    """Cheap fingerprint of the daily facts in one window.
+
+    Late Search Console backfills change the row count or ``updated_at``, so a
+    saved snapshot is only reused while its window is provably unchanged.
+    """
+    daily_count, daily_updated_at = (
+        db.query(func.count(CampaignDailyMetric.id), func.max(CampaignDailyMetric.updated_at))
+        .filter(
+            CampaignDailyMetric.campaign_id == campaign.id,
+            CampaignDailyMetric.metric_date >= start,
+            CampaignDailyMetric.metric_date <= end,
+        )
+        .one()
+    )
+    search_count, search_updated_at = (
+        db.query(func.count(SearchConsoleDailyMetric.id), func.max(SearchConsoleDailyMetric.updated_at))
+        .filter(
+            SearchConsoleDailyMetric.organization_id == campaign.organization_id,
+            SearchConsoleDailyMetric.campaign_id == campaign.id,
+            SearchConsoleDailyMetric.metric_date >= start,
+            SearchConsoleDailyMetric.metric_date <= end,
+        )
+        .one()
+    )
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "search_source": search_source,
+        "daily_records": int(daily_count or 0),
+        "daily_updated_at": _iso(_aware(daily_updated_at)),
+        "search_console_records": int(search_count or 0),
+        "search_console_updated_at": _iso(_aware(search_updated_at)),
+    }
+
+
+def _search_trend_points(rows: Iterable[Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "date": row.metric_date.isoformat(),
+            "visits": row.clicks,
+            "appearances": row.impressions,
+            "average_position": _round(row.avg_position),
+        }
+        for row in rows
+        if row.clicks is not None or row.impressions is not None or row.avg_position is not None
+    ]
+
+
+def _daily_window_aggregates(daily_rows: list[CampaignDailyMetric], search_rows: list[Any]) -> dict[str, Any]:
+    return {
+        "google_visits": {"value": _sum(search_rows, "clicks"), "coverage": _coverage(search_rows, "clicks")},
+        "google_appearances": {
+            "value": _sum(search_rows, "impressions"),
+            "coverage": _coverage(search_rows, "impressions"),
+        },
+        "average_google_position": {
+            "value": _weighted_position(search_rows),
+            "coverage": _coverage(search_rows, "avg_position"),
+        },
+        "visibility_health": {
+            "value": _latest(daily_rows, "intelligence_score"),
+            "coverage": _coverage(daily_rows, "intelligence_score"),
+        },
+        "trend_points": _search_trend_points(search_rows),
+        "daily_records": len(daily_rows),
+        "search_console_records": len(search_rows),
+    }
+
+
+def _saved_daily_window_aggregates(snapshot: dict[str, Any]) -> dict[str, Any] | None:
+    metrics = {str(item.get("key")): item for item in snapshot.get("metrics") or []}
+    google_trend = next(
+        (item for item in snapshot.get("trend_series") or [] if item.get("key") == "google_discovery"),
+        None,
+    )
+    appendix = snapshot.get("appendix") or {}
+    if google_trend is None or any(key not in metrics for key in DAILY_WINDOW_METRIC_KEYS):
+        return None
+    aggregates: dict[str, Any] = {
+        key: {
+            "value": metrics[key].get("current"),
+            "coverage": (metrics[key].get("coverage") or {}).get("current"),
+        }
+        for key in DAILY_WINDOW_METRIC_KEYS
+    }
+    aggregates.update(
+        {
+            "trend_points": list(google_trend.get("points") or []),
+            "daily_records": int(appendix.get("current_daily_records") or 0),
+            "search_console_records": int(appendix.get("current_search_console_records") or 0),
+        }
+    )
+    return aggregates
+
+
+def _reusable_comparison_window(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign: Campaign,
+    comparison_digest: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Return the previous report's current-window aggregates when they still match the data."""
+
+    saved_reports = (
+        db.query(MonthlyReport.summary_json)
+        .filter(
+            MonthlyReport.tenant_id == tenant_id,
+            MonthlyReport.campaign_id == campaign.id,
+        )
+        .order_by(MonthlyReport.generated_at.desc(), MonthlyReport.id.desc())
+        .limit(PREVIOUS_SNAPSHOT_LOOKBACK)
+        .all()
+    )
+    for (summary_json,) in saved_reports:
+        try:
+            snapshot = json.loads(summary_json or "{}")
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(snapshot, dict) or snapshot.get("schema_version") != REPORT_SNAPSHOT_VERSION:
+            continue
+        if (snapshot.get("source") or {}).get("daily_window_digest") != comparison_digest:
+            continue
+        if not validate_snapshot(snapshot):
+            continue
+        aggregates = _saved_daily_window_aggregates(snapshot)
+        if aggregates is not None:
+            return aggregates
+    return None
+
+
 def build_report_readiness(
     db: Session,
     *,
@@ -574,9 +722,55 @@ def build_report_snapshot(
     generated_at: datetime | None = None,
 ) -> dict[str, Any]:
     resolved_generated_at = _aware(generated_at) or datetime.now(UTC)
+    latest_search_date = (
+        db.query(func.max(SearchConsoleDailyMetric.metric_date))
+        .filter(
+            SearchConsoleDailyMetric.organization_id == campaign.organization_id,
+            SearchConsoleDailyMetric.campaign_id == campaign.id,
+        )
+        .scalar()
+    )
+    latest_metric_date = (
+        db.query(func.max(CampaignDailyMetric.metric_date))
+        .filter(CampaignDailyMetric.campaign_id == campaign.id)
+        .scalar()
+    )
+    observed_end = latest_search_date or latest_metric_date or resolved_generated_at.date()
+    current_start = observed_end - timedelta(days=REPORT_PERIOD_DAYS - 1)
+    previous_end = current_start - timedelta(days=1)
+    previous_start = previous_end - timedelta(days=REPORT_PERIOD_DAYS - 1)
+    # Search Console facts are the reporting source of truth. CampaignDailyMetric remains a
+    # compatibility fallback for older installs and derived intelligence fields.
+    search_source = "search_console" if latest_search_date is not None else "daily_metrics"
+    current_window_digest = _daily_window_digest(
+        db,
+        campaign=campaign,
+        start=current_start,
+        end=observed_end,
+        search_source=search_source,
+    )
+    # The previous report's current window is this report's comparison window. Reuse its
+    # saved aggregates when the underlying facts are unchanged and only load the new period.
+    saved_comparison = _reusable_comparison_window(
+        db,
+        tenant_id=tenant_id,
+        campaign=campaign,
+        comparison_digest=_daily_window_digest(
+            db,
+            campaign=campaign,
+            start=previous_start,
+            end=previous_end,
+            search_source=search_source,
+        ),
+    )
+    window_start = current_start if saved_comparison is not None else previous_start
     metric_rows = (
         db.query(CampaignDailyMetric)
-        .filter(CampaignDailyMetric.campaign_id == campaign.id)
+        .filter(
+            CampaignDailyMetric.campaign_id == campaign.id,
+            CampaignDailyMetric.metric_date >= window_start,
+            CampaignDailyMetric.metric_date <= observed_end,
+        )
         .order_by(CampaignDailyMetric.metric_date.asc())
         .all()
     )
@@ -585,30 +779,24 @@ def build_report_snapshot(
         .filter(
             SearchConsoleDailyMetric.organization_id == campaign.organization_id,
             SearchConsoleDailyMetric.campaign_id == campaign.id,
+            SearchConsoleDailyMetric.metric_date >= window_start,
+            SearchConsoleDailyMetric.metric_date <= observed_end,
         )
         .order_by(SearchConsoleDailyMetric.metric_date.asc())
         .all()
+        if search_source == "search_console"
+        else []
     )
-    observed_end = (
-        search_console_rows[-1].metric_date
-        if search_console_rows
-        else metric_rows[-1].metric_date
-        if metric_rows
-        else resolved_generated_at.date()
-    )
-    current_start = observed_end - timedelta(days=REPORT_PERIOD_DAYS - 1)
-    previous_end = current_start - timedelta(days=1)
-    previous_start = previous_end - timedelta(days=REPORT_PERIOD_DAYS - 1)
     current_rows = [row for row in metric_rows if current_start <= row.metric_date <= observed_end]
     previous_rows = [row for row in metric_rows if previous_start <= row.metric_date <= previous_end]
-    # Search Console facts are the reporting source of truth. CampaignDailyMetric remains a
-    # compatibility fallback for older installs and derived intelligence fields.
     current_search_rows = [
         row for row in search_console_rows if current_start <= row.metric_date <= observed_end
-    ] if search_console_rows else current_rows
+    ] if search_source == "search_console" else current_rows
     previous_search_rows = [
         row for row in search_console_rows if previous_start <= row.metric_date <= previous_end
-    ] if search_console_rows else previous_rows
+    ] if search_source == "search_console" else previous_rows
+    current_daily = _daily_window_aggregates(current_rows, current_search_rows)
+    comparison_daily = saved_comparison or _daily_window_aggregates(previous_rows, previous_search_rows)
 
     current_start_dt = datetime.combine(current_start, datetime.min.time(), tzinfo=UTC)
     current_end_dt = datetime.combine(observed_end + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
@@ -622,6 +810,8 @@ def build_report_snapshot(
             CrawlRun.campaign_id == campaign.id,
             CrawlRun.status == "completed",
             CrawlRun.finished_at.isnot(None),
+            CrawlRun.finished_at >= previous_start_dt,
+            CrawlRun.finished_at < current_end_dt,
         )
         .order_by(CrawlRun.finished_at.asc(), CrawlRun.id.asc())
         .all()
@@ -723,43 +913,43 @@ def build_report_snapshot(
         _metric(
             key="google_visits",
             label="Visits from Google",
-            current=_sum(current_search_rows, "clicks"),
-            previous=_sum(previous_search_rows, "clicks"),
+            current=current_daily["google_visits"]["value"],
+            previous=comparison_daily["google_visits"]["value"],
             good_direction="up",
             unit="visits",
             explanation="How many people clicked from Google to the website.",
             source_label="Google Search Console",
             source_system="search_console",
-            current_coverage=_coverage(current_search_rows, "clicks"),
-            comparison_coverage=_coverage(previous_search_rows, "clicks"),
+            current_coverage=current_daily["google_visits"]["coverage"],
+            comparison_coverage=comparison_daily["google_visits"]["coverage"],
             last_updated=search_last_updated,
         ),
         _metric(
             key="google_appearances",
             label="Times shown on Google",
-            current=_sum(current_search_rows, "impressions"),
-            previous=_sum(previous_search_rows, "impressions"),
+            current=current_daily["google_appearances"]["value"],
+            previous=comparison_daily["google_appearances"]["value"],
             good_direction="up",
             unit="appearances",
             explanation="How often the business appeared in Google search results.",
             source_label="Google Search Console",
             source_system="search_console",
-            current_coverage=_coverage(current_search_rows, "impressions"),
-            comparison_coverage=_coverage(previous_search_rows, "impressions"),
+            current_coverage=current_daily["google_appearances"]["coverage"],
+            comparison_coverage=comparison_daily["google_appearances"]["coverage"],
             last_updated=search_last_updated,
         ),
         _metric(
             key="average_google_position",
             label="Average Google position",
-            current=_weighted_position(current_search_rows),
-            previous=_weighted_position(previous_search_rows),
+            current=current_daily["average_google_position"]["value"],
+            previous=comparison_daily["average_google_position"]["value"],
             good_direction="down",
             unit="position",
             explanation="A smaller position number means the business appeared closer to the top.",
             source_label="Google Search Console",
             source_system="search_console",
-            current_coverage=_coverage(current_search_rows, "avg_position"),
-            comparison_coverage=_coverage(previous_search_rows, "avg_position"),
+            current_coverage=current_daily["average_google_position"]["coverage"],
+            comparison_coverage=comparison_daily["average_google_position"]["coverage"],
             last_updated=search_last_updated,
         ),
         _metric(
@@ -847,15 +1037,15 @@ def build_report_snapshot(
         _metric(
             key="visibility_health",
             label="Visibility health score",
-            current=_latest(current_rows, "intelligence_score"),
-            previous=_latest(previous_rows, "intelligence_score"),
+            current=current_daily["visibility_health"]["value"],
+            previous=comparison_daily["visibility_health"]["value"],
             good_direction="up",
             unit="score",
             explanation="A consistent summary of the location's saved search and website evidence.",
             source_label="InsightOS intelligence engine",
             source_system="intelligence_engine",
-            current_coverage=_coverage(current_rows, "intelligence_score"),
-            comparison_coverage=_coverage(previous_rows, "intelligence_score"),
+            current_coverage=current_daily["visibility_health"]["coverage"],
+            comparison_coverage=comparison_daily["visibility_health"]["coverage"],
             last_updated=max((row.metric_date for row in current_rows if row.intelligence_score is not None), default=None),
         ),
     ]
@@ -866,26 +1056,8 @@ def build_report_snapshot(
             "title": "How people found the business on Google",
             "description": "Daily website visits and search appearances from Google Search Console. Gaps mean Google did not provide a saved value for that day.",
             "source_label": "Google Search Console",
-            "points": [
-                {
-                    "date": row.metric_date.isoformat(),
-                    "visits": row.clicks,
-                    "appearances": row.impressions,
-                    "average_position": _round(row.avg_position),
-                }
-                for row in current_search_rows
-                if row.clicks is not None or row.impressions is not None or row.avg_position is not None
-            ],
-            "comparison_points": [
-                {
-                    "date": row.metric_date.isoformat(),
-                    "visits": row.clicks,
-                    "appearances": row.impressions,
-                    "average_position": _round(row.avg_position),
-                }
-                for row in previous_search_rows
-                if row.clicks is not None or row.impressions is not None or row.avg_position is not None
-            ],
+            "points": current_daily["trend_points"],
+            "comparison_points": comparison_daily["trend_points"],
         },
         {
             "key": "tracked_rankings",
@@ -939,17 +1111,6 @@ def build_report_snapshot(
         },
     ]
 
-    recommendations = (
-        db.query(StrategyRecommendation)
-        .filter(
-            StrategyRecommendation.tenant_id == tenant_id,
-            StrategyRecommendation.campaign_id == campaign.id,
-        )
-        .order_by(StrategyRecommendation.created_at.desc())
-        .all()
-    )
-    plans = _plan_map(db, tenant_id, recommendations)
-    recommendations_by_id = {item.id: item for item in recommendations}
     period_end_dt = current_end_dt
 
     completed_rows = (
@@ -966,6 +1127,73 @@ def build_report_snapshot(
         .all()
     )
 
+    measured_rows = (
+        db.query(ActionPlanMeasurement)
+        .filter(
+            ActionPlanMeasurement.tenant_id == tenant_id,
+            ActionPlanMeasurement.campaign_id == campaign.id,
+            ActionPlanMeasurement.measurement_status == "measured",
+            ActionPlanMeasurement.outcome_measured_at.isnot(None),
+            ActionPlanMeasurement.outcome_measured_at >= current_start_dt,
+            ActionPlanMeasurement.outcome_measured_at < period_end_dt,
+        )
+        .order_by(ActionPlanMeasurement.outcome_measured_at.desc())
+        .limit(12)
+        .all()
+    )
+
+    active_occurrences = (
+        db.query(ActionPlanOccurrence)
+        .filter(
+            ActionPlanOccurrence.tenant_id == tenant_id,
+            ActionPlanOccurrence.campaign_id == campaign.id,
+            ActionPlanOccurrence.status.in_(("ready", "in_progress", "blocked")),
+        )
+        .order_by(ActionPlanOccurrence.due_at.asc(), ActionPlanOccurrence.created_at.asc())
+        .limit(24)
+        .all()
+    )
+
+    # Only the fallback priorities and recommendations referenced by this period's
+    # action plan rows are needed, not the campaign's whole recommendation history.
+    recommendations = (
+        db.query(StrategyRecommendation)
+        .filter(
+            StrategyRecommendation.tenant_id == tenant_id,
+            StrategyRecommendation.campaign_id == campaign.id,
+        )
+        .order_by(StrategyRecommendation.created_at.desc())
+        .limit(24)
+        .all()
+    )
+    referenced_recommendation_ids = {
+        row.recommendation_id
+        for row in [*completed_rows, *measured_rows, *active_occurrences]
+        if row.recommendation_id
+    } - {item.id for item in recommendations}
+    if referenced_recommendation_ids:
+        recommendations.extend(
+            db.query(StrategyRecommendation)
+            .filter(
+                StrategyRecommendation.tenant_id == tenant_id,
+                StrategyRecommendation.campaign_id == campaign.id,
+                StrategyRecommendation.id.in_(sorted(referenced_recommendation_ids)),
+            )
+            .order_by(StrategyRecommendation.created_at.desc())
+            .all()
+        )
+    recommendation_count = int(
+        db.query(func.count(StrategyRecommendation.id))
+        .filter(
+            StrategyRecommendation.tenant_id == tenant_id,
+            StrategyRecommendation.campaign_id == campaign.id,
+        )
+        .scalar()
+        or 0
+    )
+    plans = _plan_map(db, tenant_id, recommendations)
+    recommendations_by_id = {item.id: item for item in recommendations}
+
     def completed_action_item(row: ActionPlanOccurrence) -> dict[str, Any]:
         plan = plans.get(row.recommendation_id) or {}
         recommendation = recommendations_by_id.get(row.recommendation_id)
@@ -1000,20 +1228,6 @@ def build_report_snapshot(
         limit=12,
     )
 
-    measured_rows = (
-        db.query(ActionPlanMeasurement)
-        .filter(
-            ActionPlanMeasurement.tenant_id == tenant_id,
-            ActionPlanMeasurement.campaign_id == campaign.id,
-            ActionPlanMeasurement.measurement_status == "measured",
-            ActionPlanMeasurement.outcome_measured_at.isnot(None),
-            ActionPlanMeasurement.outcome_measured_at >= current_start_dt,
-            ActionPlanMeasurement.outcome_measured_at < period_end_dt,
-        )
-        .order_by(ActionPlanMeasurement.outcome_measured_at.desc())
-        .limit(12)
-        .all()
-    )
     measured_outcomes = _dedupe_story_items([
         {
             "id": row.id,
@@ -1026,18 +1240,6 @@ def build_report_snapshot(
         for row in measured_rows
     ], limit=12)
 
-    active_occurrences = (
-        db.query(ActionPlanOccurrence)
-        .filter(
-            ActionPlanOccurrence.tenant_id == tenant_id,
-            ActionPlanOccurrence.campaign_id == campaign.id,
-            ActionPlanOccurrence.status.in_(("ready", "in_progress", "blocked")),
-        )
-        .order_by(ActionPlanOccurrence.due_at.asc(), ActionPlanOccurrence.created_at.asc())
-        .limit(24)
-        .all()
-    )
-
     measurements_by_occurrence = {
         row.occurrence_id: row
         for row in (
@@ -1285,12 +1487,13 @@ def build_report_snapshot(
             "normalization_versions": sorted({row.normalization_version for row in current_rows}),
             "lexicon_versions": sorted({row.lexicon_version for row in active_occurrences + completed_rows}),
             "strategy_version": strategy_threshold_version,
+            "daily_window_digest": current_window_digest,
         },
         "appendix": {
-            "current_daily_records": len(current_rows),
-            "comparison_daily_records": len(previous_rows),
-            "current_search_console_records": len(current_search_rows),
-            "comparison_search_console_records": len(previous_search_rows),
+            "current_daily_records": current_daily["daily_records"],
+            "comparison_daily_records": comparison_daily["daily_records"],
+            "current_search_console_records": current_daily["search_console_records"],
+            "comparison_search_console_records": comparison_daily["search_console_records"],
             "rank_snapshot_records": db.query(RankingSnapshot).filter(
                 RankingSnapshot.tenant_id == tenant_id,
                 RankingSnapshot.campaign_id == campaign.id,
@@ -1299,7 +1502,7 @@ def build_report_snapshot(
                 TechnicalIssue.tenant_id == tenant_id,
                 TechnicalIssue.campaign_id == campaign.id,
             ).count(),
-            "recommendation_records": len(recommendations),
+            "recommendation_records": recommendation_count,
             "completed_crawl_records": len(current_crawls),
             "review_snapshot_records": len(current_reviews),
             "current_rank_snapshot_records": len(current_rank_rows),
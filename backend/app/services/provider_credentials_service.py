@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import copy
 import uuid
+from collections import OrderedDict
 from datetime import UTC, datetime
+from threading import Lock
+from time import monotonic
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.core.crypto import CredentialCryptoError, decrypt_payload, encrypt_payload
+from app.core.metrics import provider_credential_cache_requests_total
 from app.core.settings import get_settings
 from app.models.organization import Organization
 from app.models.organization_provider_credential import OrganizationProviderCredential
@@ -22,6 +28,46 @@ class ProviderCredentialConfigurationError(RuntimeError):
         self.status_code = status_code
 
 
+class _CachedCredentials:
+    """Decrypted credentials held in process memory only.
+
+    The secret never appears in ``repr`` output and the entry refuses to be
+    pickled, so it cannot leak through logs, task payloads or result backends.
+    """
+
+    __slots__ = ("stamp", "auth_mode", "owner", "expires_at", "_secret")
+
+    def __init__(
+        self,
+        *,
+        stamp: tuple[str, str, datetime | None],
+        auth_mode: str,
+        owner: str,
+        secret: dict[str, Any],
+        expires_at: float,
+    ) -> None:
+        self.stamp = stamp
+        self.auth_mode = auth_mode
+        self.owner = owner
+        self.expires_at = expires_at
+        self._secret = copy.deepcopy(secret)
+
+    def secret(self) -> dict[str, Any]:
+        return copy.deepcopy(self._secret)
+
+    def __repr__(self) -> str:
+        return f"_CachedCredentials(owner={self.owner!r}, auth_mode={self.auth_mode!r}, secret=<redacted>)"
+
+    def __reduce__(self) -> Any:
+        raise TypeError("Cached provider credentials cannot be pickled.")
+
+
+_CredentialCacheKey = tuple[str, str, str, str | None, bool]
+
+_CREDENTIAL_CACHE: OrderedDict[_CredentialCacheKey, _CachedCredentials] = OrderedDict()
+_CREDENTIAL_CACHE_LOCK = Lock()
+
+
 def resolve_provider_credentials(
     db: Session,
     organization_id: str,
@@ -30,6 +76,24 @@ def resolve_provider_credentials(
     required_credential_mode: str | None = None,
     require_org_oauth: bool = False,
 ) -> dict[str, Any]:
+    # Hot collection loops resolve the same credentials many times a minute.
+    # A fresh entry skips the policy/credential queries and AES decryption;
+    # an expired one is revalidated against the row's updated_at stamp so
+    # unchanged secrets are not decrypted again.
+    cache_key = _credential_cache_key(
+        db,
+        organization_id=organization_id,
+        provider_name=provider_name,
+        required_credential_mode=required_credential_mode,
+        require_org_oauth=require_org_oauth,
+    )
+    cached = _cached_credentials(cache_key)
+    if cached is not None and cached.expires_at > monotonic():
+        credentials = cached.secret()
+        if not _oauth2_refresh_due(provider_name, cached.auth_mode, credentials):
+            provider_credential_cache_requests_total.labels(outcome="hit").inc()
+            return credentials
+
     selected_row = _select_provider_credential_row(
         db,
         organization_id=organization_id,
@@ -38,9 +102,15 @@ def resolve_provider_credentials(
         require_org_oauth=require_org_oauth,
     )
     if selected_row is None:
+        _discard_cached_credentials(cache_key)
         return {}
 
-    credentials = _decrypt_payload(selected_row.encrypted_secret_blob)
+    if cached is not None and cached.stamp == _credential_stamp(selected_row):
+        provider_credential_cache_requests_total.labels(outcome="revalidated").inc()
+        credentials = cached.secret()
+    else:
+        provider_credential_cache_requests_total.labels(outcome="miss").inc()
+        credentials = _decrypt_payload(selected_row.encrypted_secret_blob)
     if selected_row.auth_mode == "oauth2":
         credentials = _refresh_oauth2_credentials_if_needed(
             db,
@@ -48,6 +118,7 @@ def resolve_provider_credentials(
             provider_name=provider_name,
             credentials=credentials,
         )
+    _store_cached_credentials(cache_key, selected_row, credentials)
     return credentials
 
 
@@ -59,6 +130,17 @@ def resolve_provider_credential_owner(
     required_credential_mode: str | None = None,
     require_org_oauth: bool = False,
 ) -> str:
+    cached = _cached_credentials(
+        _credential_cache_key(
+            db,
+            organization_id=organization_id,
+            provider_name=provider_name,
+            required_credential_mode=required_credential_mode,
+            require_org_oauth=require_org_oauth,
+        )
+    )
+    if cached is not None and cached.expires_at > monotonic():
+        return cached.owner
     selected_row = _select_provider_credential_row(
         db,
         organization_id=organization_id,
@@ -169,6 +251,7 @@ def upsert_provider_policy(
         row.credential_mode = credential_mode
         row.updated_at = now
     db.commit()
+    invalidate_provider_credential_cache(organization_id=organization_id, provider_name=provider_name)
     db.refresh(row)
     return row
 
@@ -212,6 +295,7 @@ def upsert_organization_provider_credentials(
         row.key_version = key_version
         row.updated_at = now
     db.commit()
+    invalidate_provider_credential_cache(organization_id=organization_id, provider_name=provider_name)
     db.refresh(row)
     return row
 
@@ -255,6 +339,7 @@ def upsert_platform_provider_credentials(
         row.key_version = key_version
         row.updated_at = now
     db.commit()
+    invalidate_provider_credential_cache(provider_name=provider_name)
     db.refresh(row)
     return row
 
@@ -302,11 +387,7 @@ def _refresh_oauth2_credentials_if_needed(
     if provider_name != GOOGLE_PROVIDER_NAME:
         return credentials
 
-    settings = get_settings()
-    now = int(datetime.now(UTC).timestamp())
-    expires_at = _safe_int(credentials.get("expires_at"))
-    access_token = str(credentials.get("access_token", "")).strip()
-    if access_token and expires_at is not None and expires_at > now + settings.google_oauth_access_token_skew_seconds:
+    if not _oauth2_refresh_due(provider_name, "oauth2", credentials):
         return credentials
 
     refresh_token = str(credentials.get("refresh_token", "")).strip()
@@ -347,10 +428,120 @@ def _refresh_oauth2_credentials_if_needed(
     row.key_version = key_version
     row.updated_at = datetime.now(UTC)
     db.commit()
+    invalidate_provider_credential_cache(
+        organization_id=row.organization_id if isinstance(row, OrganizationProviderCredential) else None,
+        provider_name=provider_name,
+    )
     db.refresh(row)
     return merged
 
 
+def _oauth2_refresh_due(provider_name: str, auth_mode: str, credentials: dict[str, Any]) -> bool:
+    if auth_mode != "oauth2" or provider_name != GOOGLE_PROVIDER_NAME:
+        return False
+    now = int(datetime.now(UTC).timestamp())
+    expires_at = _safe_int(credentials.get("expires_at"))
+    access_token = str(credentials.get("access_token", "")).strip()
+    skew_seconds = get_settings().google_oauth_access_token_skew_seconds
+    return not (access_token and expires_at is not None and expires_at > now + skew_seconds)
+
+
+def invalidate_provider_credential_cache(
+    *,
+    organization_id: str | None = None,
+    provider_name: str | None = None,
+) -> None:
+    """Drop cached credentials matching the given organization and/or provider.
+
+    With no arguments the whole cache is cleared. Platform credential writes
+    pass only ``provider_name`` because every organization may fall back to them.
+    """
+    with _CREDENTIAL_CACHE_LOCK:
+        for key in list(_CREDENTIAL_CACHE):
+            if organization_id is not None and key[1] != organization_id:
+                continue
+            if provider_name is not None and key[2] != provider_name:
+                continue
+            del _CREDENTIAL_CACHE[key]
+
+
+def _credential_cache_key(
+    db: Session,
+    *,
+    organization_id: str,
+    provider_name: str,
+    required_credential_mode: str | None,
+    require_org_oauth: bool,
+) -> _CredentialCacheKey:
+    return (
+        str(db.get_bind().url),
+        str(organization_id),
+        provider_name,
+        required_credential_mode,
+        require_org_oauth,
+    )
+
+
+def _credential_stamp(
+    row: OrganizationProviderCredential | PlatformProviderCredential,
+) -> tuple[str, str, datetime | None]:
+    return (type(row).__name__, str(row.id), row.updated_at)
+
+
+def _cached_credentials(key: _CredentialCacheKey) -> _CachedCredentials | None:
+    with _CREDENTIAL_CACHE_LOCK:
+        entry = _CREDENTIAL_CACHE.get(key)
+        if entry is not None:
+            _CREDENTIAL_CACHE.move_to_end(key)
+        return entry
+
+
+def _store_cached_credentials(
+    key: _CredentialCacheKey,
+    row: OrganizationProviderCredential | PlatformProviderCredential,
+    credentials: dict[str, Any],
+) -> None:
+    settings = get_settings()
+    max_entries = int(settings.provider_credential_cache_max_entries)
+    if max_entries <= 0:
+        return
+    entry = _CachedCredentials(
+        stamp=_credential_stamp(row),
+        auth_mode=row.auth_mode,
+        owner="organization" if isinstance(row, OrganizationProviderCredential) else "platform",
+        secret=credentials,
+        expires_at=monotonic() + float(settings.provider_credential_cache_ttl_seconds),
+    )
+    with _CREDENTIAL_CACHE_LOCK:
+        _CREDENTIAL_CACHE[key] = entry
+        _CREDENTIAL_CACHE.move_to_end(key)
+        while len(_CREDENTIAL_CACHE) > max_entries:
+            _CREDENTIAL_CACHE.popitem(last=False)
+
+
+def _discard_cached_credentials(key: _CredentialCacheKey) -> None:
+    with _CREDENTIAL_CACHE_LOCK:
+        _CREDENTIAL_CACHE.pop(key, None)
+
+
+@event.listens_for(OrganizationProviderCredential, "after_delete")
+def _invalidate_organization_credentials_on_delete(
+    _mapper: Any,
+    _connection: Any,
+    target: OrganizationProviderCredential,
+) -> None:
+    invalidate_provider_credential_cache(organization_id=target.organization_id, provider_name=target.provider_name)
+
+
+@event.listens_for(PlatformProviderCredential, "after_delete")
+def _invalidate_platform_credentials_on_delete(
+    _mapper: Any,
+    _connection: Any,
+    target: PlatformProviderCredential,
+) -> None:
+    invalidate_provider_credential_cache(provider_name=target.provider_name)
+
+
 def _safe_int(value: Any) -> int | None:
     try:
         return int(value)
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import logging
 import threading
 import time
 from dataclasses import dataclass
 
+from app.core.config import get_settings
 from app.services.infra_service import queue_depth_count
+from app.services.queue_controls.depth_sampler import QueueDepthSampler
 from app.services.queue_controls.fair_scheduler import ScheduledJob, WeightedFairScheduler
+from app.services.queue_controls.shared_admission import AdmissionStoreUnavailable, RedisAdmissionStore
 from app.services.queue_controls.starvation_monitor import evaluate_starvation
 from app.services.queue_controls.token_bucket import TokenBucket, TokenBucketState
 
+logger = logging.getLogger("lsos.queue.admission")
+
 _CRITICAL_QUEUE_LAG = 180
 _WARNING_QUEUE_LAG = 60
 _DEFAULT_BUCKET_CAPACITY = 120
 _DEFAULT_BUCKET_REFILL_PER_SECOND = 2.0
 _TARGET_GOVERNANCE_WAIT_SECONDS = 30.0
+_QUEUE_DEPTH_SAMPLE_INTERVAL_SECONDS = 1.0
+_QUEUE_DEPTH_MAX_AGE_SECONDS = 5.0
+_FAIR_SHARE_WINDOW_SECONDS = 10
+_FAIR_SHARE_MIN_JOBS = 5
+_SHARED_STORE_RETRY_SECONDS = 30.0
 
 _NON_CRITICAL_QUEUES = {"crawl_queue", "rank_queue", "content_queue", "authority_queue"}
 
@@ -21,6 +32,13 @@ _lock = threading.Lock()
 _shadow_replay_enabled = True
 _buckets: dict[tuple[str, str], TokenBucket] = {}
 _scheduler = WeightedFairScheduler(weights={"system": 1})
+_depth_sampler = QueueDepthSampler(
+    queue_depth_count,
+    interval_seconds=_QUEUE_DEPTH_SAMPLE_INTERVAL_SECONDS,
+    max_age_seconds=_QUEUE_DEPTH_MAX_AGE_SECONDS,
+)
+_shared_store: RedisAdmissionStore | None = None
+_shared_store_retry_at = 0.0
 
 
 @dataclass(frozen=True)
@@ -33,23 +51,43 @@ def admit_enqueue(*, tenant_id: str, queue_name: str) -> AdmissionDecision:
     global _shadow_replay_enabled
 
     tenant = tenant_id.strip() if tenant_id.strip() else "system"
-    now_epoch = int(time.time())
-    queue_depth = queue_depth_count(queue_name)
+    queue_depth = _depth_sampler.depth(queue_name)
+    governance_depth = _depth_sampler.depth("default_queue")
     with _lock:
         if queue_depth is not None and queue_depth >= _CRITICAL_QUEUE_LAG:
             _shadow_replay_enabled = False
         elif queue_depth is not None and queue_depth < _WARNING_QUEUE_LAG:
             _shadow_replay_enabled = True
 
-        governance_depth = queue_depth_count("default_queue")
-        if governance_depth is not None:
-            starvation = evaluate_starvation(
-                max_wait_seconds=float(governance_depth),
-                target_wait_seconds=_TARGET_GOVERNANCE_WAIT_SECONDS,
+    if governance_depth is not None:
+        starvation = evaluate_starvation(
+            max_wait_seconds=float(governance_depth),
+            target_wait_seconds=_TARGET_GOVERNANCE_WAIT_SECONDS,
+        )
+        if starvation.level == "critical" and queue_name in _NON_CRITICAL_QUEUES:
+            return AdmissionDecision(allowed=False, reason="auto_throttled_for_governance_starvation")
+
+    if queue_depth is not None and queue_depth >= _CRITICAL_QUEUE_LAG and queue_name in _NON_CRITICAL_QUEUES:
+        return AdmissionDecision(allowed=False, reason="critical_queue_lag")
+
+    store = _shared_admission_store()
+    if store is not None:
+        try:
+            result = store.admit(
+                tenant_id=tenant,
+                queue_name=queue_name,
+                contended=queue_depth is not None and queue_depth >= _WARNING_QUEUE_LAG,
             )
-            if starvation.level == "critical" and queue_name in _NON_CRITICAL_QUEUES:
-                return AdmissionDecision(allowed=False, reason="auto_throttled_for_governance_starvation")
+        except AdmissionStoreUnavailable:
+            _mark_shared_store_unavailable()
+        else:
+            return AdmissionDecision(allowed=result.allowed, reason=result.reason)
+    return _admit_locally(tenant=tenant, queue_name=queue_name)
 
+
+def _admit_locally(*, tenant: str, queue_name: str) -> AdmissionDecision:
+    now_epoch = int(time.time())
+    with _lock:
         bucket_key = (tenant, queue_name)
         bucket = _buckets.get(bucket_key)
         if bucket is None:
@@ -66,9 +104,6 @@ def admit_enqueue(*, tenant_id: str, queue_name: str) -> AdmissionDecision:
         if not bucket.try_consume(now_epoch=now_epoch):
             return AdmissionDecision(allowed=False, reason="token_bucket_rejected")
 
-        if queue_depth is not None and queue_depth >= _CRITICAL_QUEUE_LAG and queue_name in _NON_CRITICAL_QUEUES:
-            return AdmissionDecision(allowed=False, reason="critical_queue_lag")
-
         current_job = ScheduledJob(tenant_id=tenant, queue_name=queue_name, payload={})
         _scheduler.enqueue(current_job)
         selected = _scheduler.next_job()
@@ -81,6 +116,42 @@ def admit_enqueue(*, tenant_id: str, queue_name: str) -> AdmissionDecision:
     return AdmissionDecision(allowed=True, reason="allowed")
 
 
+def _shared_admission_store() -> RedisAdmissionStore | None:
+    global _shared_store
+
+    settings = get_settings()
+    if (
+        settings.app_env.lower() == "test"
+        or settings.hosted_serverless
+        or settings.queue_admission_backend != "redis"
+    ):
+        return None
+    with _lock:
+        if _shared_store is None and time.monotonic() >= _shared_store_retry_at:
+            _shared_store = RedisAdmissionStore(
+                settings.redis_url,
+                capacity=_DEFAULT_BUCKET_CAPACITY,
+                refill_rate_per_second=_DEFAULT_BUCKET_REFILL_PER_SECOND,
+                fair_share_window_seconds=_FAIR_SHARE_WINDOW_SECONDS,
+                fair_share_min_jobs=_FAIR_SHARE_MIN_JOBS,
+            )
+        return _shared_store
+
+
+def _mark_shared_store_unavailable() -> None:
+    global _shared_store, _shared_store_retry_at
+
+    # Keep enqueueing on this process's own limits rather than failing every task
+    # while Redis is down, and try the shared store again after a short pause.
+    logger.warning(
+        "queue_admission_shared_store_unavailable",
+        extra={"event": "queue_admission_shared_store_unavailable", "retry_seconds": _SHARED_STORE_RETRY_SECONDS},
+    )
+    with _lock:
+        _shared_store = None
+        _shared_store_retry_at = time.monotonic() + _SHARED_STORE_RETRY_SECONDS
+
+
 def shadow_replay_allowed() -> bool:
     with _lock:
         return _shadow_replay_enabled
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from time import monotonic
+
+
+class QueueDepthSampler:
+    """Keep recent queue depths fresh from a background thread.
+
+    Callers read the last sample instead of probing the broker on every enqueue. A
+    queue is probed synchronously the first time it is requested and then refreshed
+    every ``interval_seconds``; samples older than ``max_age_seconds`` read as unknown.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[str], int | None],
+        *,
+        interval_seconds: float,
+        max_age_seconds: float,
+    ) -> None:
+        if interval_seconds <= 0 or max_age_seconds < interval_seconds:
+            raise ValueError("max_age_seconds must be at least interval_seconds, which must be positive")
+        self._probe = probe
+        self._interval_seconds = float(interval_seconds)
+        self._max_age_seconds = float(max_age_seconds)
+        self._lock = threading.Lock()
+        self._samples: dict[str, tuple[int | None, float]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_pid: int | None = None
+
+    def depth(self, queue_name: str) -> int | None:
+        with self._lock:
+            sample = self._samples.get(queue_name)
+            self._ensure_running_locked()
+        if sample is None:
+            return self.refresh(queue_name)
+        value, sampled_at = sample
+        if monotonic() - sampled_at > self._max_age_seconds:
+            return None
+        return value
+
+    def refresh(self, queue_name: str) -> int | None:
+        try:
+            value = self._probe(queue_name)
+        except Exception:
+            value = None
+        with self._lock:
+            self._samples[queue_name] = (value, monotonic())
+        return value
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=self._interval_seconds * 2)
+        with self._lock:
+            self._thread = None
+            self._samples.clear()
+        self._stop = threading.Event()
+
+    def _ensure_running_locked(self) -> None:
+        # Forked workers inherit the object but not the thread, so restart per process.
+        if self._thread is not None and self._thread.is_alive() and self._thread_pid == os.getpid():
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop,),
+            name="queue-depth-sampler",
+            daemon=True,
+        )
+        self._thread_pid = os.getpid()
+        self._thread.start()
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self._interval_seconds):
+            with self._lock:
+                queue_names = list(self._samples)
+            for queue_name in queue_names:
+                self.refresh(queue_name)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import redis
+from redis.exceptions import RedisError
+
+# Token bucket and fair-share accounting for one (tenant, queue) admission, evaluated
+# atomically so every API replica and worker draws from the same budget.
+#
+# KEYS[1] bucket hash: tokens, refilled_at_ms
+# KEYS[2] queue fair-share hash: __window, __total, <tenant> -> admitted in window
+# ARGV: capacity, refill_per_second, tenant, window_seconds, contended, min_share
+_ADMISSION_SCRIPT = """
+local current_time = redis.call('TIME')
+local now_ms = tonumber(current_time[1]) * 1000 + math.floor(tonumber(current_time[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local refill_per_ms = tonumber(ARGV[2]) / 1000
+local tenant = ARGV[3]
+local window_ms = tonumber(ARGV[4]) * 1000
+local contended = ARGV[5] == '1'
+local min_share = tonumber(ARGV[6])
+local bucket_ttl_ms = math.max(window_ms, math.ceil(capacity / math.max(refill_per_ms, 0.000001)) * 2)
+
+local stored = redis.call('HMGET', KEYS[1], 'tokens', 'refilled_at_ms')
+local tokens = tonumber(stored[1]) or capacity
+local refilled_at_ms = tonumber(stored[2]) or now_ms
+if now_ms > refilled_at_ms then
+    tokens = math.min(capacity, tokens + (now_ms - refilled_at_ms) * refill_per_ms)
+    refilled_at_ms = now_ms
+end
+
+local window_started_at = now_ms - (now_ms % window_ms)
+if tonumber(redis.call('HGET', KEYS[2], '__window')) ~= window_started_at then
+    redis.call('DEL', KEYS[2])
+    redis.call('HSET', KEYS[2], '__window', window_started_at, '__total', 0)
+    redis.call('PEXPIRE', KEYS[2], window_ms * 2)
+end
+local admitted = tonumber(redis.call('HGET', KEYS[2], tenant)) or 0
+
+if contended then
+    local total = tonumber(redis.call('HGET', KEYS[2], '__total')) or 0
+    local active_tenants = redis.call('HLEN', KEYS[2]) - 2
+    if admitted == 0 then
+        active_tenants = active_tenants + 1
+    end
+    local fair_share = math.max(min_share, math.ceil((total + 1) / active_tenants))
+    if admitted >= fair_share then
+        return {0, 'fair_scheduler_deferred', fair_share - admitted}
+    end
+end
+
+if tokens < 1 then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'refilled_at_ms', refilled_at_ms)
+    redis.call('PEXPIRE', KEYS[1], bucket_ttl_ms)
+    return {0, 'token_bucket_rejected', 0}
+end
+
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'refilled_at_ms', refilled_at_ms)
+redis.call('PEXPIRE', KEYS[1], bucket_ttl_ms)
+redis.call('HINCRBY', KEYS[2], tenant, 1)
+redis.call('HINCRBY', KEYS[2], '__total', 1)
+return {1, 'allowed', math.floor(tokens)}
+"""
+
+
+class AdmissionStoreUnavailable(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class SharedAdmissionResult:
+    allowed: bool
+    reason: str
+    remaining: int
+
+
+class RedisAdmissionStore:
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        capacity: int,
+        refill_rate_per_second: float,
+        fair_share_window_seconds: int,
+        fair_share_min_jobs: int,
+        key_prefix: str = "queue_admission:v1",
+    ) -> None:
+        if not redis_url.strip():
+            raise ValueError("redis_url is required")
+        if capacity <= 0 or refill_rate_per_second <= 0 or fair_share_window_seconds <= 0:
+            raise ValueError("capacity, refill rate, and fair-share window must be greater than zero")
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_connect_timeout=0.2,
+            socket_timeout=0.2,
+            retry_on_timeout=False,
+        )
+        self._admission_script = self._redis.register_script(_ADMISSION_SCRIPT)
+        self._capacity = int(capacity)
+        self._refill_rate_per_second = float(refill_rate_per_second)
+        self._fair_share_window_seconds = int(fair_share_window_seconds)
+        self._fair_share_min_jobs = max(1, int(fair_share_min_jobs))
+        self._key_prefix = key_prefix
+
+    def admit(self, *, tenant_id: str, queue_name: str, contended: bool) -> SharedAdmissionResult:
+        try:
+            result = self._admission_script(
+                keys=[
+                    f"{self._key_prefix}:bucket:{queue_name}:{tenant_id}",
+                    f"{self._key_prefix}:fair_share:{queue_name}",
+                ],
+                args=[
+                    self._capacity,
+                    self._refill_rate_per_second,
+                    tenant_id,
+                    self._fair_share_window_seconds,
+                    1 if contended else 0,
+                    self._fair_share_min_jobs,
+                ],
+            )
+            allowed, reason, remaining = int(result[0]), result[1], int(result[2])
+        except (RedisError, TypeError, ValueError, IndexError) as exc:
+            raise AdmissionStoreUnavailable("Redis admission store is unavailable") from exc
+        if isinstance(reason, bytes):
+            reason = reason.decode("utf-8")
+        return SharedAdmissionResult(allowed=allowed == 1, reason=str(reason), remaining=remaining)
@@ -12,15 +12,17 @@ from app.domain import entitlement_codes
 from app.events import emit_event
 from app.models.business_location import BusinessLocation
 from app.models.campaign import Campaign
+from app.models.cost_economics import CostLedgerEntry
 from app.models.organization import Organization
 from app.models.rank import CampaignKeyword, KeywordCluster, Ranking, RankingSnapshot
 from app.providers import get_rank_provider_for_organization
 from app.services.cost_economics_service import (
     CostEconomicsError,
+    ProviderCostUnit,
     authorize_reserved_provider_dispatch,
-    reconcile_provider_cost,
+    reconcile_provider_cost_batch,
     release_provider_cost,
-    reserve_provider_cost,
+    reserve_provider_cost_batch,
 )
 from app.services.entitlement_service import EntitlementNotFoundError, check_and_consume
 from app.services.provider_credentials_service import (
@@ -458,28 +460,52 @@ def run_snapshot_collection(db: Session, tenant_id: str, campaign_id: str, locat
             "keyword_snapshot",
             1,
         )
+    reservations: dict[str, CostLedgerEntry] = {}
+    if provider_cost_identity is not None and credential_owner is not None:
+        provider_name, capability, operation, quantity = provider_cost_identity
+        # One lock and one commit for the whole collection; the allowance is
+        # checked against its total before any keyword is dispatched.
+        units = [
+            ProviderCostUnit(
+                idempotency_key=f"rank:{collection_id}:{kw.id}",
+                quantity=(
+                    quantity * _dataforseo_keyword_cost_multiplier(kw.keyword)
+                    if provider_name == "dataforseo"
+                    else quantity
+                ),
+            )
+            for kw in keywords
+        ]
+        try:
+            reserved = reserve_provider_cost_batch(
+                db,
+                organization_id=str(campaign.organization_id),
+                business_location_id=campaign.business_location_id,
+                campaign_id=campaign.id,
+                provider_name=provider_name,
+                capability=capability,
+                operation=operation,
+                credential_owner=credential_owner,
+                units=units,
+            )
+        except CostEconomicsError as exc:
+            raise HTTPException(
+                status_code=exc.status_code,
+                detail={"message": str(exc), "reason_code": exc.reason_code},
+            ) from exc
+        reservations = {kw.id: reservation for kw, reservation in zip(keywords, reserved)}
+
     created = 0
-    for kw in keywords:
-        reservation = None
-        if provider_cost_identity is not None and credential_owner is not None:
-            provider_name, capability, operation, quantity = provider_cost_identity
-            if provider_name == "dataforseo":
-                quantity *= _dataforseo_keyword_cost_multiplier(kw.keyword)
+    # Reconciled together after the run, like the reservations were taken.
+    dispatched: list[tuple[CostLedgerEntry, float | None]] = []
+    for index, kw in enumerate(keywords):
+        reservation = reservations.get(kw.id)
+        if reservation is not None:
             try:
-                reservation = reserve_provider_cost(
-                    db,
-                    organization_id=str(campaign.organization_id),
-                    business_location_id=campaign.business_location_id,
-                    campaign_id=campaign.id,
-                    provider_name=provider_name,
-                    capability=capability,
-                    operation=operation,
-                    credential_owner=credential_owner,
-                    quantity=quantity,
-                    idempotency_key=f"rank:{collection_id}:{kw.id}",
-                )
                 authorize_reserved_provider_dispatch(db, reservation=reservation)
             except CostEconomicsError as exc:
+                reconcile_provider_cost_batch(db, reconciliations=dispatched)
+                _release_undispatched(db, reservations, keywords[index + 1 :])
                 raise HTTPException(
                     status_code=exc.status_code,
                     detail={"message": str(exc), "reason_code": exc.reason_code},
@@ -491,15 +517,14 @@ def run_snapshot_collection(db: Session, tenant_id: str, campaign_id: str, locat
                 target_domain=campaign.domain,
             )
         except Exception:
-            if reservation is not None:
-                release_provider_cost(db, reservation=reservation)
+            reconcile_provider_cost_batch(db, reconciliations=dispatched)
+            _release_undispatched(db, reservations, keywords[index:])
             raise
         if reservation is not None:
-            reconcile_provider_cost(
-                db,
-                reservation=reservation,
-                provider_reported_cost=snapshot_payload.get("provider_reported_cost"),
-            )
+            dispatched.append((reservation, snapshot_payload.get("provider_reported_cost")))
+            # Ends the dispatch fence so the organization lock is not held
+            # across the next keyword's provider call.
+            db.commit()
         position = int(snapshot_payload["position"])
         confidence = float(snapshot_payload["confidence"])
         previous = (
@@ -547,6 +572,7 @@ def run_snapshot_collection(db: Session, tenant_id: str, campaign_id: str, locat
         )
         db.add(snapshot_row)
         created += 1
+    reconcile_provider_cost_batch(db, reconciliations=dispatched)
     emit_event(
         db,
         tenant_id=tenant_id,
@@ -581,6 +607,19 @@ _DATAFORSEO_MULTIPLIED_OPERATORS = (
 )
 
 
+def _release_undispatched(
+    db: Session,
+    reservations: dict[str, CostLedgerEntry],
+    keywords: list[CampaignKeyword],
+) -> None:
+    # A batch reservation covers the whole collection, so a stopped run must
+    # hand back exposure for every keyword that never reached the provider.
+    for kw in keywords:
+        reservation = reservations.get(kw.id)
+        if reservation is not None:
+            release_provider_cost(db, reservation=reservation)
+
+
 def _dataforseo_keyword_cost_multiplier(keyword: str) -> int:
     """Reserve the documented 5x multiplier for every advanced search operator."""
     normalized = keyword.casefold()
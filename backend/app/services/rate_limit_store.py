@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from functools import lru_cache
+import logging
+import math
 import re
+from threading import Lock
 import time
-from typing import Protocol
+from typing import Any, Protocol, TypeVar
 
 import redis
 from redis.exceptions import RedisError
@@ -26,6 +32,9 @@ _POSTGRES_TRANSACTION_RETRY_BACKOFF_SECONDS = (0.025, 0.05)
 _RETRYABLE_POSTGRES_SQLSTATES = frozenset({"40001", "40P01", "55P03"})
 _SCOPE_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
 _POLICY_KEY_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_.:-]{0,63}$")
+_MAX_LEASE_BLOCK_SIZE = 10_000
+_T = TypeVar("_T")
+logger = logging.getLogger("lsos.api.rate_limit")
 
 _SET_ROLE_SQL = text("SET LOCAL ROLE lsos_app")
 _SET_TIMEOUTS_SQL = text(
@@ -51,6 +60,33 @@ _CONSUME_SQL = text(
     )
     """
 )
+_RESERVE_SQL = text(
+    """
+    SELECT
+        granted,
+        request_count,
+        window_started_at,
+        reset_at,
+        retry_after_seconds
+    FROM public.reserve_request_rate_limit(
+        :scope_hash,
+        :policy_key,
+        :request_limit,
+        :tokens
+    )
+    """
+)
+_RELEASE_SQL = text(
+    """
+    SELECT public.release_request_rate_limit(
+        :scope_hash,
+        :policy_key,
+        :request_limit,
+        :window_started_at,
+        :tokens
+    )
+    """
+)
 _PRUNE_SQL = text(
     """
     SELECT public.prune_request_rate_limit_counters(
@@ -109,6 +145,63 @@ end
 return {request_count, stored_window, now_epoch}
 """
 
+# Lease scripts share the fixed-window hash layout above, so leased and
+# per-request processes can enforce the same bucket side by side.
+_REDIS_RESERVE_SCRIPT = """
+local current_time = redis.call('TIME')
+local now_epoch = tonumber(current_time[1])
+local window_started_at = now_epoch - (now_epoch % 60)
+local stored = redis.call('HMGET', KEYS[1], 'window_started_at', 'request_count')
+local stored_window = tonumber(stored[1])
+local request_count = tonumber(stored[2])
+local request_limit = tonumber(ARGV[1])
+local requested = tonumber(ARGV[2])
+
+if stored_window == nil or request_count == nil or stored_window < window_started_at then
+    stored_window = window_started_at
+    request_count = 0
+end
+
+local granted = math.min(requested, math.max(0, request_limit - request_count))
+if granted > 0 then
+    request_count = request_count + granted
+else
+    request_count = math.min(request_count + 1, request_limit + 1)
+end
+
+redis.call(
+    'HSET',
+    KEYS[1],
+    'window_started_at',
+    stored_window,
+    'request_count',
+    request_count
+)
+redis.call('EXPIRE', KEYS[1], math.max(120, (stored_window + 60) - now_epoch))
+
+return {granted, request_count, stored_window, now_epoch}
+"""
+
+_REDIS_RELEASE_SCRIPT = """
+local stored = redis.call('HMGET', KEYS[1], 'window_started_at', 'request_count')
+local stored_window = tonumber(stored[1])
+local request_count = tonumber(stored[2])
+local request_limit = tonumber(ARGV[1])
+local lease_window = tonumber(ARGV[2])
+local released = tonumber(ARGV[3])
+
+-- Tokens only belong to the window they were reserved in. Once the bucket has
+-- rolled, the unused allotment already expired with it.
+if stored_window == nil or request_count == nil or stored_window ~= lease_window then
+    return 0
+end
+
+local admitted = math.min(request_count, request_limit)
+released = math.min(released, admitted)
+redis.call('HSET', KEYS[1], 'request_count', admitted - released)
+return released
+"""
+
 
 @dataclass(frozen=True, slots=True)
 class RateLimitDecision:
@@ -120,6 +213,18 @@ class RateLimitDecision:
     retry_after_seconds: int
 
 
+@dataclass(frozen=True, slots=True)
+class RateLimitLease:
+    """A block of tokens reserved from the shared window for local admission."""
+
+    granted: int
+    limit: int
+    count: int
+    window_started_at_epoch: int
+    reset_at_epoch: int
+    retry_after_seconds: int
+
+
 class RateLimitStoreUnavailable(RuntimeError):
     """Raised when a configured distributed rate-limit store cannot decide."""
 
@@ -133,6 +238,25 @@ class RateLimitStore(Protocol):
     ) -> RateLimitDecision: ...
 
 
+class LeasableRateLimitStore(RateLimitStore, Protocol):
+    def reserve(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        tokens: int,
+    ) -> RateLimitLease: ...
+
+    def release(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        window_started_at_epoch: int,
+        tokens: int,
+    ) -> int: ...
+
+
 class PostgresFixedWindowRateLimitStore:
     def __init__(
         self,
@@ -165,6 +289,120 @@ class PostgresFixedWindowRateLimitStore:
             policy_key=policy_key,
             limit=limit,
         )
+        def _decision(row: Any) -> RateLimitDecision:
+            count = int(row["request_count"])
+            remaining = int(row["remaining"])
+            reset_at = row["reset_at"]
+            if reset_at is None or not hasattr(reset_at, "timestamp"):
+                raise RateLimitStoreUnavailable(
+                    "PostgreSQL rate-limit store returned an invalid reset time"
+                )
+            allowed = row["allowed"]
+            retry_after_seconds = int(row["retry_after_seconds"])
+            if (
+                not isinstance(allowed, bool)
+                or not 1 <= count <= int(limit) + 1
+                or remaining != max(0, int(limit) - count)
+                or allowed != (count <= int(limit))
+                or retry_after_seconds < 1
+            ):
+                raise RateLimitStoreUnavailable(
+                    "PostgreSQL rate-limit store returned an invalid decision"
+                )
+            return RateLimitDecision(
+                allowed=allowed,
+                limit=int(limit),
+                count=count,
+                remaining=remaining,
+                reset_at_epoch=int(reset_at.timestamp()),
+                retry_after_seconds=retry_after_seconds,
+            )
+
+        return self._execute_one(
+            _CONSUME_SQL,
+            {
+                "scope_hash": scope_hash,
+                "policy_key": policy_key,
+                "request_limit": limit,
+            },
+            _decision,
+        )
+
+    def reserve(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        tokens: int,
+    ) -> RateLimitLease:
+        _validate_consume_input(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+        )
+        _validate_lease_tokens(tokens)
+
+        def _lease(row: Any) -> RateLimitLease:
+            window_started_at = row["window_started_at"]
+            reset_at = row["reset_at"]
+            if not hasattr(window_started_at, "timestamp") or not hasattr(reset_at, "timestamp"):
+                raise RateLimitStoreUnavailable(
+                    "PostgreSQL rate-limit store returned an invalid reset time"
+                )
+            return _checked_lease(
+                granted=int(row["granted"]),
+                limit=limit,
+                tokens=tokens,
+                count=int(row["request_count"]),
+                window_started_at_epoch=int(window_started_at.timestamp()),
+                reset_at_epoch=int(reset_at.timestamp()),
+                retry_after_seconds=int(row["retry_after_seconds"]),
+                backend="PostgreSQL",
+            )
+
+        return self._execute_one(
+            _RESERVE_SQL,
+            {
+                "scope_hash": scope_hash,
+                "policy_key": policy_key,
+                "request_limit": limit,
+                "tokens": tokens,
+            },
+            _lease,
+        )
+
+    def release(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        window_started_at_epoch: int,
+        tokens: int,
+    ) -> int:
+        _validate_consume_input(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+        )
+        _validate_lease_tokens(tokens)
+        return self._execute_one(
+            _RELEASE_SQL,
+            {
+                "scope_hash": scope_hash,
+                "policy_key": policy_key,
+                "request_limit": limit,
+                "window_started_at": datetime.fromtimestamp(window_started_at_epoch, UTC),
+                "tokens": tokens,
+            },
+            lambda row: int(next(iter(row.values()))),
+        )
+
+    def _execute_one(
+        self,
+        statement: Any,
+        params: dict[str, object],
+        parse: Callable[[Any], _T],
+    ) -> _T:
         attempt_count = len(_POSTGRES_TRANSACTION_RETRY_BACKOFF_SECONDS) + 1
         for attempt in range(attempt_count):
             session: Session | None = None
@@ -173,45 +411,8 @@ class PostgresFixedWindowRateLimitStore:
                 session = self._session_factory()
                 with session.begin():
                     self._restrict_transaction(session)
-                    row = (
-                        session.execute(
-                            _CONSUME_SQL,
-                            {
-                                "scope_hash": scope_hash,
-                                "policy_key": policy_key,
-                                "request_limit": limit,
-                            },
-                        )
-                        .mappings()
-                        .one()
-                    )
-                count = int(row["request_count"])
-                remaining = int(row["remaining"])
-                reset_at = row["reset_at"]
-                if reset_at is None or not hasattr(reset_at, "timestamp"):
-                    raise RateLimitStoreUnavailable(
-                        "PostgreSQL rate-limit store returned an invalid reset time"
-                    )
-                allowed = row["allowed"]
-                retry_after_seconds = int(row["retry_after_seconds"])
-                if (
-                    not isinstance(allowed, bool)
-                    or not 1 <= count <= int(limit) + 1
-                    or remaining != max(0, int(limit) - count)
-                    or allowed != (count <= int(limit))
-                    or retry_after_seconds < 1
-                ):
-                    raise RateLimitStoreUnavailable(
-                        "PostgreSQL rate-limit store returned an invalid decision"
-                    )
-                return RateLimitDecision(
-                    allowed=allowed,
-                    limit=int(limit),
-                    count=count,
-                    remaining=remaining,
-                    reset_at_epoch=int(reset_at.timestamp()),
-                    retry_after_seconds=retry_after_seconds,
-                )
+                    row = session.execute(statement, params).mappings().one()
+                return parse(row)
             except RateLimitStoreUnavailable:
                 raise
             except Exception as exc:
@@ -293,6 +494,10 @@ class RedisFixedWindowRateLimitStore:
         self._consume_script = self._redis.register_script(
             _REDIS_FIXED_WINDOW_SCRIPT
         )
+        # Lease scripts are registered on first use so per-request deployments
+        # never load them.
+        self._reserve_script: Callable[..., Any] | None = None
+        self._release_script: Callable[..., Any] | None = None
 
     def consume(
         self,
@@ -305,7 +510,7 @@ class RedisFixedWindowRateLimitStore:
             policy_key=policy_key,
             limit=limit,
         )
-        redis_key = f"request_rate_limit:v1:{policy_key}:{scope_hash}"
+        redis_key = _redis_key(policy_key, scope_hash)
         try:
             result = self._consume_script(
                 keys=[redis_key],
@@ -346,6 +551,375 @@ class RedisFixedWindowRateLimitStore:
         )
 
 
+    def reserve(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        tokens: int,
+    ) -> RateLimitLease:
+        _validate_consume_input(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+        )
+        _validate_lease_tokens(tokens)
+        if self._reserve_script is None:
+            self._reserve_script = self._redis.register_script(_REDIS_RESERVE_SCRIPT)
+        try:
+            result = self._reserve_script(
+                keys=[_redis_key(policy_key, scope_hash)],
+                args=[int(limit), int(tokens)],
+            )
+            if not isinstance(result, (list, tuple)) or len(result) != 4:
+                raise RateLimitStoreUnavailable(
+                    "Redis rate-limit store returned an invalid decision"
+                )
+            granted, count, window_started_at, now_epoch = (int(value) for value in result)
+        except RateLimitStoreUnavailable:
+            raise
+        except (RedisError, TypeError, ValueError) as exc:
+            raise RateLimitStoreUnavailable(
+                "Redis rate-limit store is unavailable"
+            ) from exc
+
+        reset_at_epoch = window_started_at + 60
+        if window_started_at < 0 or window_started_at % 60 != 0 or reset_at_epoch <= now_epoch:
+            raise RateLimitStoreUnavailable(
+                "Redis rate-limit store returned an invalid decision"
+            )
+        return _checked_lease(
+            granted=granted,
+            limit=limit,
+            tokens=tokens,
+            count=count,
+            window_started_at_epoch=window_started_at,
+            reset_at_epoch=reset_at_epoch,
+            retry_after_seconds=max(1, reset_at_epoch - now_epoch),
+            backend="Redis",
+        )
+
+    def release(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        window_started_at_epoch: int,
+        tokens: int,
+    ) -> int:
+        _validate_consume_input(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+        )
+        _validate_lease_tokens(tokens)
+        if self._release_script is None:
+            self._release_script = self._redis.register_script(_REDIS_RELEASE_SCRIPT)
+        try:
+            return int(
+                self._release_script(
+                    keys=[_redis_key(policy_key, scope_hash)],
+                    args=[int(limit), int(window_started_at_epoch), int(tokens)],
+                )
+            )
+        except (RedisError, TypeError, ValueError) as exc:
+            raise RateLimitStoreUnavailable(
+                "Redis rate-limit store is unavailable"
+            ) from exc
+
+
+@dataclass(slots=True)
+class _LocalAllotment:
+    lease: RateLimitLease
+    tokens: int
+    expires_at: float
+    last_used_at: float
+    refill: Future[None] | None = None
+
+
+class LeasedRateLimitStore:
+    """Serve admissions from per-process token blocks reserved in a shared store.
+
+    Each key reserves up to ``block_size`` tokens from the shared fixed window
+    and admits requests locally until the block runs low, when a background
+    refill reserves the next block. Idle allotments, evicted keys and
+    ``close()`` hand unused tokens back to the shared window.
+
+    Accuracy bounds, per key and fixed window:
+
+    * Over-admission is zero. The shared store never grants more than the
+      limit, and a local block expires one second before the store's window
+      resets, so tokens are never spent in the window after they were granted.
+    * Under-admission is at most ``(processes - 1) * block_size`` requests.
+      That is the allotment other processes can hold for the key. It lasts
+      until they spend it or return it after ``idle_seconds``.
+    * Response headers report the shared count as of the last reservation,
+      minus tokens still unspent locally.
+    """
+
+    def __init__(
+        self,
+        store: LeasableRateLimitStore,
+        *,
+        block_size: int,
+        idle_seconds: float = 5.0,
+        max_keys: int = 10_000,
+    ) -> None:
+        if isinstance(block_size, bool) or not 1 <= int(block_size) <= _MAX_LEASE_BLOCK_SIZE:
+            raise ValueError("block_size must be between 1 and 10000")
+        if not math.isfinite(float(idle_seconds)) or not 0.1 <= float(idle_seconds) <= 60.0:
+            raise ValueError("idle_seconds must be between 0.1 and 60 seconds")
+        if not 1 <= int(max_keys) <= 1_000_000:
+            raise ValueError("max_keys must be between 1 and 1000000")
+        self._store = store
+        self._block_size = int(block_size)
+        self._idle_seconds = float(idle_seconds)
+        self._max_keys = int(max_keys)
+        self._allotments: OrderedDict[tuple[str, str], _LocalAllotment] = OrderedDict()
+        self._lock = Lock()
+        self._next_sweep_at = time.monotonic() + self._idle_seconds
+        # One worker keeps refills and returns ordered and off the request path.
+        self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rate-limit-lease")
+
+    def consume(
+        self,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+    ) -> RateLimitDecision:
+        decision = self.consume_local(scope_hash=scope_hash, policy_key=policy_key, limit=limit)
+        if decision is not None:
+            return decision
+        with self._lock:
+            allotment = self._allotments.get((policy_key, scope_hash))
+            refill = allotment.refill if allotment is not None else None
+        if refill is not None:
+            # Waiting for the block already in flight costs the same round-trip
+            # as reserving another one, without parking a second block here.
+            refill.result()
+            decision = self.consume_local(scope_hash=scope_hash, policy_key=policy_key, limit=limit)
+            if decision is not None:
+                return decision
+        lease = self._store.reserve(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+            tokens=min(self._block_size, limit),
+        )
+        with self._lock:
+            allotment = self._merge(
+                (policy_key, scope_hash),
+                lease,
+                requested_at=time.monotonic(),
+            )
+            return self._admit(allotment, time.monotonic())
+
+    def consume_local(
+        self,
+        *,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+    ) -> RateLimitDecision | None:
+        """Admit from the local allotment without blocking; ``None`` needs the store."""
+        _validate_consume_input(
+            scope_hash=scope_hash,
+            policy_key=policy_key,
+            limit=limit,
+        )
+        key = (policy_key, scope_hash)
+        now = time.monotonic()
+        expired: list[tuple[tuple[str, str], _LocalAllotment]] = []
+        with self._lock:
+            if now >= self._next_sweep_at:
+                expired = self._sweep_idle(now)
+            allotment = self._allotments.get(key)
+            if allotment is not None and (allotment.expires_at <= now or allotment.lease.limit != limit):
+                expired.append((key, self._allotments.pop(key)))
+                allotment = None
+            decision = None
+            if allotment is not None and (allotment.tokens > 0 or allotment.lease.granted == 0):
+                decision = self._admit(allotment, now)
+                self._schedule_refill(key, allotment)
+        self._return_unused(expired)
+        return decision
+
+    def close(self) -> None:
+        """Return every unused token to the shared store and stop refills."""
+        with self._lock:
+            allotments = list(self._allotments.items())
+            self._allotments.clear()
+        self._background.shutdown(wait=True)
+        for key, allotment in allotments:
+            self._release(key, allotment)
+
+    def _admit(self, allotment: _LocalAllotment, now: float) -> RateLimitDecision:
+        lease = allotment.lease
+        allotment.last_used_at = now
+        retry_after_seconds = max(1, math.ceil(allotment.expires_at - now) + 1)
+        if allotment.tokens <= 0:
+            return RateLimitDecision(
+                allowed=False,
+                limit=lease.limit,
+                count=lease.limit + 1,
+                remaining=0,
+                reset_at_epoch=lease.reset_at_epoch,
+                retry_after_seconds=retry_after_seconds,
+            )
+        allotment.tokens -= 1
+        # A saturated reservation records limit + 1; only admitted tokens count.
+        count = max(1, min(lease.count, lease.limit) - allotment.tokens)
+        return RateLimitDecision(
+            allowed=True,
+            limit=lease.limit,
+            count=count,
+            remaining=max(0, lease.limit - count),
+            reset_at_epoch=lease.reset_at_epoch,
+            retry_after_seconds=retry_after_seconds,
+        )
+
+    def _merge(
+        self,
+        key: tuple[str, str],
+        lease: RateLimitLease,
+        *,
+        requested_at: float,
+    ) -> _LocalAllotment:
+        # Stop spending one second early: retry_after is rounded up, so the
+        # store's window may end up to a second before requested_at + retry_after.
+        expires_at = requested_at + lease.retry_after_seconds - 1
+        allotment = self._allotments.get(key)
+        if (
+            allotment is not None
+            and allotment.lease.window_started_at_epoch == lease.window_started_at_epoch
+            and allotment.lease.limit == lease.limit
+        ):
+            allotment.tokens += lease.granted
+            allotment.lease = lease
+            allotment.expires_at = min(allotment.expires_at, expires_at)
+        else:
+            allotment = _LocalAllotment(
+                lease=lease,
+                tokens=lease.granted,
+                expires_at=expires_at,
+                last_used_at=requested_at,
+            )
+            self._allotments[key] = allotment
+        self._allotments.move_to_end(key)
+        while len(self._allotments) > self._max_keys:
+            evicted = self._allotments.popitem(last=False)
+            self._background.submit(self._release, *evicted)
+        return allotment
+
+    def _schedule_refill(self, key: tuple[str, str], allotment: _LocalAllotment) -> None:
+        if (
+            allotment.refill is not None
+            or allotment.lease.granted == 0
+            or allotment.tokens > min(self._block_size, allotment.lease.limit) // 2
+        ):
+            return
+        allotment.refill = self._background.submit(self._refill, key, allotment.lease.limit)
+
+    def _refill(self, key: tuple[str, str], limit: int) -> None:
+        policy_key, scope_hash = key
+        requested_at = time.monotonic()
+        try:
+            lease = self._store.reserve(
+                scope_hash=scope_hash,
+                policy_key=policy_key,
+                limit=limit,
+                tokens=min(self._block_size, limit),
+            )
+        except Exception as exc:
+            # The next request that finds the allotment empty reserves
+            # synchronously and surfaces the outage to the middleware.
+            logger.warning(
+                "rate_limit_lease_refill_failed",
+                extra={"event": "rate_limit_lease_refill_failed", "backend_error_type": exc.__class__.__name__},
+            )
+            with self._lock:
+                allotment = self._allotments.get(key)
+                if allotment is not None:
+                    allotment.refill = None
+            return
+        with self._lock:
+            allotment = self._merge(key, lease, requested_at=requested_at)
+            allotment.refill = None
+
+    def _sweep_idle(self, now: float) -> list[tuple[tuple[str, str], _LocalAllotment]]:
+        self._next_sweep_at = now + self._idle_seconds
+        idle = [
+            key
+            for key, allotment in self._allotments.items()
+            if allotment.last_used_at + self._idle_seconds <= now and allotment.refill is None
+        ]
+        return [(key, self._allotments.pop(key)) for key in idle]
+
+    def _return_unused(self, allotments: list[tuple[tuple[str, str], _LocalAllotment]]) -> None:
+        for key, allotment in allotments:
+            if allotment.tokens > 0 and allotment.expires_at > time.monotonic():
+                self._background.submit(self._release, key, allotment)
+
+    def _release(self, key: tuple[str, str], allotment: _LocalAllotment) -> None:
+        if allotment.tokens <= 0 or allotment.expires_at <= time.monotonic():
+            return
+        policy_key, scope_hash = key
+        try:
+            self._store.release(
+                scope_hash=scope_hash,
+                policy_key=policy_key,
+                limit=allotment.lease.limit,
+                window_started_at_epoch=allotment.lease.window_started_at_epoch,
+                tokens=allotment.tokens,
+            )
+        except Exception as exc:
+            # Unreturned tokens only tighten the limit until the window resets.
+            logger.warning(
+                "rate_limit_lease_release_failed",
+                extra={"event": "rate_limit_lease_release_failed", "backend_error_type": exc.__class__.__name__},
+            )
+
+
+def _redis_key(policy_key: str, scope_hash: str) -> str:
+    return f"request_rate_limit:v1:{policy_key}:{scope_hash}"
+
+
+def _validate_lease_tokens(tokens: int) -> None:
+    if isinstance(tokens, bool) or not isinstance(tokens, int) or not 1 <= tokens <= _MAX_LEASE_BLOCK_SIZE:
+        raise ValueError("tokens must be between 1 and 10000")
+
+
+def _checked_lease(
+    *,
+    granted: int,
+    limit: int,
+    tokens: int,
+    count: int,
+    window_started_at_epoch: int,
+    reset_at_epoch: int,
+    retry_after_seconds: int,
+    backend: str,
+) -> RateLimitLease:
+    if (
+        not 0 <= granted <= min(int(tokens), int(limit))
+        or not max(1, granted) <= count <= int(limit) + 1
+        or (granted == 0 and count != int(limit) + 1)
+        or reset_at_epoch != window_started_at_epoch + 60
+        or retry_after_seconds < 1
+    ):
+        raise RateLimitStoreUnavailable(
+            f"{backend} rate-limit store returned an invalid decision"
+        )
+    return RateLimitLease(
+        granted=granted,
+        limit=int(limit),
+        count=count,
+        window_started_at_epoch=window_started_at_epoch,
+        reset_at_epoch=reset_at_epoch,
+        retry_after_seconds=retry_after_seconds,
+    )
+
+
 def _rate_limit_session_factory(
     statement_timeout_ms: int,
     lock_timeout_ms: int,
@@ -438,8 +1012,11 @@ def _is_retryable_postgres_transaction_error(exc: BaseException) -> bool:
 
 
 __all__ = [
+    "LeasableRateLimitStore",
+    "LeasedRateLimitStore",
     "PostgresFixedWindowRateLimitStore",
     "RateLimitDecision",
+    "RateLimitLease",
     "RateLimitStore",
     "RateLimitStoreUnavailable",
     "RedisFixedWindowRateLimitStore",
@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import base64
 import binascii
+import json
+import logging
 import math
 import re
 import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, datetime
 from hashlib import sha256
 from html import escape
 from io import BytesIO
+from threading import Lock
+from time import perf_counter
 from typing import Any
 
 from reportlab.lib import colors
@@ -31,6 +38,10 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from app.core.metrics import report_pdf_section_render_seconds
+
+logger = logging.getLogger("lsos.reporting.pdf")
+
 PAGE_WIDTH, PAGE_HEIGHT = LETTER
 INK = HexColor("#171717")
 MUTED = HexColor("#626262")
@@ -43,6 +54,12 @@ GOOD_SOFT = HexColor("#EAF7F2")
 BAD = HexColor("#B42318")
 BAD_SOFT = HexColor("#FDECEA")
 BLUE = HexColor("#2B9FC9")
+TREND_CHART_MARGINS = (38, 8, 28, 18)
+
+# Bump when layout code changes so cached output from older code is never reused.
+RENDER_CACHE_VERSION = "report-pdf-render-v1"
+CHART_CACHE_MAX_ENTRIES = 2048
+DOCUMENT_CACHE_MAX_ENTRIES = 64
 
 
 def _ascii(value: Any) -> str:
@@ -260,6 +277,223 @@ def _styles() -> dict[str, ParagraphStyle]:
     }
 
 
+@dataclass(frozen=True)
+class _TrendSeriesPlan:
+    color: Any
+    dashed: bool
+    line_width: float
+    coordinates: tuple[tuple[float, float], ...]
+
+
+@dataclass(frozen=True)
+class _TrendChartPlan:
+    """Pre-computed drawing instructions for one trend chart.
+
+    Plans only depend on the chart input data, so identical charts across
+    reports share one cached plan and draw the exact same PDF operators.
+    """
+
+    empty: bool
+    grid_y: tuple[float, ...] = ()
+    top_label: str = ""
+    bottom_label: str = ""
+    series: tuple[_TrendSeriesPlan, ...] = ()
+    start_label: str = ""
+    end_label: str = ""
+
+
+class _RenderCache:
+    """Bounded, thread-safe LRU cache for render output keyed by content hash."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_CHART_CACHE = _RenderCache(max_entries=CHART_CACHE_MAX_ENTRIES)
+_DOCUMENT_CACHE = _RenderCache(max_entries=DOCUMENT_CACHE_MAX_ENTRIES)
+
+
+def _content_hash(kind: str, payload: Any) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256(f"{RENDER_CACHE_VERSION}:{kind}:{canonical}".encode("utf-8")).hexdigest()
+
+
+def render_cache_stats() -> dict[str, dict[str, int]]:
+    return {"charts": _CHART_CACHE.stats(), "documents": _DOCUMENT_CACHE.stats()}
+
+
+def clear_render_cache() -> None:
+    _CHART_CACHE.clear()
+    _DOCUMENT_CACHE.clear()
+
+
+class _SectionTimer:
+    """Records how long each report section takes to assemble and lay out."""
+
+    def __init__(self, report_kind: str) -> None:
+        self.report_kind = report_kind
+        self.durations: dict[str, float] = {}
+        self._last = perf_counter()
+
+    def lap(self, section: str) -> None:
+        now = perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        self.durations[section] = self.durations.get(section, 0.0) + elapsed
+        report_pdf_section_render_seconds.labels(report_kind=self.report_kind, section=section).observe(elapsed)
+
+    def log(self) -> None:
+        logger.info(
+            "report_pdf_rendered",
+            extra={
+                "report_kind": self.report_kind,
+                "section_seconds": {name: round(value, 6) for name, value in self.durations.items()},
+            },
+        )
+
+
+def _trend_coordinates(
+    values: list[float],
+    *,
+    lower_is_better: bool,
+    minimum: float,
+    maximum: float,
+    left: float,
+    bottom: float,
+    plot_width: float,
+    plot_height: float,
+) -> tuple[tuple[float, float], ...]:
+    denominator = max(len(values) - 1, 1)
+    coordinates: list[tuple[float, float]] = []
+    for index, value in enumerate(values):
+        ratio = (value - minimum) / (maximum - minimum)
+        if lower_is_better:
+            ratio = 1 - ratio
+        coordinates.append(
+            (
+                left + (index / denominator) * plot_width,
+                bottom + ratio * plot_height,
+            )
+        )
+    return tuple(coordinates)
+
+
+def _build_trend_chart_plan(
+    current_values: list[float],
+    comparison_values: list[float],
+    *,
+    start_label: str,
+    end_label: str,
+    lower_is_better: bool,
+    width: float,
+    height: float,
+) -> _TrendChartPlan:
+    left, right, bottom, top = TREND_CHART_MARGINS
+    plot_width = width - left - right
+    plot_height = height - bottom - top
+    values = comparison_values + current_values
+    if not values:
+        return _TrendChartPlan(empty=True)
+
+    minimum, maximum = min(values), max(values)
+    if math.isclose(minimum, maximum):
+        padding = max(abs(maximum) * 0.1, 1.0)
+        minimum -= padding
+        maximum += padding
+
+    top_value = minimum if lower_is_better else maximum
+    bottom_value = maximum if lower_is_better else minimum
+    series: list[_TrendSeriesPlan] = []
+    for points, color, dashed, line_width in (
+        (comparison_values, BLUE, True, 1.5),
+        (current_values, ACCENT, False, 2.2),
+    ):
+        coordinates = _trend_coordinates(
+            points,
+            lower_is_better=lower_is_better,
+            minimum=minimum,
+            maximum=maximum,
+            left=left,
+            bottom=bottom,
+            plot_width=plot_width,
+            plot_height=plot_height,
+        )
+        if coordinates:
+            series.append(_TrendSeriesPlan(color=color, dashed=dashed, line_width=line_width, coordinates=coordinates))
+    return _TrendChartPlan(
+        empty=False,
+        grid_y=tuple(bottom + ratio * plot_height for ratio in (0, 0.5, 1)),
+        top_label=f"{top_value:,.1f}",
+        bottom_label=f"{bottom_value:,.1f}",
+        series=tuple(series),
+        start_label=start_label,
+        end_label=end_label,
+    )
+
+
+def _trend_chart_plan(
+    current_points: list[dict[str, Any]],
+    comparison_points: list[dict[str, Any]],
+    *,
+    field: str,
+    lower_is_better: bool,
+    width: float,
+    height: float,
+) -> _TrendChartPlan:
+    current_values = [float(point[field]) for point in current_points]
+    comparison_values = [float(point[field]) for point in comparison_points]
+    start_label = _ascii(current_points[0].get("date") or "") if current_points else ""
+    end_label = _ascii(current_points[-1].get("date") or "") if current_points else ""
+    key = _content_hash(
+        "trend_chart",
+        [current_values, comparison_values, start_label, end_label, lower_is_better, width, height],
+    )
+    plan = _CHART_CACHE.get(key)
+    if plan is None:
+        plan = _build_trend_chart_plan(
+            current_values,
+            comparison_values,
+            start_label=start_label,
+            end_label=end_label,
+            lower_is_better=lower_is_better,
+            width=width,
+            height=height,
+        )
+        _CHART_CACHE.put(key, plan)
+    return plan
+
+
 class TrendChart(Flowable):
     def __init__(
         self,
@@ -277,103 +511,60 @@ class TrendChart(Flowable):
         self.comparison = [point for point in comparison_points if point.get(field) is not None]
         self.field = field
         self.lower_is_better = lower_is_better
+        self.plan = _trend_chart_plan(
+            self.current,
+            self.comparison,
+            field=field,
+            lower_is_better=lower_is_better,
+            width=width,
+            height=self.height,
+        )
 
     def wrap(self, available_width: float, available_height: float) -> tuple[float, float]:
         return min(self.width, available_width), self.height
 
-    def _coordinates(
-        self,
-        points: list[dict[str, Any]],
-        *,
-        minimum: float,
-        maximum: float,
-        left: float,
-        bottom: float,
-        plot_width: float,
-        plot_height: float,
-    ) -> list[tuple[float, float]]:
-        denominator = max(len(points) - 1, 1)
-        coordinates: list[tuple[float, float]] = []
-        for index, point in enumerate(points):
-            value = float(point[self.field])
-            ratio = (value - minimum) / (maximum - minimum)
-            if self.lower_is_better:
-                ratio = 1 - ratio
-            coordinates.append(
-                (
-                    left + (index / denominator) * plot_width,
-                    bottom + ratio * plot_height,
-                )
-            )
-        return coordinates
-
     def draw(self) -> None:
         canvas = self.canv
-        left, right, bottom, top = 38, 8, 28, 18
+        plan = self.plan
+        left, right, bottom, top = TREND_CHART_MARGINS
         plot_width = self.width - left - right
         plot_height = self.height - bottom - top
-        values = [float(point[self.field]) for point in self.current + self.comparison]
-        if not values:
+        if plan.empty:
             canvas.setFillColor(MUTED)
             canvas.setFont("Helvetica", 8)
             canvas.drawString(left, bottom + plot_height / 2, "No saved trend values are available yet.")
             return
 
-        minimum, maximum = min(values), max(values)
-        if math.isclose(minimum, maximum):
-            padding = max(abs(maximum) * 0.1, 1.0)
-            minimum -= padding
-            maximum += padding
-
         canvas.setStrokeColor(LINE)
         canvas.setLineWidth(0.7)
-        for ratio in (0, 0.5, 1):
-            y = bottom + ratio * plot_height
+        for y in plan.grid_y:
             canvas.line(left, y, left + plot_width, y)
 
-        top_value = minimum if self.lower_is_better else maximum
-        bottom_value = maximum if self.lower_is_better else minimum
         canvas.setFillColor(MUTED)
         canvas.setFont("Helvetica", 6.5)
-        canvas.drawRightString(left - 5, bottom + plot_height - 2, f"{top_value:,.1f}")
-        canvas.drawRightString(left - 5, bottom - 2, f"{bottom_value:,.1f}")
-
-        for points, color, dashed, width in (
-            (self.comparison, BLUE, True, 1.5),
-            (self.current, ACCENT, False, 2.2),
-        ):
-            coordinates = self._coordinates(
-                points,
-                minimum=minimum,
-                maximum=maximum,
-                left=left,
-                bottom=bottom,
-                plot_width=plot_width,
-                plot_height=plot_height,
-            )
-            if not coordinates:
-                continue
-            canvas.setStrokeColor(color)
-            canvas.setLineWidth(width)
-            canvas.setDash(4, 3) if dashed else canvas.setDash()
+        canvas.drawRightString(left - 5, bottom + plot_height - 2, plan.top_label)
+        canvas.drawRightString(left - 5, bottom - 2, plan.bottom_label)
+
+        for series in plan.series:
+            canvas.setStrokeColor(series.color)
+            canvas.setLineWidth(series.line_width)
+            canvas.setDash(4, 3) if series.dashed else canvas.setDash()
             path = canvas.beginPath()
-            path.moveTo(*coordinates[0])
-            for coordinate in coordinates[1:]:
+            path.moveTo(*series.coordinates[0])
+            for coordinate in series.coordinates[1:]:
                 path.lineTo(*coordinate)
             canvas.drawPath(path, stroke=1, fill=0)
-            if not dashed:
-                canvas.setFillColor(color)
-                for x, y in coordinates:
+            if not series.dashed:
+                canvas.setFillColor(series.color)
+                for x, y in series.coordinates:
                     canvas.circle(x, y, 1.7, stroke=0, fill=1)
         canvas.setDash()
 
         canvas.setFillColor(MUTED)
         canvas.setFont("Helvetica", 6.5)
         if self.current:
-            start = _ascii(self.current[0].get("date") or "")
-            end = _ascii(self.current[-1].get("date") or "")
-            canvas.drawString(left, 10, start)
-            canvas.drawRightString(left + plot_width, 10, end)
+            canvas.drawString(left, 10, plan.start_label)
+            canvas.drawRightString(left + plot_width, 10, plan.end_label)
 
 
 class PortfolioBarChart(Flowable):
@@ -954,7 +1145,8 @@ def _page(canvas: Any, document: SimpleDocTemplate, *, title: str, brand: dict[s
     canvas.restoreState()
 
 
-def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
+def _render_report_pdf(snapshot: dict[str, Any]) -> bytes:
+    timer = _SectionTimer("campaign")
     styles = _styles()
     campaign = snapshot.get("campaign") or {}
     brand = snapshot.get("brand") or {}
@@ -982,6 +1174,7 @@ def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
         author=_ascii(publisher),
         subject=_ascii(report_title),
         pageCompression=1,
+        invariant=1,
     )
     usable_width = PAGE_WIDTH - document.leftMargin - document.rightMargin
     story: list[Any] = [
@@ -1010,8 +1203,10 @@ def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
         _metric_grid(metrics, styles, usable_width),
         Spacer(1, 12),
     ]
+    timer.lap("summary")
     story.extend([SectionBookmark("Performance over time", "performance-over-time")])
     story.extend(_chart_blocks(snapshot, styles, usable_width))
+    timer.lap("charts")
     story.extend(
         [
             CondPageBreak(220),
@@ -1053,8 +1248,10 @@ def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
         )
     )
     story.extend([Spacer(1, 8)])
+    timer.lap("what_changed")
     story.append(SectionBookmark("What to do next", "what-to-do-next"))
     story.extend(_action_blocks(list(snapshot.get("next_priorities") or []), styles, usable_width))
+    timer.lap("next_priorities")
     story.extend(
         [
             PageBreak(),
@@ -1099,16 +1296,20 @@ def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
             ),
         ]
     )
+    timer.lap("data_sources")
 
     document.build(
         story,
         onFirstPage=lambda canvas, doc: _page(canvas, doc, title=title, brand=brand),
         onLaterPages=lambda canvas, doc: _page(canvas, doc, title=title, brand=brand),
     )
+    timer.lap("layout")
+    timer.log()
     return buffer.getvalue()
 
 
-def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
+def _render_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
+    timer = _SectionTimer("portfolio")
     styles = _styles()
     organization = snapshot.get("organization") or {}
     brand = snapshot.get("brand") or {}
@@ -1134,6 +1335,7 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
         author=_ascii(publisher),
         subject=_ascii(report_title),
         pageCompression=1,
+        invariant=1,
     )
     usable_width = PAGE_WIDTH - document.leftMargin - document.rightMargin
     period_label = (
@@ -1261,6 +1463,7 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
                 ),
             ]
         )
+    timer.lap("summary")
     story.extend(
         [
             PageBreak(),
@@ -1299,6 +1502,7 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
                 Spacer(1, 12),
             ]
         )
+    timer.lap("comparison")
 
     for index, location in enumerate(locations, start=1):
         lookup = _metric_lookup(location)
@@ -1398,6 +1602,8 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
             ]
         )
 
+    timer.lap("locations")
+
     appendix_rows: list[list[Any]] = [
         [
             Paragraph("Location", styles["table_head"]),
@@ -1520,6 +1726,7 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
             ),
         ]
     )
+    timer.lap("appendix")
 
     document.build(
         story,
@@ -1538,4 +1745,24 @@ def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
             brand=brand,
         ),
     )
+    timer.lap("layout")
+    timer.log()
     return buffer.getvalue()
+
+
+def _cached_render(kind: str, snapshot: dict[str, Any], renderer: Callable[[dict[str, Any]], bytes]) -> bytes:
+    key = _content_hash(kind, snapshot)
+    content = _DOCUMENT_CACHE.get(key)
+    if content is None:
+        content = renderer(snapshot)
+        _DOCUMENT_CACHE.put(key, content)
+    return content
+
+
+def build_report_pdf(snapshot: dict[str, Any]) -> bytes:
+    return _cached_render("campaign_report", snapshot, _render_report_pdf)
+
+
+def build_portfolio_report_pdf(snapshot: dict[str, Any]) -> bytes:
+    return _cached_render("portfolio_report", snapshot, _render_portfolio_report_pdf)
+
@@ -6,6 +6,7 @@ from statistics import median
 from typing import Any
 
 from fastapi import HTTPException, status
+from sqlalchemy import case, extract, func
 from sqlalchemy.orm import Session
 
 from app.models.business_location import BusinessLocation
@@ -65,15 +66,10 @@ def _campaign_context(
     return campaign, location
 
 
-def _owned_reviews_for_campaign(db: Session, campaign_id: str) -> list[ReputationReview]:
+def _owned_review_filter(campaign_ids: list[str]) -> tuple[Any, ...]:
     return (
-        db.query(ReputationReview)
-        .filter(
-            ReputationReview.campaign_id == campaign_id,
-            ReputationReview.source_type == "owned_profile",
-        )
-        .order_by(ReputationReview.reviewed_at.desc())
-        .all()
+        ReputationReview.campaign_id.in_(campaign_ids),
+        ReputationReview.source_type == "owned_profile",
     )
 
 
@@ -85,48 +81,127 @@ def _rating_sentiment(rating: float) -> str:
     return "mixed"
 
 
-def _metrics(rows: list[ReputationReview], *, now: datetime) -> dict[str, Any]:
+def _count_where(condition: Any) -> Any:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _dialect_name(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _metric_aggregates(
+    db: Session,
+    campaign_ids: list[str],
+    *,
+    now: datetime,
+) -> dict[str, dict[str, Any]]:
+    """Return one row of review counts and averages per campaign."""
     current_start = now - timedelta(days=30)
     previous_start = current_start - timedelta(days=30)
-    current = [row for row in rows if _as_utc(row.reviewed_at) >= current_start]
-    previous = [
-        row
-        for row in rows
-        if previous_start <= _as_utc(row.reviewed_at) < current_start
-    ]
-    answerable = [row for row in rows if row.response_status in {"unanswered", "responded"}]
-    responded = [row for row in answerable if row.response_status == "responded"]
-    response_hours = [
-        max(
+    rating = ReputationReview.rating
+    reviewed_at = ReputationReview.reviewed_at
+    is_current = reviewed_at >= current_start
+    is_previous = (reviewed_at >= previous_start) & (reviewed_at < current_start)
+    is_unanswered = ReputationReview.response_status == "unanswered"
+    rows = (
+        db.query(
+            ReputationReview.campaign_id.label("campaign_id"),
+            func.count(ReputationReview.id).label("total_reviews"),
+            func.avg(rating).label("average_rating"),
+            _count_where(is_current).label("reviews_last_30_days"),
+            _count_where(is_previous).label("reviews_previous_30_days"),
+            func.avg(case((is_current, rating))).label("average_rating_last_30_days"),
+            func.avg(case((is_previous, rating))).label("average_rating_previous_30_days"),
+            _count_where(is_current & (rating >= 4)).label("positive_reviews_last_30_days"),
+            _count_where(is_current & (rating == 3)).label("mixed_reviews_last_30_days"),
+            _count_where(is_current & (rating <= 2)).label("negative_reviews_last_30_days"),
+            _count_where(is_unanswered).label("unanswered_reviews"),
+            _count_where(
+                is_unanswered & (rating <= 2) & (reviewed_at >= now - timedelta(days=14))
+            ).label("urgent_unanswered_reviews"),
+            _count_where(
+                ReputationReview.response_status.in_(("unanswered", "responded"))
+            ).label("answerable_reviews"),
+            _count_where(ReputationReview.response_status == "responded").label(
+                "responded_reviews"
+            ),
+            func.max(reviewed_at).label("newest_review_at"),
+        )
+        .filter(*_owned_review_filter(campaign_ids))
+        .group_by(ReputationReview.campaign_id)
+        .all()
+    )
+    return {row.campaign_id: row._asdict() for row in rows}
+
+
+def _response_time_aggregates(
+    db: Session,
+    campaign_ids: list[str],
+) -> dict[str, tuple[float | None, int]]:
+    """Return the median reply time in hours and its sample size per campaign."""
+    filters = (
+        *_owned_review_filter(campaign_ids),
+        ReputationReview.response_status == "responded",
+        ReputationReview.response_updated_at.isnot(None),
+    )
+    if _dialect_name(db) == "postgresql":
+        hours = func.greatest(
             0.0,
-            (
-                _as_utc(row.response_updated_at) - _as_utc(row.reviewed_at)
-            ).total_seconds()
+            extract("epoch", ReputationReview.response_updated_at - ReputationReview.reviewed_at)
             / 3600,
         )
-        for row in responded
-        if row.response_updated_at is not None
-    ]
-    average_rating = sum(float(row.rating) for row in rows) / len(rows) if rows else None
-    current_average = (
-        sum(float(row.rating) for row in current) / len(current) if current else None
-    )
-    previous_average = (
-        sum(float(row.rating) for row in previous) / len(previous) if previous else None
+        rows = (
+            db.query(
+                ReputationReview.campaign_id,
+                func.percentile_cont(0.5).within_group(hours),
+                func.count(ReputationReview.id),
+            )
+            .filter(*filters)
+            .group_by(ReputationReview.campaign_id)
+            .all()
+        )
+        return {
+            campaign_id: (float(value) if value is not None else None, int(count))
+            for campaign_id, value, count in rows
+        }
+    # SQLite has no ordered-set aggregates, so it returns the reply delays alone
+    # and the median is taken here.
+    hours = func.max(
+        0.0,
+        (
+            func.julianday(ReputationReview.response_updated_at)
+            - func.julianday(ReputationReview.reviewed_at)
+        )
+        * 24,
     )
-    response_rate = (len(responded) / len(answerable) * 100) if answerable else None
-    unanswered = [row for row in answerable if row.response_status == "unanswered"]
-    urgent_unanswered = [
-        row
-        for row in unanswered
-        if float(row.rating) <= 2 and _as_utc(row.reviewed_at) >= now - timedelta(days=14)
-    ]
+    samples: dict[str, list[float]] = defaultdict(list)
+    for campaign_id, value in db.query(ReputationReview.campaign_id, hours).filter(*filters):
+        samples[campaign_id].append(float(value))
+    return {
+        campaign_id: (float(median(values)), len(values))
+        for campaign_id, values in samples.items()
+    }
+
+
+def _metrics(
+    aggregate: dict[str, Any] | None,
+    response_time: tuple[float | None, int] | None,
+) -> dict[str, Any]:
+    aggregate = aggregate or {}
+    median_hours, sample_size = response_time or (None, 0)
+    current_average = aggregate.get("average_rating_last_30_days")
+    previous_average = aggregate.get("average_rating_previous_30_days")
+    reviews_current = int(aggregate.get("reviews_last_30_days") or 0)
+    reviews_previous = int(aggregate.get("reviews_previous_30_days") or 0)
+    answerable = int(aggregate.get("answerable_reviews") or 0)
+    responded = int(aggregate.get("responded_reviews") or 0)
+    newest = aggregate.get("newest_review_at")
     return {
-        "total_reviews": len(rows),
-        "average_rating": _round(average_rating, 2),
-        "reviews_last_30_days": len(current),
-        "reviews_previous_30_days": len(previous),
-        "review_pace_change": len(current) - len(previous),
+        "total_reviews": int(aggregate.get("total_reviews") or 0),
+        "average_rating": _round(aggregate.get("average_rating"), 2),
+        "reviews_last_30_days": reviews_current,
+        "reviews_previous_30_days": reviews_previous,
+        "review_pace_change": reviews_current - reviews_previous,
         "average_rating_last_30_days": _round(current_average, 2),
         "average_rating_previous_30_days": _round(previous_average, 2),
         "rating_change": (
@@ -134,57 +209,156 @@ def _metrics(rows: list[ReputationReview], *, now: datetime) -> dict[str, Any]:
             if current_average is not None and previous_average is not None
             else None
         ),
-        "positive_reviews_last_30_days": sum(float(row.rating) >= 4 for row in current),
-        "mixed_reviews_last_30_days": sum(float(row.rating) == 3 for row in current),
-        "negative_reviews_last_30_days": sum(float(row.rating) <= 2 for row in current),
-        "unanswered_reviews": len(unanswered),
-        "urgent_unanswered_reviews": len(urgent_unanswered),
-        "answerable_reviews": len(answerable),
-        "responded_reviews": len(responded),
-        "response_rate_percent": _round(response_rate),
-        "median_response_hours": _round(median(response_hours)) if response_hours else None,
-        "response_time_sample_size": len(response_hours),
-        "newest_review_at": (
-            max(_as_utc(row.reviewed_at) for row in rows).isoformat() if rows else None
-        ),
+        "positive_reviews_last_30_days": int(aggregate.get("positive_reviews_last_30_days") or 0),
+        "mixed_reviews_last_30_days": int(aggregate.get("mixed_reviews_last_30_days") or 0),
+        "negative_reviews_last_30_days": int(aggregate.get("negative_reviews_last_30_days") or 0),
+        "unanswered_reviews": int(aggregate.get("unanswered_reviews") or 0),
+        "urgent_unanswered_reviews": int(aggregate.get("urgent_unanswered_reviews") or 0),
+        "answerable_reviews": answerable,
+        "responded_reviews": responded,
+        "response_rate_percent": _round(responded / answerable * 100) if answerable else None,
+        "median_response_hours": _round(median_hours),
+        "response_time_sample_size": sample_size,
+        "newest_review_at": _as_utc(newest).isoformat() if newest is not None else None,
     }
 
 
-def _weekly_trend(rows: list[ReputationReview], *, now: datetime) -> list[dict[str, Any]]:
+def _week_start(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _weekly_trends(
+    db: Session,
+    campaign_ids: list[str],
+    *,
+    now: datetime,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the last ``TREND_WEEKS`` Monday-based buckets per campaign."""
     today = now.date()
     current_week_start = today - timedelta(days=today.weekday())
     first_week_start = current_week_start - timedelta(weeks=TREND_WEEKS - 1)
-    buckets: dict[date, list[ReputationReview]] = defaultdict(list)
+    window_start = datetime.combine(first_week_start, datetime.min.time(), tzinfo=UTC)
+    window_end = datetime.combine(
+        current_week_start + timedelta(weeks=1), datetime.min.time(), tzinfo=UTC
+    )
+    rating = ReputationReview.rating
+    if _dialect_name(db) == "postgresql":
+        week = func.date_trunc("week", func.timezone("UTC", ReputationReview.reviewed_at))
+    else:
+        week = func.date(ReputationReview.reviewed_at, "-6 days", "weekday 1")
+    rows = (
+        db.query(
+            ReputationReview.campaign_id,
+            week.label("week_start"),
+            func.count(ReputationReview.id),
+            func.avg(rating),
+            _count_where(rating >= 4),
+            _count_where(rating == 3),
+            _count_where(rating <= 2),
+        )
+        .filter(
+            *_owned_review_filter(campaign_ids),
+            ReputationReview.reviewed_at >= window_start,
+            ReputationReview.reviewed_at < window_end,
+        )
+        .group_by(ReputationReview.campaign_id, week)
+        .all()
+    )
+    buckets: dict[tuple[str, date], tuple[Any, ...]] = {
+        (campaign_id, _week_start(week_value)): values
+        for campaign_id, week_value, *values in rows
+    }
+    trends: dict[str, list[dict[str, Any]]] = {}
+    for campaign_id in campaign_ids:
+        result: list[dict[str, Any]] = []
+        for index in range(TREND_WEEKS):
+            week_start = first_week_start + timedelta(weeks=index)
+            count, average, positive, mixed, negative = buckets.get(
+                (campaign_id, week_start), (0, None, 0, 0, 0)
+            )
+            result.append(
+                {
+                    "week_start": week_start.isoformat(),
+                    "reviews_received": int(count),
+                    "average_rating": _round(average, 2),
+                    "positive": int(positive),
+                    "mixed": int(mixed),
+                    "negative": int(negative),
+                }
+            )
+        trends[campaign_id] = result
+    return trends
+
+
+def _theme_rows(
+    db: Session,
+    campaign_ids: list[str],
+    *,
+    now: datetime,
+) -> dict[str, list[Any]]:
+    """Load only the columns theme matching needs, limited to the theme window."""
+    rows_by_campaign: dict[str, list[Any]] = defaultdict(list)
+    rows = (
+        db.query(
+            ReputationReview.id,
+            ReputationReview.campaign_id,
+            ReputationReview.rating,
+            ReputationReview.body,
+            ReputationReview.reviewed_at,
+        )
+        .filter(
+            *_owned_review_filter(campaign_ids),
+            ReputationReview.reviewed_at >= now - timedelta(days=THEME_WINDOW_DAYS),
+            ReputationReview.body.isnot(None),
+        )
+        .order_by(ReputationReview.reviewed_at.desc(), ReputationReview.id)
+    )
     for row in rows:
-        reviewed_date = _as_utc(row.reviewed_at).date()
-        week_start = reviewed_date - timedelta(days=reviewed_date.weekday())
-        if first_week_start <= week_start <= current_week_start:
-            buckets[week_start].append(row)
-    result: list[dict[str, Any]] = []
-    for index in range(TREND_WEEKS):
-        week_start = first_week_start + timedelta(weeks=index)
-        week_rows = buckets.get(week_start, [])
-        result.append(
-            {
-                "week_start": week_start.isoformat(),
-                "reviews_received": len(week_rows),
-                "average_rating": (
-                    _round(
-                        sum(float(row.rating) for row in week_rows) / len(week_rows),
-                        2,
-                    )
-                    if week_rows
-                    else None
-                ),
-                "positive": sum(float(row.rating) >= 4 for row in week_rows),
-                "mixed": sum(float(row.rating) == 3 for row in week_rows),
-                "negative": sum(float(row.rating) <= 2 for row in week_rows),
-            }
+        rows_by_campaign[row.campaign_id].append(row)
+    return rows_by_campaign
+
+
+def _oldest_unanswered_ids(
+    db: Session,
+    campaign_ids: list[str],
+    *,
+    limit: int = 5,
+) -> dict[str, list[str]]:
+    position = (
+        func.row_number()
+        .over(
+            partition_by=ReputationReview.campaign_id,
+            order_by=(
+                ReputationReview.reviewed_at.asc(),
+                ReputationReview.rating.asc(),
+                ReputationReview.id.asc(),
+            ),
         )
-    return result
+        .label("position")
+    )
+    ranked = (
+        db.query(ReputationReview.id, ReputationReview.campaign_id, position)
+        .filter(
+            *_owned_review_filter(campaign_ids),
+            ReputationReview.response_status == "unanswered",
+        )
+        .subquery()
+    )
+    ids: dict[str, list[str]] = defaultdict(list)
+    for review_id, campaign_id, _position in (
+        db.query(ranked.c.id, ranked.c.campaign_id, ranked.c.position)
+        .filter(ranked.c.position <= limit)
+        .order_by(ranked.c.campaign_id, ranked.c.position)
+    ):
+        ids[campaign_id].append(review_id)
+    return ids
 
 
-def _themes(rows: list[ReputationReview], *, now: datetime) -> list[dict[str, Any]]:
+def _themes(rows: list[Any], *, now: datetime) -> list[dict[str, Any]]:
     window_start = now - timedelta(days=THEME_WINDOW_DAYS)
     theme_rows: dict[str, dict[str, Any]] = {}
     for key, label, _terms in THEMES:
@@ -233,28 +407,27 @@ def _themes(rows: list[ReputationReview], *, now: datetime) -> list[dict[str, An
 
 
 def _actions(
-    rows: list[ReputationReview],
     metrics: dict[str, Any],
     themes: list[dict[str, Any]],
+    unanswered_ids: list[str],
 ) -> list[dict[str, Any]]:
     actions: list[dict[str, Any]] = []
-    unanswered = [row for row in rows if row.response_status == "unanswered"]
-    unanswered.sort(key=lambda row: (_as_utc(row.reviewed_at), float(row.rating)))
+    unanswered = metrics["unanswered_reviews"]
     if unanswered:
         actions.append(
             {
                 "id": "answer_waiting_reviews",
                 "priority": "high" if metrics["urgent_unanswered_reviews"] else "medium",
-                "title": f"Reply to {len(unanswered)} waiting review{'s' if len(unanswered) != 1 else ''}",
+                "title": f"Reply to {unanswered} waiting review{'s' if unanswered != 1 else ''}",
                 "why": (
                     "Start with the newest one- and two-star reviews. A timely response shows customers that the business is listening."
                     if metrics["urgent_unanswered_reviews"]
                     else "These customers have not received a saved business response yet."
                 ),
                 "metric_label": "Reviews still waiting for a reply",
-                "current_value": len(unanswered),
+                "current_value": unanswered,
                 "target_value": 0,
-                "evidence_review_ids": [row.id for row in unanswered[:5]],
+                "evidence_review_ids": unanswered_ids,
             }
         )
     negative_themes = [
@@ -320,15 +493,45 @@ def _actions(
     return sorted(actions, key=lambda item: priority_order[item["priority"]])
 
 
+def _location_payloads(
+    db: Session,
+    *,
+    campaigns: list[tuple[Campaign, BusinessLocation]],
+    now: datetime,
+) -> list[dict[str, Any]]:
+    """Build location payloads from grouped aggregates rather than loaded review rows."""
+    campaign_ids = [campaign.id for campaign, _location in campaigns]
+    if not campaign_ids:
+        return []
+    aggregates = _metric_aggregates(db, campaign_ids, now=now)
+    response_times = _response_time_aggregates(db, campaign_ids)
+    trends = _weekly_trends(db, campaign_ids, now=now)
+    theme_rows = _theme_rows(db, campaign_ids, now=now)
+    unanswered_ids = _oldest_unanswered_ids(db, campaign_ids)
+    return [
+        _location_payload(
+            campaign=campaign,
+            location=location,
+            metrics=_metrics(aggregates.get(campaign.id), response_times.get(campaign.id)),
+            weekly_trend=trends[campaign.id],
+            themes=_themes(theme_rows.get(campaign.id, []), now=now),
+            unanswered_ids=unanswered_ids.get(campaign.id, []),
+            now=now,
+        )
+        for campaign, location in campaigns
+    ]
+
+
 def _location_payload(
     *,
     campaign: Campaign,
     location: BusinessLocation,
-    rows: list[ReputationReview],
+    metrics: dict[str, Any],
+    weekly_trend: list[dict[str, Any]],
+    themes: list[dict[str, Any]],
+    unanswered_ids: list[str],
     now: datetime,
 ) -> dict[str, Any]:
-    metrics = _metrics(rows, now=now)
-    themes = _themes(rows, now=now)
     return {
         "campaign_id": campaign.id,
         "business_location_id": location.id,
@@ -336,9 +539,9 @@ def _location_payload(
         "city": location.city or location.primary_city,
         "region": location.region,
         "metrics": metrics,
-        "weekly_trend": _weekly_trend(rows, now=now),
+        "weekly_trend": weekly_trend,
         "themes": themes,
-        "actions": _actions(rows, metrics, themes),
+        "actions": _actions(metrics, themes, unanswered_ids),
         "evidence": {
             "source_scope": "authorized_owned_profile_reviews",
             "theme_taxonomy_version": THEME_TAXONOMY_VERSION,
@@ -365,13 +568,7 @@ def location_intelligence(
         organization_id=organization_id,
         campaign_id=campaign_id,
     )
-    rows = _owned_reviews_for_campaign(db, campaign.id)
-    return _location_payload(
-        campaign=campaign,
-        location=location,
-        rows=rows,
-        now=resolved_now,
-    )
+    return _location_payloads(db, campaigns=[(campaign, location)], now=resolved_now)[0]
 
 
 def _portfolio_outliers(locations: list[dict[str, Any]]) -> None:
@@ -462,29 +659,14 @@ def portfolio_intelligence(
             continue
         seen_locations.add(campaign.business_location_id)
         active_campaigns.append(campaign)
-    campaign_ids = [campaign.id for campaign in active_campaigns]
-    reviews = (
-        db.query(ReputationReview)
-        .filter(
-            ReputationReview.campaign_id.in_(campaign_ids),
-            ReputationReview.source_type == "owned_profile",
-        )
-        .all()
-        if campaign_ids
-        else []
+    locations = _location_payloads(
+        db,
+        campaigns=[
+            (campaign, locations_by_id[campaign.business_location_id])
+            for campaign in active_campaigns
+        ],
+        now=resolved_now,
     )
-    rows_by_campaign: dict[str, list[ReputationReview]] = defaultdict(list)
-    for review in reviews:
-        rows_by_campaign[review.campaign_id].append(review)
-    locations = [
-        _location_payload(
-            campaign=campaign,
-            location=locations_by_id[campaign.business_location_id],
-            rows=rows_by_campaign.get(campaign.id, []),
-            now=resolved_now,
-        )
-        for campaign in active_campaigns
-    ]
     _portfolio_outliers(locations)
     locations.sort(
         key=lambda item: (
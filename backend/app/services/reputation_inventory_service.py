@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 import json
 from typing import Any
+import uuid
 
 from fastapi import HTTPException, status
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.core.settings import get_settings
-from app.events import emit_event
+from app.events import EventEmission, emit_event, emit_events
 from app.models.business_location import BusinessLocation
 from app.models.campaign import Campaign
 from app.models.data_connection import DataConnection
@@ -37,15 +40,24 @@ SNAPSHOT_FIELDS = (
 )
 OWNED_PROFILE_PROVIDER = "google_business_profile"
 MAX_OWNED_REVIEW_PAGES = 20
+MAX_OWNED_REVIEW_FULL_RESYNC_PAGES = 200
 OWNED_REVIEW_PAGE_SIZE = 50
+OWNED_REVIEW_FULL_RESYNC_INTERVAL = timedelta(days=7)
+REVIEW_UPSERT_BATCH_SIZE = 500
+_REVIEW_KEY_COLUMNS = ("tenant_id", "business_location_id", "source_key", "external_review_id")
 
 
 def sync_owned_profile_reviews(
     db: Session,
     *,
     connection: DataConnection,
+    force_full: bool = False,
 ) -> dict[str, Any]:
-    """Collect owned-profile reviews without enabling drafting or reply mutations."""
+    """Collect owned-profile reviews without enabling drafting or reply mutations.
+
+    Routine runs only read reviews updated since the stored high-water mark; the
+    full history is re-read every ``OWNED_REVIEW_FULL_RESYNC_INTERVAL``.
+    """
     if (
         connection.provider_name != OWNED_PROFILE_PROVIDER
         or connection.status == data_connections_service.CONNECTION_STATUS_DISCONNECTED
@@ -74,24 +86,49 @@ def sync_owned_profile_reviews(
         timeout_seconds=float(get_settings().google_oauth_http_timeout_seconds),
     )
     parent = f"{account_id}/{location_id}"
+    cursor = dict(connection.sync_cursor or {})
+    previous = dict(cursor.get("owned_reviews") or {})
+    started_at = datetime.now(UTC)
+    high_water_mark = _datetime(previous.get("high_water_mark"))
+    last_full_sync_at = _datetime(previous.get("last_full_sync_at"))
+    # Reviews arrive newest-first by update time, so routine syncs stop at the last
+    # stored update time; a periodic full pass picks up anything the provider
+    # changed without bumping it.
+    full_sync = (
+        force_full
+        or high_water_mark is None
+        or last_full_sync_at is None
+        or bool(previous.get("resync_required"))
+        or started_at - last_full_sync_at >= OWNED_REVIEW_FULL_RESYNC_INTERVAL
+    )
+    max_pages = MAX_OWNED_REVIEW_FULL_RESYNC_PAGES if full_sync else MAX_OWNED_REVIEW_PAGES
     page_token: str | None = None
     records: list[dict[str, Any]] = []
     provider_total: int | None = None
     provider_average: float | None = None
     pages_received = 0
+    reached_high_water_mark = False
     truncated = False
 
-    for _page_number in range(MAX_OWNED_REVIEW_PAGES):
+    for _page_number in range(max_pages):
         page = provider.list_reviews(
             parent=parent,
             page_size=OWNED_REVIEW_PAGE_SIZE,
             page_token=page_token,
         )
         pages_received += 1
-        records.extend(page["items"])
+        items = list(page["items"])
         if provider_total is None:
             provider_total = page.get("total_review_count")
             provider_average = page.get("average_rating")
+        if not full_sync:
+            fresh = [item for item in items if not _older_than(item, high_water_mark)]
+            records.extend(fresh)
+            if len(fresh) < len(items):
+                reached_high_water_mark = True
+                break
+        else:
+            records.extend(items)
         page_token = page.get("next_page_token")
         if not page_token:
             break
@@ -106,12 +143,27 @@ def sync_owned_profile_reviews(
         records=records,
     )
     synced_at = datetime.now(UTC)
-    cursor = dict(connection.sync_cursor or {})
+    if truncated and not full_sync:
+        # The gap between the last page read and the stored mark is unknown, so
+        # keep the old mark and let the next run walk the full history.
+        next_high_water_mark = high_water_mark
+    else:
+        next_high_water_mark = max(
+            [value for value in map(_update_time, records) if value is not None]
+            + ([high_water_mark] if high_water_mark is not None else []),
+            default=None,
+        )
     cursor["owned_reviews"] = {
         "synced_at": synced_at.isoformat(),
+        "mode": "full" if full_sync else "incremental",
         "reviews_received": len(records),
         "pages_received": pages_received,
         "truncated": truncated,
+        "high_water_mark": _json_value(next_high_water_mark),
+        "last_full_sync_at": (
+            started_at.isoformat() if full_sync else _json_value(last_full_sync_at)
+        ),
+        "resync_required": truncated and not full_sync,
     }
     connection.sync_cursor = cursor
     connection.connection_metadata = {
@@ -131,9 +183,11 @@ def sync_owned_profile_reviews(
         "connection_id": connection.id,
         "campaign_id": campaign.id,
         "business_location_id": location.id,
+        "mode": "full" if full_sync else "incremental",
         "reviews_received": len(records),
         "reviews_saved": len(saved),
         "pages_received": pages_received,
+        "reached_high_water_mark": reached_high_water_mark,
         "provider_total": provider_total,
         "provider_average_rating": provider_average,
         "truncated": truncated,
@@ -142,6 +196,15 @@ def sync_owned_profile_reviews(
     }
 
 
+def _update_time(record: dict[str, Any]) -> datetime | None:
+    return _datetime(record.get("provider_updated_at")) or _datetime(record.get("reviewed_at"))
+
+
+def _older_than(record: dict[str, Any], high_water_mark: datetime | None) -> bool:
+    updated_at = _update_time(record)
+    return high_water_mark is not None and updated_at is not None and updated_at < high_water_mark
+
+
 def _campaign_context(
     db: Session,
     *,
@@ -178,6 +241,7 @@ def upsert_reviews(
     records: list[dict[str, Any]],
     captured_at: datetime | None = None,
 ) -> list[ReputationReview]:
+    """Upsert reviews and their evidence snapshots in bulk ``ON CONFLICT`` batches."""
     campaign, location = _campaign_context(
         db,
         tenant_id=tenant_id,
@@ -185,85 +249,106 @@ def upsert_reviews(
         campaign_id=campaign_id,
     )
     capture_time = _as_utc(captured_at or datetime.now(UTC))
-    saved: list[ReputationReview] = []
+    normalized_by_key: dict[tuple[str, str], dict[str, Any]] = {}
     for record in records:
         normalized = _normalize_record(record)
-        row = (
-            db.query(ReputationReview)
-            .filter(
-                ReputationReview.tenant_id == tenant_id,
-                ReputationReview.business_location_id == location.id,
-                ReputationReview.source_key == normalized["source_key"],
-                ReputationReview.external_review_id == normalized["external_review_id"],
-            )
-            .first()
+        # Postgres rejects a batch that updates the same row twice; the last copy wins.
+        key = (normalized["source_key"], normalized["external_review_id"])
+        normalized_by_key.pop(key, None)
+        normalized_by_key[key] = normalized
+
+    insert = _dialect_insert(db)
+    review_table = ReputationReview.__table__
+    observation_table = ReputationReviewObservation.__table__
+    review_ids: dict[tuple[str, str], str] = {}
+    new_observations: list[tuple[str, str]] = []
+    pending = list(normalized_by_key.values())
+    for start in range(0, len(pending), REVIEW_UPSERT_BATCH_SIZE):
+        batch = pending[start : start + REVIEW_UPSERT_BATCH_SIZE]
+        statement = insert(review_table).values(
+            [
+                {
+                    **normalized,
+                    "id": str(uuid.uuid4()),
+                    "tenant_id": tenant_id,
+                    "organization_id": organization_id,
+                    "campaign_id": campaign.id,
+                    "business_location_id": location.id,
+                    "first_seen_at": capture_time,
+                    "last_seen_at": capture_time,
+                    "created_at": capture_time,
+                    "updated_at": capture_time,
+                }
+                for normalized in batch
+            ]
         )
-        if row is None:
-            row = ReputationReview(
-                tenant_id=tenant_id,
-                organization_id=organization_id,
-                campaign_id=campaign.id,
-                business_location_id=location.id,
-                source_key=normalized["source_key"],
-                source_name=normalized["source_name"],
-                source_type=normalized["source_type"],
-                provider_name=normalized["provider_name"],
-                external_review_id=normalized["external_review_id"],
-                reviewed_at=normalized["reviewed_at"],
-                first_seen_at=capture_time,
-                last_seen_at=capture_time,
-                created_at=capture_time,
-                updated_at=capture_time,
-                rating=normalized["rating"],
-            )
-            db.add(row)
-            db.flush()
-
-        for field, value in normalized.items():
-            if field not in {"source_key", "external_review_id"}:
-                setattr(row, field, value)
-        row.last_seen_at = capture_time
-        row.updated_at = capture_time
-        snapshot = {key: _json_value(getattr(row, key)) for key in SNAPSHOT_FIELDS}
-        digest = sha256(
-            json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        ).hexdigest()
-        observation = (
-            db.query(ReputationReviewObservation)
-            .filter(
-                ReputationReviewObservation.review_id == row.id,
-                ReputationReviewObservation.evidence_digest == digest,
-            )
-            .first()
+        statement = statement.on_conflict_do_update(
+            index_elements=list(_REVIEW_KEY_COLUMNS),
+            set_={
+                column: statement.excluded[column]
+                for column in (*batch[0].keys(), "last_seen_at", "updated_at")
+                if column not in _REVIEW_KEY_COLUMNS
+            },
+        ).returning(
+            review_table.c.id,
+            review_table.c.source_key,
+            review_table.c.external_review_id,
         )
-        if observation is None:
-            db.add(
-                ReputationReviewObservation(
-                    tenant_id=tenant_id,
-                    organization_id=organization_id,
-                    campaign_id=campaign.id,
-                    business_location_id=location.id,
-                    review_id=row.id,
-                    snapshot=snapshot,
-                    evidence_digest=digest,
-                    captured_at=capture_time,
-                )
+        for row in db.execute(statement):
+            review_ids[(row.source_key, row.external_review_id)] = row.id
+
+        observation_rows = []
+        for normalized in batch:
+            snapshot = {key: _json_value(normalized[key]) for key in SNAPSHOT_FIELDS}
+            observation_rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "tenant_id": tenant_id,
+                    "organization_id": organization_id,
+                    "campaign_id": campaign.id,
+                    "business_location_id": location.id,
+                    "review_id": review_ids[
+                        (normalized["source_key"], normalized["external_review_id"])
+                    ],
+                    "snapshot": snapshot,
+                    "evidence_digest": _snapshot_digest(snapshot),
+                    "captured_at": capture_time,
+                }
             )
-            if row.source_type == "owned_profile":
-                emit_event(
-                    db,
-                    tenant_id=tenant_id,
-                    event_type="reputation.review.saved",
-                    payload={
-                        "organization_id": organization_id,
-                        "campaign_id": campaign.id,
-                        "business_location_id": location.id,
-                        "review_id": row.id,
-                        "evidence_digest": digest,
-                    },
-                )
-        saved.append(row)
+        owned_review_ids = {
+            review_ids[(normalized["source_key"], normalized["external_review_id"])]
+            for normalized in batch
+            if normalized["source_type"] == "owned_profile"
+        }
+        inserted = db.execute(
+            insert(observation_table)
+            .values(observation_rows)
+            .on_conflict_do_nothing(index_elements=["review_id", "evidence_digest"])
+            .returning(observation_table.c.review_id, observation_table.c.evidence_digest)
+        )
+        new_observations.extend(
+            (row.review_id, row.evidence_digest)
+            for row in inserted
+            if row.review_id in owned_review_ids
+        )
 
+    emit_events(
+        db,
+        (
+            EventEmission(
+                tenant_id=tenant_id,
+                event_type="reputation.review.saved",
+                payload={
+                    "organization_id": organization_id,
+                    "campaign_id": campaign.id,
+                    "business_location_id": location.id,
+                    "review_id": review_id,
+                    "evidence_digest": digest,
+                },
+            )
+            for review_id, digest in new_observations
+        ),
+    )
     emit_event(
         db,
         tenant_id=tenant_id,
@@ -272,13 +357,29 @@ def upsert_reviews(
             "campaign_id": campaign.id,
             "business_location_id": location.id,
             "records_received": len(records),
-            "records_saved": len(saved),
+            "records_saved": len(review_ids),
         },
     )
     db.commit()
-    for row in saved:
-        db.refresh(row)
-    return saved
+    ordered_ids = [review_ids[key] for key in normalized_by_key]
+    rows_by_id: dict[str, ReputationReview] = {}
+    for start in range(0, len(ordered_ids), REVIEW_UPSERT_BATCH_SIZE):
+        chunk = ordered_ids[start : start + REVIEW_UPSERT_BATCH_SIZE]
+        rows_by_id.update(
+            (row.id, row)
+            for row in db.query(ReputationReview).filter(ReputationReview.id.in_(chunk))
+        )
+    return [rows_by_id[review_id] for review_id in ordered_ids]
+
+
+def _dialect_insert(db: Session):
+    return sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+
+
+def _snapshot_digest(snapshot: dict[str, Any]) -> str:
+    return sha256(
+        json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
 
 
 def list_reviews(
@@ -360,9 +461,7 @@ def record_owned_reply(
     review.updated_at = capture_time
 
     snapshot = {key: _json_value(getattr(review, key)) for key in SNAPSHOT_FIELDS}
-    digest = sha256(
-        json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    ).hexdigest()
+    digest = _snapshot_digest(snapshot)
     observation = (
         db.query(ReputationReviewObservation)
         .filter(
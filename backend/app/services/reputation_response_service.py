@@ -6,7 +6,7 @@ from decimal import Decimal, ROUND_CEILING
 import json
 import re
 from time import perf_counter
-from typing import Any
+from typing import Any, Iterable
 
 from fastapi import HTTPException
 from sqlalchemy import func
@@ -110,6 +110,123 @@ SENSITIVE_PATTERNS: dict[str, tuple[str, ...]] = {
     ),
 }
 
+
+class _SensitiveTopicClassifier:
+    """Precompiled sensitive-topic matcher with a literal-phrase prefilter.
+
+    Patterns shaped like ``\\b(phrase|phrase...)\\b`` contribute their leading
+    literal phrases as anchors. For ASCII text a pattern's regex only runs when
+    one of its anchors occurs as a substring, which is a necessary condition for a
+    match, so results are identical to searching every pattern.
+    """
+
+    def __init__(self, patterns: dict[str, tuple[str, ...]]) -> None:
+        self.source = patterns
+        self.topics = tuple(
+            (
+                topic,
+                tuple(
+                    (re.compile(pattern, flags=re.IGNORECASE), _pattern_anchors(pattern))
+                    for pattern in topic_patterns
+                ),
+            )
+            for topic, topic_patterns in patterns.items()
+        )
+
+    def classify(self, normalized: str) -> list[str]:
+        use_anchors = normalized.isascii()
+        matched: list[str] = []
+        for topic, compiled_patterns in self.topics:
+            for compiled, anchors in compiled_patterns:
+                if (
+                    use_anchors
+                    and anchors is not None
+                    and not any(anchor in normalized for anchor in anchors)
+                ):
+                    continue
+                if compiled.search(normalized):
+                    matched.append(topic)
+                    break
+        return matched
+
+
+def _pattern_anchors(pattern: str) -> tuple[str, ...] | None:
+    """Return lowercase literals one of which every match must contain, if derivable."""
+    wrapped = re.fullmatch(r"\\b\((.*)\)\\b", pattern)
+    if wrapped is None:
+        return _required_character(pattern)
+    alternatives: list[str] = []
+    depth = 0
+    current = ""
+    escaped = False
+    for character in wrapped.group(1):
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif character == "|" and depth == 0:
+            alternatives.append(current)
+            current = ""
+            continue
+        current += character
+    alternatives.append(current)
+    anchors: list[str] = []
+    for alternative in alternatives:
+        literal = re.match(r"[A-Za-z ]*", alternative).group(0)
+        if alternative[len(literal) : len(literal) + 1] in {"?", "*", "{"}:
+            literal = literal[:-1]
+        if not literal.strip():
+            return None
+        anchors.append(literal.lower())
+    return tuple(anchors)
+
+
+def _required_character(pattern: str) -> tuple[str, ...] | None:
+    """Return an unquantified top-level literal character such as the ``@`` in an email."""
+    depth = 0
+    in_class = False
+    escaped = False
+    for index, character in enumerate(pattern):
+        if escaped:
+            escaped = False
+            continue
+        if character == "\\":
+            escaped = True
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif (
+            depth == 0
+            and character in "@#%&=:/"
+            and pattern[index + 1 : index + 2] not in {"?", "*", "{"}
+        ):
+            if "|" in pattern:
+                return None
+            return (character,)
+    return None
+
+
+_sensitive_topic_classifier = _SensitiveTopicClassifier(SENSITIVE_PATTERNS)
+
+
+def _active_sensitive_topic_classifier() -> _SensitiveTopicClassifier:
+    global _sensitive_topic_classifier
+    if _sensitive_topic_classifier.source is not SENSITIVE_PATTERNS:
+        _sensitive_topic_classifier = _SensitiveTopicClassifier(SENSITIVE_PATTERNS)
+    return _sensitive_topic_classifier
+
+
 DEFAULT_POLICY_RULES: dict[str, Any] = {
     "mode": "draft_only",
     "human_approval_required": True,
@@ -259,11 +376,24 @@ def classify_sensitive_topics(review_text: str | None) -> list[str]:
     normalized = str(review_text or "").strip().lower()
     if not normalized:
         return []
-    return [
-        topic
-        for topic, patterns in SENSITIVE_PATTERNS.items()
-        if any(re.search(pattern, normalized, flags=re.IGNORECASE) for pattern in patterns)
-    ]
+    return _active_sensitive_topic_classifier().classify(normalized)
+
+
+def classify_sensitive_topics_batch(review_texts: Iterable[str | None]) -> list[list[str]]:
+    """Classify many stored reviews, scanning each distinct text once."""
+    classifier = _active_sensitive_topic_classifier()
+    cache: dict[str, list[str]] = {}
+    results: list[list[str]] = []
+    for review_text in review_texts:
+        normalized = str(review_text or "").strip().lower()
+        if not normalized:
+            results.append([])
+            continue
+        topics = cache.get(normalized)
+        if topics is None:
+            topics = cache[normalized] = classifier.classify(normalized)
+        results.append(list(topics))
+    return results
 
 
 def list_response_drafts(
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+import hashlib
+import logging
+import threading
+from time import monotonic, sleep as time_sleep
 from typing import Any
 from urllib.parse import urlsplit, urlunsplit
 
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
+from app.db.session import SessionLocal
 from app.models.campaign import Campaign
 from app.models.crawl import CrawlPageResult, CrawlRun, Page
 from app.models.data_connection import DataConnection
@@ -13,13 +23,28 @@ from app.models.site_integrity import (
     SearchConsoleSitemapSnapshot,
     UrlInspectionSnapshot,
 )
-from app.providers.execution_types import ProviderExecutionRequest
+from app.providers.execution_types import ProviderExecutionRequest, ProviderExecutionResult
 from app.providers.google_search_console import SearchConsoleSiteIntegrityAdapter
 from app.services import data_connections_service
+from app.services.rate_limit_store import (
+    PostgresFixedWindowRateLimitStore,
+    RateLimitStore,
+    RateLimitStoreUnavailable,
+    RedisFixedWindowRateLimitStore,
+)
 
+logger = logging.getLogger(__name__)
 
 MAX_URLS_PER_REFRESH = 25
 DEFAULT_URLS_PER_REFRESH = 10
+# Google's URL Inspection quota is metered per Search Console property.
+URL_INSPECTION_DAILY_QUOTA = 2000
+URL_INSPECTION_PER_MINUTE_QUOTA = 600
+URL_INSPECTION_POLICY_KEY = "gsc.url_inspection"
+JOB_URLS_PER_RUN = 200
+INSPECTION_CHUNK_SIZE = 25
+INSPECTION_WORKERS = 8
+_QUOTA_REASON_CODES = frozenset({"quota_exhausted", "rate_limited"})
 STALE_AFTER = timedelta(days=7)
 _SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
@@ -194,6 +219,433 @@ def refresh_site_integrity(
 ) -> dict[str, Any]:
     resolved_now = now or datetime.now(UTC)
     max_urls = max(1, min(int(max_urls), MAX_URLS_PER_REFRESH))
+    campaign, connection = _refreshable_connection(
+        db,
+        tenant_id=tenant_id,
+        campaign_id=campaign_id,
+    )
+    reserved = _reserve_quota(db, connection, requested=max_urls, now=resolved_now)
+    if not reserved:
+        raise _provider_error(None, action="check pages", reason_code="quota_exhausted")
+    try:
+        sitemap_rows = _refresh_sitemaps(
+            db,
+            campaign=campaign,
+            connection=connection,
+            now=resolved_now,
+        )
+    except SiteIntegrityError:
+        _record_quota_use(db, connection, _InspectionOutcome(), reserved=reserved, now=resolved_now)
+        db.commit()
+        raise
+
+    pages = _priority_pages(
+        db,
+        tenant_id=tenant_id,
+        campaign=campaign,
+        limit=reserved,
+    )
+    outcome = _inspect_pages(
+        campaign=campaign,
+        connection=connection,
+        pages=pages,
+    )
+    _persist_inspections(
+        db,
+        campaign=campaign,
+        connection=connection,
+        inspections=outcome.inspections,
+        inspected_at=resolved_now,
+    )
+    _record_quota_use(db, connection, outcome, reserved=reserved, now=resolved_now)
+    inspected = len(outcome.inspections)
+    failures = outcome.failures
+
+    metadata = dict(connection.connection_metadata or {})
+    metadata["site_integrity_last_refresh_at"] = resolved_now.isoformat()
+    metadata["site_integrity_last_requested_urls"] = len(pages)
+    metadata["site_integrity_last_inspected_urls"] = inspected
+    metadata["site_integrity_last_failed_urls"] = len(failures)
+    connection.connection_metadata = metadata
+    connection.last_error_code = None if inspected or not pages else "site_integrity_refresh_failed"
+    connection.last_error_message = None if inspected or not pages else "No page checks completed."
+    connection.updated_at = resolved_now
+    db.commit()
+
+    return {
+        "refresh": {
+            "requested_urls": len(pages),
+            "inspected_urls": inspected,
+            "failed_urls": len(failures),
+            "failures": failures,
+            "sitemaps_read": len(sitemap_rows),
+            "quota_guardrail": {
+                "maximum_urls_per_request": MAX_URLS_PER_REFRESH,
+                "requested_maximum": max_urls,
+            },
+            "quota": _inspection_quota(connection, now=resolved_now),
+        },
+        "integrity": get_site_integrity(
+            db,
+            tenant_id=tenant_id,
+            campaign_id=campaign_id,
+            now=resolved_now,
+        ),
+    }
+
+
+def run_site_integrity_batch(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign_id: str,
+    job_id: str | None = None,
+    batch_size: int = JOB_URLS_PER_RUN,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Inspect the next slice of the site from the saved cursor.
+
+    Each chunk is persisted and committed with the cursor and quota use, so
+    progress is visible to other sessions and a retried job resumes where the
+    last committed chunk stopped. When the daily quota runs out the result
+    carries ``resume_at`` for the caller to schedule the next run.
+    """
+    resolved_now = now or datetime.now(UTC)
+    campaign, connection = _refreshable_connection(
+        db,
+        tenant_id=tenant_id,
+        campaign_id=campaign_id,
+    )
+    pages = _priority_pages(db, tenant_id=tenant_id, campaign=campaign, limit=None)
+    metadata = dict(connection.connection_metadata or {})
+    position = _cursor_position(metadata.get("site_integrity_cursor"), pages)
+    sitemaps_read = 0
+    if position == 0:
+        sitemaps_read = len(
+            _refresh_sitemaps(db, campaign=campaign, connection=connection, now=resolved_now)
+        )
+
+    quota = _inspection_quota(connection, now=resolved_now)
+    run_limit = min(max(1, int(batch_size)), quota["remaining_today"])
+    pending = pages[position : position + run_limit]
+    inspected = 0
+    failures: list[dict[str, str]] = []
+    stop_reason: str | None = None
+    _record_progress(
+        connection,
+        state="running",
+        job_id=job_id,
+        position=position,
+        total=len(pages),
+        inspected=inspected,
+        failed=0,
+        now=resolved_now,
+    )
+    db.commit()
+
+    for offset in range(0, len(pending), INSPECTION_CHUNK_SIZE):
+        requested = len(pending[offset : offset + INSPECTION_CHUNK_SIZE])
+        reserved = _reserve_quota(db, connection, requested=requested, now=resolved_now)
+        if not reserved:
+            stop_reason = "daily_quota"
+            break
+        chunk = pending[offset : offset + reserved]
+        outcome = _inspect_pages(campaign=campaign, connection=connection, pages=chunk)
+        _persist_inspections(
+            db,
+            campaign=campaign,
+            connection=connection,
+            inspections=outcome.inspections,
+            inspected_at=resolved_now,
+        )
+        _record_quota_use(db, connection, outcome, reserved=reserved, now=resolved_now)
+        inspected += len(outcome.inspections)
+        failures.extend(outcome.failures)
+        completed = chunk[: outcome.completed]
+        position += len(completed)
+        if completed:
+            _set_cursor(connection, position=position, url=completed[-1][1])
+        _record_progress(
+            connection,
+            state="running",
+            job_id=job_id,
+            position=position,
+            total=len(pages),
+            inspected=inspected,
+            failed=len(failures),
+            now=resolved_now,
+        )
+        db.commit()
+        if outcome.stop_reason is not None:
+            stop_reason = outcome.stop_reason
+            break
+        if reserved < requested:
+            # Other workers spent the rest of today's quota for this property.
+            stop_reason = "daily_quota"
+            break
+
+    covered = position >= len(pages)
+    if covered:
+        _set_cursor(connection, position=None, url=None)
+    metadata = dict(connection.connection_metadata or {})
+    metadata["site_integrity_last_refresh_at"] = resolved_now.isoformat()
+    if covered:
+        metadata["site_integrity_coverage_completed_at"] = resolved_now.isoformat()
+    connection.connection_metadata = metadata
+
+    resume_at: datetime | None = None
+    if not covered:
+        if stop_reason is None and not _inspection_quota(connection, now=resolved_now)["remaining_today"]:
+            stop_reason = "daily_quota"
+        if stop_reason == "rate_limited":
+            resume_at = resolved_now + timedelta(minutes=1)
+        elif stop_reason == "daily_quota":
+            resume_at = _next_quota_day(resolved_now)
+        else:
+            resume_at = resolved_now
+    if covered:
+        state = "completed"
+    elif resume_at is not None and resume_at.date() > resolved_now.date():
+        state = "waiting_for_quota"
+    else:
+        state = "queued"
+    progress = _record_progress(
+        connection,
+        state=state,
+        job_id=job_id,
+        position=0 if covered else position,
+        total=len(pages),
+        inspected=inspected,
+        failed=len(failures),
+        now=resolved_now,
+        resume_at=resume_at,
+    )
+    connection.updated_at = resolved_now
+    db.commit()
+    return {
+        "campaign_id": campaign.id,
+        "inspected_urls": inspected,
+        "failed_urls": len(failures),
+        "failures": failures[:25],
+        "sitemaps_read": sitemaps_read,
+        "stop_reason": stop_reason,
+        "progress": progress,
+        "quota": _inspection_quota(connection, now=resolved_now),
+        "resume_at": resume_at.isoformat() if resume_at is not None else None,
+    }
+
+
+def get_site_integrity_progress(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign_id: str,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    resolved_now = now or datetime.now(UTC)
+    campaign = _campaign(db, tenant_id=tenant_id, campaign_id=campaign_id)
+    connection = _connection(db, campaign=campaign)
+    if connection is None:
+        raise SiteIntegrityError(
+            "Connect Google Search Console for this location before checking index status.",
+            reason_code="search_console_connection_required",
+            status_code=409,
+        )
+    metadata = connection.connection_metadata or {}
+    progress = metadata.get("site_integrity_progress")
+    return {
+        "campaign_id": campaign.id,
+        "progress": dict(progress) if isinstance(progress, dict) else {"state": "idle"},
+        "coverage_completed_at": metadata.get("site_integrity_coverage_completed_at"),
+        "quota": _inspection_quota(connection, now=resolved_now),
+    }
+
+
+class UrlInspectionPacer:
+    """One-minute window over URL Inspection calls for one property.
+
+    Google meters URL Inspection per Search Console property. With a shared
+    ``store`` every worker process draws from the same per-minute window;
+    without one, or while the store is unavailable, calls are paced by a
+    sliding window local to this process.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_minute: int = URL_INSPECTION_PER_MINUTE_QUOTA,
+        clock: Callable[[], float] = monotonic,
+        sleep: Callable[[float], None] = time_sleep,
+        store: RateLimitStore | None = None,
+        scope_hash: str = "",
+    ) -> None:
+        self.per_minute = max(1, int(per_minute))
+        self._clock = clock
+        self._sleep = sleep
+        self._store = store
+        self._scope_hash = scope_hash
+        self._lock = threading.Lock()
+        self._calls: deque[float] = deque()
+
+    def acquire(self) -> None:
+        if self._store is not None:
+            try:
+                self._acquire_shared()
+                return
+            except RateLimitStoreUnavailable:
+                logger.warning(
+                    "url_inspection_pacer_store_unavailable",
+                    extra={"event": "url_inspection_pacer_store_unavailable"},
+                )
+        while True:
+            with self._lock:
+                current = self._clock()
+                while self._calls and current - self._calls[0] >= 60.0:
+                    self._calls.popleft()
+                if len(self._calls) < self.per_minute:
+                    self._calls.append(current)
+                    return
+                wait_seconds = 60.0 - (current - self._calls[0])
+            self._sleep(max(0.01, wait_seconds))
+
+    def _acquire_shared(self) -> None:
+        while True:
+            decision = self._store.consume(
+                self._scope_hash,
+                URL_INSPECTION_POLICY_KEY,
+                self.per_minute,
+            )
+            if decision.allowed:
+                return
+            self._sleep(float(decision.retry_after_seconds))
+
+
+_PACERS: dict[str, UrlInspectionPacer] = {}
+_PACERS_LOCK = threading.Lock()
+_PACING_STORE: RateLimitStore | None = None
+
+
+def _shared_pacing_store() -> RateLimitStore | None:
+    global _PACING_STORE
+
+    settings = get_settings()
+    if settings.app_env.lower() == "test":
+        return None
+    if _PACING_STORE is None:
+        if settings.rate_limit_backend == "postgres":
+            _PACING_STORE = PostgresFixedWindowRateLimitStore()
+        else:
+            _PACING_STORE = RedisFixedWindowRateLimitStore(settings.redis_url)
+    return _PACING_STORE
+
+
+def url_inspection_pacer(site_url: str) -> UrlInspectionPacer:
+    with _PACERS_LOCK:
+        pacer = _PACERS.get(site_url)
+        if pacer is None:
+            pacer = UrlInspectionPacer(
+                store=_shared_pacing_store(),
+                scope_hash=hashlib.sha256(site_url.encode("utf-8")).hexdigest(),
+            )
+            _PACERS[site_url] = pacer
+        return pacer
+
+
+@dataclass
+class _InspectionOutcome:
+    inspections: list[tuple[str | None, dict[str, Any]]] = field(default_factory=list)
+    failures: list[dict[str, str]] = field(default_factory=list)
+    calls: int = 0
+    completed: int = 0
+    stop_reason: str | None = None
+
+
+def _inspect_pages(
+    *,
+    campaign: Campaign,
+    connection: DataConnection,
+    pages: list[tuple[str | None, str]],
+    max_workers: int = INSPECTION_WORKERS,
+) -> _InspectionOutcome:
+    """Inspect pages concurrently under the property's per-minute pacer.
+
+    The adapter reads credentials through its session, so each call gets a
+    short-lived session of its own. Every page that was inspected is
+    reported, but ``completed`` only counts the leading pages that finished
+    without hitting a quota or rate limit; the cursor only advances past those.
+    """
+    outcome = _InspectionOutcome()
+    if not pages:
+        return outcome
+    base_payload = {
+        "organization_id": campaign.organization_id,
+        "campaign_id": campaign.id,
+        "site_url": connection.external_resource_id,
+    }
+    pacer = url_inspection_pacer(str(connection.external_resource_id))
+    throttled = threading.Event()
+
+    def inspect(inspection_url: str) -> ProviderExecutionResult | None:
+        if throttled.is_set():
+            return None
+        pacer.acquire()
+        session = SessionLocal()
+        try:
+            result = SearchConsoleSiteIntegrityAdapter(db=session).execute(
+                ProviderExecutionRequest(
+                    operation="url_inspection",
+                    payload={**base_payload, "inspection_url": inspection_url},
+                )
+            )
+        finally:
+            session.close()
+        if getattr(result.error, "reason_code", None) in _QUOTA_REASON_CODES:
+            throttled.set()
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(pages)))) as executor:
+        results = list(executor.map(inspect, [url for _page_id, url in pages]))
+
+    # Workers finish out of order, so the quota result can sit after pages
+    # that were skipped once the throttle was set.
+    throttle_codes = [
+        result.error.reason_code
+        for result in results
+        if result is not None
+        and not result.success
+        and getattr(result.error, "reason_code", None) in _QUOTA_REASON_CODES
+    ]
+    if throttle_codes:
+        outcome.stop_reason = "daily_quota" if "quota_exhausted" in throttle_codes else "rate_limited"
+
+    leading = True
+    for (page_id, inspection_url), result in zip(pages, results, strict=True):
+        if result is None:
+            leading = False
+            continue
+        outcome.calls += 1
+        reason_code = getattr(result.error, "reason_code", "provider_failed")
+        if not result.success and reason_code in _QUOTA_REASON_CODES:
+            leading = False
+            continue
+        outcome.completed += int(leading)
+        if not result.success:
+            outcome.failures.append({"url": inspection_url, "reason_code": reason_code})
+            continue
+        record = (result.raw_payload or {}).get("record")
+        if not isinstance(record, dict):
+            outcome.failures.append({"url": inspection_url, "reason_code": "response_invalid"})
+            continue
+        outcome.inspections.append((page_id, record))
+    return outcome
+
+
+def _refreshable_connection(
+    db: Session,
+    *,
+    tenant_id: str,
+    campaign_id: str,
+) -> tuple[Campaign, DataConnection]:
     campaign = _campaign(db, tenant_id=tenant_id, campaign_id=campaign_id)
     connection = _connection(db, campaign=campaign)
     if connection is None:
@@ -217,21 +669,29 @@ def refresh_site_integrity(
             reason_code="organization_required",
             status_code=409,
         )
+    return campaign, connection
+
 
+def _refresh_sitemaps(
+    db: Session,
+    *,
+    campaign: Campaign,
+    connection: DataConnection,
+    now: datetime,
+) -> list[dict[str, Any]]:
     adapter = SearchConsoleSiteIntegrityAdapter(db=db)
-    base_payload = {
-        "organization_id": campaign.organization_id,
-        "campaign_id": campaign.id,
-        "site_url": connection.external_resource_id,
-    }
     sitemap_result = adapter.execute(
         ProviderExecutionRequest(
             operation="sitemaps_list",
-            payload=base_payload,
+            payload={
+                "organization_id": campaign.organization_id,
+                "campaign_id": campaign.id,
+                "site_url": connection.external_resource_id,
+            },
         )
     )
     if not sitemap_result.success:
-        _record_connection_error(connection, sitemap_result.error, now=resolved_now)
+        _record_connection_error(connection, sitemap_result.error, now=now)
         db.commit()
         raise _provider_error(sitemap_result.error, action="read this website's sitemaps")
 
@@ -242,76 +702,135 @@ def refresh_site_integrity(
             campaign=campaign,
             connection=connection,
             row=row,
-            observed_at=resolved_now,
+            observed_at=now,
         )
+    return sitemap_rows
 
-    pages = _priority_pages(
-        db,
-        tenant_id=tenant_id,
-        campaign=campaign,
-        limit=max_urls,
+
+def _inspection_quota(connection: DataConnection, *, now: datetime) -> dict[str, Any]:
+    metadata = connection.connection_metadata or {}
+    used_today = 0
+    if metadata.get("site_integrity_quota_day") == now.date().isoformat():
+        used_today = _safe_int(metadata.get("site_integrity_quota_used"))
+    return {
+        "day": now.date().isoformat(),
+        "daily_limit": URL_INSPECTION_DAILY_QUOTA,
+        "per_minute_limit": URL_INSPECTION_PER_MINUTE_QUOTA,
+        "used_today": min(used_today, URL_INSPECTION_DAILY_QUOTA),
+        "remaining_today": max(0, URL_INSPECTION_DAILY_QUOTA - used_today),
+        "resets_at": _next_quota_day(now).isoformat(),
+    }
+
+
+def _locked_connection(db: Session, connection: DataConnection) -> DataConnection:
+    # Reload the metadata under the row lock so quota written by other workers is kept.
+    return (
+        db.query(DataConnection)
+        .filter(DataConnection.id == connection.id)
+        .populate_existing()
+        .with_for_update()
+        .one()
     )
-    inspected = 0
-    failures: list[dict[str, str]] = []
-    for page_id, inspection_url in pages:
-        result = adapter.execute(
-            ProviderExecutionRequest(
-                operation="url_inspection",
-                payload={**base_payload, "inspection_url": inspection_url},
-            )
-        )
-        if not result.success:
-            failures.append(
-                {
-                    "url": inspection_url,
-                    "reason_code": getattr(result.error, "reason_code", "provider_failed"),
-                }
-            )
-            continue
-        record = (result.raw_payload or {}).get("record")
-        if not isinstance(record, dict):
-            failures.append({"url": inspection_url, "reason_code": "response_invalid"})
-            continue
-        _upsert_inspection(
-            db,
-            campaign=campaign,
-            connection=connection,
-            page_id=page_id,
-            row=record,
-            inspected_at=resolved_now,
-        )
-        inspected += 1
 
+
+def _write_quota_used(connection: DataConnection, *, used_today: int, now: datetime) -> None:
     metadata = dict(connection.connection_metadata or {})
-    metadata["site_integrity_last_refresh_at"] = resolved_now.isoformat()
-    metadata["site_integrity_last_requested_urls"] = len(pages)
-    metadata["site_integrity_last_inspected_urls"] = inspected
-    metadata["site_integrity_last_failed_urls"] = len(failures)
+    metadata["site_integrity_quota_day"] = now.date().isoformat()
+    metadata["site_integrity_quota_used"] = max(0, used_today)
     connection.connection_metadata = metadata
-    connection.last_error_code = None if inspected or not pages else "site_integrity_refresh_failed"
-    connection.last_error_message = None if inspected or not pages else "No page checks completed."
-    connection.updated_at = resolved_now
+
+
+def _reserve_quota(
+    db: Session,
+    connection: DataConnection,
+    *,
+    requested: int,
+    now: datetime,
+) -> int:
+    """Claim up to ``requested`` inspections from today's quota and commit the claim.
+
+    The claim is taken under the connection's row lock before any call is
+    made, so concurrent refreshes of one property cannot spend the same
+    remaining quota twice.
+    """
+    _locked_connection(db, connection)
+    quota = _inspection_quota(connection, now=now)
+    reserved = min(max(0, int(requested)), quota["remaining_today"])
+    if reserved:
+        _write_quota_used(connection, used_today=quota["used_today"] + reserved, now=now)
     db.commit()
+    return reserved
 
-    return {
-        "refresh": {
-            "requested_urls": len(pages),
-            "inspected_urls": inspected,
-            "failed_urls": len(failures),
-            "failures": failures,
-            "sitemaps_read": len(sitemap_rows),
-            "quota_guardrail": {
-                "maximum_urls_per_request": MAX_URLS_PER_REFRESH,
-                "requested_maximum": max_urls,
-            },
-        },
-        "integrity": get_site_integrity(
-            db,
-            tenant_id=tenant_id,
-            campaign_id=campaign_id,
-            now=resolved_now,
-        ),
+
+def _record_quota_use(
+    db: Session,
+    connection: DataConnection,
+    outcome: _InspectionOutcome,
+    *,
+    reserved: int,
+    now: datetime,
+) -> None:
+    """Settle a reservation: return calls that were not made, or close out the day."""
+    _locked_connection(db, connection)
+    used_today = _inspection_quota(connection, now=now)["used_today"]
+    used_today -= max(0, reserved - outcome.calls)
+    if outcome.stop_reason == "daily_quota":
+        used_today = URL_INSPECTION_DAILY_QUOTA
+    _write_quota_used(connection, used_today=used_today, now=now)
+
+
+def _next_quota_day(now: datetime) -> datetime:
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=UTC)
+
+
+def _cursor_position(cursor: Any, pages: list[tuple[str | None, str]]) -> int:
+    if not isinstance(cursor, dict):
+        return 0
+    url = _normalized_url(str(cursor.get("url") or ""))
+    if url:
+        for index, (_page_id, page_url) in enumerate(pages):
+            if _normalized_url(page_url) == url:
+                return index + 1
+    # The page behind the cursor left the latest crawl; keep the offset.
+    return min(_safe_int(cursor.get("position")), len(pages))
+
+
+def _set_cursor(connection: DataConnection, *, position: int | None, url: str | None) -> None:
+    metadata = dict(connection.connection_metadata or {})
+    if position is None:
+        metadata.pop("site_integrity_cursor", None)
+    else:
+        metadata["site_integrity_cursor"] = {"position": position, "url": url}
+    connection.connection_metadata = metadata
+
+
+def _record_progress(
+    connection: DataConnection,
+    *,
+    state: str,
+    job_id: str | None,
+    position: int,
+    total: int,
+    inspected: int,
+    failed: int,
+    now: datetime,
+    resume_at: datetime | None = None,
+) -> dict[str, Any]:
+    progress = {
+        "state": state,
+        "job_id": job_id,
+        "position": position,
+        "total_urls": total,
+        "remaining_urls": max(0, total - position),
+        "inspected_urls": inspected,
+        "failed_urls": failed,
+        "updated_at": now.isoformat(),
+        "resume_at": resume_at.isoformat() if resume_at is not None else None,
     }
+    metadata = dict(connection.connection_metadata or {})
+    metadata["site_integrity_progress"] = progress
+    connection.connection_metadata = metadata
+    return progress
 
 
 def _campaign(db: Session, *, tenant_id: str, campaign_id: str) -> Campaign:
@@ -352,7 +871,7 @@ def _priority_pages(
     *,
     tenant_id: str,
     campaign: Campaign,
-    limit: int,
+    limit: int | None,
 ) -> list[tuple[str | None, str]]:
     latest_run = (
         db.query(CrawlRun)
@@ -395,7 +914,7 @@ def _priority_pages(
             continue
         seen.add(normalized)
         deduped.append((page_id, url))
-        if len(deduped) >= limit:
+        if limit is not None and len(deduped) >= limit:
             break
     return deduped
 
@@ -632,50 +1151,58 @@ def _index_action(row: UrlInspectionSnapshot) -> str:
     return "Review Google's coverage reason, fix the page signal it names, then check the page again."
 
 
-def _upsert_inspection(
+def _persist_inspections(
     db: Session,
     *,
     campaign: Campaign,
     connection: DataConnection,
-    page_id: str | None,
-    row: dict[str, Any],
+    inspections: list[tuple[str | None, dict[str, Any]]],
     inspected_at: datetime,
-) -> UrlInspectionSnapshot:
-    inspection_url = str(row.get("inspection_url") or "").strip()
-    record = (
-        db.query(UrlInspectionSnapshot)
-        .filter(
+) -> list[UrlInspectionSnapshot]:
+    by_url: dict[str, tuple[str | None, dict[str, Any]]] = {}
+    for page_id, row in inspections:
+        by_url[str(row.get("inspection_url") or "").strip()] = (page_id, row)
+    if not by_url:
+        return []
+    existing = {
+        record.inspection_url: record
+        for record in db.query(UrlInspectionSnapshot).filter(
             UrlInspectionSnapshot.campaign_id == campaign.id,
-            UrlInspectionSnapshot.inspection_url == inspection_url,
+            UrlInspectionSnapshot.inspection_url.in_(list(by_url)),
         )
-        .first()
-    )
-    if record is None:
-        record = UrlInspectionSnapshot(
-            tenant_id=campaign.tenant_id,
-            organization_id=str(campaign.organization_id),
-            campaign_id=campaign.id,
-            connection_id=connection.id,
-            site_url=connection.external_resource_id,
-            inspection_url=inspection_url,
-            created_at=inspected_at,
-        )
-        db.add(record)
-    record.page_id = page_id
-    record.verdict = str(row.get("verdict") or "VERDICT_UNSPECIFIED")
-    record.coverage_state = _optional_text(row.get("coverage_state"))
-    record.robots_txt_state = _optional_text(row.get("robots_txt_state"))
-    record.indexing_state = _optional_text(row.get("indexing_state"))
-    record.page_fetch_state = _optional_text(row.get("page_fetch_state"))
-    record.google_canonical = _optional_text(row.get("google_canonical"))
-    record.user_canonical = _optional_text(row.get("user_canonical"))
-    record.crawled_as = _optional_text(row.get("crawled_as"))
-    record.last_crawl_time = _parse_datetime(row.get("last_crawl_time"))
-    record.sitemap_urls = _string_list(row.get("sitemap_urls"))
-    record.referring_urls = _string_list(row.get("referring_urls"))
-    record.inspected_at = inspected_at
-    record.updated_at = inspected_at
-    return record
+    }
+    records: list[UrlInspectionSnapshot] = []
+    created: list[UrlInspectionSnapshot] = []
+    for inspection_url, (page_id, row) in by_url.items():
+        record = existing.get(inspection_url)
+        if record is None:
+            record = UrlInspectionSnapshot(
+                tenant_id=campaign.tenant_id,
+                organization_id=str(campaign.organization_id),
+                campaign_id=campaign.id,
+                connection_id=connection.id,
+                site_url=connection.external_resource_id,
+                inspection_url=inspection_url,
+                created_at=inspected_at,
+            )
+            created.append(record)
+        record.page_id = page_id
+        record.verdict = str(row.get("verdict") or "VERDICT_UNSPECIFIED")
+        record.coverage_state = _optional_text(row.get("coverage_state"))
+        record.robots_txt_state = _optional_text(row.get("robots_txt_state"))
+        record.indexing_state = _optional_text(row.get("indexing_state"))
+        record.page_fetch_state = _optional_text(row.get("page_fetch_state"))
+        record.google_canonical = _optional_text(row.get("google_canonical"))
+        record.user_canonical = _optional_text(row.get("user_canonical"))
+        record.crawled_as = _optional_text(row.get("crawled_as"))
+        record.last_crawl_time = _parse_datetime(row.get("last_crawl_time"))
+        record.sitemap_urls = _string_list(row.get("sitemap_urls"))
+        record.referring_urls = _string_list(row.get("referring_urls"))
+        record.inspected_at = inspected_at
+        record.updated_at = inspected_at
+        records.append(record)
+    db.add_all(created)
+    return records
 
 
 def _upsert_sitemap(
@@ -726,8 +1253,13 @@ def _record_connection_error(connection: DataConnection, error: Any, *, now: dat
     connection.updated_at = now
 
 
-def _provider_error(error: Any, *, action: str) -> SiteIntegrityError:
-    reason_code = getattr(error, "reason_code", "provider_failed")
+def _provider_error(
+    error: Any,
+    *,
+    action: str,
+    reason_code: str | None = None,
+) -> SiteIntegrityError:
+    reason_code = reason_code or getattr(error, "reason_code", "provider_failed")
     if reason_code == "auth_failed":
         message = "Google access needs to be reconnected in Settings before this check can run."
         status_code = 409
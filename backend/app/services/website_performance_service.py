@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from urllib.parse import urlparse
@@ -12,6 +15,7 @@ from app.intelligence.lexicon.evaluator import evaluate_core_web_vitals
 from app.intelligence.lexicon.loader import get_active_lexicon
 from app.models.campaign import Campaign
 from app.models.website_performance import WebsitePerformanceMeasurement
+from app.providers.http_clients import get_http_client, http_client_max_connections
 from app.services import metric_contract_service
 
 
@@ -43,6 +47,12 @@ PAGESPEED_CONTRACT_IDS = (
     "web.pagespeed.tbt",
     "web.pagespeed.performance_score",
 )
+DEFAULT_MAX_CONCURRENT_PAGESPEED_RUNS = 8
+# CrUX answers in well under a second, so a few workers keep up with every PSI slot.
+CRUX_LOOKUP_WORKERS = 4
+
+_pagespeed_slots_lock = threading.Lock()
+_pagespeed_slots: dict[int, threading.BoundedSemaphore] = {}
 
 
 class WebsitePerformanceProviderError(RuntimeError):
@@ -69,6 +79,77 @@ def origin_for_url(url: str) -> str:
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
+class CruxLookupCoalescer:
+    """Share identical CrUX record lookups between campaigns collected together.
+
+    Lookups are keyed by (scope, target, form factor, day): the first caller sends the
+    request and every concurrent or later caller for the same key receives its response.
+    """
+
+    def __init__(self, *, lookup_day: date) -> None:
+        self.lookup_day = lookup_day
+        self.requests_sent = 0
+        self._lock = threading.Lock()
+        self._lookups: dict[tuple[str, str, str, date], Future[httpx.Response]] = {}
+
+    def post(
+        self,
+        client: httpx.Client,
+        *,
+        scope: str,
+        target: str,
+        request_base: dict[str, Any],
+        api_key: str,
+    ) -> httpx.Response:
+        key = (scope, target, str(request_base["formFactor"]), self.lookup_day)
+        with self._lock:
+            lookup = self._lookups.get(key)
+            owner = lookup is None
+            if owner:
+                lookup = Future()
+                self._lookups[key] = lookup
+                self.requests_sent += 1
+        if owner:
+            try:
+                lookup.set_result(
+                    _post_crux(
+                        client,
+                        scope=scope,
+                        target=target,
+                        request_base=request_base,
+                        api_key=api_key,
+                    )
+                )
+            except BaseException as exc:
+                lookup.set_exception(exc)
+        return lookup.result()
+
+
+def _post_crux(
+    client: httpx.Client,
+    *,
+    scope: str,
+    target: str,
+    request_base: dict[str, Any],
+    api_key: str,
+) -> httpx.Response:
+    return client.post(
+        CRUX_ENDPOINT,
+        params={"key": api_key},
+        json={**request_base, scope: target},
+    )
+
+
+def _pagespeed_run_slots(limit: int) -> threading.BoundedSemaphore:
+    # One semaphore per configured limit, shared by every batch in the process.
+    with _pagespeed_slots_lock:
+        slots = _pagespeed_slots.get(limit)
+        if slots is None:
+            slots = threading.BoundedSemaphore(limit)
+            _pagespeed_slots[limit] = slots
+        return slots
+
+
 def _date_from_crux(payload: dict[str, Any] | None) -> date | None:
     if not isinstance(payload, dict):
         return None
@@ -102,6 +183,7 @@ def query_crux_field_data(
     requested_url: str,
     form_factor: str,
     api_key: str,
+    coalescer: CruxLookupCoalescer | None = None,
 ) -> dict[str, Any]:
     if not api_key.strip():
         raise WebsitePerformanceProviderError(
@@ -121,11 +203,14 @@ def query_crux_field_data(
     resolved_scope = "url"
     measured_url = requested_url
     fallback_to_origin = False
+    send = coalescer.post if coalescer is not None else _post_crux
     for index, (scope, target) in enumerate(attempts):
-        response = client.post(
-            CRUX_ENDPOINT,
-            params={"key": api_key},
-            json={**request_base, scope: target},
+        response = send(
+            client,
+            scope=scope,
+            target=target,
+            request_base=request_base,
+            api_key=api_key,
         )
         if response.status_code == 200:
             resolved_scope = scope
@@ -309,160 +394,266 @@ def collect_campaign_performance(
     idempotency_scope: str | None = None,
     client: httpx.Client | None = None,
 ) -> list[WebsitePerformanceMeasurement]:
+    return collect_performance_batch(
+        db,
+        campaigns=[campaign],
+        form_factor=form_factor,
+        captured_at=captured_at,
+        idempotency_scope=idempotency_scope,
+        client=client,
+    )[campaign.id]
+
+
+def collect_performance_batch(
+    db: Session,
+    *,
+    campaigns: Sequence[Campaign],
+    form_factor: str,
+    captured_at: datetime | None = None,
+    idempotency_scope: str | None = None,
+    client: httpx.Client | None = None,
+    max_concurrent_pagespeed_runs: int | None = None,
+) -> dict[str, list[WebsitePerformanceMeasurement]]:
+    """Collect field and lab measurements for many campaigns in one sweep.
+
+    Provider calls run on worker threads: CrUX and PageSpeed for a campaign overlap,
+    PageSpeed runs are capped process-wide, and identical CrUX lookups are sent once
+    and fanned out to every campaign that asked for them. Without an explicit
+    ``client``, PageSpeed concurrency is also capped to what the shared
+    ``website_performance`` connection pool can serve. Rows are written on the
+    calling thread in campaign order.
+    """
     if form_factor not in {"mobile", "desktop"}:
         raise ValueError("form_factor must be mobile or desktop.")
-    if not campaign.organization_id:
+    unique_campaigns = list({campaign.id: campaign for campaign in campaigns}.values())
+    if any(not campaign.organization_id for campaign in unique_campaigns):
         raise ValueError("Campaign is missing organization scope.")
     measured_at = captured_at or datetime.now(UTC)
-    requested_url = normalize_site_url(campaign.domain)
-    lexicon = get_active_lexicon(db, tenant_id=campaign.tenant_id)
+    requested_urls = {campaign.id: normalize_site_url(campaign.domain) for campaign in unique_campaigns}
     settings = get_settings()
     api_key = settings.pagespeed_api_key.strip() or settings.crux_api_key.strip()
-    owns_client = client is None
-    resolved_client = client or httpx.Client(
-        timeout=settings.website_performance_http_timeout_seconds,
-        follow_redirects=True,
-    )
-    collectors = (
-        (
-            "crux_field",
-            lambda: query_crux_field_data(
-                resolved_client,
-                requested_url=requested_url,
-                form_factor=form_factor,
-                api_key=settings.crux_api_key,
-            ),
-        ),
-        (
-            "pagespeed_lab",
-            lambda: query_pagespeed_lab_data(
-                resolved_client,
-                requested_url=requested_url,
-                form_factor=form_factor,
-                api_key=api_key,
-            ),
+    pagespeed_limit = max(
+        1,
+        int(
+            max_concurrent_pagespeed_runs
+            or getattr(
+                settings,
+                "website_performance_max_concurrent_pagespeed_runs",
+                DEFAULT_MAX_CONCURRENT_PAGESPEED_RUNS,
+            )
         ),
     )
-    rows: list[WebsitePerformanceMeasurement] = []
-    try:
-        for source, collector in collectors:
-            resolved_scope = (
-                str(idempotency_scope).strip()
-                if idempotency_scope
-                else measured_at.date().isoformat()
-            )
-            idempotency_key = (
-                f"website-performance:{campaign.id}:{form_factor}:"
-                f"{source}:{resolved_scope}"
-            )
-            existing = (
-                db.query(WebsitePerformanceMeasurement)
-                .filter(
-                    WebsitePerformanceMeasurement.idempotency_key == idempotency_key
+    resolved_scope = (
+        str(idempotency_scope).strip()
+        if idempotency_scope
+        else measured_at.date().isoformat()
+    )
+    idempotency_keys = {
+        (campaign.id, source): (
+            f"website-performance:{campaign.id}:{form_factor}:"
+            f"{source}:{resolved_scope}"
+        )
+        for campaign in unique_campaigns
+        for source in ("crux_field", "pagespeed_lab")
+    }
+    existing_by_key = {
+        row.idempotency_key: row
+        for row in (
+            db.query(WebsitePerformanceMeasurement)
+            .filter(
+                WebsitePerformanceMeasurement.idempotency_key.in_(
+                    list(idempotency_keys.values())
                 )
-                .first()
             )
-            if existing is not None:
-                rows.append(existing)
-                continue
+            .all()
+        )
+    }
 
-            result: dict[str, Any]
-            error_code: str | None = None
-            error_message: str | None = None
-            try:
-                result = collector()
-            except WebsitePerformanceProviderError as exc:
-                result = {
-                    "status": "failed",
-                    "scope": "url",
-                    "measured_url": requested_url,
-                    "metrics": {},
-                }
-                error_code = exc.code
-                error_message = str(exc)
-            except (httpx.HTTPError, ValueError) as exc:
-                result = {
-                    "status": "failed",
-                    "scope": "url",
-                    "measured_url": requested_url,
-                    "metrics": {},
-                }
-                error_code = "provider_request_failed"
-                error_message = str(exc)
-
-            metrics = dict(result.get("metrics") or {})
-            assessment = _assessment_for_measurement(
-                db,
-                tenant_id=campaign.tenant_id,
-                form_factor=form_factor,
-                source=source,
-                metrics=metrics,
-                measured_at=measured_at,
-            )
-            diagnostics = dict(result.get("diagnostics") or {})
-            diagnostics["assessment"] = assessment
-            contract_ids = CRUX_CONTRACT_IDS if source == "crux_field" else PAGESPEED_CONTRACT_IDS
-            contract_scope = {
-                "organization_id": campaign.organization_id,
-                "campaign_id": campaign.id,
-                "measured_url": str(result.get("measured_url") or requested_url),
-                "scope": str(result.get("scope") or "url"),
-                "form_factor": form_factor,
-                "collection_start": result.get("collection_start"),
-                "collection_end": result.get("collection_end"),
-                "source_version": result.get("source_version"),
-                "captured_at": measured_at,
-                "run_environment": diagnostics.get("test_environment"),
-                "fallback_to_origin": bool(result.get("fallback_to_origin")),
-            }
-            contract_evidence = metric_contract_service.scope_evidence(
-                contract_ids[0],
-                contract_scope,
-                require_complete=False,
-                db=db,
-            )
-            row = WebsitePerformanceMeasurement(
-                tenant_id=campaign.tenant_id,
-                organization_id=campaign.organization_id,
-                business_location_id=campaign.business_location_id,
-                campaign_id=campaign.id,
-                requested_url=requested_url,
-                measured_url=str(result.get("measured_url") or requested_url),
-                source=source,
-                scope=str(result.get("scope") or "url"),
-                form_factor=form_factor,
-                status=str(result.get("status") or "failed"),
-                lcp_ms=metrics.get("lcp_ms"),
-                inp_ms=metrics.get("inp_ms"),
-                cls_value=metrics.get("cls_value"),
-                ttfb_ms=metrics.get("ttfb_ms"),
-                fcp_ms=metrics.get("fcp_ms"),
-                tbt_ms=metrics.get("tbt_ms"),
-                performance_score=metrics.get("performance_score"),
-                collection_start=result.get("collection_start"),
-                collection_end=result.get("collection_end"),
-                source_version=result.get("source_version"),
-                metric_contract_versions=metric_contract_service.contract_versions(
-                    contract_ids, db=db
-                ),
-                scope_key=contract_evidence["scope_key"],
-                lexicon_id=lexicon.meta.lexicon_id,
-                lexicon_version=lexicon.meta.version,
-                fallback_to_origin=bool(result.get("fallback_to_origin")),
-                distribution=dict(result.get("distribution") or {}),
-                diagnostics=diagnostics,
-                error_code=error_code,
-                error_message=error_message,
-                idempotency_key=idempotency_key,
-                captured_at=measured_at,
-            )
-            db.add(row)
-            db.flush()
-            rows.append(row)
-        return rows
-    finally:
-        if owns_client:
-            resolved_client.close()
+    if client is None:
+        # The shared pool is sized from WEBSITE_PERFORMANCE_MAX_CONCURRENT_PAGESPEED_RUNS;
+        # more workers than connections would only queue inside httpx.
+        pagespeed_limit = min(
+            pagespeed_limit,
+            max(1, http_client_max_connections("website_performance") - CRUX_LOOKUP_WORKERS),
+        )
+    worker_count = pagespeed_limit + CRUX_LOOKUP_WORKERS
+    resolved_client = client or get_http_client("website_performance")
+    coalescer = CruxLookupCoalescer(lookup_day=measured_at.date())
+    pagespeed_slots = _pagespeed_run_slots(pagespeed_limit)
+
+    def crux_collector(requested_url: str) -> Callable[[], dict[str, Any]]:
+        return lambda: query_crux_field_data(
+            resolved_client,
+            requested_url=requested_url,
+            form_factor=form_factor,
+            api_key=settings.crux_api_key,
+            coalescer=coalescer,
+        )
+
+    def pagespeed_collector(requested_url: str) -> Callable[[], dict[str, Any]]:
+        def collect() -> dict[str, Any]:
+            with pagespeed_slots:
+                return query_pagespeed_lab_data(
+                    resolved_client,
+                    requested_url=requested_url,
+                    form_factor=form_factor,
+                    api_key=api_key,
+                )
+
+        return collect
+
+    collected: dict[str, list[WebsitePerformanceMeasurement]] = {}
+    lexicons: dict[str, Any] = {}
+    with ThreadPoolExecutor(
+        max_workers=worker_count,
+        thread_name_prefix="website-performance",
+    ) as executor:
+        pending: dict[tuple[str, str], Future[tuple[dict[str, Any], str | None, str | None]]] = {}
+        # Submit the slow lab runs first so they start while CrUX lookups finish.
+        for source, make_collector in (
+            ("pagespeed_lab", pagespeed_collector),
+            ("crux_field", crux_collector),
+        ):
+            for campaign in unique_campaigns:
+                if idempotency_keys[(campaign.id, source)] in existing_by_key:
+                    continue
+                requested_url = requested_urls[campaign.id]
+                pending[(campaign.id, source)] = executor.submit(
+                    _run_collector,
+                    make_collector(requested_url),
+                    requested_url=requested_url,
+                )
+
+        for campaign in unique_campaigns:
+            rows: list[WebsitePerformanceMeasurement] = []
+            for source in ("crux_field", "pagespeed_lab"):
+                idempotency_key = idempotency_keys[(campaign.id, source)]
+                existing = existing_by_key.get(idempotency_key)
+                if existing is not None:
+                    rows.append(existing)
+                    continue
+                result, error_code, error_message = pending[(campaign.id, source)].result()
+                if campaign.tenant_id not in lexicons:
+                    lexicons[campaign.tenant_id] = get_active_lexicon(db, tenant_id=campaign.tenant_id)
+                row = _measurement_row(
+                    db,
+                    campaign=campaign,
+                    lexicon=lexicons[campaign.tenant_id],
+                    source=source,
+                    form_factor=form_factor,
+                    requested_url=requested_urls[campaign.id],
+                    result=result,
+                    error_code=error_code,
+                    error_message=error_message,
+                    idempotency_key=idempotency_key,
+                    measured_at=measured_at,
+                )
+                db.add(row)
+                db.flush()
+                rows.append(row)
+            collected[campaign.id] = rows
+    return collected
+
+
+def _run_collector(
+    collector: Callable[[], dict[str, Any]],
+    *,
+    requested_url: str,
+) -> tuple[dict[str, Any], str | None, str | None]:
+    failed = {
+        "status": "failed",
+        "scope": "url",
+        "measured_url": requested_url,
+        "metrics": {},
+    }
+    try:
+        return collector(), None, None
+    except WebsitePerformanceProviderError as exc:
+        return failed, exc.code, str(exc)
+    except (httpx.HTTPError, ValueError) as exc:
+        return failed, "provider_request_failed", str(exc)
+
+
+def _measurement_row(
+    db: Session,
+    *,
+    campaign: Campaign,
+    lexicon: Any,
+    source: str,
+    form_factor: str,
+    requested_url: str,
+    result: dict[str, Any],
+    error_code: str | None,
+    error_message: str | None,
+    idempotency_key: str,
+    measured_at: datetime,
+) -> WebsitePerformanceMeasurement:
+    metrics = dict(result.get("metrics") or {})
+    assessment = _assessment_for_measurement(
+        db,
+        tenant_id=campaign.tenant_id,
+        form_factor=form_factor,
+        source=source,
+        metrics=metrics,
+        measured_at=measured_at,
+    )
+    diagnostics = dict(result.get("diagnostics") or {})
+    diagnostics["assessment"] = assessment
+    contract_ids = CRUX_CONTRACT_IDS if source == "crux_field" else PAGESPEED_CONTRACT_IDS
+    contract_scope = {
+        "organization_id": campaign.organization_id,
+        "campaign_id": campaign.id,
+        "measured_url": str(result.get("measured_url") or requested_url),
+        "scope": str(result.get("scope") or "url"),
+        "form_factor": form_factor,
+        "collection_start": result.get("collection_start"),
+        "collection_end": result.get("collection_end"),
+        "source_version": result.get("source_version"),
+        "captured_at": measured_at,
+        "run_environment": diagnostics.get("test_environment"),
+        "fallback_to_origin": bool(result.get("fallback_to_origin")),
+    }
+    contract_evidence = metric_contract_service.scope_evidence(
+        contract_ids[0],
+        contract_scope,
+        require_complete=False,
+        db=db,
+    )
+    return WebsitePerformanceMeasurement(
+        tenant_id=campaign.tenant_id,
+        organization_id=campaign.organization_id,
+        business_location_id=campaign.business_location_id,
+        campaign_id=campaign.id,
+        requested_url=requested_url,
+        measured_url=str(result.get("measured_url") or requested_url),
+        source=source,
+        scope=str(result.get("scope") or "url"),
+        form_factor=form_factor,
+        status=str(result.get("status") or "failed"),
+        lcp_ms=metrics.get("lcp_ms"),
+        inp_ms=metrics.get("inp_ms"),
+        cls_value=metrics.get("cls_value"),
+        ttfb_ms=metrics.get("ttfb_ms"),
+        fcp_ms=metrics.get("fcp_ms"),
+        tbt_ms=metrics.get("tbt_ms"),
+        performance_score=metrics.get("performance_score"),
+        collection_start=result.get("collection_start"),
+        collection_end=result.get("collection_end"),
+        source_version=result.get("source_version"),
+        metric_contract_versions=metric_contract_service.contract_versions(
+            contract_ids, db=db
+        ),
+        scope_key=contract_evidence["scope_key"],
+        lexicon_id=lexicon.meta.lexicon_id,
+        lexicon_version=lexicon.meta.version,
+        fallback_to_origin=bool(result.get("fallback_to_origin")),
+        distribution=dict(result.get("distribution") or {}),
+        diagnostics=diagnostics,
+        error_code=error_code,
+        error_message=error_message,
+        idempotency_key=idempotency_key,
+        captured_at=measured_at,
+    )
 
 
 def serialize_measurement(row: WebsitePerformanceMeasurement) -> dict[str, Any]:
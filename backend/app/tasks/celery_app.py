@@ -3,23 +3,41 @@ from __future__ import annotations
 import os
 import threading
 import time
+from contextvars import Token
 
 from celery import Celery
 from celery.app.task import Task
 from celery.schedules import crontab
-from celery.signals import beat_init, heartbeat_sent, task_postrun, task_prerun, worker_ready
+from celery.signals import (
+    beat_init,
+    heartbeat_sent,
+    task_postrun,
+    task_prerun,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 from kombu import Queue
 
 from app.core.config import get_settings
 from app.core.metrics import celery_task_duration_seconds, tasks_in_progress
+from app.db.query_budget import (
+    QueryBudgetScope,
+    begin_query_budget_scope,
+    end_query_budget_scope,
+    query_budget_enabled,
+)
 from app.db.redis_client import get_redis_client
+from app.governance.replay.shadow_runner import shutdown_shadow_replay_pool
 from app.governance.startup_invariants import run_startup_invariants
 from app.infra.contracts import SCHEDULER_HEARTBEAT_KEY, WORKER_HEARTBEAT_KEY
+from app.providers.http_clients import close_http_clients
 from app.services.queue_admission_service import admit_enqueue
 
 _scheduler_heartbeat_started = False
 _task_start_lock = threading.Lock()
 _task_started_at: dict[str, float] = {}
+_task_query_budgets: dict[str, Token[QueryBudgetScope | None]] = {}
 _RETRY_SCHEDULE_SECONDS = (5, 15, 60, 300, 900)
 
 
@@ -75,6 +93,18 @@ def _worker_heartbeat_sent(**_kwargs) -> None:
     _publish_heartbeat(WORKER_HEARTBEAT_KEY)
 
 
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_http_clients(**_kwargs) -> None:
+    close_http_clients()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_shadow_replay_pool(**_kwargs) -> None:
+    shutdown_shadow_replay_pool()
+
+
 @beat_init.connect
 def _scheduler_heartbeat_loop(**_kwargs) -> None:
     global _scheduler_heartbeat_started
@@ -100,6 +130,13 @@ def _record_task_start(task_id=None, **_kwargs) -> None:
     queue_name = _queue_for_task_name(task_name)
     with _task_start_lock:
         _task_started_at[task_id] = time.perf_counter()
+        if query_budget_enabled():
+            # Signal handlers cannot fail a task, so task budgets only log.
+            _task_query_budgets[task_id] = begin_query_budget_scope(
+                'task',
+                task_name or 'unknown',
+                action='log',
+            )
     tasks_in_progress.labels(queue_name=queue_name).inc()
 
 
@@ -109,6 +146,9 @@ def _record_task_duration(task_id=None, task=None, **_kwargs) -> None:
         return
     with _task_start_lock:
         started_at = _task_started_at.pop(task_id, None)
+        query_budget = _task_query_budgets.pop(task_id, None)
+    if query_budget is not None:
+        end_query_budget_scope(query_budget)
     if started_at is None:
         return
     duration_seconds = time.perf_counter() - started_at
@@ -200,6 +240,14 @@ def create_celery_app() -> Celery:
             'task': 'analytics.rollup_daily',
             'schedule': crontab(minute=15, hour=1),
         },
+        'fleet-job-counter-reconciliation': {
+            'task': 'fleet.reconcile_job_counters',
+            'schedule': crontab(minute='*/15'),
+        },
+        'cost-exposure-counter-reconciliation': {
+            'task': 'cost.reconcile_exposure_counters',
+            'schedule': crontab(minute='7,37'),
+        },
         'migration-upload-retention-nightly': {
             'task': 'migration.purge_expired_uploads',
             'schedule': crontab(minute=45, hour=1),
@@ -4,6 +4,7 @@ import logging
 import time
 
 from app.db.session import SessionLocal
+from app.events.queue import enqueue_event, finish_worker_job, start_worker_job
 from app.intelligence.cohort_pattern_engine import discover_cohort_patterns as discover_learning_cohort_patterns
 from app.intelligence.digital_twin.models.training_pipeline import train_prediction_models
 from app.intelligence.intelligence_metrics_aggregator import compute_system_metrics
@@ -66,7 +67,22 @@ def train_digital_twin_models_task() -> dict:
 
 
 @celery_app.task(name='intelligence.run_worker')
-def run_intelligence_worker_task(worker_name: str, payload: dict) -> dict:
+def run_intelligence_worker_task(worker_name: str, payload: dict, lease_id: str | None = None) -> dict:
+    if lease_id is not None:
+        start_worker_job(worker_name, lease_id)
+    try:
+        return _run_worker_with_retries(worker_name, payload)
+    finally:
+        if lease_id is not None:
+            finish_worker_job(worker_name, lease_id)
+
+
+@celery_app.task(name='intelligence.redispatch_worker_event')
+def redispatch_worker_event_task(event_type: str, payload: dict, attempt: int) -> dict:
+    return enqueue_event(event_type, payload, attempt=attempt)
+
+
+def _run_worker_with_retries(worker_name: str, payload: dict) -> dict:
     last_error: Exception | None = None
     for attempt, delay in enumerate((0.0, *_WORKER_RETRY_BACKOFF_SECONDS), start=1):
         if delay:
@@ -19,6 +19,7 @@ from app.services import (
     authority_service,
     competitor_service,
     content_service,
+    cost_economics_service,
     crawl_metrics,
     crawl_service,
     data_governance_service,
@@ -578,7 +579,10 @@ def crawl_fetch_batch(self, crawl_run_id: str, batch_urls: list[str] | None = No
                 _finish_task_execution(db, execution, "failed", result)
                 return result
             if batch_urls is None and result.get("status") == "running" and int(result.get("pending_urls", 0)) > 0:
-                crawl_fetch_batch.delay(crawl_run_id=crawl_run_id, batch_size=batch_size)
+                crawl_fetch_batch.apply_async(
+                    kwargs={"crawl_run_id": crawl_run_id, "batch_size": batch_size},
+                    countdown=result.get("next_batch_delay_seconds") or None,
+                )
             _finish_task_execution(db, execution, "success", result)
             return result
     except EntitlementNotFoundError as exc:
@@ -1503,6 +1507,30 @@ def entity_analyze_campaign(self, tenant_id: str, campaign_id: str) -> dict:
 @celery_app.task(name="fleet.process_fleet_job_item_task")
 def process_fleet_job_item_task(fleet_job_item_id: str):
     return fleet_service.process_fleet_job_item_with_new_session(fleet_job_item_id)
+
+
+@celery_app.task(name="fleet.reconcile_job_counters")
+def fleet_reconcile_job_counters() -> dict:
+    db = SessionLocal()
+    try:
+        return fleet_service.reconcile_fleet_job_counters(db=db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="cost.reconcile_exposure_counters")
+def cost_reconcile_exposure_counters() -> dict:
+    db = SessionLocal()
+    try:
+        return cost_economics_service.reconcile_cost_exposure_counters(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
     
 
 @celery_app.task(name="strategy.run_automation_for_all_campaigns", bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={"max_retries": 2})
@@ -142,6 +142,9 @@ from app.models.wordpress_content_inventory import (  # noqa: F401
 from app.models.wordpress_change_preview import WordPressChangePreview  # noqa: F401
 from app.models.wordpress_automation_policy import WordPressAutomationPolicy  # noqa: F401
 from app.intelligence.knowledge_graph.update_engine import reset_graph_write_batcher
+from app.services.cost_economics_service import invalidate_price_card_cache
+from app.services.crawl_robots import clear_robots_cache
+from app.services.provider_credentials_service import invalidate_provider_credential_cache
 from tests.fixtures.intelligence_graph_factory import create_intelligence_graph
 from tests.helpers.economic_setup import ensure_test_tier_profile, provision_test_organization
 
@@ -487,6 +490,9 @@ def db_session(apply_migrations: dict[str, object]) -> Generator[Session, None,
     test_session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False)
     test_session = test_session_local()
     reset_graph_write_batcher()
+    invalidate_price_card_cache()
+    invalidate_provider_credential_cache()
+    clear_robots_cache()
 
     activation = test_session.get(
         CommercialFeatureActivation,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.organization import Organization
+from app.services import cost_economics_service
+from app.services.cost_economics_service import (
+    reconcile_cost_exposure_counters,
+    reserve_provider_cost,
+)
+from tests.integration.test_active_location_allowance_concurrency import _seed_price_card
+
+
+pytestmark = pytest.mark.postgres_required
+
+
+def _reserve(session, organization_id: str, key: str):
+    return reserve_provider_cost(
+        session,
+        organization_id=organization_id,
+        provider_name="dataforseo",
+        capability="rank_tracking",
+        operation="google_organic_live_advanced",
+        credential_owner="platform",
+        quantity=10,
+        idempotency_key=key,
+    )
+
+
+def test_reconcile_waits_for_an_in_flight_reservation_before_summing(
+    apply_migrations,
+    db_session,
+    monkeypatch,
+) -> None:
+    organization = db_session.query(Organization).order_by(Organization.id).first()
+    assert organization is not None
+    organization_id = organization.id
+    _seed_price_card(
+        db_session,
+        capability="rank_tracking",
+        operation="google_organic_live_advanced",
+        version="pg-exposure-reconcile-v1",
+        unit="serp_page",
+        unit_cost="0.002",
+    )
+    # The first reservation creates the period's counter row.
+    _reserve(db_session, organization_id, "pg:exposure-reconcile:first")
+    db_session.commit()
+
+    reservation_locked = threading.Event()
+    release_reservation = threading.Event()
+    reconcile_summing = threading.Event()
+    original_locked_exposure = cost_economics_service._locked_exposure
+    original_ledger_totals = cost_economics_service._ledger_exposure_totals
+
+    def holding_locked_exposure(*args, **kwargs):
+        exposure = original_locked_exposure(*args, **kwargs)
+        if threading.current_thread().name == "exposure-reservation":
+            reservation_locked.set()
+            if not release_reservation.wait(timeout=5):
+                raise AssertionError("Timed out while holding the exposure counter")
+        return exposure
+
+    def observed_ledger_totals(*args, **kwargs):
+        if threading.current_thread().name == "exposure-reconcile":
+            reconcile_summing.set()
+        return original_ledger_totals(*args, **kwargs)
+
+    monkeypatch.setattr(cost_economics_service, "_locked_exposure", holding_locked_exposure)
+    monkeypatch.setattr(cost_economics_service, "_ledger_exposure_totals", observed_ledger_totals)
+
+    engine = create_engine(str(apply_migrations["database_url"]), pool_pre_ping=True)
+    session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    errors: dict[str, BaseException] = {}
+
+    def reserve() -> None:
+        session = session_local()
+        try:
+            _reserve(session, organization_id, "pg:exposure-reconcile:second")
+        except BaseException as exc:  # pragma: no cover - asserted in the parent thread
+            session.rollback()
+            errors["reservation"] = exc
+        finally:
+            session.close()
+
+    def reconcile() -> None:
+        session = session_local()
+        try:
+            reconcile_cost_exposure_counters(session)
+        except BaseException as exc:  # pragma: no cover - asserted in the parent thread
+            session.rollback()
+            errors["reconcile"] = exc
+        finally:
+            session.close()
+
+    reservation_thread = threading.Thread(target=reserve, name="exposure-reservation", daemon=True)
+    reconcile_thread = threading.Thread(target=reconcile, name="exposure-reconcile", daemon=True)
+    reservation_thread.start()
+    try:
+        assert reservation_locked.wait(timeout=5), "Reservation never locked its exposure counter"
+        reconcile_thread.start()
+        assert not reconcile_summing.wait(timeout=0.5), (
+            "Reconcile summed the ledger without waiting for the counter lock"
+        )
+    finally:
+        release_reservation.set()
+        reservation_thread.join(timeout=5)
+        if reconcile_thread.ident is not None:
+            reconcile_thread.join(timeout=5)
+        engine.dispose()
+
+    assert not reservation_thread.is_alive()
+    assert not reconcile_thread.is_alive()
+    assert errors == {}
+    assert reconcile_summing.is_set()
+
+    db_session.expire_all()
+    # The counter still includes the reservation that committed while reconcile waited.
+    assert reconcile_cost_exposure_counters(db_session, repair=False)["counters_drifted"] == 0
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.fleet_job import FleetJob
+from app.services import fleet_service
+from tests.test_fleet_job_counters import _items, _schedule_job
+
+
+pytestmark = pytest.mark.postgres_required
+
+
+def test_counter_reconcile_waits_for_an_in_flight_item_transition(
+    apply_migrations,
+    client,
+    db_session,
+    monkeypatch,
+) -> None:
+    job = _schedule_job(client, db_session, item_keys=["held"], idempotency_key="pg-counter-race")
+    item_id = _items(db_session, job)[0].id
+    job_id = job.id
+    db_session.commit()
+
+    transition_locked = threading.Event()
+    release_transition = threading.Event()
+    reconcile_counting = threading.Event()
+    original_shift = fleet_service._shift_job_counters
+    original_count = fleet_service._count_job_items
+
+    def holding_shift(**kwargs):
+        original_shift(**kwargs)
+        if threading.current_thread().name == "fleet-transition" and not transition_locked.is_set():
+            transition_locked.set()
+            if not release_transition.wait(timeout=5):
+                raise AssertionError("Timed out while holding the fleet job row")
+
+    def observed_count(**kwargs):
+        if threading.current_thread().name == "fleet-reconcile":
+            reconcile_counting.set()
+        return original_count(**kwargs)
+
+    monkeypatch.setattr(fleet_service, "_shift_job_counters", holding_shift)
+    monkeypatch.setattr(fleet_service, "_count_job_items", observed_count)
+
+    engine = create_engine(str(apply_migrations["database_url"]), pool_pre_ping=True)
+    session_local = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    errors: dict[str, BaseException] = {}
+
+    def process(session) -> None:
+        fleet_service.process_fleet_job_item(db=session, fleet_job_item_id=item_id)
+
+    def reconcile(session) -> None:
+        fleet_service.reconcile_fleet_job_counters(db=session)
+
+    def run(name: str, call) -> None:
+        session = session_local()
+        try:
+            call(session)
+        except BaseException as exc:  # pragma: no cover - asserted in the parent thread
+            session.rollback()
+            errors[name] = exc
+        finally:
+            session.close()
+
+    transition_thread = threading.Thread(
+        target=run,
+        args=("transition", process),
+        name="fleet-transition",
+        daemon=True,
+    )
+    reconcile_thread = threading.Thread(
+        target=run,
+        args=("reconcile", reconcile),
+        name="fleet-reconcile",
+        daemon=True,
+    )
+    transition_thread.start()
+    try:
+        assert transition_locked.wait(timeout=5), "Item transition never shifted the job counters"
+        reconcile_thread.start()
+        assert not reconcile_counting.wait(timeout=0.5), (
+            "Reconcile counted the items without waiting for the job row lock"
+        )
+    finally:
+        release_transition.set()
+        transition_thread.join(timeout=5)
+        if reconcile_thread.ident is not None:
+            reconcile_thread.join(timeout=5)
+        engine.dispose()
+
+    assert not transition_thread.is_alive()
+    assert not reconcile_thread.is_alive()
+    assert errors == {}
+    assert reconcile_counting.is_set()
+
+    db_session.expire_all()
+    job = db_session.get(FleetJob, job_id)
+    assert (job.queued_items, job.running_items, job.succeeded_items) == (0, 0, 1)
+    assert fleet_service.reconcile_fleet_job_counters(db=db_session)["jobs_corrected"] == 0
@@ -41,13 +41,15 @@ def test_queue_backpressure_rejects_spikes(monkeypatch) -> None:
         'get_settings',
         lambda: SimpleNamespace(app_env='test', max_queue_depth=1, max_worker_inflight=1),
     )
-    monkeypatch.setattr(worker_queue, '_RETRY_BACKOFF_SECONDS', (0.0,))
-    worker_queue._QUEUE_DEPTH['experiment'] = 1
+    worker_queue._local_store.acquire(
+        'experiment', 'held-lease', lease_seconds=60, max_queue_depth=1, max_worker_inflight=1
+    )
 
     result = worker_queue.dispatch_worker_job('experiment', {'event_id': 'evt-1'})
 
     assert result['status'] == 'failed'
     assert result['error'] == 'backpressure_limit_exceeded'
+    assert result['retry_after_seconds'] > 0
 
 
 def test_campaign_execution_lock_defers_duplicate_cycles() -> None:
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import random
+import re
+from time import perf_counter
+
+from app.services.crawl_robots import parse_robots_txt
+
+URLS = 100_000
+
+_SECTIONS = ["blog", "products", "category", "search", "account", "cart", "static", "media", "help", "about"]
+
+
+def _robots_txt() -> str:
+    lines = ["User-agent: *", "Crawl-delay: 1"]
+    for index, section in enumerate(_SECTIONS):
+        lines.append(f"Disallow: /{section}/private-{index}/")
+        lines.append(f"Allow: /{section}/private-{index}/public")
+        lines.append(f"Disallow: /{section}/*?sort=")
+        lines.append(f"Disallow: /{section}/*.pdf$")
+    lines.extend(["Disallow: /*?session=", "Disallow: /*&utm_", "Disallow: /tmp", "Allow: /tmp/shared$"])
+    return "\n".join(lines)
+
+
+def _paths() -> list[str]:
+    rng = random.Random(9309)
+    paths: list[str] = []
+    for index in range(URLS):
+        section = rng.choice(_SECTIONS)
+        slug = f"item-{index}"
+        shape = rng.random()
+        if shape < 0.2:
+            paths.append(f"/{section}/private-{_SECTIONS.index(section)}/{slug}")
+        elif shape < 0.3:
+            paths.append(f"/{section}/{slug}?sort=price")
+        elif shape < 0.4:
+            paths.append(f"/{section}/{slug}.pdf")
+        elif shape < 0.5:
+            paths.append(f"/{section}/{slug}?session={index}")
+        else:
+            paths.append(f"/{section}/{slug}")
+    return paths
+
+
+def _uncompiled_allows(rules: list[tuple[bool, str]], path: str) -> bool:
+    # Per-URL regex evaluation of every rule, as a matcher without a compile
+    # step would do it.
+    best: tuple[int, bool] | None = None
+    for allow, pattern in rules:
+        anchored = pattern.endswith("$")
+        body = pattern[:-1] if anchored else pattern
+        expression = ".*".join(re.escape(part) for part in body.split("*")) + ("$" if anchored else "")
+        if re.compile(expression).match(path) and (best is None or (len(pattern), allow) > best):
+            best = (len(pattern), allow)
+    return True if best is None else best[1]
+
+
+def test_compiled_robots_policy_evaluates_100k_urls(monkeypatch) -> None:
+    robots_txt = _robots_txt()
+    paths = _paths()
+    rules = [
+        (line.startswith("Allow"), line.split(":", 1)[1].strip())
+        for line in robots_txt.splitlines()
+        if line.startswith(("Allow", "Disallow"))
+    ]
+
+    compilations = 0
+    compile_pattern = re.compile
+
+    def counted_compile(*args, **kwargs) -> re.Pattern[str]:
+        nonlocal compilations
+        compilations += 1
+        return compile_pattern(*args, **kwargs)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(re, "compile", counted_compile)
+        started_at = perf_counter()
+        policy = parse_robots_txt(robots_txt).policy_for("lsosbot")
+        compiled_decisions = [policy.allows(path) for path in paths]
+        compiled_seconds = perf_counter() - started_at
+
+    started_at = perf_counter()
+    uncompiled_decisions = [_uncompiled_allows(rules, path) for path in paths[:10_000]]
+    uncompiled_seconds = (perf_counter() - started_at) * (URLS / 10_000)
+
+    print(
+        {
+            "urls": URLS,
+            "rules": len(rules),
+            "regex_compilations": compilations,
+            "uncompiled_regex_compilations": len(rules) * URLS,
+            "compiled_seconds": round(compiled_seconds, 3),
+            "uncompiled_seconds_estimated": round(uncompiled_seconds, 3),
+            "blocked": compiled_decisions.count(False),
+        }
+    )
+
+    assert compiled_decisions[:10_000] == uncompiled_decisions
+    assert 0 < compiled_decisions.count(False) < URLS
+    # Each rule compiles once when the file is parsed, never per evaluated URL.
+    assert compilations <= len(rules)
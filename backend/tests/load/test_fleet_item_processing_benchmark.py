@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+from app.models.fleet_job_item import FleetJobItem
+from app.models.portfolio import Portfolio
+from app.services import fleet_service
+
+SAMPLED_ITEMS = 50
+
+
+def _job(db_session, organization_id: str, item_count: int):
+    portfolio = Portfolio(organization_id=organization_id, name=f"Fleet {item_count}", code=f"fleet-{item_count}")
+    db_session.add(portfolio)
+    db_session.commit()
+    job, _created = fleet_service.create_schedule_job(
+        db=db_session,
+        organization_id=organization_id,
+        portfolio_id=portfolio.id,
+        user_id=None,
+        idempotency_key=f"benchmark-{item_count}",
+        item_seeds=[{"item_key": f"location:{index}", "payload": {"index": index}} for index in range(item_count)],
+    )
+    return job
+
+
+def _seconds_per_item(db_session, job) -> float:
+    item_ids = [
+        row[0]
+        for row in db_session.query(FleetJobItem.id)
+        .filter(FleetJobItem.fleet_job_id == job.id)
+        .order_by(FleetJobItem.item_key.desc())
+        .limit(SAMPLED_ITEMS)
+        .all()
+    ]
+    started_at = perf_counter()
+    for item_id in item_ids:
+        fleet_service.process_fleet_job_item(db=db_session, fleet_job_item_id=item_id)
+    return (perf_counter() - started_at) / len(item_ids)
+
+
+def test_fleet_item_processing_time_stays_flat_as_job_grows(db_session, create_test_org) -> None:
+    organization = create_test_org(name="Fleet Benchmark Org")
+    small = _seconds_per_item(db_session, _job(db_session, organization.id, 100))
+    large = _seconds_per_item(db_session, _job(db_session, organization.id, 10_000))
+
+    print(
+        {
+            "items_sampled": SAMPLED_ITEMS,
+            "ms_per_item_100": round(small * 1000, 3),
+            "ms_per_item_10000": round(large * 1000, 3),
+        }
+    )
+    # Recounting every item on each transition made this ratio grow with the job size.
+    assert large < small * 2
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import datetime
+import ipaddress
+import ssl
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+
+import httpx
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from prometheus_client import REGISTRY
+
+from app.providers import http_clients
+
+REQUESTS = 200
+PROVIDER = "tls_benchmark"
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b'{"position": 3}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:  # noqa: ANN002
+        return
+
+
+def _write_self_signed_certificate(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+@pytest.fixture
+def tls_server(tmp_path, monkeypatch) -> Iterator[str]:
+    cert_path, key_path = _write_self_signed_certificate(tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("SSL_CERT_FILE", str(cert_path))
+    http_clients.close_http_clients()
+    try:
+        yield f"https://localhost:{server.server_port}/rank"
+    finally:
+        http_clients.close_http_clients()
+        server.shutdown()
+        server.server_close()
+
+
+def _measure(fetch) -> dict[str, float]:  # noqa: ANN001
+    latencies: list[float] = []
+    for _ in range(REQUESTS):
+        started_at = perf_counter()
+        assert fetch().json() == {"position": 3}
+        latencies.append(perf_counter() - started_at)
+    latencies.sort()
+    return {
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 3),
+        "total_ms": round(sum(latencies) * 1000, 1),
+    }
+
+
+def _per_call_client_get(url: str) -> httpx.Response:
+    with httpx.Client() as client:
+        return client.get(url)
+
+
+def test_pooled_client_against_per_call_client_over_tls(tls_server) -> None:
+    reused_before = REGISTRY.get_sample_value(
+        "http_client_requests_total", {"provider": PROVIDER, "connection": "reused"}
+    ) or 0.0
+
+    per_call = _measure(lambda: _per_call_client_get(tls_server))
+    pooled = _measure(lambda: http_clients.get_http_client(PROVIDER).get(tls_server))
+    reused = (
+        REGISTRY.get_sample_value("http_client_requests_total", {"provider": PROVIDER, "connection": "reused"})
+        - reused_before
+    )
+    print({"requests": REQUESTS, "per_call": per_call, "pooled": pooled, "reused_connections": reused})
+
+    assert reused == REQUESTS - 1
+    assert pooled["p50_ms"] * 3 < per_call["p50_ms"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+
+from app.services import keyword_research_service
+
+SERVICES = ("Drain Cleaning", "Water Heater Repair", "Leak Detection", "Sewer Line Repair", "Emergency Plumbing")
+AREAS = ("Reno", "Sparks", "Carson City", "Fernley", "Truckee")
+
+
+def _pages(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "url": f"https://site.example/guides/topic{index}",
+            "title": f"Topic{index} checklist for {AREAS[index % len(AREAS)]} homeowners",
+            "meta_description": f"What to know about topic{index} before calling a plumber.",
+            "heading_text": f"{SERVICES[index % len(SERVICES)]} guide" if index % 50 == 0 else f"Topic{index} guide",
+        }
+        for index in range(count)
+    ]
+
+
+def _items(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            "keyword": f"topic{index * 7} {SERVICES[index % len(SERVICES)].casefold()} cost",
+            "relevance_status": "relevant",
+            "matched_service_name": SERVICES[index % len(SERVICES)],
+            "matched_service_area_name": AREAS[index % len(AREAS)],
+            "evidence": {},
+        }
+        for index in range(count)
+    ]
+
+
+def _score_every_page(item: dict[str, object], pages: list[dict[str, str]]) -> str | None:
+    tokens = keyword_research_service._meaningful_tokens
+    service_name = str(item["matched_service_name"])
+    area_name = str(item["matched_service_area_name"])
+    best_url, best_score = None, 0
+    for page in pages:
+        page_text = " ".join(str(page.get(field) or "") for field in ("url", "title", "meta_description", "heading_text")).casefold()
+        page_tokens = tokens(page_text)
+        score = 8 if service_name.casefold() in page_text else min(6, len(tokens(service_name) & page_tokens) * 2)
+        score += 3 if area_name.casefold() in page_text else min(2, len(tokens(area_name) & page_tokens))
+        score += min(6, len(tokens(str(item["keyword"])) & page_tokens) * 2)
+        if score > best_score:
+            best_url, best_score = page["url"], score
+    return best_url if best_score >= 6 else None
+
+
+@pytest.mark.parametrize("page_count", [1_000, 10_000])
+def test_target_page_index_benchmark_against_scoring_every_page(page_count: int) -> None:
+    pages = _pages(page_count)
+    items = _items(5_000)
+
+    started_at = perf_counter()
+    index = keyword_research_service._TargetPageIndex(pages)
+    indexed = [keyword_research_service._target_page_for_item(item, target_pages=index)["url"] for item in items]
+    indexed_seconds = perf_counter() - started_at
+
+    sample = items[:50]
+    started_at = perf_counter()
+    exhaustive = [_score_every_page(item, pages) for item in sample]
+    exhaustive_seconds_per_keyword = (perf_counter() - started_at) / len(sample)
+
+    indexed_seconds_per_keyword = indexed_seconds / len(items)
+    print(
+        {
+            "pages": page_count,
+            "keywords": len(items),
+            "indexed_seconds": round(indexed_seconds, 3),
+            "indexed_ms_per_keyword": round(indexed_seconds_per_keyword * 1000, 4),
+            "exhaustive_ms_per_keyword": round(exhaustive_seconds_per_keyword * 1000, 4),
+            "projected_exhaustive_seconds": round(exhaustive_seconds_per_keyword * len(items), 1),
+        }
+    )
+    assert indexed[: len(sample)] == exhaustive
+    assert indexed_seconds_per_keyword * 20 < exhaustive_seconds_per_keyword
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import random
+from time import perf_counter
+
+from app.services import crawl_parser
+
+PAGE_COUNT = 100_000
+FAMILY_COUNT = 2_000
+FAMILY_SIZE = 5
+
+
+def _signature(values: list[int]) -> str:
+    return b"".join(value.to_bytes(4, "big") for value in values).hex()
+
+
+def _corpus(rng: random.Random) -> tuple[list[str], list[int | None]]:
+    signatures: list[str] = []
+    labels: list[int | None] = []
+    for family in range(FAMILY_COUNT):
+        base = [rng.getrandbits(32) for _ in range(crawl_parser.MINHASH_PERMUTATIONS)]
+        for _ in range(FAMILY_SIZE):
+            # Templated copies agree on roughly nine of every ten minimum hashes.
+            variant = [value if rng.random() < 0.9 else rng.getrandbits(32) for value in base]
+            signatures.append(_signature(variant))
+            labels.append(family)
+    while len(signatures) < PAGE_COUNT:
+        signatures.append(_signature([rng.getrandbits(32) for _ in range(crawl_parser.MINHASH_PERMUTATIONS)]))
+        labels.append(None)
+    return signatures, labels
+
+
+def test_near_duplicate_clustering_benchmark_at_100k_pages(monkeypatch) -> None:
+    signatures, labels = _corpus(random.Random(20260823))
+    comparisons = 0
+    shared_minhashes = crawl_parser._shared_minhashes
+
+    def counted_shared_minhashes(left: tuple[int, ...], right: tuple[int, ...]) -> int:
+        nonlocal comparisons
+        comparisons += 1
+        return shared_minhashes(left, right)
+
+    monkeypatch.setattr(crawl_parser, "_shared_minhashes", counted_shared_minhashes)
+
+    started_at = perf_counter()
+    clusters = crawl_parser.near_duplicate_clusters(signatures)
+    elapsed = perf_counter() - started_at
+
+    found = {index: cluster_id for cluster_id, cluster in enumerate(clusters) for index in cluster}
+    false_positives = sum(1 for cluster in clusters for index in cluster if labels[index] is None)
+    # Clusters are built around each family's first page, so a family counts as
+    # recovered when every copy that reaches the threshold against it shares its cluster.
+    recalled = sum(
+        1
+        for family in range(FAMILY_COUNT)
+        if family * FAMILY_SIZE in found
+        and all(
+            found.get(family * FAMILY_SIZE + offset) == found[family * FAMILY_SIZE]
+            for offset in range(1, FAMILY_SIZE)
+            if crawl_parser.minhash_similarity(
+                signatures[family * FAMILY_SIZE],
+                signatures[family * FAMILY_SIZE + offset],
+            )
+            >= crawl_parser.NEAR_DUPLICATE_MIN_SIMILARITY
+        )
+    )
+    print(
+        {
+            "pages": PAGE_COUNT,
+            "clusters": len(clusters),
+            "seconds": round(elapsed, 3),
+            "signature_comparisons": comparisons,
+            "families_recovered": recalled,
+            "false_positive_pages": false_positives,
+        }
+    )
+    assert false_positives == 0
+    assert recalled >= FAMILY_COUNT * 0.99
+    # Bucketed candidates keep comparisons proportional to the template families,
+    # never pairwise across the crawl.
+    assert comparisons <= FAMILY_COUNT * FAMILY_SIZE * crawl_parser.MINHASH_BANDS
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import event
+
+from app.models.business_location import BusinessLocation
+from app.models.data_connection import DataConnection
+from app.models.reputation import ReputationReview
+from app.services import reputation_inventory_service
+from tests.conftest import create_test_campaign
+
+REVIEW_COUNT = 10_000
+NEW_REVIEWS_PER_SYNC = 10
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _review(index: int, *, updated_at: datetime) -> dict[str, object]:
+    return {
+        "source_key": "google_business_profile",
+        "source_name": "Google Business Profile",
+        "source_type": "owned_profile",
+        "provider_name": "google",
+        "external_review_id": f"review-{index}",
+        "external_resource_name": f"accounts/1/locations/2/reviews/review-{index}",
+        "rating": float(1 + index % 5),
+        "body": f"Review body {index}",
+        "author_name": f"Customer {index}",
+        "author_is_anonymous": False,
+        "response_status": "unanswered",
+        "reviewed_at": updated_at,
+        "provider_updated_at": updated_at,
+    }
+
+
+class _FakeReviewsProvider:
+    """Local stand-in for the Business Profile reviews API, newest update first."""
+
+    def __init__(self, reviews: list[dict[str, object]]) -> None:
+        self.reviews = reviews
+        self.requests = 0
+
+    def __call__(self, **_kwargs) -> _FakeReviewsProvider:
+        return self
+
+    def list_reviews(self, *, parent, page_size, page_token=None):
+        self.requests += 1
+        ordered = sorted(self.reviews, key=lambda item: item["provider_updated_at"], reverse=True)
+        offset = int(page_token or 0)
+        return {
+            "items": ordered[offset : offset + page_size],
+            "average_rating": 3.0,
+            "total_review_count": len(ordered),
+            "next_page_token": str(offset + page_size) if offset + page_size < len(ordered) else None,
+        }
+
+
+def test_incremental_owned_review_sync_against_full_history_download(
+    db_session,
+    create_test_org,
+    monkeypatch,
+) -> None:
+    organization = create_test_org(name="Review sync org")
+    campaign = create_test_campaign(db_session, organization.id, name="Review sync campaign")
+    location = BusinessLocation(
+        organization_id=organization.id,
+        name="Review sync location",
+        status="active",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+    db_session.add(location)
+    db_session.flush()
+    campaign.business_location_id = location.id
+    connection = DataConnection(
+        tenant_id=campaign.tenant_id,
+        organization_id=organization.id,
+        business_location_id=location.id,
+        campaign_id=campaign.id,
+        provider_name="google_business_profile",
+        external_resource_id="locations/2",
+        resource_scope="owned_business_profile",
+        status="connected",
+        sync_cursor={},
+        connection_metadata={"account_id": "accounts/1"},
+    )
+    db_session.add(connection)
+    db_session.commit()
+
+    provider = _FakeReviewsProvider(
+        [_review(index, updated_at=BASE_TIME + timedelta(minutes=index)) for index in range(REVIEW_COUNT)]
+    )
+    monkeypatch.setattr(reputation_inventory_service, "GoogleBusinessProfileReviewsProvider", provider)
+    monkeypatch.setattr(
+        reputation_inventory_service,
+        "_google_access_token",
+        lambda _db, _organization_id: "access-token",
+    )
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        started_at = perf_counter()
+        full = reputation_inventory_service.sync_owned_profile_reviews(db_session, connection=connection)
+        full_seconds = perf_counter() - started_at
+        full_requests, full_statements = provider.requests, len(statements)
+
+        newest = BASE_TIME + timedelta(minutes=REVIEW_COUNT)
+        provider.reviews.extend(
+            _review(REVIEW_COUNT + index, updated_at=newest + timedelta(minutes=index))
+            for index in range(NEW_REVIEWS_PER_SYNC)
+        )
+        provider.requests = 0
+        statements.clear()
+        started_at = perf_counter()
+        incremental = reputation_inventory_service.sync_owned_profile_reviews(db_session, connection=connection)
+        incremental_seconds = perf_counter() - started_at
+        incremental_requests, incremental_statements = provider.requests, len(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    print(
+        {
+            "reviews": REVIEW_COUNT,
+            "full_requests": full_requests,
+            "full_statements": full_statements,
+            "full_seconds": round(full_seconds, 3),
+            "incremental_requests": incremental_requests,
+            "incremental_statements": incremental_statements,
+            "incremental_seconds": round(incremental_seconds, 3),
+            # The per-row path issued a review lookup, an observation lookup and an
+            # event lookup for every review, on every sync.
+            "per_row_statement_floor": 3 * REVIEW_COUNT,
+        }
+    )
+    assert full["mode"] == "full" and full["reviews_saved"] == REVIEW_COUNT
+    assert incremental["mode"] == "incremental"
+    assert incremental["reviews_saved"] == NEW_REVIEWS_PER_SYNC + 1
+    assert db_session.query(ReputationReview).count() == REVIEW_COUNT + NEW_REVIEWS_PER_SYNC
+    assert incremental_requests == 1
+    # Each new owned review still emits its own saved event on the first full pass.
+    assert full_statements < 1.1 * REVIEW_COUNT
+    assert incremental_statements * 50 < full_statements
@@ -98,16 +98,19 @@ def _measure_queue_peak_depth(monkeypatch, campaign_count: int) -> int:
     peak_depth = 0
     original_sync = worker_queue._sync_metrics
 
-    def tracked_sync() -> None:
+    def tracked_sync(*args) -> None:  # noqa: ANN002
         nonlocal peak_depth
         stats = worker_queue.queue_stats()['queue_depth']
         peak_depth = max(peak_depth, max(stats.values(), default=0))
-        original_sync()
+        original_sync(*args)
 
     monkeypatch.setattr(worker_queue, 'get_settings', lambda: SimpleNamespace(app_env='test', max_queue_depth=10000, max_worker_inflight=2000))
-    monkeypatch.setattr(worker_queue, '_RETRY_BACKOFF_SECONDS', (0.0,))
     monkeypatch.setattr(worker_queue, '_sync_metrics', tracked_sync)
-    monkeypatch.setattr(worker_queue, '_run_inline', lambda worker_name, payload: _sleep_then_return(worker_name, payload))
+    monkeypatch.setattr(
+        worker_queue,
+        '_run_inline',
+        lambda worker_name, payload, lease_id: _sleep_then_return(worker_name, payload, lease_id),
+    )
 
     with ThreadPoolExecutor(max_workers=min(64, campaign_count)) as executor:
         futures = [
@@ -120,8 +123,9 @@ def _measure_queue_peak_depth(monkeypatch, campaign_count: int) -> int:
     return peak_depth
 
 
-def _sleep_then_return(worker_name: str, payload: dict[str, object]) -> dict[str, object]:
+def _sleep_then_return(worker_name: str, payload: dict[str, object], lease_id: str) -> dict[str, object]:
     sleep(0.002)
+    worker_queue.finish_worker_job(worker_name, lease_id)
     return {'worker': worker_name, 'payload': payload}
 
 
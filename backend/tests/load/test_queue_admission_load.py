@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import uuid
+from time import perf_counter
+
+import pytest
+import redis
+
+from app.services.queue_controls.shared_admission import RedisAdmissionStore
+
+PROCESS_COUNT = 4
+RUN_SECONDS = 3.0
+CAPACITY = 50
+REFILL_PER_SECOND = 20.0
+
+
+def _redis_url() -> str:
+    return os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def _hammer(args: tuple[str, str, float]) -> tuple[int, int, list[float]]:
+    redis_url, key_prefix, deadline_offset = args
+    store = RedisAdmissionStore(
+        redis_url,
+        capacity=CAPACITY,
+        refill_rate_per_second=REFILL_PER_SECOND,
+        fair_share_window_seconds=10,
+        fair_share_min_jobs=5,
+        key_prefix=key_prefix,
+    )
+    allowed = rejected = 0
+    latencies: list[float] = []
+    deadline = perf_counter() + deadline_offset
+    while perf_counter() < deadline:
+        started_at = perf_counter()
+        result = store.admit(tenant_id="tenant-a", queue_name="crawl_queue", contended=False)
+        latencies.append(perf_counter() - started_at)
+        if result.allowed:
+            allowed += 1
+        else:
+            rejected += 1
+    return allowed, rejected, latencies
+
+
+def test_shared_admission_enforces_one_global_bucket_across_processes() -> None:
+    try:
+        redis.Redis.from_url(_redis_url(), socket_connect_timeout=0.2).ping()
+    except redis.exceptions.RedisError:
+        pytest.skip("Redis is not reachable for the shared admission load test")
+
+    key_prefix = f"queue_admission:load:{uuid.uuid4().hex}"
+    context = multiprocessing.get_context("spawn")
+    started_at = perf_counter()
+    with context.Pool(PROCESS_COUNT) as pool:
+        results = pool.map(_hammer, [(_redis_url(), key_prefix, RUN_SECONDS)] * PROCESS_COUNT)
+    elapsed = perf_counter() - started_at
+
+    allowed = sum(item[0] for item in results)
+    attempts = sum(item[0] + item[1] for item in results)
+    latencies = sorted(latency for item in results for latency in item[2])
+    ceiling = CAPACITY + REFILL_PER_SECOND * elapsed
+    floor = CAPACITY + REFILL_PER_SECOND * RUN_SECONDS * 0.9
+    print(
+        {
+            "processes": PROCESS_COUNT,
+            "attempts": attempts,
+            "allowed": allowed,
+            "global_ceiling": round(ceiling, 1),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 3),
+        }
+    )
+    # A per-process limiter would admit roughly PROCESS_COUNT times the global budget.
+    assert attempts > allowed * 2
+    assert floor <= allowed <= ceiling
+    assert latencies[int(len(latencies) * 0.99)] < 0.01
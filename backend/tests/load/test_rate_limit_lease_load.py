@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+import uuid
+from time import perf_counter
+
+import pytest
+import redis
+
+from app.services.rate_limit_store import LeasedRateLimitStore, RedisFixedWindowRateLimitStore
+
+PROCESS_COUNT = 4
+RUN_SECONDS = 2.0
+LIMIT = 3_000
+BLOCK_SIZE = 50
+POLICY_KEY = "lease_load_v1"
+
+
+def _redis_url() -> str:
+    return os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def _hammer(args: tuple[str, str, bool, float]) -> tuple[int, int, list[float]]:
+    redis_url, scope_hash, leased, deadline_offset = args
+    store = RedisFixedWindowRateLimitStore(redis_url)
+    if leased:
+        store = LeasedRateLimitStore(store, block_size=BLOCK_SIZE)
+    allowed = rejected = 0
+    latencies: list[float] = []
+    deadline = perf_counter() + deadline_offset
+    while perf_counter() < deadline:
+        started_at = perf_counter()
+        decision = store.consume(scope_hash=scope_hash, policy_key=POLICY_KEY, limit=LIMIT)
+        latencies.append(perf_counter() - started_at)
+        if decision.allowed:
+            allowed += 1
+        else:
+            rejected += 1
+    if leased:
+        store.close()
+    return allowed, rejected, latencies
+
+
+def _run(leased: bool) -> dict[str, float]:
+    # Keep each run inside one fixed window so admissions compare to one limit.
+    seconds_into_window = time.time() % 60
+    if seconds_into_window > 60 - RUN_SECONDS - 3:
+        time.sleep(61 - seconds_into_window)
+    scope_hash = uuid.uuid4().hex + uuid.uuid4().hex
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(PROCESS_COUNT) as pool:
+        results = pool.map(_hammer, [(_redis_url(), scope_hash, leased, RUN_SECONDS)] * PROCESS_COUNT)
+    allowed = sum(item[0] for item in results)
+    latencies = sorted(latency for item in results for latency in item[2])
+    return {
+        "attempts": allowed + sum(item[1] for item in results),
+        "allowed": allowed,
+        "over_admission_rate": max(0, allowed - LIMIT) / LIMIT,
+        "p50_us": round(latencies[len(latencies) // 2] * 1_000_000, 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99)] * 1_000_000, 1),
+    }
+
+
+def test_leased_limiter_against_per_request_consume() -> None:
+    try:
+        redis.Redis.from_url(_redis_url(), socket_connect_timeout=0.2).ping()
+    except redis.exceptions.RedisError:
+        pytest.skip("Redis is not reachable for the rate-limit lease load test")
+
+    per_request = _run(leased=False)
+    leased = _run(leased=True)
+    print({"processes": PROCESS_COUNT, "limit": LIMIT, "per_request": per_request, "leased": leased})
+
+    assert per_request["attempts"] > LIMIT and leased["attempts"] > LIMIT
+    assert per_request["over_admission_rate"] == 0
+    assert leased["over_admission_rate"] == 0
+    # Documented under-admission bound: blocks parked in the other processes.
+    assert leased["allowed"] >= LIMIT - (PROCESS_COUNT - 1) * BLOCK_SIZE
+    assert leased["p50_us"] * 5 < per_request["p50_us"]
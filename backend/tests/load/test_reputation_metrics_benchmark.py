@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from statistics import median
+from time import perf_counter
+import uuid
+
+from sqlalchemy import event, insert
+
+from app.models.business_location import BusinessLocation
+from app.models.reputation import ReputationReview
+from app.services import reputation_intelligence_service
+from tests.conftest import create_test_campaign
+
+REVIEW_COUNT = 100_000
+# Campaign and location context plus the grouped metric, reply-time, weekly trend
+# and theme queries; none of them grows with the number of reviews.
+STATEMENT_BUDGET = 10
+NOW = datetime(2026, 8, 10, 12, 0, tzinfo=UTC)
+
+
+def _reviews(campaign, location_id: str) -> list[dict[str, object]]:
+    rows = []
+    for index in range(REVIEW_COUNT):
+        reviewed_at = NOW - timedelta(minutes=7 * index)
+        responded = index % 3 == 0
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "tenant_id": campaign.tenant_id,
+                "organization_id": campaign.organization_id,
+                "campaign_id": campaign.id,
+                "business_location_id": location_id,
+                "source_key": "google_business_profile",
+                "source_name": "Google Business Profile",
+                "source_type": "owned_profile",
+                "provider_name": "google",
+                "external_review_id": f"review-{index}",
+                "rating": float(1 + index % 5),
+                "body": "The crew arrived late." if index % 11 == 0 else "Great service.",
+                "response_status": "responded" if responded else "unanswered",
+                "response_text": "Thank you." if responded else None,
+                "response_updated_at": reviewed_at + timedelta(hours=index % 97) if responded else None,
+                "reviewed_at": reviewed_at,
+                "first_seen_at": NOW,
+                "last_seen_at": NOW,
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+        )
+    return rows
+
+
+def test_sql_reputation_metrics_against_loading_every_review(db_session, create_test_org) -> None:
+    organization = create_test_org(name="Reputation metrics org")
+    campaign = create_test_campaign(db_session, organization.id, name="Reputation metrics campaign")
+    location = BusinessLocation(
+        organization_id=organization.id,
+        name="Reputation metrics location",
+        status="active",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    db_session.add(location)
+    db_session.flush()
+    campaign.business_location_id = location.id
+    rows = _reviews(campaign, location.id)
+    for start in range(0, len(rows), 5_000):
+        db_session.execute(insert(ReputationReview), rows[start : start + 5_000])
+    db_session.commit()
+
+    statements: list[str] = []
+    reviews_loaded = 0
+
+    def _count_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    def _count_review(_target, _context) -> None:
+        nonlocal reviews_loaded
+        reviews_loaded += 1
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _count_statement)
+    event.listen(ReputationReview, "load", _count_review)
+    try:
+        started_at = perf_counter()
+        result = reputation_intelligence_service.location_intelligence(
+            db_session,
+            tenant_id=campaign.tenant_id,
+            organization_id=organization.id,
+            campaign_id=campaign.id,
+            now=NOW,
+        )
+        aggregated_seconds = perf_counter() - started_at
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_statement)
+        event.remove(ReputationReview, "load", _count_review)
+
+    db_session.expire_all()
+    started_at = perf_counter()
+    loaded = (
+        db_session.query(ReputationReview)
+        .filter(ReputationReview.campaign_id == campaign.id)
+        .order_by(ReputationReview.reviewed_at.desc())
+        .all()
+    )
+    loaded_seconds = perf_counter() - started_at
+
+    metrics = result["metrics"]
+    current = [row for row in loaded if row.reviewed_at.replace(tzinfo=UTC) >= NOW - timedelta(days=30)]
+    response_hours = [
+        (row.response_updated_at - row.reviewed_at).total_seconds() / 3600
+        for row in loaded
+        if row.response_status == "responded"
+    ]
+    print(
+        {
+            "reviews": REVIEW_COUNT,
+            "aggregated_statements": len(statements),
+            "aggregated_review_rows_loaded": reviews_loaded,
+            "aggregated_seconds": round(aggregated_seconds, 3),
+            "load_rows_only_seconds": round(loaded_seconds, 3),
+        }
+    )
+    assert metrics["total_reviews"] == REVIEW_COUNT
+    assert metrics["average_rating"] == round(sum(row.rating for row in loaded) / len(loaded), 2)
+    assert metrics["reviews_last_30_days"] == len(current)
+    assert metrics["median_response_hours"] == round(median(response_hours), 1)
+    assert sum(item["reviews_received"] for item in result["weekly_trend"]) == sum(
+        row.reviewed_at.replace(tzinfo=UTC) >= datetime(2026, 5, 25, tzinfo=UTC) for row in loaded
+    )
+    # The old path loaded every review as an ORM row before any Python math.
+    assert reviews_loaded == 0
+    assert len(statements) <= STATEMENT_BUDGET
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from time import perf_counter
+from types import SimpleNamespace
+
+from app.services import reputation_response_service
+
+REVIEW_COUNT = 20_000
+SENTENCES = (
+    "The crew arrived on time and cleaned up after the job.",
+    "Pricing was fair and the estimate matched the quote.",
+    "Our technician explained every step and answered questions.",
+    "Scheduling took a few calls but the work itself was solid.",
+    "They hauled everything away in under two hours.",
+    "I asked for a refund after they overcharged me.",
+    "One worker was rude and my lawyer will hear about it.",
+    "The ladder looked unsafe and someone nearly had an accident.",
+    "Reach me at owner@example.com or 775-555-0199 with questions.",
+    "Wrong company, we never hired this business.",
+)
+
+
+def _corpus() -> list[str]:
+    reviews = []
+    for index in range(REVIEW_COUNT):
+        sentences = [SENTENCES[(index * 7 + offset) % 5] for offset in range(3)]
+        if index % 9 == 0:
+            sentences.append(SENTENCES[5 + index % 5])
+        reviews.append(f"Review {index}. " + " ".join(sentences))
+    return reviews
+
+
+def _classify_each_pattern(review_text: str | None) -> list[str]:
+    normalized = str(review_text or "").strip().lower()
+    if not normalized:
+        return []
+    return [
+        topic
+        for topic, patterns in reputation_response_service.SENSITIVE_PATTERNS.items()
+        if any(re.search(pattern, normalized, flags=re.IGNORECASE) for pattern in patterns)
+    ]
+
+
+def test_compiled_classifier_against_per_pattern_regex_scans(monkeypatch) -> None:
+    reviews = _corpus()
+    regex_searches = 0
+
+    def _counted(compiled: re.Pattern[str]) -> SimpleNamespace:
+        def search(text: str) -> re.Match[str] | None:
+            nonlocal regex_searches
+            regex_searches += 1
+            return compiled.search(text)
+
+        return SimpleNamespace(search=search)
+
+    classifier = reputation_response_service._active_sensitive_topic_classifier()
+    monkeypatch.setattr(
+        classifier,
+        "topics",
+        tuple(
+            (topic, tuple((_counted(compiled), anchors) for compiled, anchors in patterns))
+            for topic, patterns in classifier.topics
+        ),
+    )
+    pattern_count = sum(len(patterns) for patterns in reputation_response_service.SENSITIVE_PATTERNS.values())
+
+    started_at = perf_counter()
+    expected = [_classify_each_pattern(text) for text in reviews]
+    per_pattern_seconds = perf_counter() - started_at
+
+    started_at = perf_counter()
+    compiled = [reputation_response_service.classify_sensitive_topics(text) for text in reviews]
+    compiled_seconds = perf_counter() - started_at
+    compiled_searches, regex_searches = regex_searches, 0
+
+    started_at = perf_counter()
+    batch = reputation_response_service.classify_sensitive_topics_batch(reviews)
+    batch_seconds = perf_counter() - started_at
+    batch_searches = regex_searches
+
+    print(
+        {
+            "reviews": REVIEW_COUNT,
+            "flagged": sum(bool(topics) for topics in expected),
+            "per_pattern_regex_searches": REVIEW_COUNT * pattern_count,
+            "compiled_regex_searches": compiled_searches,
+            "batch_regex_searches": batch_searches,
+            "per_pattern_ms_per_review": round(per_pattern_seconds / REVIEW_COUNT * 1000, 4),
+            "compiled_ms_per_review": round(compiled_seconds / REVIEW_COUNT * 1000, 4),
+            "batch_ms_per_review": round(batch_seconds / REVIEW_COUNT * 1000, 4),
+        }
+    )
+    assert compiled == expected
+    assert batch == expected
+    # The literal-phrase prefilter skips most regex runs; the unfiltered path ran
+    # every pattern against every review.
+    assert compiled_searches * 4 < REVIEW_COUNT * pattern_count
+    assert batch_searches <= compiled_searches
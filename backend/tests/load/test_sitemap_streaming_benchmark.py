@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import gzip
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+from app.services.crawl_sitemaps import SitemapWalk
+
+CHUNK_BYTES = 64 * 1024
+
+
+def _gzip_sitemap(url_count: int) -> bytes:
+    rows = "".join(
+        f"<url><loc>https://example.com/products/item-{index}</loc><lastmod>2026-02-03T04:05:06Z</lastmod>"
+        f"<changefreq>daily</changefreq><priority>0.5</priority></url>"
+        for index in range(url_count)
+    )
+    return gzip.compress(
+        f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{rows}</urlset>'.encode()
+    )
+
+
+class _StreamedResponse:
+    status_code = 200
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def iter_bytes(self, chunk_size: int = CHUNK_BYTES):
+        for offset in range(0, len(self._body), chunk_size):
+            yield self._body[offset : offset + chunk_size]
+
+
+class _SitemapServer:
+    def __init__(self, sitemaps: dict[str, bytes]) -> None:
+        self._sitemaps = sitemaps
+
+    @contextmanager
+    def stream(self, _method: str, url: str, timeout: float = 10.0):  # noqa: ARG002
+        yield _StreamedResponse(self._sitemaps[url])
+
+
+def _walk(url_count: int) -> dict[str, float]:
+    body = _gzip_sitemap(url_count)
+    server = _SitemapServer({"https://example.com/sitemap.xml.gz": body})
+    walk = SitemapWalk(
+        server,
+        ["https://example.com/sitemap.xml.gz"],
+        accept_sitemap=lambda url: url,
+        max_sitemaps=1,
+        max_bytes=200_000_000,
+        concurrency=1,
+    )
+    tracemalloc.start()
+    started_at = perf_counter()
+    seen = sum(1 for _entry in walk)
+    elapsed = perf_counter() - started_at
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert seen == url_count
+    return {
+        "urls": url_count,
+        "gzip_bytes": len(body),
+        "seconds": round(elapsed, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def test_sitemap_walk_memory_stays_flat_as_sitemaps_grow() -> None:
+    small = _walk(5_000)
+    large = _walk(50_000)
+    print({"small": small, "large": large})
+
+    assert large["peak_kib"] < small["peak_kib"] * 1.5
+    assert large["peak_kib"] < 2048
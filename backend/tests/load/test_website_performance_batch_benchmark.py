@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime
+from time import perf_counter
+from types import SimpleNamespace
+
+import httpx
+
+from app.services import website_performance_service
+from tests.conftest import create_test_campaign
+
+BRAND_COUNT = 40
+LOCATIONS_PER_BRAND = 5
+CRUX_LATENCY_SECONDS = 0.005
+PAGESPEED_LATENCY_SECONDS = 0.05
+MAX_CONCURRENT_PAGESPEED_RUNS = 8
+
+
+class _FakeGoogleApis:
+    """Local stand-in for CrUX and PSI that counts requests and sleeps like the real thing."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = {"crux": 0, "pagespeed": 0}
+        self.pagespeed_in_flight = 0
+        self.peak_pagespeed_in_flight = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "chromeuxreport.googleapis.com":
+            with self._lock:
+                self.requests["crux"] += 1
+            time.sleep(CRUX_LATENCY_SECONDS)
+            return httpx.Response(
+                200,
+                json={
+                    "record": {
+                        "metrics": {"largest_contentful_paint": {"percentiles": {"p75": 2100}}},
+                        "collectionPeriod": {
+                            "firstDate": {"year": 2026, "month": 7, "day": 1},
+                            "lastDate": {"year": 2026, "month": 7, "day": 28},
+                        },
+                    }
+                },
+            )
+        with self._lock:
+            self.requests["pagespeed"] += 1
+            self.pagespeed_in_flight += 1
+            self.peak_pagespeed_in_flight = max(self.peak_pagespeed_in_flight, self.pagespeed_in_flight)
+        time.sleep(PAGESPEED_LATENCY_SECONDS)
+        with self._lock:
+            self.pagespeed_in_flight -= 1
+        return httpx.Response(
+            200,
+            json={
+                "lighthouseResult": {
+                    "categories": {"performance": {"score": 0.9}},
+                    "audits": {"largest-contentful-paint": {"numericValue": 2000}},
+                }
+            },
+        )
+
+
+def test_batch_collection_sweep_against_sequential_per_campaign_calls(
+    db_session,
+    create_test_org,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        website_performance_service,
+        "get_settings",
+        lambda: SimpleNamespace(
+            crux_api_key="benchmark-key",
+            pagespeed_api_key="",
+            website_performance_http_timeout_seconds=45.0,
+            website_performance_collection_interval_hours=168,
+            website_performance_max_concurrent_pagespeed_runs=MAX_CONCURRENT_PAGESPEED_RUNS,
+        ),
+    )
+    organization = create_test_org(name="Performance sweep org")
+    campaigns = [
+        create_test_campaign(
+            db_session,
+            organization.id,
+            name=f"Brand {brand} location {location}",
+            domain=f"brand{brand}.test",
+        )
+        for brand in range(BRAND_COUNT)
+        for location in range(LOCATIONS_PER_BRAND)
+    ]
+
+    sequential_api = _FakeGoogleApis()
+    started_at = perf_counter()
+    with httpx.Client(transport=httpx.MockTransport(sequential_api)) as client:
+        for campaign in campaigns:
+            requested_url = website_performance_service.normalize_site_url(campaign.domain)
+            website_performance_service.query_crux_field_data(
+                client, requested_url=requested_url, form_factor="mobile", api_key="benchmark-key"
+            )
+            website_performance_service.query_pagespeed_lab_data(
+                client, requested_url=requested_url, form_factor="mobile", api_key="benchmark-key"
+            )
+    sequential_seconds = perf_counter() - started_at
+
+    batch_api = _FakeGoogleApis()
+    started_at = perf_counter()
+    with httpx.Client(transport=httpx.MockTransport(batch_api)) as client:
+        results = website_performance_service.collect_performance_batch(
+            db_session,
+            campaigns=campaigns,
+            form_factor="mobile",
+            captured_at=datetime(2026, 7, 30, 18, 0, tzinfo=UTC),
+            client=client,
+        )
+    batch_seconds = perf_counter() - started_at
+
+    print(
+        {
+            "campaigns": len(campaigns),
+            "sequential_seconds": round(sequential_seconds, 2),
+            "batch_seconds": round(batch_seconds, 2),
+            "sequential_requests": sequential_api.requests,
+            "batch_requests": batch_api.requests,
+            "batch_peak_pagespeed_in_flight": batch_api.peak_pagespeed_in_flight,
+        }
+    )
+    assert len(results) == len(campaigns)
+    assert all(rows[0].lcp_ms == 2100 for rows in results.values())
+    assert sequential_api.requests["crux"] == len(campaigns)
+    assert batch_api.requests["crux"] == BRAND_COUNT
+    assert batch_api.requests["pagespeed"] == len(campaigns)
+    # Lab runs overlap up to the configured cap instead of queueing one at a time.
+    assert sequential_api.peak_pagespeed_in_flight == 1
+    assert 1 < batch_api.peak_pagespeed_in_flight <= MAX_CONCURRENT_PAGESPEED_RUNS
@@ -1,12 +1,15 @@
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
+import pytest
+
 from app.models.campaign import Campaign
 from app.models.competitor import Competitor
-from app.models.content import ContentBrief
+from app.models.content import ContentAsset, ContentBrief
 from app.models.crawl import CrawlPageResult, CrawlRun, Page
 from app.models.keyword_research import KeywordResearchRun, KeywordResearchSuggestion
 from app.services import content_service
+from tests.conftest import create_test_campaign
 
 
 def _login(client, email, password):
@@ -584,3 +587,63 @@ def test_content_readiness_separates_owner_review_from_publishing():
         "website_changed": False,
     }
     assert "not approval" in result["limitations"][0]
+
+
+def _published_asset(db_session, campaign, cluster_name: str, title: str) -> ContentAsset:
+    asset = ContentAsset(
+        tenant_id=campaign.tenant_id,
+        campaign_id=campaign.id,
+        cluster_name=cluster_name,
+        title=title,
+        status="published",
+    )
+    db_session.add(asset)
+    db_session.flush()
+    return asset
+
+
+def test_internal_link_map_keeps_top_similar_targets_per_asset(db_session, create_test_org):
+    org = create_test_org(name="Internal Link Map Org")
+    campaign = create_test_campaign(db_session, org.id, name="Internal Link Map Campaign")
+    drain = _published_asset(db_session, campaign, "Drain Cleaning", "Drain Cleaning Cost Guide")
+    clog = _published_asset(db_session, campaign, "Drain Cleaning", "Clogged Drain Warning Signs")
+    heater = _published_asset(db_session, campaign, "Water Heater Repair", "Water Heater Repair Checklist")
+    tank = _published_asset(db_session, campaign, "Water Heater Repair", "Tankless Water Heater Guide")
+    roof = _published_asset(db_session, campaign, "Roof Inspection", "Hail Damage Roof Inspection")
+
+    result = content_service.refresh_internal_link_map(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign_id=campaign.id,
+        top_k=1,
+        min_similarity=0.2,
+    )
+
+    links = {
+        item["source_asset_id"]: item
+        for item in content_service.get_link_recommendations(
+            db_session, tenant_id=campaign.tenant_id, campaign_id=campaign.id
+        )
+    }
+    assert result["link_recommendations"] == len(links) == 4
+    assert links[drain.id]["target_asset_id"] == clog.id
+    assert links[clog.id]["target_asset_id"] == drain.id
+    assert links[heater.id]["target_asset_id"] == tank.id
+    assert links[tank.id]["target_asset_id"] == heater.id
+    assert links[drain.id]["anchor_text"] == "drain cleaning"
+    assert roof.id not in links
+    assert all(0.2 <= item["confidence"] <= 1.0 for item in links.values())
+
+
+def test_internal_link_map_ignores_terms_shared_by_most_of_a_large_campaign():
+    assets = [
+        SimpleNamespace(cluster_name="Plumbing", title=f"Plumbing topic{index // 2} guide")
+        for index in range(40)
+    ]
+
+    vectors = content_service._internal_link_map_vectors(assets)
+    neighbours = content_service._top_similar_internal_link_targets(vectors, top_k=5, min_similarity=0.1)
+
+    assert all("plumbing" not in vector for vector in vectors)
+    assert neighbours[0] == [(1, pytest.approx(1.0))]
+    assert neighbours[3] == [(2, pytest.approx(1.0))]
@@ -6,21 +6,30 @@ import pytest
 from app.models.business_location import BusinessLocation
 from app.models.campaign import Campaign
 from app.models.commercial_feature_activation import CommercialFeatureActivation
-from app.models.cost_economics import CostLedgerEntry, OrganizationCostAllocation, ProviderPriceCard
+from app.models.cost_economics import (
+    CostLedgerEntry,
+    OrganizationCostAllocation,
+    OrganizationCostExposure,
+    ProviderPriceCard,
+)
 from app.models.organization import Organization
 from app.services.commercial_plan_service import apply_commercial_plan
 from app.services.cost_economics_service import (
     CostAllowanceExceeded,
     CostEconomicsError,
+    ProviderCostUnit,
     authorize_reserved_provider_dispatch,
     get_allowance_summary,
     get_customer_credit_summary,
     get_margin_report,
     list_tier_margin_models,
+    reconcile_cost_exposure_counters,
     reconcile_provider_cost,
+    reconcile_provider_cost_batch,
     record_monthly_allocation,
     release_provider_cost,
     reserve_provider_cost,
+    reserve_provider_cost_batch,
 )
 from app.services.rank_service import _dataforseo_keyword_cost_multiplier
 
@@ -470,6 +479,130 @@ def test_platform_allowance_stops_before_dispatch(db_session, create_test_org) -
     )
 
 
+def _reserve_batch(db_session, organization_id: str, units: list[ProviderCostUnit]):
+    return reserve_provider_cost_batch(
+        db_session,
+        organization_id=organization_id,
+        provider_name="dataforseo",
+        capability="rank_tracking",
+        operation="google_organic_live_advanced",
+        credential_owner="platform",
+        units=units,
+        now=datetime(2026, 7, 30, 15, 0, tzinfo=UTC),
+    )
+
+
+def _exposure(db_session, organization_id: str) -> OrganizationCostExposure:
+    db_session.expire_all()
+    return (
+        db_session.query(OrganizationCostExposure)
+        .filter(OrganizationCostExposure.organization_id == organization_id)
+        .one()
+    )
+
+
+def test_batch_reservation_is_all_or_nothing_and_replays_existing_keys(db_session, create_test_org) -> None:
+    org = create_test_org(name="Batch reservation org")
+    db_session.commit()
+
+    existing = _reserve(db_session, org.id, key="rank:batch:0")
+    reservations = _reserve_batch(
+        db_session,
+        org.id,
+        [ProviderCostUnit(idempotency_key=f"rank:batch:{index}", quantity=10) for index in range(3)],
+    )
+
+    assert [row.idempotency_key for row in reservations] == [f"rank:batch:{index}" for index in range(3)]
+    assert reservations[0].id == existing.id
+    assert _exposure(db_session, org.id).customer_credit_units == 6
+
+    with pytest.raises(CostAllowanceExceeded) as exc_info:
+        _reserve_batch(
+            db_session,
+            org.id,
+            [
+                ProviderCostUnit(idempotency_key="rank:batch:fits", quantity=10),
+                ProviderCostUnit(idempotency_key="rank:batch:overflow", quantity=9970),
+            ],
+        )
+
+    assert exc_info.value.reason_code == "insight_credit_allowance_exhausted"
+    assert (
+        db_session.query(CostLedgerEntry)
+        .filter(CostLedgerEntry.idempotency_key.in_(["rank:batch:fits", "rank:batch:overflow"]))
+        .count()
+        == 0
+    )
+    assert _exposure(db_session, org.id).customer_credit_units == 6
+
+
+def test_exposure_counters_track_the_ledger_and_repair_drift(db_session, create_test_org) -> None:
+    org = create_test_org(name="Exposure counter org")
+    db_session.commit()
+    now = datetime(2026, 7, 30, 16, 0, tzinfo=UTC)
+
+    kept, released, _open = _reserve_batch(
+        db_session,
+        org.id,
+        [ProviderCostUnit(idempotency_key=f"rank:counter:{index}", quantity=10) for index in range(3)],
+    )
+    reconcile_provider_cost(db_session, reservation=kept, provider_reported_cost=Decimal("0.018"), now=now)
+    release_provider_cost(db_session, reservation=released, now=now)
+
+    counter = _exposure(db_session, org.id)
+    assert Decimal(counter.budget_impact_cost) == Decimal("0.03800000")
+    assert counter.customer_credit_units == 4
+    assert reconcile_cost_exposure_counters(db_session, now=now)["counters_drifted"] == 0
+
+    counter.customer_credit_units = 500
+    counter.budget_impact_cost = Decimal("9")
+    db_session.commit()
+    result = reconcile_cost_exposure_counters(db_session, now=now)
+
+    assert result["counters_drifted"] == 1
+    assert result["repaired"] is True
+    counter = _exposure(db_session, org.id)
+    assert Decimal(counter.budget_impact_cost) == Decimal("0.03800000")
+    assert counter.customer_credit_units == 4
+
+
+def test_batch_reconciliation_matches_single_reconciles_and_replays(db_session, create_test_org) -> None:
+    org = create_test_org(name="Batch reconcile org")
+    db_session.commit()
+    now = datetime(2026, 7, 30, 16, 0, tzinfo=UTC)
+    first, second, third = _reserve_batch(
+        db_session,
+        org.id,
+        [ProviderCostUnit(idempotency_key=f"rank:batch-reconcile:{index}", quantity=10) for index in range(3)],
+    )
+    already = reconcile_provider_cost(db_session, reservation=first, provider_reported_cost=Decimal("0.018"), now=now)
+
+    rows = reconcile_provider_cost_batch(
+        db_session,
+        reconciliations=[(first, Decimal("0.5")), (second, Decimal("0.018")), (third, None)],
+        now=now,
+    )
+
+    assert rows[0].id == already.id
+    assert [row.reservation_id for row in rows] == [first.id, second.id, third.id]
+    assert [row.event_type for row in rows] == ["reconciliation"] * 3
+    assert Decimal(rows[1].provider_reported_cost) == Decimal("0.01800000")
+    assert Decimal(rows[2].provider_reported_cost) == Decimal(third.estimated_cost)
+    assert reconcile_cost_exposure_counters(db_session, now=now, repair=False)["counters_drifted"] == 0
+
+    replay = reconcile_provider_cost_batch(db_session, reconciliations=[(second.id, Decimal("9"))], now=now)
+    assert [row.id for row in replay] == [rows[1].id]
+    assert (
+        db_session.query(CostLedgerEntry)
+        .filter(
+            CostLedgerEntry.organization_id == org.id,
+            CostLedgerEntry.event_type == "reconciliation",
+        )
+        .count()
+        == 3
+    )
+
+
 def test_failed_provider_cost_is_released(db_session, create_test_org) -> None:
     org = create_test_org(name="Released cost org")
     db_session.commit()
@@ -560,6 +693,37 @@ def test_ai_token_price_card_is_versioned_and_metered(db_session, create_test_or
     assert reservation.input_tokens == 1_000_000
     assert reservation.price_card_version == "model-a-2026-07-v1"
 
+    db_session.add(
+        ProviderPriceCard(
+            provider_name="future_ai",
+            capability="recommendation",
+            operation="generate",
+            model_name="model-a",
+            version="model-a-2026-08-v1",
+            unit="request",
+            unit_cost=Decimal("0.5"),
+            currency="USD",
+            effective_from=datetime(2026, 7, 15, tzinfo=UTC),
+            active=True,
+        )
+    )
+    db_session.commit()
+    repriced = reserve_provider_cost(
+        db_session,
+        organization_id=org.id,
+        provider_name="future_ai",
+        capability="recommendation",
+        operation="generate",
+        credential_owner="platform",
+        quantity=1,
+        idempotency_key="ai:test:two",
+        model_name="model-a",
+        now=datetime(2026, 7, 30, tzinfo=UTC),
+    )
+
+    # Publishing a card invalidates the cached lookup immediately.
+    assert repriced.price_card_version == "model-a-2026-08-v1"
+
 
 def test_margin_report_uses_latest_versioned_allocation(db_session, create_test_org) -> None:
     org = create_test_org(name="Margin report org")
@@ -1,5 +1,12 @@
 from app.models.campaign import Campaign
+import gzip
+import hashlib
 import json
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+import httpx
+import pytest
 
 from app.models.crawl import (
     CrawlFrontierUrl,
@@ -11,10 +18,18 @@ from app.models.crawl import (
 )
 from app.models.organization import Organization
 from app.models.user import User
-from app.services import crawl_service
+from app.providers import crawl as crawl_provider
+from app.services import crawl_parser, crawl_service
 from tests.helpers.economic_setup import provision_test_organization
 
 
+@pytest.fixture(autouse=True)
+def _crawl_adapter_uses_patched_client(monkeypatch):
+    # Page fetches go through the pooled crawl client; route them to whichever
+    # fake client a test installs in place of httpx.Client.
+    monkeypatch.setattr(crawl_provider, "get_http_client", lambda _provider: httpx.Client())
+
+
 class _FakeResponse:
     def __init__(
         self,
@@ -30,6 +45,11 @@ class _FakeResponse:
         self.headers = {"content-type": content_type}
         self.url = url
         self.history = history or []
+        self.content = text.encode("utf-8")
+
+    def iter_bytes(self, chunk_size: int = 65536):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
 
 
 class _FakeClient:
@@ -42,6 +62,10 @@ class _FakeClient:
     def __exit__(self, _exc_type, _exc, _tb):
         return False
 
+    @contextmanager
+    def stream(self, _method: str, url: str, timeout: float = 10.0):
+        yield self.get(url, timeout=timeout)
+
     def get(self, url: str, timeout: float = 10.0):  # noqa: ARG002
         if url.endswith("/robots.txt"):
             return _FakeResponse(200, "User-agent: *\nDisallow:", url=url)
@@ -63,6 +87,13 @@ class _DisallowClient(_FakeClient):
         return _FakeResponse(200, "<html><title>Private</title></html>", url=url)
 
 
+class _CrawlDelayClient(_FakeClient):
+    def get(self, url: str, timeout: float = 10.0):  # noqa: ARG002
+        if url.endswith("/robots.txt"):
+            return _FakeResponse(200, "User-agent: *\nCrawl-delay: 3\nDisallow: /*?session=", url=url)
+        return _FakeResponse(200, "<html><title>Page</title></html>", url=url)
+
+
 class _ExpansionClient(_FakeClient):
     def get(self, url: str, timeout: float = 10.0):  # noqa: ARG002
         if url.endswith("/robots.txt"):
@@ -118,6 +149,36 @@ class _SitemapClient(_FakeClient):
         return _FakeResponse(404, "", url=url)
 
 
+class _GzipSitemapClient(_FakeClient):
+    def __init__(self, *_args, **_kwargs):
+        self.urls = 3000
+        self.requested: list[str] = []
+
+    def stream(self, _method: str, url: str, timeout: float = 10.0):  # noqa: ARG002
+        self.requested.append(url)
+        return super().stream(_method, url, timeout=timeout)
+
+    def get(self, url: str, timeout: float = 10.0):  # noqa: ARG002
+        if url.endswith("/sitemap-index.xml"):
+            children = "".join(
+                f"<sitemap><loc>https://example.com/part-{index}.xml.gz</loc></sitemap>" for index in range(3)
+            )
+            return _FakeResponse(200, f"<sitemapindex>{children}</sitemapindex>", url=url)
+        if ".xml.gz" in url:
+            part = url.rsplit("-", 1)[1].split(".", 1)[0]
+            rows = "".join(
+                f"<url><loc>https://example.com/{part}/{index}</loc><lastmod>2026-01-0{1 + index % 9}</lastmod>"
+                f"<changefreq>Weekly</changefreq><priority>0.{index % 10}</priority></url>"
+                for index in range(self.urls)
+            )
+            response = _FakeResponse(200, "", "application/gzip", url=url)
+            response.content = gzip.compress(
+                f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{rows}</urlset>'.encode()
+            )
+            return response
+        return _FakeResponse(404, "", url=url)
+
+
 
 def _provision_user_org(db_session, user: User) -> Organization:
     organization = db_session.query(Organization).filter(Organization.id == user.tenant_id).first()
@@ -132,6 +193,7 @@ def _add_crawl_result(
     *,
     status_code: int = 200,
     content_hash: str | None = None,
+    content_minhash: str | None = None,
     canonical_url: str | None = None,
 ) -> CrawlPageResult:
     result = CrawlPageResult(
@@ -146,6 +208,7 @@ def _add_crawl_result(
         redirect_count=0,
         canonical_url=canonical_url,
         content_hash=content_hash,
+        content_minhash=content_minhash,
         word_count=50 if content_hash else 5,
         internal_link_count=0,
         structured_data_types=[],
@@ -156,20 +219,120 @@ def _add_crawl_result(
 
 
 def test_sitemap_inventory_is_bounded_to_the_crawled_website():
-    urls, loaded = crawl_service._discover_sitemap_inventory(
+    walk = crawl_service._sitemap_walk(
         _SitemapClient(),
         "https://example.com",
-        "Sitemap: https://example.com/sitemap-index.xml",
-        max_urls=10,
+        ["https://example.com/sitemap-index.xml"],
     )
+    urls = list(crawl_service._discover_sitemap_inventory(walk, "https://example.com", max_urls=10))
+    loaded = walk.urlset_loaded
 
     assert loaded is True
-    assert urls == ["https://example.com/", "https://example.com/unlinked"]
+    assert [entry.url for entry in urls] == ["https://example.com/", "https://example.com/unlinked"]
     assert crawl_service.build_batch_urls("https://example.com", "deep") == [
         "https://example.com"
     ]
 
 
+def test_sitemap_inventory_streams_gzip_sitemaps_with_hints_and_limits():
+    client = _GzipSitemapClient()
+
+    walk = crawl_service._sitemap_walk(
+        client,
+        "https://example.com",
+        ["https://example.com/sitemap-index.xml"],
+        max_sitemaps=3,
+        concurrency=2,
+    )
+    entries = list(crawl_service._discover_sitemap_inventory(walk, "https://example.com", max_urls=10_000))
+    loaded = walk.urlset_loaded
+
+    assert loaded is True
+    assert client.requested[0] == "https://example.com/sitemap-index.xml"
+    assert len(client.requested) == 3
+    assert len(entries) == 2 * client.urls
+    first = next(entry for entry in entries if entry.url == "https://example.com/0/1")
+    assert first.lastmod == datetime(2026, 1, 2, tzinfo=UTC)
+    assert first.changefreq == "weekly"
+    assert first.priority == 0.1
+
+    capped = list(
+        crawl_service._discover_sitemap_inventory(
+            crawl_service._sitemap_walk(
+                _GzipSitemapClient(),
+                "https://example.com",
+                ["https://example.com/sitemap-index.xml"],
+            ),
+            "https://example.com",
+            max_urls=10,
+        )
+    )
+    truncated_walk = crawl_service._sitemap_walk(
+        _GzipSitemapClient(),
+        "https://example.com",
+        ["https://example.com/part-0.xml.gz"],
+        max_bytes=64 * 1024,
+    )
+    truncated = list(
+        crawl_service._discover_sitemap_inventory(truncated_walk, "https://example.com", max_urls=5000)
+    )
+    truncated_loaded = truncated_walk.urlset_loaded
+
+    assert len(capped) == 10
+    assert truncated_loaded is True
+    assert 0 < len(truncated) < client.urls
+
+
+
+def test_sitemap_inventory_stops_pulling_entries_once_the_budget_is_spent():
+    pulled: list[str] = []
+
+    class _Walk:
+        def __iter__(self):
+            for index in range(1_000):
+                url = f"https://example.com/page-{index // 2}"
+                pulled.append(url)
+                yield crawl_service.SitemapEntry(url=url)
+
+    inventory = crawl_service._discover_sitemap_inventory(_Walk(), "https://example.com", max_urls=3)
+
+    assert [entry.url for entry in inventory] == [
+        "https://example.com/page-0",
+        "https://example.com/page-1",
+        "https://example.com/page-2",
+    ]
+    assert len(pulled) == 5
+
+
+def test_sitemap_entries_are_written_to_the_frontier_in_chunks(db_session, monkeypatch):
+    monkeypatch.setattr(crawl_service, "_FRONTIER_INSERT_CHUNK_SIZE", 100)
+    user = db_session.query(User).filter(User.email == "a@example.com").first()
+    assert user is not None
+    campaign = Campaign(tenant_id=user.tenant_id, name="Sitemap Frontier", domain="example.com")
+    db_session.add(campaign)
+    db_session.flush()
+    run = CrawlRun(tenant_id=user.tenant_id, campaign_id=campaign.id, crawl_type="deep", status="scheduled", seed_url="https://example.com")
+    db_session.add(run)
+    db_session.flush()
+    lastmod = datetime(2026, 3, 1, tzinfo=UTC)
+    entries = (
+        crawl_service.SitemapEntry(
+            url=f"https://example.com/page-{index % 250}",
+            lastmod=lastmod,
+            changefreq="daily",
+            priority=0.8,
+        )
+        for index in range(300)
+    )
+
+    inserted = crawl_service.enqueue_sitemap_entries(db_session, run, entries)
+
+    rows = db_session.query(CrawlFrontierUrl).filter(CrawlFrontierUrl.crawl_run_id == run.id).all()
+    assert inserted == len(rows) == 250
+    assert {row.discovered_from_url for row in rows} == {"sitemap"}
+    assert {(row.sitemap_changefreq, row.sitemap_priority) for row in rows} == {("daily", 0.8)}
+    assert rows[0].sitemap_lastmod.replace(tzinfo=UTC) == lastmod
+
 
 def test_execute_run_persists_results_and_issues(db_session, monkeypatch):
     monkeypatch.setattr(crawl_service.httpx, "Client", _FakeClient)
@@ -215,6 +378,36 @@ def test_execute_run_respects_robots_disallow(db_session, monkeypatch):
     assert result["processed_urls"] == 0
 
 
+def test_execute_run_applies_robots_query_rules_and_crawl_delay(db_session, monkeypatch):
+    monkeypatch.setattr(crawl_service.httpx, "Client", _CrawlDelayClient)
+    sleeps: list[float] = []
+    monkeypatch.setattr(crawl_service.time, "sleep", sleeps.append)
+    user = db_session.query(User).filter(User.email == "a@example.com").first()
+    assert user is not None
+    organization = _provision_user_org(db_session, user)
+
+    campaign = Campaign(tenant_id=user.tenant_id, organization_id=organization.id, name="Delay Crawl", domain="example.com")
+    db_session.add(campaign)
+    db_session.flush()
+    run = CrawlRun(tenant_id=user.tenant_id, campaign_id=campaign.id, crawl_type="deep", status="scheduled", seed_url="https://example.com")
+    db_session.add(run)
+    db_session.commit()
+
+    result = crawl_service.execute_run(
+        db_session,
+        crawl_run_id=run.id,
+        provided_urls=[
+            "https://example.com/a",
+            "https://example.com/b?session=1",
+            "https://example.com/c",
+        ],
+    )
+
+    assert result["processed_urls"] == 2
+    assert result["next_batch_delay_seconds"] == 3.0
+    assert len(sleeps) == 1 and 2.5 < sleeps[0] <= 3.0
+
+
 
 def test_execute_run_discovers_internal_links_with_limit(db_session, monkeypatch):
     monkeypatch.setattr(crawl_service.httpx, "Client", _ExpansionClient)
@@ -427,3 +620,67 @@ def test_finalize_run_integrity_requires_complete_coverage_for_sitewide_findings
         .all()
     )
     assert len(persisted) == 4
+
+
+def test_finalize_run_integrity_reports_near_duplicates_with_similarity(db_session):
+    user = db_session.query(User).filter(User.email == "a@example.com").first()
+    assert user is not None
+    organization = _provision_user_org(db_session, user)
+    campaign = Campaign(
+        tenant_id=user.tenant_id,
+        organization_id=organization.id,
+        name="Near Duplicate Crawl",
+        domain="example.com",
+    )
+    db_session.add(campaign)
+    db_session.flush()
+    run = CrawlRun(
+        tenant_id=user.tenant_id,
+        campaign_id=campaign.id,
+        crawl_type="deep",
+        status="complete",
+        seed_url="https://example.com",
+    )
+    db_session.add(run)
+    db_session.flush()
+
+    article = " ".join(f"plumbing{index}" for index in range(120))
+    texts = {
+        "https://example.com/reno/drain-cleaning": f"Updated March 3 2026 {article}",
+        "https://example.com/sparks/drain-cleaning": f"Updated April 9 2026 {article}",
+        "https://example.com/sparks/drain-cleaning-copy": f"Updated April 9 2026 {article}",
+        "https://example.com/roofing": " ".join(f"roofing{index}" for index in range(120)),
+    }
+    for url, text in texts.items():
+        page = Page(tenant_id=user.tenant_id, campaign_id=campaign.id, url=url)
+        db_session.add(page)
+        db_session.flush()
+        _add_crawl_result(
+            db_session,
+            run,
+            page,
+            content_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            content_minhash=crawl_parser.content_minhash_for_text(text),
+        )
+    db_session.flush()
+
+    issues = crawl_service.finalize_run_integrity(db_session, run, coverage_complete=False)
+
+    details = sorted(
+        (json.loads(issue.details_json) for issue in issues if issue.issue_code == "duplicate_content"),
+        key=lambda item: item["match_type"],
+    )
+    assert [(item["match_type"], item["page_url"], item["duplicate_with"]) for item in details] == [
+        (
+            "exact_visible_text",
+            "https://example.com/sparks/drain-cleaning-copy",
+            "https://example.com/sparks/drain-cleaning",
+        ),
+        (
+            "near_duplicate_visible_text",
+            "https://example.com/sparks/drain-cleaning",
+            "https://example.com/reno/drain-cleaning",
+        ),
+    ]
+    assert 0.7 <= details[1]["similarity"] < 1.0
+    assert details[1]["confidence"] == "likely"
@@ -1,3 +1,7 @@
+import json
+from itertools import combinations
+from pathlib import Path
+
 from app.services import crawl_parser
 
 
@@ -133,3 +137,59 @@ def test_taxonomy_preserves_multi_step_redirect_evidence():
     redirect_issue = next(item for item in issues if item["issue_code"] == "redirect_chain")
     assert redirect_issue["details"]["redirect_count"] == 2
     assert redirect_issue["details"]["final_url"] == "https://example.com/new"
+
+
+def test_near_duplicate_clusters_match_labeled_corpus():
+    fixture = Path(__file__).parent / "fixtures" / "near_duplicate_pages.json"
+    pages = json.loads(fixture.read_text())["pages"]
+    signatures = [
+        crawl_parser.parse_signals(
+            page["url"],
+            f"<html><head><title>Page</title></head><body><p>{page['text']}</p></body></html>",
+        )["content_minhash"]
+        for page in pages
+    ]
+
+    clusters = crawl_parser.near_duplicate_clusters(signatures)
+
+    predicted = {
+        (left, right)
+        for cluster in clusters
+        for left, right in combinations(sorted(cluster), 2)
+    }
+    labeled = {
+        (left, right)
+        for left, right in combinations(range(len(pages)), 2)
+        if pages[left]["cluster"] is not None and pages[left]["cluster"] == pages[right]["cluster"]
+    }
+    assert predicted == labeled
+    for left, right in labeled:
+        assert crawl_parser.minhash_similarity(signatures[left], signatures[right]) >= 0.7
+
+
+def test_near_duplicate_clusters_do_not_chain_past_the_preferred_page():
+    def signature(values: list[int]) -> str:
+        return b"".join(value.to_bytes(4, "big") for value in values).hex()
+
+    base = list(range(1, crawl_parser.MINHASH_PERMUTATIONS + 1))
+    # Each neighbour shares 48 of 64 minimum hashes, but the two ends share only 32.
+    middle = base[:48] + [value + 1000 for value in base[48:]]
+    far = [value + 2000 for value in base[:16]] + middle[16:]
+    assert crawl_parser.minhash_similarity(signature(base), signature(far)) < 0.7
+
+    assert crawl_parser.near_duplicate_clusters([signature(base), signature(middle), signature(far)]) == [[0, 1]]
+    assert crawl_parser.near_duplicate_clusters([signature(middle), signature(base), signature(far)]) == [
+        [0, 1, 2]
+    ]
+
+
+def test_content_minhash_is_stable_and_skipped_for_thin_pages():
+    body = " ".join(f"word{index}" for index in range(40))
+    signals = crawl_parser.parse_signals("https://example.com/a", f"<body><p>{body}</p></body>")
+    again = crawl_parser.parse_signals("https://example.com/b", f"<body><div>{body}</div></body>")
+    thin = crawl_parser.parse_signals("https://example.com/c", "<body><p>Too short.</p></body>")
+
+    assert len(signals["content_minhash"]) == crawl_parser.MINHASH_PERMUTATIONS * 8
+    assert signals["content_minhash"] == again["content_minhash"]
+    assert crawl_parser.minhash_similarity(signals["content_minhash"], again["content_minhash"]) == 1.0
+    assert thin["content_minhash"] is None
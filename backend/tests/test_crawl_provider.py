@@ -39,7 +39,7 @@ class _Client:
 
 
 def test_default_adapter_preserves_redirect_chain(monkeypatch):
-    monkeypatch.setattr(crawl_provider.httpx, "Client", _Client)
+    monkeypatch.setattr(crawl_provider, "get_http_client", lambda _provider: _Client())
     adapter = crawl_provider.DefaultCrawlAdapter(retry_attempts=1)
 
     result = adapter.fetch_url(
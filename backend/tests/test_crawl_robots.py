@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from app.services import crawl_robots
+from app.services.crawl_robots import fetch_robots_txt, parse_robots_txt
+
+# RFC 9309 section 5.1.
+_RFC_EXAMPLE = """
+User-Agent: *
+Disallow: *.gif$
+Disallow: /example/
+Allow: /publications/
+
+User-Agent: foobot
+Disallow:/
+Allow:/example/page.html
+Allow:/example/allowed.gif
+
+User-Agent: barbot
+User-Agent: bazbot
+Disallow: /example/page.html
+
+User-Agent: quxbot
+
+Sitemap: https://example.com/sitemap.xml
+"""
+
+
+@pytest.mark.parametrize(
+    ("user_agent", "path", "allowed"),
+    [
+        ("*", "/publications/report.html", True),
+        ("*", "/example/page.html", False),
+        ("*", "/images/logo.gif", False),
+        ("*", "/images/logo.gif?size=2", True),
+        ("FooBot/1.2", "/example/page.html", True),
+        ("foobot", "/example/allowed.gif", True),
+        ("foobot", "/example/other.html", False),
+        ("barbot", "/example/page.html", False),
+        ("bazbot", "/example/page.html", False),
+        ("barbot", "/publications/report.html", True),
+        ("quxbot", "/example/page.html", True),
+        ("otherbot", "/example/page.html", False),
+        ("foobot", "/robots.txt", True),
+    ],
+)
+def test_rfc_example_groups(user_agent: str, path: str, allowed: bool) -> None:
+    assert parse_robots_txt(_RFC_EXAMPLE).allows(path, user_agent) is allowed
+
+
+def test_longest_match_wins_and_allow_wins_ties() -> None:
+    # RFC 9309 section 5.2.
+    robots = parse_robots_txt(
+        "User-Agent: foobot\n"
+        "Allow: /example/page/\n"
+        "Disallow: /example/page/disallowed.gif\n"
+        "User-Agent: *\n"
+        "Allow: /tie\n"
+        "Disallow: /tie\n"
+    )
+
+    assert robots.allows("/example/page/", "foobot") is True
+    assert robots.allows("/example/page/disallowed.gif", "foobot") is False
+    assert robots.allows("/tie/anything") is True
+
+
+def test_groups_for_the_same_agent_are_merged() -> None:
+    robots = parse_robots_txt(
+        "user-agent: a\ndisallow: /c\n"
+        "user-agent: b\ndisallow: /d\n"
+        "user-agent: e\nuser-agent: a\ndisallow: /g\n"
+    )
+
+    assert robots.allows("/c", "a") is False
+    assert robots.allows("/g", "a") is False
+    assert robots.allows("/d", "a") is True
+    assert robots.allows("/g", "e") is False
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "matches"),
+    [
+        ("/fish", "/fish.html", True),
+        ("/fish", "/Fish.asp", False),
+        ("/*.php", "/folder/filename.php?parameters", True),
+        ("/*.php$", "/filename.php", True),
+        ("/*.php$", "/filename.php?parameters", False),
+        ("/fish*.php", "/fishheads/catfish.php?parameters", True),
+        ("/fish*", "/fishheads", True),
+        ("/foo/bar/ツ", "/foo/bar/%E3%83%84", True),
+        ("/foo/bar/%E3%83%84", "/foo/bar/ツ", True),
+        ("/foo/bar/%62%61%7A", "/foo/bar/baz", True),
+        ("/foo/bar?baz=quz", "/foo/bar?baz=quz", True),
+    ],
+)
+def test_wildcards_end_anchors_and_percent_encoding(pattern: str, path: str, matches: bool) -> None:
+    robots = parse_robots_txt(f"User-agent: *\nDisallow: {pattern}\n")
+
+    assert robots.allows(path) is not matches
+
+
+def test_crawl_delay_and_sitemaps_are_collected() -> None:
+    robots = parse_robots_txt(
+        "User-agent: *\nCrawl-delay: 2.5\nDisallow: /tmp\n"
+        "User-agent: slowbot\nCrawl-delay: nope\n"
+        "Sitemap: https://example.com/a.xml\n"
+    )
+
+    assert robots.crawl_delay() == 2.5
+    assert robots.crawl_delay("slowbot") is None
+    assert robots.sitemaps == ["https://example.com/a.xml"]
+
+
+@pytest.fixture(autouse=True)
+def _empty_robots_cache() -> Iterator[None]:
+    crawl_robots.clear_robots_cache()
+    yield
+    crawl_robots.clear_robots_cache()
+
+
+class _RobotsClient:
+    def __init__(self, *responses) -> None:  # noqa: ANN002
+        self.responses = list(responses)
+        self.calls: list[str] = []
+
+    def get(self, url: str, timeout: float = 10.0):  # noqa: ARG002
+        self.calls.append(url)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _response(status_code: int, text: str = "", **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, text=text, headers={key.replace("_", "-"): value for key, value in headers.items()})
+
+
+def test_fetch_caches_per_origin_and_honors_cache_headers() -> None:
+    client = _RobotsClient(
+        _response(200, "User-agent: *\nDisallow: /a", cache_control="max-age=600"),
+        _response(200, "User-agent: *\nDisallow: /b", cache_control="no-store"),
+        _response(200, "User-agent: *\nDisallow: /c"),
+    )
+
+    first = fetch_robots_txt(client, "https://example.com/page?x=1")
+    assert fetch_robots_txt(client, "https://EXAMPLE.com/other") is first
+    assert first.allows("/a") is False
+    assert client.calls == ["https://example.com/robots.txt"]
+
+    uncached = fetch_robots_txt(client, "https://other.example/")
+    assert fetch_robots_txt(client, "https://other.example/").allows("/c") is False
+    assert uncached.allows("/b") is False
+    assert len(client.calls) == 3
+
+
+def test_fetch_status_handling_and_stale_copy_on_outage(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(crawl_robots, "monotonic", lambda: now[0])
+    client = _RobotsClient(
+        _response(404),
+        _response(503),
+        _response(200, "User-agent: *\nDisallow: /private", cache_control="max-age=60"),
+        httpx.ConnectError("down"),
+    )
+
+    assert fetch_robots_txt(client, "https://missing.example/").allows("/anything") is True
+    assert fetch_robots_txt(client, "https://broken.example/").allows("/anything") is False
+
+    cached = fetch_robots_txt(client, "https://example.com/")
+    now[0] += 61
+    stale = fetch_robots_txt(client, "https://example.com/")
+
+    assert stale is cached
+    assert stale.allows("/private") is False and stale.allows("/public") is True
@@ -578,3 +578,68 @@ def test_tenant_cycle_is_idempotent_and_recovers_expired_lease(
         headers={"Authorization": f"Bearer {token_b}"},
     )
     assert cross_tenant.status_code == 404
+
+
+def test_website_performance_sweep_collects_due_campaigns_in_one_batch(
+    db_session,
+    create_test_org,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        durable_job_service,
+        "get_settings",
+        lambda: SimpleNamespace(
+            crux_api_key="test-google-key",
+            website_performance_collection_interval_hours=168,
+        ),
+    )
+    organization = create_test_org(name="Performance sweep org")
+    campaigns = [
+        create_test_campaign(db_session, organization.id, name=f"Sweep {index}", domain=f"sweep-{index}.test")
+        for index in range(3)
+    ]
+    for campaign in campaigns:
+        campaign.setup_state = "Active"
+    db_session.commit()
+
+    queued = durable_job_service.enqueue_due_website_performance_jobs(
+        db_session,
+        now=datetime(2026, 7, 30, 18, 0, tzinfo=UTC),
+    )
+    db_session.commit()
+
+    jobs = sorted(
+        db_session.query(PlatformJob)
+        .filter(
+            PlatformJob.job_type == durable_job_service.WEBSITE_PERFORMANCE_BATCH_COLLECTION_JOB_TYPE
+        )
+        .all(),
+        key=lambda job: job.payload["form_factor"],
+    )
+    assert queued == 6
+    assert [job.payload["form_factor"] for job in jobs] == ["desktop", "mobile"]
+    assert all(
+        job.payload["campaign_ids"] == sorted(campaign.id for campaign in campaigns) for job in jobs
+    )
+
+    campaigns[2].setup_state = "Paused"
+    db_session.commit()
+    batches: list[tuple[str, list[str], str | None]] = []
+
+    def _collect_batch(db, *, campaigns, form_factor, idempotency_scope=None, **_kwargs):  # noqa: ANN001
+        batches.append((form_factor, [campaign.id for campaign in campaigns], idempotency_scope))
+        return {campaign.id: [] for campaign in campaigns}
+
+    monkeypatch.setattr(
+        durable_job_service.website_performance_service,
+        "collect_performance_batch",
+        _collect_batch,
+    )
+    mobile_job = jobs[1]
+    result = durable_job_service.DEFAULT_HANDLERS[mobile_job.job_type](db_session, mobile_job)
+
+    assert batches == [
+        ("mobile", sorted(campaign.id for campaign in campaigns[:2]), "2026-07-30"),
+    ]
+    assert [entry["campaign_id"] for entry in result["campaigns"]] == batches[0][1]
+    assert result["skipped_campaign_ids"] == [campaigns[2].id]
@@ -1,3 +1,8 @@
+import threading
+import time
+
+from prometheus_client import REGISTRY
+
 from app.core.event_bus import EventBus
 from app.events.event_bus import publish_event, reset_subscribers, subscribe
 from app.events.event_types import EventType
@@ -41,3 +46,139 @@ def test_internal_event_bus_dispatches_handlers() -> None:
     publish_event(EventType.SIGNAL_UPDATED.value, {'campaign_id': 'c1', 'signals': {'avg_rank': 8.2}})
 
     assert seen == [{'campaign_id': 'c1', 'signals': {'avg_rank': 8.2}}]
+
+
+def test_async_dispatch_isolates_slow_and_failing_handlers() -> None:
+    bus = EventBus(dispatch_mode='async', max_workers=4, handler_timeout_seconds=0)
+    release = threading.Event()
+    seen: list[str] = []
+    inline: list[str] = []
+
+    def _slow(payload: dict) -> None:
+        release.wait(5)
+        seen.append(f"slow:{payload['n']}")
+
+    def _failing(payload: dict) -> None:
+        raise RuntimeError('handler exploded')
+
+    def _fast(payload: dict) -> None:
+        seen.append(f"fast:{payload['n']}")
+
+    def _transactional(payload: dict) -> None:
+        inline.append(threading.current_thread().name)
+
+    for handler in (_slow, _failing, _fast):
+        bus.subscribe('crawl.completed', handler)
+    bus.subscribe('crawl.completed', _transactional, dispatch='sync')
+
+    started_at = time.monotonic()
+    bus.publish('crawl.completed', {'n': 1})
+    assert time.monotonic() - started_at < 1
+    assert inline == [threading.current_thread().name]
+
+    assert _wait_for(lambda: 'fast:1' in seen)
+    assert 'slow:1' not in seen
+    release.set()
+    assert bus.drain(timeout=5)
+    assert sorted(seen) == ['fast:1', 'slow:1']
+    bus.shutdown()
+
+
+def test_ordered_handlers_keep_per_campaign_order_within_concurrency_limit() -> None:
+    bus = EventBus(dispatch_mode='async', max_workers=8, handler_timeout_seconds=0)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    seen: dict[str, list[int]] = {'c1': [], 'c2': [], 'c3': []}
+
+    def _handler(payload: dict) -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.005)
+        seen[payload['campaign_id']].append(payload['sequence'])
+        with lock:
+            active -= 1
+
+    bus.subscribe(EventType.SIGNAL_UPDATED.value, _handler, ordered=True, max_concurrency=2)
+    for sequence in range(10):
+        for campaign_id in seen:
+            bus.publish(EventType.SIGNAL_UPDATED.value, {'campaign_id': campaign_id, 'sequence': sequence})
+
+    assert bus.drain(timeout=10)
+    assert seen == {campaign_id: list(range(10)) for campaign_id in seen}
+    assert peak == 2
+    bus.shutdown()
+
+
+def test_overdue_handler_releases_its_slot_but_keeps_its_lane() -> None:
+    bus = EventBus(dispatch_mode='async', max_workers=3, handler_timeout_seconds=0.05)
+    release = threading.Event()
+    seen: list[tuple[str, int]] = []
+
+    def _handler(payload: dict) -> None:
+        if payload['sequence'] == 0:
+            release.wait(5)
+        seen.append((payload['campaign_id'], payload['sequence']))
+
+    bus.subscribe('report.generated', _handler, ordered=True, max_concurrency=1)
+    before = REGISTRY.get_sample_value(
+        'event_handler_failures_total',
+        {'event_type': 'report.generated', 'handler': f'{__name__}.{_handler.__qualname__}', 'reason': 'timeout'},
+    ) or 0.0
+    bus.publish('report.generated', {'campaign_id': 'c1', 'sequence': 0})
+    bus.publish('report.generated', {'campaign_id': 'c1', 'sequence': 1})
+    bus.publish('report.generated', {'campaign_id': 'c2', 'sequence': 1})
+
+    # The overdue delivery frees its slot for another campaign, not its own lane.
+    assert _wait_for(lambda: seen == [('c2', 1)])
+    time.sleep(0.1)
+    assert seen == [('c2', 1)]
+    assert REGISTRY.get_sample_value(
+        'event_handler_failures_total',
+        {'event_type': 'report.generated', 'handler': f'{__name__}.{_handler.__qualname__}', 'reason': 'timeout'},
+    ) == before + 1
+    release.set()
+    assert _wait_for(lambda: seen == [('c2', 1), ('c1', 0), ('c1', 1)])
+    bus.shutdown()
+
+
+def test_ordered_overflow_runs_inline_after_the_lane_catches_up() -> None:
+    bus = EventBus(dispatch_mode='async', max_workers=2, max_pending=1, handler_timeout_seconds=0)
+    release = threading.Event()
+    seen: list[tuple[int, str]] = []
+
+    def _handler(payload: dict) -> None:
+        if payload['sequence'] == 0:
+            release.wait(5)
+        seen.append((payload['sequence'], threading.current_thread().name))
+
+    bus.subscribe('report.generated', _handler, ordered=True, max_concurrency=1)
+    bus.publish('report.generated', {'campaign_id': 'c1', 'sequence': 0})
+    publisher = threading.Thread(
+        target=bus.publish,
+        args=('report.generated', {'campaign_id': 'c1', 'sequence': 1}),
+        name='overflow-publisher',
+    )
+    publisher.start()
+
+    time.sleep(0.1)
+    assert seen == []
+    assert publisher.is_alive()
+    release.set()
+    publisher.join(timeout=5)
+
+    assert [sequence for sequence, _thread in seen] == [0, 1]
+    assert seen[1][1] == 'overflow-publisher'
+    assert bus.drain(timeout=5)
+    bus.shutdown()
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:  # noqa: ANN001
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
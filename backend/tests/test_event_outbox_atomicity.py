@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from app.events.emitter import emit_event
+from sqlalchemy import event
+
+from app.events.emitter import EventEmission, EventEnvelope, buffered_events, emit_event, emit_events
 from app.events.event_bus import reset_subscribers, subscribe
 from app.events.outbox.event_outbox import EventOutbox
 from app.intelligence.workers.outbox_worker import process as process_outbox
+from app.models.audit_log import AuditLog
 
 
 def test_emit_event_rollback_does_not_publish_or_persist_outbox(db_session) -> None:
@@ -51,3 +54,60 @@ def test_outbox_worker_publishes_only_committed_events(db_session) -> None:
     assert len(handled) == 1
     assert handled[0]['event_type'] == 'tenant.created'
     assert handled[0]['payload']['name'] == 'Committed Tenant'
+
+
+def test_emit_events_dedupes_a_batch_in_bulk_like_single_emits(db_session) -> None:
+    existing = emit_event(
+        db_session,
+        tenant_id='tenant-outbox-test',
+        event_type='reputation.review.saved',
+        payload={'review_id': 'review-0'},
+    )
+    db_session.commit()
+    emissions = [
+        EventEmission(
+            tenant_id='tenant-outbox-test',
+            event_type='reputation.review.saved',
+            payload={'review_id': f'review-{index % 25}'},
+        )
+        for index in range(50)
+    ]
+
+    statements: list[str] = []
+    bind = db_session.get_bind()
+    listener = lambda _conn, _cursor, statement, *_args: statements.append(statement)  # noqa: E731
+    event.listen(bind, 'before_cursor_execute', listener)
+    try:
+        envelopes = emit_events(db_session, emissions)
+    finally:
+        event.remove(bind, 'before_cursor_execute', listener)
+    db_session.commit()
+
+    # One dedupe read, one outbox insert and one audit insert for the batch.
+    assert len(statements) == 3
+    assert envelopes[0] == existing
+    assert envelopes[1] == envelopes[26]
+    assert len({envelope.event_id for envelope in envelopes}) == 25
+    assert db_session.query(EventOutbox).count() == 25
+    assert db_session.query(AuditLog).filter(AuditLog.event_type == 'reputation.review.saved').count() == 25
+
+
+def test_buffered_events_write_on_exit_or_commit_and_drop_on_rollback(db_session) -> None:
+    with buffered_events(db_session):
+        emit_event(db_session, tenant_id='tenant-outbox-test', event_type='tenant.created', payload={'name': 'A'})
+        assert db_session.query(EventOutbox).count() == 0
+        db_session.commit()
+        emit_event(db_session, tenant_id='tenant-outbox-test', event_type='tenant.created', payload={'name': 'B'})
+        emit_event(db_session, tenant_id='tenant-outbox-test', event_type='tenant.created', payload={'name': 'B'})
+    assert db_session.query(EventOutbox).count() == 2
+    db_session.commit()
+
+    with buffered_events(db_session):
+        emit_event(db_session, tenant_id='tenant-outbox-test', event_type='tenant.created', payload={'name': 'C'})
+        db_session.rollback()
+    db_session.commit()
+
+    names = sorted(
+        EventEnvelope.model_validate_json(row.payload_json).payload['name'] for row in db_session.query(EventOutbox)
+    )
+    assert names == ['A', 'B']
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from app.models.fleet_job import FleetJob, FleetJobStatus
+from app.models.fleet_job_item import FleetJobItem, FleetJobItemStatus
+from app.models.portfolio import Portfolio
+from app.services import fleet_service
+
+
+def _login(client, email: str, password: str) -> tuple[str, str]:
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    return data["access_token"], data["user"]["organization_id"]
+
+
+def _schedule_job(client, db_session, *, item_keys: list[str], idempotency_key: str) -> FleetJob:
+    token, org_id = _login(client, "org-admin@example.com", "pass-org-admin")
+    created = client.post(
+        f"/api/v1/organizations/{org_id}/business-locations",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": f"Counter location {idempotency_key}", "domain": f"{idempotency_key}.example.com"},
+    )
+    assert created.status_code == 200
+    portfolio = (
+        db_session.query(Portfolio)
+        .filter(
+            Portfolio.organization_id == org_id,
+            Portfolio.business_location_id == created.json()["data"]["business_location"]["id"],
+        )
+        .one()
+    )
+    job, _created = fleet_service.create_schedule_job(
+        db=db_session,
+        organization_id=org_id,
+        portfolio_id=portfolio.id,
+        user_id=None,
+        idempotency_key=idempotency_key,
+        item_seeds=[{"item_key": key, "payload": {"index": index}} for index, key in enumerate(item_keys)],
+    )
+    return job
+
+
+def _items(db_session, job: FleetJob) -> list[FleetJobItem]:
+    return (
+        db_session.query(FleetJobItem)
+        .filter(FleetJobItem.fleet_job_id == job.id)
+        .order_by(FleetJobItem.item_key.asc())
+        .all()
+    )
+
+
+def test_fleet_counters_move_incrementally_without_recounting_items(client, db_session, monkeypatch) -> None:
+    job = _schedule_job(client, db_session, item_keys=["a", "b", "c-fail"], idempotency_key="counters-1")
+    items = _items(db_session, job)
+    assert items[0].request_payload == {"item_key": "a", "payload": {"index": 0}}
+
+    def no_recount(**_kwargs):
+        raise AssertionError("item processing must not recount the job's items")
+
+    monkeypatch.setattr(fleet_service, "_count_job_items", no_recount)
+    results = [fleet_service.process_fleet_job_item(db=db_session, fleet_job_item_id=item.id) for item in items]
+    assert [result["status"] for result in results] == ["succeeded", "succeeded", "failed"]
+
+    db_session.expire_all()
+    job = db_session.get(FleetJob, job.id)
+    assert (job.queued_items, job.running_items, job.succeeded_items, job.failed_items) == (0, 0, 2, 1)
+    assert job.status == FleetJobStatus.PARTIAL
+
+    assert fleet_service.retry_failed_items(db=db_session, organization_id=job.organization_id, fleet_job_id=job.id) == 1
+    db_session.expire_all()
+    job = db_session.get(FleetJob, job.id)
+    assert (job.queued_items, job.failed_items, job.status) == (1, 0, FleetJobStatus.RUNNING)
+
+
+def test_fleet_item_payload_falls_back_to_job_request_for_older_items(client, db_session) -> None:
+    job = _schedule_job(client, db_session, item_keys=["legacy"], idempotency_key="counters-2")
+    item = _items(db_session, job)[0]
+    item.request_payload = None
+    db_session.commit()
+
+    assert fleet_service._resolve_item_payload(job=job, item=item) == {"index": 0}
+
+
+def test_fleet_counter_reconciliation_corrects_drift(client, db_session) -> None:
+    job = _schedule_job(client, db_session, item_keys=["x", "y"], idempotency_key="counters-3")
+    items = _items(db_session, job)
+    fleet_service.process_fleet_job_item(db=db_session, fleet_job_item_id=items[0].id)
+    # A status repaired directly in the database bypasses the counters.
+    db_session.query(FleetJobItem).filter(FleetJobItem.id == items[1].id).update(
+        {FleetJobItem.status: FleetJobItemStatus.SUCCEEDED}, synchronize_session=False
+    )
+    db_session.commit()
+
+    result = fleet_service.reconcile_fleet_job_counters(db=db_session)
+    assert result["jobs_corrected"] == 1
+    db_session.expire_all()
+    job = db_session.get(FleetJob, job.id)
+    assert (job.queued_items, job.succeeded_items) == (0, 2)
+    assert job.status == FleetJobStatus.SUCCEEDED
+    assert fleet_service.reconcile_fleet_job_counters(db=db_session)["jobs_corrected"] == 0
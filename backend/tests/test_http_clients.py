@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import get_settings
+from app.providers import http_clients
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:  # noqa: ANN002
+        return
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry() -> Iterator[None]:
+    http_clients.close_http_clients()
+    yield
+    http_clients.close_http_clients()
+
+
+def _sample(provider: str, connection: str) -> float:
+    return REGISTRY.get_sample_value(
+        "http_client_requests_total",
+        {"provider": provider, "connection": connection},
+    ) or 0.0
+
+
+def test_registry_shares_one_configured_pool_per_provider(monkeypatch) -> None:
+    settings = get_settings().model_copy(
+        update={
+            "http_client_provider_max_connections": "dataforseo=7",
+            "website_performance_http_timeout_seconds": 12.0,
+        }
+    )
+    monkeypatch.setattr(http_clients, "get_settings", lambda: settings)
+
+    dataforseo = http_clients.get_http_client("dataforseo")
+    website_performance = http_clients.get_http_client("website_performance")
+
+    assert http_clients.get_http_client("dataforseo") is dataforseo
+    assert http_clients.get_http_client("dataforseo", proxy="http://proxy.example:8080") is not dataforseo
+    assert dataforseo._transport._pool._max_connections == 7
+    assert website_performance._transport._pool._max_connections == (
+        settings.website_performance_max_concurrent_pagespeed_runs + 4
+    )
+    assert http_clients.http_client_max_connections("dataforseo") == 7
+    assert website_performance.follow_redirects is True
+    assert website_performance.timeout.read == 12.0
+    assert dataforseo.timeout.connect == settings.http_client_connect_timeout_seconds
+
+    http_clients.close_http_clients()
+
+    assert dataforseo.is_closed and website_performance.is_closed
+    assert http_clients.get_http_client("dataforseo") is not dataforseo
+
+
+def test_connections_are_reused_and_counted_per_provider(local_server) -> None:
+    new_before = _sample("pool_test", "new")
+    reused_before = _sample("pool_test", "reused")
+    client = http_clients.get_http_client("pool_test")
+
+    for _ in range(3):
+        assert client.get(local_server).json() == {"ok": True}
+
+    assert _sample("pool_test", "new") - new_before == 1
+    assert _sample("pool_test", "reused") - reused_before == 2
+    assert REGISTRY.get_sample_value(
+        "http_client_request_duration_seconds_count", {"provider": "pool_test"}
+    ) >= 3
+
+
+def test_pooled_clients_do_not_carry_cookies_between_calls() -> None:
+    sent_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "session=tenantA; Path=/"})
+
+    client = http_clients.get_http_client("cookie_test")
+    client._transport = httpx.MockTransport(handler)
+
+    client.get("https://customer-a.example/")
+    client.get("https://customer-a.example/")
+    client.get("https://customer-b.example/")
+
+    assert sent_cookies == [None, None, None]
+    assert len(client.cookies.jar) == 0
+
+
+def test_forked_child_builds_its_own_pools_without_closing_inherited_ones(monkeypatch) -> None:
+    inherited = http_clients.get_http_client("crawl")
+    monkeypatch.setattr(http_clients, "_owner_pid", -1)
+
+    replacement = http_clients.get_http_client("crawl")
+
+    assert replacement is not inherited
+    assert inherited.is_closed is False
+    inherited.close()
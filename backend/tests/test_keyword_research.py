@@ -340,6 +340,64 @@ def _login(client, email: str, password: str) -> str:
     return response.json()["data"]["access_token"]
 
 
+def _brute_force_target_url(item: dict, pages: list[dict]) -> str | None:
+    tokens = keyword_research_service._meaningful_tokens
+    service_name = item.get("matched_service_name") or ""
+    area_name = item.get("matched_service_area_name") or ""
+    best_url, best_score = None, 0
+    for page in pages:
+        page_text = " ".join(
+            str(page.get(field) or "") for field in ("url", "title", "meta_description", "heading_text")
+        ).casefold()
+        page_tokens = tokens(page_text)
+        score = 0
+        if service_name and service_name.casefold() in page_text:
+            score += 8
+        else:
+            score += min(6, len(tokens(service_name) & page_tokens) * 2)
+        if area_name and area_name.casefold() in page_text:
+            score += 3
+        else:
+            score += min(2, len(tokens(area_name) & page_tokens))
+        score += min(6, len(tokens(item["keyword"]) & page_tokens) * 2)
+        if score > best_score:
+            best_url, best_score = page["url"], score
+    return best_url if best_score >= 6 else None
+
+
+def test_indexed_target_page_matching_matches_scoring_every_page() -> None:
+    services = ["Emergency Plumbing", "Drain Cleaning", "Water Heater Repair", "AC", "Roof Repair", ""]
+    areas = ["Reno", "Sparks", "Carson City", ""]
+    modifiers = ["cost", "near me", "best", "emergency", "same day", "24 hour", "how to fix"]
+    pages = [
+        {
+            "url": f"https://plumber.example/{services[index % 5].casefold().replace(' ', '-')}-{index}",
+            "title": f"{services[(index * 3) % 5]} in {areas[index % 3]}",
+            "meta_description": f"Backflow and {modifiers[index % 7]} help" if index % 4 else None,
+            "heading_text": f"{areas[(index + 1) % 3]} {services[(index + 2) % 5]} team",
+        }
+        for index in range(60)
+    ]
+    index = keyword_research_service._TargetPageIndex(pages)
+    checked = 0
+    for service_position, service_name in enumerate(services):
+        for area_position, area_name in enumerate(areas):
+            for modifier in modifiers:
+                item = {
+                    "keyword": f"{modifier} {service_name} {area_name}".strip(),
+                    "relevance_status": "relevant",
+                    "matched_service_name": service_name or None,
+                    "matched_service_area_name": area_name or None,
+                    "evidence": {},
+                }
+                expected = _brute_force_target_url(item, pages)
+                indexed = keyword_research_service._target_page_for_item(item, target_pages=index)
+                assert indexed["url"] == expected, item
+                assert indexed["status"] == ("existing" if expected else "needs_page")
+                checked += 1
+    assert checked == len(services) * len(areas) * len(modifiers)
+
+
 def test_keyword_research_api_returns_empty_state_before_first_run(client) -> None:
     token = _login(client, "a@example.com", "pass-a")
     headers = {"Authorization": f"Bearer {token}"}
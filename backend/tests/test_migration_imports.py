@@ -12,11 +12,14 @@ from app.models.migration_import import (
     MigrationImportBatch,
     MigrationImportRecord,
     MigrationUploadChunk,
+    MigrationUploadReviewRow,
     MigrationUploadSession,
 )
+from app.models.platform_job import PlatformJob
 from app.models.portfolio import Portfolio
 from app.models.rank import CampaignKeyword, KeywordCluster, Ranking, RankingSnapshot
 from app.models.reporting import ReportDeliveryEvent, ReportRecipient
+from app.services import durable_job_service, migration_import_service, migration_upload_service
 from app.services.migration_upload_service import purge_expired_upload_sessions
 from app.services.commercial_plan_service import apply_commercial_plan
 
@@ -458,6 +461,305 @@ def test_resumable_migration_upload_reviews_more_than_direct_row_limit(client) -
     assert len(review["rows"]) == 25
 
 
+def test_large_migration_upload_is_reviewed_in_batches_and_applied_in_background(
+    client, db_session, monkeypatch
+) -> None:
+    monkeypatch.setattr(migration_import_service, "REVIEW_BATCH_SIZE", 2)
+    monkeypatch.setattr(migration_import_service, "APPLY_BATCH_SIZE", 2)
+    monkeypatch.setattr(migration_upload_service, "INLINE_APPLY_ROWS", 0)
+    token, org_id = _login(client, "org-owner@example.com", "pass-org-owner")
+    csv_text = (
+        "Record Type,Location Name,Website,Keyword,Group,Position,Captured At\n"
+        "location,Streamed Office,streamed-office.example,,,,\n"
+        "keyword,Streamed Office,,dumpster rental,Core,,\n"
+        "keyword,Streamed Office,,junk hauling,Core,,\n"
+        "competitor,Streamed Office,,,,,\n"
+        "keyword,Streamed Office,,dumpster rental,Repeat,,\n"
+        "ranking,Streamed Office,,junk hauling,,4,2026-07-31\n"
+    )
+    # Part boundaries fall inside lines, so rows are joined across parts.
+    chunks = [csv_text[:40], csv_text[40:150], csv_text[150:]]
+    created = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads",
+        json={
+            "source_system": "other",
+            "total_chunks": len(chunks),
+            "expected_sha256": hashlib.sha256(csv_text.encode("utf-8")).hexdigest(),
+            "client_request_id": str(uuid.uuid4()),
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    upload_id = created.json()["data"]["upload"]["id"]
+    for index, content in enumerate(chunks):
+        uploaded = client.put(
+            f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/chunks/{index}",
+            json={
+                "content": content,
+                "chunk_sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert uploaded.status_code == 200
+
+    reviewed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review?page_size=4",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert reviewed.status_code == 200
+    review = reviewed.json()["data"]
+    assert "rows_sha256" in review
+    assert review["summary"]["total_rows"] == 6
+    # The competitor row has no domain and blocks the import until it is fixed.
+    assert review["summary"]["needs_attention"] == 1
+    assert review["summary"]["duplicates_in_file"] == 1
+    assert [row["status"] for row in review["rows"]] == ["ready", "ready", "ready", "needs_attention"]
+    page_two = client.get(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review/rows?page=2&page_size=4",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert [row["status"] for row in page_two.json()["data"]["rows"]] == ["duplicate", "ready"]
+    assert db_session.query(MigrationUploadReviewRow).filter_by(upload_id=upload_id).count() == 6
+
+    blocked = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/apply",
+        json={
+            "review_hash": review["review_hash"],
+            "client_request_id": str(uuid.uuid4()),
+            "confirmed": True,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert blocked.status_code == 409
+    assert blocked.json()["errors"][0]["details"]["reason_code"] == "migration_rows_need_attention"
+
+    # Pretend the owner fixed the competitor row so the rest can be applied.
+    upload = db_session.query(MigrationUploadSession).filter_by(id=upload_id).one()
+    competitor_row = (
+        db_session.query(MigrationUploadReviewRow).filter_by(upload_id=upload_id, row_number=5).one()
+    )
+    competitor_row.status = "duplicate"
+    competitor_row.review = {**competitor_row.review, "status": "duplicate"}
+    upload.review_payload = {
+        **upload.review_payload,
+        "summary": {**upload.review_payload["summary"], "needs_attention": 0},
+    }
+    db_session.commit()
+
+    applied = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/apply",
+        json={
+            "review_hash": review["review_hash"],
+            "client_request_id": str(uuid.uuid4()),
+            "confirmed": True,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert applied.status_code == 200
+    result = applied.json()["data"]
+    assert result["upload"]["status"] == "applying"
+    assert result["upload"]["apply_progress"]["phase"] == "staging"
+    job = db_session.get(PlatformJob, result["job_id"])
+    assert job.job_type == "migration_imports.apply_upload"
+
+    db_session.expire_all()
+    upload = db_session.query(MigrationUploadSession).filter_by(id=upload_id).one()
+    runs = []
+    while True:
+        step = migration_upload_service.continue_upload_apply(
+            db_session, upload=upload, max_rows=3, commit=True
+        )
+        runs.append(step["progress"])
+        if step["finished"]:
+            break
+        assert len(runs) < 10
+    assert runs[0]["rows_staged"] == 3
+    assert runs[-1]["phase"] == "applied"
+    assert runs[-1]["rows_applied"] == 4
+
+    db_session.expire_all()
+    batch = db_session.get(MigrationImportBatch, result["batch"]["id"])
+    assert batch.status == "applied"
+    assert batch.summary["records_applied"] == 4
+    assert batch.summary["keywords_created"] == 2
+    assert batch.summary["ranking_history_created"] == 1
+    assert db_session.query(MigrationImportRecord).filter_by(batch_id=batch.id).count() == 6
+    assert db_session.query(MigrationUploadSession).filter_by(id=upload_id).one().status == "applied"
+    location = db_session.query(BusinessLocation).filter_by(organization_id=org_id, name="Streamed Office").one()
+    campaign = db_session.query(Campaign).filter_by(business_location_id=location.id).one()
+    assert (
+        db_session.query(RankingSnapshot)
+        .filter_by(campaign_id=campaign.id, import_batch_id=batch.id, position=4)
+        .count()
+        == 1
+    )
+
+
+def _create_single_part_upload(
+    client, token: str, org_id: str, csv_text: str, *, expected_sha256: str | None = None
+) -> str:
+    source_hash = hashlib.sha256(csv_text.encode("utf-8")).hexdigest()
+    created = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads",
+        json={
+            "source_system": "other",
+            "total_chunks": 1,
+            "expected_sha256": expected_sha256 or source_hash,
+            "client_request_id": str(uuid.uuid4()),
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    upload_id = created.json()["data"]["upload"]["id"]
+    uploaded = client.put(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/chunks/0",
+        json={"content": csv_text, "chunk_sha256": source_hash},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert uploaded.status_code == 200
+    return upload_id
+
+
+def test_large_migration_upload_is_reviewed_by_a_background_job(client, db_session, monkeypatch) -> None:
+    monkeypatch.setattr(migration_upload_service, "INLINE_REVIEW_BYTES", 0)
+    token, org_id = _login(client, "org-owner@example.com", "pass-org-owner")
+    csv_text = "Record Type,Location Name,Website\nlocation,Queued Office,queued-office.example\n"
+    upload_id = _create_single_part_upload(client, token, org_id, csv_text)
+
+    queued = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert queued.status_code == 200
+    assert queued.json()["data"]["upload"]["status"] == "reviewing"
+    assert db_session.query(MigrationUploadReviewRow).filter_by(upload_id=upload_id).count() == 0
+    retried = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert retried.json()["data"]["job_id"] == queued.json()["data"]["job_id"]
+    pending = client.get(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review/rows",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert pending.status_code == 409
+    assert pending.json()["errors"][0]["details"]["reason_code"] == "migration_upload_review_pending"
+
+    job = db_session.get(PlatformJob, queued.json()["data"]["job_id"])
+    assert job.job_type == "migration_imports.review_upload"
+    assert durable_job_service.DEFAULT_HANDLERS[job.job_type](db_session, job)["status"] == "reviewed"
+    db_session.commit()
+
+    reviewed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert reviewed.status_code == 200
+    assert reviewed.json()["data"]["summary"]["ready"] == 1
+    assert reviewed.json()["data"]["rows"][0]["location_name"] == "Queued Office"
+
+    mismatched = _create_single_part_upload(client, token, org_id, csv_text, expected_sha256="0" * 64)
+    client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{mismatched}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    upload = db_session.query(MigrationUploadSession).filter_by(id=mismatched).one()
+    migration_upload_service.run_upload_review(db_session, upload=upload)
+    db_session.commit()
+    assert upload.status == "review_failed"
+    failed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{mismatched}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert failed.status_code == 409
+    assert failed.json()["errors"][0]["details"]["reason_code"] == "migration_upload_file_hash_mismatch"
+
+
+def test_upload_reviewed_before_the_review_table_applies_its_payload_rows(
+    client, db_session, monkeypatch
+) -> None:
+    monkeypatch.setattr(migration_upload_service, "INLINE_APPLY_ROWS", 0)
+    token, org_id = _login(client, "org-owner@example.com", "pass-org-owner")
+    csv_text = (
+        "Record Type,Location Name,Website,Keyword,Group\n"
+        "location,Legacy Office,legacy-office.example,,\n"
+        "keyword,Legacy Office,,legacy search,Core\n"
+    )
+    upload_id = _create_single_part_upload(client, token, org_id, csv_text)
+    reviewed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert reviewed.status_code == 200
+
+    # Reshape it the way reviews were saved before: rows inside the payload.
+    upload = db_session.query(MigrationUploadSession).filter_by(id=upload_id).one()
+    review_rows = db_session.query(MigrationUploadReviewRow).filter_by(upload_id=upload_id)
+    legacy_review = {key: value for key, value in upload.review_payload.items() if key != "rows_sha256"}
+    legacy_review["rows"] = [row.review for row in review_rows.order_by(MigrationUploadReviewRow.row_number)]
+    legacy_review["review_hash"] = migration_import_service._review_hash(legacy_review)
+    review_rows.delete(synchronize_session=False)
+    upload.review_payload = legacy_review
+    upload.review_hash = legacy_review["review_hash"]
+    db_session.commit()
+
+    applied = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/apply",
+        json={
+            "review_hash": legacy_review["review_hash"],
+            "client_request_id": str(uuid.uuid4()),
+            "confirmed": True,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert applied.status_code == 200
+    db_session.expire_all()
+    upload = db_session.query(MigrationUploadSession).filter_by(id=upload_id).one()
+    assert migration_upload_service.continue_upload_apply(db_session, upload=upload, commit=True)["finished"]
+
+    batch = db_session.get(MigrationImportBatch, applied.json()["data"]["batch"]["id"])
+    assert batch.summary["records_applied"] == 2
+    assert batch.summary["locations_created"] == 1
+    assert batch.summary["keywords_created"] == 1
+    assert db_session.query(MigrationImportRecord).filter_by(batch_id=batch.id).count() == 2
+
+
+def test_upload_apply_rejects_a_review_made_before_the_setup_changed(client, db_session) -> None:
+    token, org_id = _login(client, "org-owner@example.com", "pass-org-owner")
+    csv_text = "Record Type,Location Name,Website\nlocation,Stale Office,stale-office.example\n"
+    upload_id = _create_single_part_upload(client, token, org_id, csv_text)
+    reviewed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert reviewed.status_code == 200
+    review_hash = reviewed.json()["data"]["review_hash"]
+    assert reviewed.json()["data"]["summary"]["ready"] == 1
+
+    # Someone adds the same location by hand after the file was reviewed.
+    created = client.post(
+        f"/api/v1/organizations/{org_id}/business-locations",
+        json={"name": "Stale Office", "domain": "stale-office.example"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert created.status_code == 200
+
+    stale = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/apply",
+        json={"review_hash": review_hash, "client_request_id": str(uuid.uuid4()), "confirmed": True},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert stale.status_code == 409
+    assert stale.json()["errors"][0]["details"]["reason_code"] == "migration_review_changed"
+    assert db_session.query(MigrationImportBatch).filter_by(organization_id=org_id).count() == 0
+
+    refreshed = client.post(
+        f"/api/v1/organizations/{org_id}/migration-imports/uploads/{upload_id}/review",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.json()["data"]["review_hash"] != review_hash
+    assert refreshed.json()["data"]["rows"][0]["status"] != "ready"
+
+
 def test_expired_migration_upload_content_is_purged(client, db_session) -> None:
     token, org_id = _login(client, "org-admin@example.com", "pass-org-admin")
     csv_text = "Record Type,Location Name,Website\nlocation,Old Upload,old.example\n"
@@ -487,7 +789,7 @@ def test_expired_migration_upload_content_is_purged(client, db_session) -> None:
     result = purge_expired_upload_sessions(db_session)
     db_session.commit()
 
-    assert result == {"sessions_deleted": 1, "chunks_deleted": 1}
+    assert result == {"sessions_deleted": 1, "chunks_deleted": 1, "review_rows_deleted": 0}
     assert db_session.query(MigrationUploadSession).filter_by(id=upload_id).count() == 0
     assert db_session.query(MigrationUploadChunk).filter_by(session_id=upload_id).count() == 0
 
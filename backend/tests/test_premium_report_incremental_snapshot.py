@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, date, datetime, timedelta
+
+from app.models.campaign_daily_metric import CampaignDailyMetric
+from app.models.reporting import MonthlyReport
+from app.models.search_console_daily_metric import SearchConsoleDailyMetric
+from app.services import premium_report_service
+from tests.conftest import create_test_campaign
+
+FIRST_END = date(2026, 7, 31)
+GENERATED_AT = datetime(2026, 9, 2, 12, 0, tzinfo=UTC)
+
+
+def _add_days(db_session, campaign, start: date, end: date, *, offset: int = 0) -> None:
+    day = start
+    index = offset
+    while day <= end:
+        db_session.add(
+            SearchConsoleDailyMetric(
+                organization_id=campaign.organization_id,
+                campaign_id=campaign.id,
+                metric_date=day,
+                clicks=10 + index % 7,
+                impressions=200 + index,
+                avg_position=8.0 - (index % 5) / 10,
+                deterministic_hash=f"{index:064d}",
+            )
+        )
+        db_session.add(
+            CampaignDailyMetric(
+                organization_id=campaign.organization_id,
+                campaign_id=campaign.id,
+                metric_date=day,
+                clicks=10 + index % 7,
+                impressions=200 + index,
+                intelligence_score=60 + index % 10,
+                deterministic_hash=f"{index:064d}",
+            )
+        )
+        day += timedelta(days=1)
+        index += 1
+    db_session.flush()
+
+
+def _save_report(db_session, campaign, snapshot: dict) -> None:
+    db_session.add(
+        MonthlyReport(
+            tenant_id=campaign.tenant_id,
+            campaign_id=campaign.id,
+            month_number=1,
+            summary_json=json.dumps(snapshot, sort_keys=True),
+        )
+    )
+    db_session.flush()
+
+
+def _setup(db_session, create_test_org):
+    org = create_test_org(name="Incremental Report Org")
+    campaign = create_test_campaign(db_session, org.id, name="Incremental Report Campaign")
+    # Two years of history before the first report window.
+    _add_days(db_session, campaign, FIRST_END - timedelta(days=729), FIRST_END)
+    first = premium_report_service.build_report_snapshot(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign=campaign,
+        month_number=1,
+        generated_at=datetime(2026, 8, 2, tzinfo=UTC),
+    )
+    _save_report(db_session, campaign, first)
+    _add_days(db_session, campaign, FIRST_END + timedelta(days=1), FIRST_END + timedelta(days=30), offset=730)
+    return campaign, first
+
+
+def test_report_snapshot_reuses_previous_period_and_matches_full_rebuild(db_session, create_test_org, monkeypatch) -> None:
+    campaign, first = _setup(db_session, create_test_org)
+    loaded_windows: list[tuple[int, int]] = []
+    original = premium_report_service._daily_window_aggregates
+
+    def spy(daily_rows, search_rows):
+        loaded_windows.append((len(daily_rows), len(search_rows)))
+        return original(daily_rows, search_rows)
+
+    monkeypatch.setattr(premium_report_service, "_daily_window_aggregates", spy)
+    incremental = premium_report_service.build_report_snapshot(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign=campaign,
+        month_number=2,
+        generated_at=GENERATED_AT,
+    )
+    assert loaded_windows == [(30, 30)]
+
+    db_session.query(MonthlyReport).filter(MonthlyReport.campaign_id == campaign.id).delete()
+    db_session.flush()
+    loaded_windows.clear()
+    rebuilt = premium_report_service.build_report_snapshot(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign=campaign,
+        month_number=2,
+        generated_at=GENERATED_AT,
+    )
+    assert loaded_windows == [(30, 30), (30, 30)]
+
+    assert incremental == rebuilt
+    assert incremental["period"]["comparison_start"] == first["period"]["start"]
+    visits = next(item for item in incremental["metrics"] if item["key"] == "google_visits")
+    first_visits = next(item for item in first["metrics"] if item["key"] == "google_visits")
+    assert visits["previous"] == first_visits["current"]
+
+
+def test_report_snapshot_recomputes_comparison_after_backfill(db_session, create_test_org) -> None:
+    campaign, first = _setup(db_session, create_test_org)
+    backfilled = (
+        db_session.query(SearchConsoleDailyMetric)
+        .filter(
+            SearchConsoleDailyMetric.campaign_id == campaign.id,
+            SearchConsoleDailyMetric.metric_date == FIRST_END,
+        )
+        .one()
+    )
+    backfilled.clicks += 500
+    db_session.flush()
+
+    snapshot = premium_report_service.build_report_snapshot(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign=campaign,
+        month_number=2,
+        generated_at=GENERATED_AT,
+    )
+
+    visits = next(item for item in snapshot["metrics"] if item["key"] == "google_visits")
+    first_visits = next(item for item in first["metrics"] if item["key"] == "google_visits")
+    assert visits["previous"] == first_visits["current"] + 500
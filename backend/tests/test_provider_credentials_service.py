@@ -229,3 +229,81 @@ def test_encrypt_decrypt_roundtrip_and_ciphertext_not_plaintext() -> None:
     assert "roundtrip-secret" not in encrypted_blob
     decrypted = svc._decrypt_payload(encrypted_blob)
     assert decrypted == plaintext
+
+
+def test_resolution_cache_skips_decryption_until_the_row_changes(db_session, monkeypatch) -> None:
+    from datetime import UTC, datetime, timedelta
+
+    from app.core.metrics import provider_credential_cache_requests_total
+    from app.services import provider_credentials_service as svc
+
+    clock = [1000.0]
+    decrypted: list[str] = []
+    real_decrypt = svc.decrypt_payload
+    monkeypatch.setattr(svc, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(svc, "decrypt_payload", lambda blob: decrypted.append(blob) or real_decrypt(blob))
+    outcomes = {
+        outcome: provider_credential_cache_requests_total.labels(outcome=outcome)._value.get()
+        for outcome in ("hit", "revalidated", "miss")
+    }
+
+    org = _create_org(db_session)
+    upsert_platform_provider_credentials(
+        db_session,
+        provider_name="dataforseo",
+        auth_mode="api_key",
+        credentials={"api_key": "cached-key"},
+    )
+    first = resolve_provider_credentials(db_session, org.id, "dataforseo")
+    first["api_key"] = "mutated-by-caller"
+    assert resolve_provider_credentials(db_session, org.id, "dataforseo") == {"api_key": "cached-key"}
+    assert len(decrypted) == 1
+
+    clock[0] += 60
+    assert resolve_provider_credentials(db_session, org.id, "dataforseo") == {"api_key": "cached-key"}
+    assert len(decrypted) == 1
+
+    # A write from another process is picked up once the entry expires.
+    row = db_session.query(PlatformProviderCredential).filter_by(provider_name="dataforseo").one()
+    row.encrypted_secret_blob = svc._encrypt_payload({"api_key": "rotated-key"})[0]
+    row.updated_at = datetime.now(UTC) + timedelta(seconds=1)
+    db_session.commit()
+    clock[0] += 60
+    assert resolve_provider_credentials(db_session, org.id, "dataforseo") == {"api_key": "rotated-key"}
+    assert len(decrypted) == 2
+
+    assert provider_credential_cache_requests_total.labels(outcome="hit")._value.get() - outcomes["hit"] == 1
+    assert provider_credential_cache_requests_total.labels(outcome="revalidated")._value.get() - outcomes[
+        "revalidated"
+    ] == 1
+    assert provider_credential_cache_requests_total.labels(outcome="miss")._value.get() - outcomes["miss"] == 2
+
+
+def test_cached_credentials_are_never_pickled_or_printed(db_session) -> None:
+    import pickle
+
+    from app.services import provider_credentials_service as svc
+
+    org = _create_org(db_session)
+    upsert_organization_provider_credentials(
+        db_session,
+        organization_id=org.id,
+        provider_name="dataforseo",
+        auth_mode="api_key",
+        credentials={"api_key": "in-memory-only"},
+    )
+    upsert_provider_policy(
+        db_session,
+        organization_id=org.id,
+        provider_name="dataforseo",
+        credential_mode="byo_required",
+    )
+    resolve_provider_credentials(db_session, org.id, "dataforseo")
+    (entry,) = svc._CREDENTIAL_CACHE.values()
+
+    assert "in-memory-only" not in repr(entry)
+    with pytest.raises(TypeError):
+        pickle.dumps(entry)
+
+    svc.invalidate_provider_credential_cache(organization_id=org.id)
+    assert not svc._CREDENTIAL_CACHE
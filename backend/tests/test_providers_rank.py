@@ -49,7 +49,7 @@ def test_synthetic_rank_provider_contract():
 
 def test_http_json_rank_provider_reads_data_wrapper(monkeypatch):
     fake_client = _FakeClient()
-    monkeypatch.setattr(rank.httpx, "Client", lambda: fake_client)
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: fake_client)
     provider = rank.HttpJsonRankProvider(
         endpoint="https://provider.example/rank",
         timeout_seconds=9.0,
@@ -69,7 +69,7 @@ def test_http_json_rank_provider_requires_position(monkeypatch):
         def post(self, url: str, json: dict, headers: dict, timeout: float):  # noqa: A002
             return _FakeResponse({"data": {"confidence": 0.9}})
 
-    monkeypatch.setattr(rank.httpx, "Client", lambda: _NoPositionClient())
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: _NoPositionClient())
     provider = rank.HttpJsonRankProvider(endpoint="https://provider.example/rank")
     try:
         provider.collect_keyword_snapshot(keyword="local seo", location_code="US")
@@ -109,7 +109,7 @@ def test_get_rank_provider_http_json_backend(monkeypatch):
 
 def test_serpapi_rank_provider_matches_target_domain(monkeypatch):
     fake_client = _FakeClient()
-    monkeypatch.setattr(rank.httpx, "Client", lambda: fake_client)
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: fake_client)
     provider = rank.SerpApiRankProvider(api_key="k")
     row = provider.collect_keyword_snapshot(keyword="best local seo", location_code="US", target_domain="rank.com")
     assert row["position"] == 4
@@ -123,7 +123,7 @@ def test_serpapi_rank_provider_returns_100_when_domain_not_found(monkeypatch):
         def get(self, url: str, params: dict, timeout: float):
             return _FakeResponse({"organic_results": [{"position": 1, "link": "https://other.com/page"}]})
 
-    monkeypatch.setattr(rank.httpx, "Client", lambda: _NoMatchClient())
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: _NoMatchClient())
     provider = rank.SerpApiRankProvider(api_key="k")
     row = provider.collect_keyword_snapshot(keyword="best local seo", location_code="US", target_domain="rank.com")
     assert row["position"] == 100
@@ -132,7 +132,7 @@ def test_serpapi_rank_provider_returns_100_when_domain_not_found(monkeypatch):
 
 def test_serpapi_rank_provider_uses_city_location(monkeypatch):
     fake_client = _FakeClient()
-    monkeypatch.setattr(rank.httpx, "Client", lambda: fake_client)
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: fake_client)
     provider = rank.SerpApiRankProvider(api_key="k")
     provider.collect_keyword_snapshot(
         keyword="junk removal",
@@ -170,7 +170,7 @@ def test_dataforseo_rank_provider_matches_target_domain(monkeypatch):
             )
 
     fake_client = _DataForSeoClient()
-    monkeypatch.setattr(rank.httpx, "Client", lambda: fake_client)
+    monkeypatch.setattr(rank, "get_http_client", lambda _provider, proxy=None: fake_client)
     provider = rank.DataForSeoRankProvider(login="login", password="password")
     row = provider.collect_keyword_snapshot(
         keyword="junk removal",
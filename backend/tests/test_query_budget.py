@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from app.core.middleware import QueryBudgetMiddleware
+from app.db import session as db_session_module
+from app.db.query_budget import (
+    QueryBudgetExceeded,
+    current_query_budget_scope,
+    fingerprint_statement,
+    query_budget_scope,
+)
+from app.models.tenant import Tenant
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _sample(metric: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(metric, labels) or 0.0
+
+
+def test_fingerprint_collapses_literals_parameters_and_in_lists() -> None:
+    assert fingerprint_statement(
+        "SELECT t1.id FROM pages AS t1\n WHERE t1.url = 'https://a.example/1' AND t1.depth > 3"
+    ) == fingerprint_statement("SELECT t1.id FROM pages AS t1 WHERE t1.url = %(url_1)s AND t1.depth > :depth")
+    assert fingerprint_statement("SELECT * FROM pages WHERE id IN (?, ?, ?)") == (
+        "SELECT * FROM pages WHERE id IN (?+)"
+    )
+    assert fingerprint_statement("SELECT * FROM pages WHERE id IN ($1, $2)") == (
+        "SELECT * FROM pages WHERE id IN (?+)"
+    )
+    assert fingerprint_statement("SELECT payload::jsonb FROM events") == "SELECT payload::jsonb FROM events"
+
+
+def test_repeated_statements_fail_a_strict_scope(db_session) -> None:
+    tenant_ids = [tenant.id for tenant in db_session.query(Tenant).all()]
+    assert len(tenant_ids) >= 2
+    db_session.expunge_all()
+
+    with pytest.raises(QueryBudgetExceeded, match="repeated statements: 2x SELECT"):
+        with query_budget_scope("test", "n_plus_one", max_repeats=1, action="raise") as scope:
+            for tenant_id in tenant_ids[:2]:
+                db_session.get(Tenant, tenant_id)
+
+    assert scope.queries == 2
+    assert _sample("sql_unit_of_work_queries_count", kind="test", name="n_plus_one") >= 1
+    assert _sample(
+        "sql_query_budget_violations_total",
+        kind="test",
+        name="n_plus_one",
+        reason="repeated_statement",
+    ) >= 1
+
+
+def test_nested_scopes_roll_up_and_budget_counts_queries(db_session) -> None:
+    db_session.expunge_all()
+
+    with query_budget_scope("test", "outer", max_queries=10, max_repeats=0, action="raise") as outer:
+        db_session.query(Tenant).count()
+        with query_budget_scope("test", "inner", max_queries=10, action="raise") as inner:
+            db_session.query(Tenant).all()
+            db_session.query(Tenant).all()
+
+    assert (inner.queries, outer.queries) == (2, 3)
+    assert inner.rows == outer.rows >= 0
+    assert current_query_budget_scope() is None
+
+    with pytest.raises(QueryBudgetExceeded, match="ran 2 queries \\(budget 1\\)"):
+        with query_budget_scope("test", "over_budget", max_queries=1, max_repeats=0, action="raise"):
+            db_session.query(Tenant).count()
+            db_session.query(Tenant).all()
+
+
+@pytest.mark.anyio
+async def test_middleware_attributes_queries_to_the_route_template(db_session) -> None:
+    del db_session
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware)
+
+    @app.get("/tenants/{tenant_id}")
+    def read_tenant(tenant_id: str) -> dict[str, int]:
+        db = db_session_module.SessionLocal()
+        try:
+            db.get(Tenant, tenant_id)
+            return {"tenants": db.query(Tenant).count()}
+        finally:
+            db.close()
+
+    route = "/tenants/{tenant_id}"
+    before = _sample("sql_unit_of_work_queries_sum", kind="http", name=route)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        response = await client.get("/tenants/missing")
+
+    assert response.status_code == 200
+    assert _sample("sql_unit_of_work_queries_count", kind="http", name=route) >= 1
+    assert _sample("sql_unit_of_work_queries_sum", kind="http", name=route) - before >= 2
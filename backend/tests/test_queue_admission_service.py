@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import time
+
+from app.services import queue_admission_service
+from app.services.queue_controls.depth_sampler import QueueDepthSampler
+from app.services.queue_controls.shared_admission import AdmissionStoreUnavailable, SharedAdmissionResult
+
+
+class _Probe:
+    def __init__(self, depths: dict[str, int | None]) -> None:
+        self.depths = depths
+        self.calls: list[str] = []
+
+    def __call__(self, queue_name: str) -> int | None:
+        self.calls.append(queue_name)
+        return self.depths.get(queue_name)
+
+
+class _SharedStore:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls: list[dict] = []
+
+    def admit(self, *, tenant_id: str, queue_name: str, contended: bool) -> SharedAdmissionResult:
+        self.calls.append({"tenant_id": tenant_id, "queue_name": queue_name, "contended": contended})
+        if self.fail:
+            raise AdmissionStoreUnavailable("down")
+        return SharedAdmissionResult(allowed=False, reason="token_bucket_rejected", remaining=0)
+
+
+def _use_sampler(monkeypatch, probe: _Probe, *, interval_seconds: float = 60.0) -> QueueDepthSampler:
+    sampler = QueueDepthSampler(probe, interval_seconds=interval_seconds, max_age_seconds=interval_seconds * 2)
+    monkeypatch.setattr(queue_admission_service, "_depth_sampler", sampler)
+    return sampler
+
+
+def test_admission_reads_sampled_depths_instead_of_probing_per_enqueue(monkeypatch) -> None:
+    probe = _Probe({"crawl_queue": 3, "default_queue": 0})
+    sampler = _use_sampler(monkeypatch, probe)
+    monkeypatch.setattr(queue_admission_service, "_buckets", {})
+    try:
+        decisions = [
+            queue_admission_service.admit_enqueue(tenant_id="system", queue_name="crawl_queue")
+            for _ in range(50)
+        ]
+    finally:
+        sampler.stop()
+
+    assert all(decision.allowed for decision in decisions)
+    assert sorted(probe.calls) == ["crawl_queue", "default_queue"]
+
+
+def test_sampled_critical_lag_rejects_non_critical_queue(monkeypatch) -> None:
+    monkeypatch.setattr(queue_admission_service, "_shadow_replay_enabled", True)
+    sampler = _use_sampler(monkeypatch, _Probe({"crawl_queue": 500, "default_queue": 0}))
+    try:
+        decision = queue_admission_service.admit_enqueue(tenant_id="tenant-a", queue_name="crawl_queue")
+    finally:
+        sampler.stop()
+
+    assert decision.allowed is False
+    assert decision.reason == "critical_queue_lag"
+    assert queue_admission_service.shadow_replay_allowed() is False
+
+
+def test_shared_store_decides_admission_and_sees_contention(monkeypatch) -> None:
+    sampler = _use_sampler(monkeypatch, _Probe({"content_queue": 75, "default_queue": 0}))
+    store = _SharedStore()
+    monkeypatch.setattr(queue_admission_service, "_shared_admission_store", lambda: store)
+    try:
+        decision = queue_admission_service.admit_enqueue(tenant_id=" ", queue_name="content_queue")
+    finally:
+        sampler.stop()
+
+    assert decision == queue_admission_service.AdmissionDecision(allowed=False, reason="token_bucket_rejected")
+    assert store.calls == [{"tenant_id": "system", "queue_name": "content_queue", "contended": True}]
+
+
+def test_shared_store_outage_falls_back_to_local_limits(monkeypatch) -> None:
+    sampler = _use_sampler(monkeypatch, _Probe({}))
+    store = _SharedStore(fail=True)
+    monkeypatch.setattr(queue_admission_service, "_shared_admission_store", lambda: store)
+    monkeypatch.setattr(queue_admission_service, "_shared_store_retry_at", 0.0)
+    monkeypatch.setattr(queue_admission_service, "_buckets", {})
+    try:
+        decision = queue_admission_service.admit_enqueue(tenant_id="system", queue_name="rank_queue")
+    finally:
+        sampler.stop()
+
+    assert decision.allowed is True
+    assert len(store.calls) == 1
+    assert queue_admission_service._shared_store_retry_at > time.monotonic()
+
+
+def test_depth_sampler_refreshes_in_background_and_expires_stale_samples() -> None:
+    probe = _Probe({"crawl_queue": 4})
+    sampler = QueueDepthSampler(probe, interval_seconds=0.02, max_age_seconds=0.05)
+    try:
+        assert sampler.depth("crawl_queue") == 4
+        probe.depths["crawl_queue"] = 9
+        deadline = time.monotonic() + 2
+        while sampler.depth("crawl_queue") != 9 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sampler.depth("crawl_queue") == 9
+    finally:
+        sampler.stop()
+
+    stale = QueueDepthSampler(probe, interval_seconds=60, max_age_seconds=60)
+    stale._samples["crawl_queue"] = (9, time.monotonic() - 120)
+    try:
+        assert stale.depth("crawl_queue") is None
+    finally:
+        stale.stop()
@@ -1,5 +1,12 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.models.business_location import BusinessLocation
+from app.models.campaign import Campaign
+from app.models.cost_economics import CostLedgerEntry
 from app.models.organization import Organization
 from app.models.user import User
+from app.services import rank_service
 from tests.helpers.economic_setup import provision_test_organization
 
 
@@ -114,3 +121,69 @@ def test_bulk_keyword_onboarding_and_portfolio_summary(client, db_session):
     )
     assert deleted.status_code == 200
     assert deleted.json()["data"]["deleted"] is True
+
+
+def test_paid_rank_collection_reconciles_its_reservations_in_one_batch(client, db_session, monkeypatch):
+    token = _login(client, "a@example.com", "pass-a")
+    user = db_session.query(User).filter(User.email == "a@example.com").first()
+    organization = db_session.query(Organization).filter(Organization.id == user.tenant_id).first()
+    provision_test_organization(db_session, organization)
+    headers = {"Authorization": f"Bearer {token}"}
+    campaign = client.post(
+        "/api/v1/campaigns",
+        json={"name": "Paid Rank Campaign", "domain": "paid-rank.com"},
+        headers=headers,
+    ).json()["data"]
+    for keyword in ("roof repair", "roof replacement", "gutter cleaning"):
+        added = client.post(
+            "/api/v1/rank/keywords",
+            json={
+                "campaign_id": campaign["id"],
+                "cluster_name": "Roofing",
+                "keyword": keyword,
+                "location_code": "US",
+            },
+            headers=headers,
+        )
+        assert added.status_code == 200
+
+    location = BusinessLocation(organization_id=organization.id, name="Paid rank location", status="active")
+    db_session.add(location)
+    db_session.flush()
+    db_session.get(Campaign, campaign["id"]).business_location_id = location.id
+    db_session.commit()
+
+    class _PaidProvider:
+        def collect_keyword_snapshot(self, *, keyword, location_code, target_domain):
+            return {"position": 4, "confidence": 0.9, "provider_reported_cost": "0.002"}
+
+    batches: list[int] = []
+    reconcile_batch = rank_service.reconcile_provider_cost_batch
+
+    def _counting_batch(db, *, reconciliations, **kwargs):
+        batches.append(len(reconciliations))
+        return reconcile_batch(db, reconciliations=reconciliations, **kwargs)
+
+    monkeypatch.setattr(
+        rank_service,
+        "get_settings",
+        lambda: SimpleNamespace(rank_provider_backend="dataforseo", rank_provider_dataforseo_depth=10),
+    )
+    monkeypatch.setattr(rank_service, "resolve_provider_credential_owner", lambda *args, **kwargs: "platform")
+    monkeypatch.setattr(rank_service, "get_rank_provider_for_organization", lambda *args: _PaidProvider())
+    monkeypatch.setattr(rank_service, "reconcile_provider_cost_batch", _counting_batch)
+
+    result = rank_service.run_snapshot_collection(db_session, organization.id, campaign["id"], "US")
+
+    assert result["snapshots_created"] == 3
+    assert batches == [3]
+    reconciled = (
+        db_session.query(CostLedgerEntry)
+        .filter(
+            CostLedgerEntry.campaign_id == campaign["id"],
+            CostLedgerEntry.event_type == "reconciliation",
+        )
+        .all()
+    )
+    assert len(reconciled) == 3
+    assert {Decimal(row.provider_reported_cost) for row in reconciled} == {Decimal("0.002")}
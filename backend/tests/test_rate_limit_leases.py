@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from threading import Lock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.middleware.rate_limit import RateLimitMiddleware
+from app.services import rate_limit_store
+from app.services.rate_limit_store import (
+    LeasedRateLimitStore,
+    RateLimitDecision,
+    RateLimitLease,
+    RateLimitStoreUnavailable,
+)
+
+HMAC_SECRET = "test-rate-limit-hmac-secret-with-at-least-32-characters"
+SCOPE = "c" * 64
+POLICY = "coarse_network_ip_v1"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.epoch = 1_999_999_980
+        self.started_at = 500.0
+
+    def monotonic(self) -> float:
+        return self.started_at + (self.epoch - 1_999_999_980)
+
+
+class _SharedWindowStore:
+    """In-memory stand-in for the Redis/PostgreSQL fixed-window contract."""
+
+    def __init__(self, clock: _Clock) -> None:
+        self.clock = clock
+        self.window_started_at = -1
+        self.count = 0
+        self.calls: list[str] = []
+        self._lock = Lock()
+
+    def _roll(self) -> int:
+        window = self.clock.epoch - self.clock.epoch % 60
+        if window > self.window_started_at:
+            self.window_started_at = window
+            self.count = 0
+        return window
+
+    def consume(self, *, scope_hash: str, policy_key: str, limit: int) -> RateLimitDecision:
+        with self._lock:
+            self.calls.append("consume")
+            window = self._roll()
+            self.count = min(self.count + 1, limit + 1)
+            return RateLimitDecision(
+                allowed=self.count <= limit,
+                limit=limit,
+                count=self.count,
+                remaining=max(0, limit - self.count),
+                reset_at_epoch=window + 60,
+                retry_after_seconds=max(1, window + 60 - self.clock.epoch),
+            )
+
+    def reserve(self, *, scope_hash: str, policy_key: str, limit: int, tokens: int) -> RateLimitLease:
+        with self._lock:
+            self.calls.append("reserve")
+            window = self._roll()
+            granted = min(tokens, max(0, limit - self.count))
+            self.count = self.count + granted if granted else min(self.count + 1, limit + 1)
+            return RateLimitLease(
+                granted=granted,
+                limit=limit,
+                count=self.count,
+                window_started_at_epoch=window,
+                reset_at_epoch=window + 60,
+                retry_after_seconds=max(1, window + 60 - self.clock.epoch),
+            )
+
+    def release(
+        self,
+        *,
+        scope_hash: str,
+        policy_key: str,
+        limit: int,
+        window_started_at_epoch: int,
+        tokens: int,
+    ) -> int:
+        with self._lock:
+            self.calls.append("release")
+            if window_started_at_epoch != self.window_started_at:
+                return 0
+            admitted = min(self.count, limit)
+            released = min(tokens, admitted)
+            self.count = admitted - released
+            return released
+
+
+def _drain(store: LeasedRateLimitStore) -> None:
+    store._background.submit(lambda: None).result()
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    # The middleware bounds store calls with asyncio.wait_for.
+    return "asyncio"
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    value = _Clock()
+    monkeypatch.setattr(rate_limit_store.time, "monotonic", value.monotonic)
+    return value
+
+
+def test_leased_processes_never_admit_beyond_the_shared_limit(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    processes = [LeasedRateLimitStore(shared, block_size=10) for _ in range(4)]
+
+    admitted = 0
+    for index in range(200):
+        process = processes[index % len(processes)]
+        admitted += process.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed
+        _drain(process)
+
+    assert admitted == 100
+    assert shared.count == 101
+    # Saturation is cached locally, so denials stop reaching the shared store.
+    assert shared.calls.count("reserve") < 200 // 10
+
+
+def test_parked_tokens_bound_under_admission_until_idle_leases_return(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    busy, *idle = [LeasedRateLimitStore(shared, block_size=10, idle_seconds=2.0) for _ in range(4)]
+    for process in idle:
+        assert process.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed
+
+    admitted = sum(busy.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed for _ in range(100))
+
+    # Documented bound: at most (processes - 1) * block_size tokens sit unused elsewhere.
+    assert admitted == 100 - len(idle) - len(idle) * 9
+    assert admitted >= 100 - len(idle) * 10
+
+    clock.epoch += 3
+    for process in idle:
+        assert process.consume_local(scope_hash="d" * 64, policy_key=POLICY, limit=100) is None
+        _drain(process)
+    assert shared.calls.count("release") == len(idle)
+    assert busy.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed
+
+
+def test_local_allotment_expires_before_the_shared_window_resets(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    store = LeasedRateLimitStore(shared, block_size=50)
+    first = store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100)
+
+    assert first.allowed is True
+    assert first.reset_at_epoch == 2_000_000_040
+    clock.epoch = 2_000_000_039
+    assert store.consume_local(scope_hash=SCOPE, policy_key=POLICY, limit=100) is None
+
+    clock.epoch = 2_000_000_040
+    renewed = store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100)
+    assert renewed.reset_at_epoch == 2_000_000_100
+    assert shared.count == 50
+
+
+def test_close_returns_unused_tokens_to_the_shared_window(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    store = LeasedRateLimitStore(shared, block_size=10)
+    for _ in range(3):
+        store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100)
+
+    store.close()
+
+    assert shared.count == 3
+
+
+def test_store_outage_surfaces_once_the_local_allotment_is_spent(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    store = LeasedRateLimitStore(shared, block_size=2)
+    assert store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed
+
+    def _unavailable(**_kwargs: object) -> RateLimitLease:
+        raise RateLimitStoreUnavailable("store down")
+
+    shared.reserve = _unavailable  # type: ignore[method-assign]
+    assert store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100).allowed
+    _drain(store)
+    with pytest.raises(RateLimitStoreUnavailable):
+        store.consume(scope_hash=SCOPE, policy_key=POLICY, limit=100)
+
+
+@pytest.mark.anyio
+async def test_middleware_lease_mode_admits_from_the_local_allotment(clock: _Clock) -> None:
+    shared = _SharedWindowStore(clock)
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        enabled=True,
+        requests_per_minute=5,
+        backend="postgres",
+        identity_source="peer",
+        hmac_secret=HMAC_SECRET,
+        redis_url="redis://unused.invalid:6379/0",
+        lease_block_size=10,
+        store=shared,
+    )
+
+    @app.get("/probe")
+    async def probe() -> dict[str, str]:
+        return {"status": "ok"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        responses = [await client.get("/probe") for _ in range(7)]
+
+    assert [response.status_code for response in responses] == [200] * 5 + [429] * 2
+    assert [response.headers["X-RateLimit-Remaining"] for response in responses[:5]] == ["4", "3", "2", "1", "0"]
+    assert "consume" not in shared.calls
+    assert shared.calls.count("reserve") <= 2
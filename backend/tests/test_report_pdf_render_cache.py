@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+
+from prometheus_client import REGISTRY
+
+from app.services import report_pdf_service
+
+
+def _snapshot(name: str = "Reno Service Team", *, visits: tuple[int, ...] = (12, 15, 18)) -> dict:
+    return {
+        "campaign": {"name": name, "location_name": name},
+        "period": {"start": "2026-07-01", "end": "2026-07-31"},
+        "executive_summary": {"headline": f"{name} progress", "summary": "Visits from Google grew."},
+        "metrics": [
+            {
+                "key": "google_visits",
+                "label": "Visits from Google",
+                "current": visits[-1],
+                "unit": "visits",
+                "result": "improved",
+                "change_percent": 10,
+                "direction": "up",
+                "source": {"label": "Google Search Console", "last_updated": "2026-07-31"},
+                "coverage": {"current": {"state": "complete", "observed": 31, "expected": 31}},
+            }
+        ],
+        "trend_series": [
+            {
+                "key": "google_discovery",
+                "description": "Daily visits from Google.",
+                "points": [
+                    {"date": f"2026-07-{day:02d}", "visits": value}
+                    for day, value in enumerate(visits, start=1)
+                ],
+                "comparison_points": [{"date": "2026-06-01", "visits": 9}, {"date": "2026-06-02", "visits": 11}],
+            }
+        ],
+        "wins": [],
+        "risks": [],
+        "completed_actions": [],
+        "measured_outcomes": [],
+        "next_priorities": [],
+        "source": {"freshness_state": "current"},
+    }
+
+
+def test_report_pdf_is_byte_stable_across_renders_and_cache_clears() -> None:
+    report_pdf_service.clear_render_cache()
+    first = report_pdf_service.build_report_pdf(_snapshot())
+    report_pdf_service.clear_render_cache()
+    time.sleep(1.1)
+    second = report_pdf_service.build_report_pdf(_snapshot())
+
+    assert first.startswith(b"%PDF-")
+    assert first == second
+
+
+def test_report_pdf_cache_reuses_documents_and_chart_plans_by_content_hash() -> None:
+    report_pdf_service.clear_render_cache()
+    report_pdf_service.build_report_pdf(_snapshot("Reno Service Team"))
+    report_pdf_service.build_report_pdf(_snapshot("Reno Service Team"))
+    report_pdf_service.build_report_pdf(_snapshot("Sparks Service Team"))
+
+    stats = report_pdf_service.render_cache_stats()
+    assert stats["documents"] == {"entries": 2, "hits": 1, "misses": 2}
+    # The second location has identical trend data, so its chart plan is reused.
+    assert stats["charts"]["entries"] == 1
+    assert stats["charts"]["hits"] == 1
+
+    report_pdf_service.build_report_pdf(_snapshot("Reno Service Team", visits=(1, 2, 3)))
+    assert report_pdf_service.render_cache_stats()["charts"]["entries"] == 2
+
+
+def test_report_pdf_records_section_render_timing() -> None:
+    report_pdf_service.clear_render_cache()
+    labels = {"report_kind": "campaign", "section": "charts"}
+    before = REGISTRY.get_sample_value("report_pdf_section_render_seconds_count", labels) or 0.0
+
+    report_pdf_service.build_report_pdf(_snapshot("Timing Location"))
+
+    assert REGISTRY.get_sample_value("report_pdf_section_render_seconds_count", labels) == before + 1
+    layout_count = REGISTRY.get_sample_value(
+        "report_pdf_section_render_seconds_count",
+        {"report_kind": "campaign", "section": "layout"},
+    )
+    assert layout_count and layout_count >= 1
@@ -160,6 +160,49 @@ def test_location_intelligence_uses_equal_periods_and_cites_review_evidence(db_s
     assert result["evidence"]["claims_limited_to_saved_reviews"] is True
 
 
+def test_weekly_trend_buckets_reviews_by_monday_and_limits_waiting_evidence(db_session):
+    user, campaign = _campaign(db_session, name="Carson", city="Carson City")
+    monday = datetime(2026, 8, 10, 0, 0, tzinfo=UTC)
+    _save_reviews(
+        db_session,
+        user,
+        campaign,
+        [
+            {"rating": 5, "reviewed_at": monday},
+            {"rating": 2, "reviewed_at": monday - timedelta(seconds=1)},
+            {"rating": 3, "reviewed_at": monday - timedelta(days=6)},
+            {"rating": 4, "reviewed_at": monday - timedelta(weeks=11)},
+            {"rating": 1, "reviewed_at": monday - timedelta(weeks=11, seconds=1)},
+            *({"rating": 4, "reviewed_at": monday - timedelta(days=20 + day)} for day in range(6)),
+        ],
+    )
+
+    result = reputation_intelligence_service.location_intelligence(
+        db_session,
+        tenant_id=user.tenant_id,
+        organization_id=str(campaign.organization_id),
+        campaign_id=campaign.id,
+        now=NOW,
+    )
+
+    trend = {item["week_start"]: item for item in result["weekly_trend"]}
+    assert trend["2026-08-10"]["reviews_received"] == 1
+    assert trend["2026-08-03"] == {
+        "week_start": "2026-08-03",
+        "reviews_received": 2,
+        "average_rating": 2.5,
+        "positive": 0,
+        "mixed": 1,
+        "negative": 1,
+    }
+    assert trend["2026-05-25"]["reviews_received"] == 1
+    assert sum(item["reviews_received"] for item in result["weekly_trend"]) == 10
+    waiting = next(item for item in result["actions"] if item["id"] == "answer_waiting_reviews")
+    assert waiting["current_value"] == 11
+    assert len(waiting["evidence_review_ids"]) == 5
+    assert result["metrics"]["newest_review_at"] == monday.isoformat()
+
+
 def test_portfolio_intelligence_aggregates_counts_and_flags_real_outliers(db_session):
     user, strong = _campaign(db_session, name="Reno", city="Reno")
     _save_reviews(
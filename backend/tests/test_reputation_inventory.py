@@ -294,6 +294,105 @@ def test_owned_review_sync_is_paginated_location_scoped_and_read_only(
     assert connection.connection_metadata["owned_reviews"]["reply_mutations_enabled"] is False
 
 
+def test_owned_review_sync_stops_at_high_water_mark_until_full_resync(
+    db_session,
+    monkeypatch,
+):
+    user, campaign, location = _location_campaign(db_session)
+    connection = DataConnection(
+        tenant_id=user.tenant_id,
+        organization_id=str(campaign.organization_id),
+        business_location_id=location.id,
+        campaign_id=campaign.id,
+        provider_name="google_business_profile",
+        external_resource_id="locations/456",
+        resource_scope="owned_business_profile",
+        status="connected",
+        sync_cursor={},
+        connection_metadata={"account_id": "accounts/123"},
+    )
+    db_session.add(connection)
+    db_session.commit()
+
+    base = datetime(2026, 8, 1, 12, 0, tzinfo=UTC)
+    reviews = [
+        _review(
+            external_review_id=f"review-{index}",
+            provider_updated_at=base + timedelta(minutes=index),
+        )
+        for index in range(120)
+    ]
+    requested: list[str | None] = []
+
+    class FakeReviewsProvider:
+        def __init__(self, **_kwargs):
+            pass
+
+        def list_reviews(self, *, parent, page_size, page_token=None):
+            requested.append(page_token)
+            ordered = sorted(reviews, key=lambda item: item["provider_updated_at"], reverse=True)
+            offset = int(page_token or 0)
+            return {
+                "items": ordered[offset : offset + page_size],
+                "average_rating": 2.0,
+                "total_review_count": len(ordered),
+                "next_page_token": str(offset + page_size) if offset + page_size < len(ordered) else None,
+            }
+
+    monkeypatch.setattr(
+        reputation_inventory_service,
+        "GoogleBusinessProfileReviewsProvider",
+        FakeReviewsProvider,
+    )
+    monkeypatch.setattr(
+        reputation_inventory_service,
+        "_google_access_token",
+        lambda _db, _organization_id: "access-token",
+    )
+
+    first = reputation_inventory_service.sync_owned_profile_reviews(db_session, connection=connection)
+    assert first["mode"] == "full"
+    assert first["reviews_saved"] == 120
+    assert requested == [None, "50", "100"]
+
+    reviews[3] = _review(
+        external_review_id="review-3",
+        response_status="responded",
+        response_text="Thanks for letting us know.",
+        provider_updated_at=base + timedelta(hours=5),
+    )
+    reviews.append(_review(external_review_id="review-new", provider_updated_at=base + timedelta(hours=6)))
+    requested.clear()
+    second = reputation_inventory_service.sync_owned_profile_reviews(db_session, connection=connection)
+
+    assert second["mode"] == "incremental"
+    assert second["reached_high_water_mark"] is True
+    assert requested == [None]
+    assert second["reviews_received"] == 3
+    cursor = connection.sync_cursor["owned_reviews"]
+    assert cursor["high_water_mark"] == (base + timedelta(hours=6)).isoformat()
+    updated = (
+        db_session.query(ReputationReviewObservation)
+        .filter(ReputationReviewObservation.snapshot["response_status"].as_string() == "responded")
+        .count()
+    )
+    assert updated == 1
+
+    connection.sync_cursor = {
+        "owned_reviews": {
+            **cursor,
+            "last_full_sync_at": (
+                datetime.now(UTC) - reputation_inventory_service.OWNED_REVIEW_FULL_RESYNC_INTERVAL
+            ).isoformat(),
+        }
+    }
+    db_session.commit()
+    requested.clear()
+    third = reputation_inventory_service.sync_owned_profile_reviews(db_session, connection=connection)
+    assert third["mode"] == "full"
+    assert len(requested) == 3
+
+
 def test_owned_review_sync_job_is_hourly_idempotent(db_session):
     user, campaign, location = _location_campaign(db_session)
     connection = DataConnection(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+import re
 from types import SimpleNamespace
 
 from app.models.business_location import BusinessLocation
@@ -179,6 +180,57 @@ def test_review_automation_separates_plan_eligibility_from_live_activation(
     )
 
 
+def _classify_each_pattern(review_text: str | None) -> list[str]:
+    normalized = str(review_text or "").strip().lower()
+    if not normalized:
+        return []
+    return [
+        topic
+        for topic, patterns in reputation_response_service.SENSITIVE_PATTERNS.items()
+        if any(re.search(pattern, normalized, flags=re.IGNORECASE) for pattern in patterns)
+    ]
+
+
+def test_compiled_sensitive_topic_classifier_matches_per_pattern_scan(monkeypatch) -> None:
+    texts = [
+        None,
+        "",
+        "Great crew, fast and friendly.",
+        "Email doctor@clinic.example about the refund.",
+        "My lawyer said the court date is set. I was injured and they were racist.",
+        "Call (775) 555-1234 - they never hired us, it was a scam and I want my money back",
+        "Suing them. Unsafe ladder, accident, ambulance, harassment, medication, motherfucker.",
+        "Issue 'suerte' and 'courtyard' should not count as legal words.",
+        "Ünsafe? No, UNSAFE: the ſue-happy neighbour called an AMBULANCE.",
+    ]
+
+    assert reputation_response_service.classify_sensitive_topics_batch(texts) == [
+        _classify_each_pattern(text) for text in texts
+    ]
+    assert reputation_response_service.classify_sensitive_topics(texts[3]) == [
+        "billing_refund",
+        "personal_health",
+    ]
+
+    assert reputation_response_service._pattern_anchors(r"\b(colou?r|hurt you|fuck(?:ing)?)\b") == (
+        "colo",
+        "hurt you",
+        "fuck",
+    )
+    assert reputation_response_service._pattern_anchors(r"\b[\w.+-]+@[\w.-]+\.[a-z]{2,}\b") == ("@",)
+    assert reputation_response_service._pattern_anchors(r"\b\d{3}[\s.-]\d{4}\b") is None
+
+    monkeypatch.setattr(
+        reputation_response_service,
+        "SENSITIVE_PATTERNS",
+        {**reputation_response_service.SENSITIVE_PATTERNS, "legal": (r"\bsmall claims\b",)},
+    )
+    assert reputation_response_service.classify_sensitive_topics("Taking this to small claims.") == [
+        "legal"
+    ]
+    assert reputation_response_service.classify_sensitive_topics("See you in court.") == []
+
+
 def test_sensitive_review_requires_a_person_without_ai_or_credits(
     db_session,
     monkeypatch,
@@ -131,6 +131,8 @@ def test_rotation_key_lists_reject_duplicates_and_weak_values() -> None:
         ({"rate_limit_identity_source": "forwarded"}, "RATE_LIMIT_IDENTITY_SOURCE"),
         ({"rate_limit_requests_per_minute": 0}, "RATE_LIMIT_REQUESTS_PER_MINUTE"),
         ({"rate_limit_requests_per_minute": 1_000_001}, "RATE_LIMIT_REQUESTS_PER_MINUTE"),
+        ({"query_budget_action": "abort"}, "QUERY_BUDGET_ACTION"),
+        ({"query_budget_max_queries": -1}, "Query budget limits"),
     ],
 )
 def test_rate_limit_settings_reject_unsupported_or_nonpositive_values(
@@ -244,3 +246,16 @@ def test_hosted_production_accepts_database_rate_limit_and_strong_cron_secret_wi
     assert settings.rate_limit_backend == "postgres"
     assert settings.rate_limit_identity_source == "vercel"
     assert settings.cron_secret == "hosted-cron-secret-with-at-least-32-characters"
+
+
+def test_strict_query_budget_is_forbidden_in_production() -> None:
+    with pytest.raises(ValidationError, match="QUERY_BUDGET_ACTION=raise"):
+        Settings(
+            _env_file=None,
+            app_env="production",
+            postgres_dsn="postgresql://user:pass@db:5432/app",
+            jwt_secret="production-jwt-secret-with-at-least-32-characters",
+            platform_master_key="AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8=",
+            public_base_url="https://example.com",
+            query_budget_action="raise",
+        )
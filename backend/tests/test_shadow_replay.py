@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from celery.signals import worker_shutdown
+
+import app.tasks.celery_app  # noqa: F401 - connects the worker shutdown handlers
+from app.governance.replay import shadow_runner
+from app.governance.replay.executor_strategy_engine import execute_case
+from app.governance.replay.schema import DriftEvent, ReplayCase
+
+
+def _case(case_id: str, expected_output: dict | None = None) -> ReplayCase:
+    return ReplayCase.model_validate(
+        {
+            "case_id": case_id,
+            "tenant_id": "tenant_replay",
+            "campaign_id": "campaign_replay",
+            "input_payload": {
+                "window": {
+                    "date_from": "2026-02-01T00:00:00Z",
+                    "date_to": "2026-02-20T00:00:00Z",
+                },
+                "raw_signals": {},
+                "tier": "pro",
+            },
+            "expected_output": expected_output or {},
+            "version_tuple": {
+                "engine_version": "phase2-controlled-scope",
+                "threshold_bundle_version": "v1.0.0",
+                "registry_version": "scenario-registry-v1",
+                "signal_schema_version": "signals-v1",
+            },
+        }
+    )
+
+
+def _settings(workers: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        shadow_replay_max_concurrency=2,
+        shadow_replay_process_workers=workers,
+        shadow_replay_corpus_chunk_size=3,
+    )
+
+
+def test_shadow_replay_compares_async_executor_output_inline(monkeypatch) -> None:
+    monkeypatch.setattr(shadow_runner, "get_settings", lambda: _settings(0))
+    emitted: list[DriftEvent] = []
+    expected = {
+        "generated_at": "2026-02-20T00:00:00Z",
+        "recommendations": [
+            {"scenario_id": "a", "confidence": 0.9},
+            {"scenario_id": "b", "confidence": 0.5},
+        ],
+    }
+
+    async def executor(_case: ReplayCase) -> dict:
+        return {
+            "generated_at": "2026-02-21T00:00:00Z",
+            "recommendations": [
+                {"scenario_id": "b", "confidence": 0.5},
+                {"scenario_id": "a", "confidence": 0.7},
+            ],
+        }
+
+    async def emit(event: DriftEvent) -> None:
+        emitted.append(event)
+
+    events = asyncio.run(
+        shadow_runner.run_shadow_replay(
+            _case("inline", expected),
+            sample_rate_percent=100,
+            executor=executor,
+            emit_drift=emit,
+        )
+    )
+
+    assert [event.drift_type for event in events] == ["hash", "ordering", "confidence_band"]
+    assert emitted == events
+    assert "generated_at" not in (events[0].diff or "")
+
+
+def test_shadow_replay_runs_sync_executor_and_comparison_in_process_pool(monkeypatch) -> None:
+    monkeypatch.setattr(shadow_runner, "get_settings", lambda: _settings(1))
+    baseline = execute_case(_case("pool"))
+
+    async def emit(_event: DriftEvent) -> None:
+        return None
+
+    async def replay(case: ReplayCase) -> list[DriftEvent]:
+        return await shadow_runner.run_shadow_replay(
+            case,
+            sample_rate_percent=100,
+            executor=execute_case,
+            emit_drift=emit,
+        )
+
+    try:
+        matching = asyncio.run(replay(_case("pool", baseline)))
+        drifted = asyncio.run(replay(_case("pool", {**baseline, "campaign_id": "other"})))
+    finally:
+        shadow_runner.shutdown_shadow_replay_pool()
+
+    assert matching == []
+    assert [event.drift_type for event in drifted] == ["hash"]
+
+
+def test_replay_corpus_streams_drift_and_reports_throughput(monkeypatch) -> None:
+    monkeypatch.setattr(shadow_runner, "get_settings", lambda: _settings(2))
+    baseline = execute_case(_case("corpus"))
+    cases = (
+        _case(f"corpus-{index}", baseline if index % 4 else {**baseline, "campaign_id": "drifted"})
+        for index in range(10)
+    )
+    emitted: list[DriftEvent] = []
+    progress: list[dict] = []
+
+    async def emit(event: DriftEvent) -> None:
+        emitted.append(event)
+
+    async def on_progress(snapshot: dict) -> None:
+        progress.append(snapshot)
+
+    report = asyncio.run(
+        shadow_runner.replay_corpus(
+            cases,
+            executor=execute_case,
+            emit_drift=emit,
+            corpus_version="corpus-v1",
+            on_progress=on_progress,
+        )
+    )
+
+    assert report.total_cases == 10
+    assert report.failed_cases == 3
+    assert report.passed_cases == 7
+    assert sorted(event.case_id for event in emitted) == ["corpus-0", "corpus-4", "corpus-8"]
+    assert report.drift_events and len(report.drift_events) == len(emitted)
+    assert len(progress) == 4
+    assert progress[-1]["cases"] == 10
+    assert report.cases_per_second and report.cases_per_second > 0
+
+
+def test_worker_shutdown_signal_stops_the_replay_pool(monkeypatch) -> None:
+    monkeypatch.setattr(shadow_runner, "get_settings", lambda: _settings(1))
+    pool = shadow_runner._get_shadow_process_pool()
+    assert pool is not None
+
+    worker_shutdown.send(sender=None)
+
+    assert shadow_runner._PROCESS_POOL is None
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
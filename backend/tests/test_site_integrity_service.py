@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import update
 
 from app.models.business_location import BusinessLocation
 from app.models.campaign import Campaign
 from app.models.crawl import CrawlPageResult, CrawlRun, Page
 from app.models.data_connection import DataConnection
 from app.models.organization import Organization
+from app.models.platform_job import PlatformJob
 from app.models.site_integrity import (
     SearchConsoleSitemapSnapshot,
     UrlInspectionSnapshot,
 )
+from app.providers.errors import ProviderQuotaExceededError
 from app.providers.execution_types import ProviderExecutionResult
-from app.services import site_integrity_service
+from app.services import durable_job_service, job_service, site_integrity_service
+from app.services.rate_limit_store import RateLimitDecision
 
 
 class _SiteIntegrityProvider:
@@ -190,3 +195,239 @@ def test_summary_requires_a_connection_without_hiding_saved_crawl_data(db_sessio
     assert result["status"] == "needs_connection"
     assert result["connection"]["connected"] is False
     assert result["next_action"]["href"] == "/settings"
+
+
+def _add_crawled_pages(db_session, campaign, count: int) -> None:
+    run = db_session.query(CrawlRun).filter(CrawlRun.campaign_id == campaign.id).one()
+    for index in range(count):
+        page = Page(
+            tenant_id=campaign.tenant_id,
+            campaign_id=campaign.id,
+            url=f"https://example.com/guide-{index:02d}",
+        )
+        db_session.add(page)
+        db_session.flush()
+        db_session.add(
+            CrawlPageResult(
+                tenant_id=campaign.tenant_id,
+                campaign_id=campaign.id,
+                crawl_run_id=run.id,
+                page_id=page.id,
+                status_code=200,
+                is_indexable=1,
+                title=f"Guide {index}",
+            )
+        )
+    db_session.commit()
+
+
+def test_background_refresh_resumes_from_cursor_when_daily_quota_resets(
+    db_session,
+    monkeypatch,
+) -> None:
+    campaign, _connection = _seed_campaign(db_session)
+    _add_crawled_pages(db_session, campaign, 6)
+    monkeypatch.setattr(
+        site_integrity_service,
+        "SearchConsoleSiteIntegrityAdapter",
+        _SiteIntegrityProvider,
+    )
+    monkeypatch.setattr(site_integrity_service, "URL_INSPECTION_DAILY_QUOTA", 4)
+    monkeypatch.setattr(site_integrity_service, "INSPECTION_CHUNK_SIZE", 3)
+    first_day = datetime.now(UTC)
+
+    queued = durable_job_service.enqueue_site_integrity_refresh(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign_id=campaign.id,
+    )
+    job_service.start_job(db_session, queued["job_id"], worker_id="site-integrity-test", lease_seconds=60)
+    db_session.commit()
+    execution = durable_job_service.execute_claimed_job(db_session, job_id=queued["job_id"])
+    assert execution["status"] == job_service.JOB_STATUS_COMPLETED
+
+    first = db_session.get(PlatformJob, queued["job_id"]).result
+    assert first["inspected_urls"] == 4
+    assert first["stop_reason"] == "daily_quota"
+    assert first["resume_at"] == f"{(first_day + timedelta(days=1)).date().isoformat()}T00:00:00+00:00"
+    follow_up = db_session.get(PlatformJob, first["next_job_id"])
+    assert follow_up.job_type == durable_job_service.SITE_INTEGRITY_REFRESH_JOB_TYPE
+    assert follow_up.status == job_service.JOB_STATUS_QUEUED
+
+    progress = site_integrity_service.get_site_integrity_progress(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign_id=campaign.id,
+        now=first_day,
+    )
+    assert progress["progress"]["state"] == "waiting_for_quota"
+    assert progress["progress"]["total_urls"] == 7
+    assert progress["progress"]["remaining_urls"] == 3
+    assert progress["quota"]["remaining_today"] == 0
+
+    second = site_integrity_service.run_site_integrity_batch(
+        db_session,
+        tenant_id=campaign.tenant_id,
+        campaign_id=campaign.id,
+        now=first_day + timedelta(days=1),
+    )
+    assert second["inspected_urls"] == 3
+    assert second["resume_at"] is None
+    assert second["progress"]["state"] == "completed"
+    assert second["quota"]["used_today"] == 3
+    assert db_session.query(UrlInspectionSnapshot).filter(
+        UrlInspectionSnapshot.campaign_id == campaign.id
+    ).count() == 7
+    db_session.refresh(_connection)
+    assert "site_integrity_cursor" not in _connection.connection_metadata
+
+
+def test_url_inspection_pacer_waits_for_the_minute_window() -> None:
+    clock = [0.0]
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        clock[0] += seconds
+
+    pacer = site_integrity_service.UrlInspectionPacer(
+        per_minute=2,
+        clock=lambda: clock[0],
+        sleep=sleep,
+    )
+    pacer.acquire()
+    clock[0] = 10.0
+    pacer.acquire()
+    pacer.acquire()
+
+    assert slept == [50.0]
+    assert clock[0] == 60.0
+
+
+class _SharedWindowStore:
+    """Fixed one-minute window shared by every pacer that holds it."""
+
+    def __init__(self) -> None:
+        self.consumed: list[tuple[str, str, int]] = []
+        self.window_count = 0
+
+    def consume(self, scope_hash: str, policy_key: str, limit: int) -> RateLimitDecision:
+        self.consumed.append((scope_hash, policy_key, limit))
+        self.window_count += 1
+        allowed = self.window_count <= limit
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit,
+            count=self.window_count,
+            remaining=max(0, limit - self.window_count),
+            reset_at_epoch=60,
+            retry_after_seconds=42,
+        )
+
+
+def test_url_inspection_pacers_share_one_window_across_workers() -> None:
+    store = _SharedWindowStore()
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        store.window_count = 0
+
+    worker_pacers = [
+        site_integrity_service.UrlInspectionPacer(
+            per_minute=2,
+            sleep=sleep,
+            store=store,
+            scope_hash="a" * 64,
+        )
+        for _worker in range(2)
+    ]
+    worker_pacers[0].acquire()
+    worker_pacers[1].acquire()
+    worker_pacers[0].acquire()
+
+    assert slept == [42.0]
+    assert {entry[1:] for entry in store.consumed} == {
+        (site_integrity_service.URL_INSPECTION_POLICY_KEY, 2)
+    }
+
+
+def test_quota_reservation_counts_use_committed_by_other_workers(db_session) -> None:
+    _campaign, connection = _seed_campaign(db_session)
+    db_session.commit()
+    now = datetime(2026, 8, 12, 12, 0, tzinfo=UTC)
+    # Another worker spent most of today's quota after this session loaded the row.
+    db_session.execute(
+        update(DataConnection)
+        .where(DataConnection.id == connection.id)
+        .values(
+            connection_metadata={
+                "site_integrity_quota_day": "2026-08-12",
+                "site_integrity_quota_used": site_integrity_service.URL_INSPECTION_DAILY_QUOTA - 5,
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db_session.commit()
+
+    reserved = site_integrity_service._reserve_quota(db_session, connection, requested=25, now=now)
+    assert reserved == 5
+
+    site_integrity_service._record_quota_use(
+        db_session,
+        connection,
+        site_integrity_service._InspectionOutcome(calls=3),
+        reserved=reserved,
+        now=now,
+    )
+    db_session.commit()
+    quota = site_integrity_service._inspection_quota(connection, now=now)
+    assert quota["remaining_today"] == 2
+
+
+class _QuotaPageProvider(_SiteIntegrityProvider):
+    def execute(self, request):
+        if request.payload["inspection_url"].endswith("/quota"):
+            return ProviderExecutionResult(success=False, latency_ms=1, error=ProviderQuotaExceededError())
+        return super().execute(request)
+
+
+class _OutOfOrderExecutor:
+    """Runs pages 0, 3, 2, 1: page 1 starts only after page 2 hit the quota."""
+
+    def __init__(self, max_workers: int) -> None:
+        del max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def map(self, fn, items):
+        items = list(items)
+        results = {index: fn(items[index]) for index in (0, 3, 2, 1)}
+        return iter([results[index] for index in range(len(items))])
+
+
+def test_inspection_outcome_keeps_results_after_skipped_pages(db_session, monkeypatch) -> None:
+    campaign, connection = _seed_campaign(db_session)
+    monkeypatch.setattr(
+        site_integrity_service,
+        "SearchConsoleSiteIntegrityAdapter",
+        _QuotaPageProvider,
+    )
+    monkeypatch.setattr(site_integrity_service, "ThreadPoolExecutor", _OutOfOrderExecutor)
+    pages = [
+        ("page-a", "https://example.com/a"),
+        ("page-b", "https://example.com/b"),
+        ("page-quota", "https://example.com/quota"),
+        ("page-d", "https://example.com/d"),
+    ]
+
+    outcome = site_integrity_service._inspect_pages(campaign=campaign, connection=connection, pages=pages)
+
+    assert outcome.stop_reason == "daily_quota"
+    assert [page_id for page_id, _record in outcome.inspections] == ["page-a", "page-d"]
+    assert outcome.completed == 1
+    assert outcome.calls == 3
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 import json
+import threading
+import time
 from types import SimpleNamespace
 
 import httpx
@@ -204,3 +206,117 @@ def test_missing_crux_data_stays_insufficient_instead_of_passing(
     assert field.diagnostics["assessment"]["assessment"]["passes_core_web_vitals"] is None
     missing_lcp = field.diagnostics["assessment"]["metrics"][0]
     assert missing_lcp["thresholds"]["good_boundary"] == 2500
+
+
+def test_batch_collection_coalesces_shared_crux_lookups_across_campaigns(
+    db_session,
+    create_test_org,
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        website_performance_service,
+        "get_settings",
+        lambda: SimpleNamespace(
+            crux_api_key="test-google-key",
+            pagespeed_api_key="",
+            website_performance_http_timeout_seconds=45.0,
+            website_performance_collection_interval_hours=168,
+            website_performance_max_concurrent_pagespeed_runs=2,
+        ),
+    )
+    organization = create_test_org(name="Multi-location performance org")
+    campaigns = [
+        create_test_campaign(db_session, organization.id, name=f"Location {index}", domain=domain)
+        for index, domain in enumerate(("brand.test", "brand.test", "brand.test/sparks"))
+    ]
+    lock = threading.Lock()
+    sent: list[tuple[str, str]] = []
+    in_flight = {"pagespeed": 0, "peak": 0}
+
+    def _counting_provider(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "chromeuxreport.googleapis.com":
+            body = json.loads(request.content.decode("utf-8"))
+            with lock:
+                sent.append(("crux", body.get("url") or body.get("origin")))
+            return _provider_response(request)
+        with lock:
+            sent.append(("pagespeed", request.url.params["url"]))
+            in_flight["pagespeed"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["pagespeed"])
+        try:
+            time.sleep(0.05)
+            return _provider_response(request)
+        finally:
+            with lock:
+                in_flight["pagespeed"] -= 1
+
+    results = website_performance_service.collect_performance_batch(
+        db_session,
+        campaigns=campaigns,
+        form_factor="mobile",
+        captured_at=datetime(2026, 7, 30, 18, 0, tzinfo=UTC),
+        client=httpx.Client(transport=httpx.MockTransport(_counting_provider)),
+        max_concurrent_pagespeed_runs=2,
+    )
+
+    assert sorted(target for kind, target in sent if kind == "crux") == [
+        "https://brand.test",
+        "https://brand.test/",
+        "https://brand.test/sparks",
+    ]
+    assert len([target for kind, target in sent if kind == "pagespeed"]) == 3
+    assert in_flight["peak"] <= 2
+    assert set(results) == {campaign.id for campaign in campaigns}
+    for campaign in campaigns:
+        field, lab = results[campaign.id]
+        assert (field.source, lab.source) == ("crux_field", "pagespeed_lab")
+        assert field.campaign_id == lab.campaign_id == campaign.id
+        assert field.scope == "origin"
+        assert field.lcp_ms == 2200
+        assert lab.performance_score == 91
+
+
+def test_batch_collection_caps_pagespeed_runs_to_the_shared_pool(
+    db_session,
+    create_test_org,
+    monkeypatch,
+) -> None:
+    organization = create_test_org(name="Pool-capped performance org")
+    campaigns = [
+        create_test_campaign(db_session, organization.id, name=f"Site {index}", domain=f"site-{index}.test")
+        for index in range(3)
+    ]
+    lock = threading.Lock()
+    in_flight = {"pagespeed": 0, "peak": 0}
+
+    def _counting_provider(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "chromeuxreport.googleapis.com":
+            return _provider_response(request)
+        with lock:
+            in_flight["pagespeed"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["pagespeed"])
+        try:
+            time.sleep(0.05)
+            return _provider_response(request)
+        finally:
+            with lock:
+                in_flight["pagespeed"] -= 1
+
+    shared_client = httpx.Client(transport=httpx.MockTransport(_counting_provider))
+    monkeypatch.setattr(website_performance_service, "get_http_client", lambda _provider: shared_client)
+    monkeypatch.setattr(
+        website_performance_service,
+        "http_client_max_connections",
+        lambda _provider: website_performance_service.CRUX_LOOKUP_WORKERS + 1,
+    )
+
+    results = website_performance_service.collect_performance_batch(
+        db_session,
+        campaigns=campaigns,
+        form_factor="mobile",
+        captured_at=datetime(2026, 7, 30, 18, 0, tzinfo=UTC),
+        max_concurrent_pagespeed_runs=4,
+    )
+
+    assert set(results) == {campaign.id for campaign in campaigns}
+    assert in_flight["peak"] == 1
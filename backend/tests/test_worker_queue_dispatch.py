@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import time
+from types import SimpleNamespace
+
+import pytest
+
 from app.events import EventType
+from app.events import queue as worker_queue
 from app.events.queue import enqueue_event
+from app.events.queue_store import InMemoryWorkerQueueStore, WorkerQueueCounts, WorkerQueueStoreUnavailable
 
 
 def test_enqueue_event_routes_outcome_recorded_to_learning_worker(monkeypatch) -> None:
@@ -22,3 +29,121 @@ def test_enqueue_event_routes_experiment_completed_to_experiment_worker(monkeypa
 
     assert result['worker'] == 'experiment'
     assert calls == [('experiment', {'policy_id': 'p1'})]
+
+
+def test_backpressure_rejects_without_blocking_and_hints_retry_after(monkeypatch) -> None:
+    worker_queue.reset_queue_state()
+    monkeypatch.setattr(
+        worker_queue,
+        'get_settings',
+        lambda: SimpleNamespace(app_env='test', max_queue_depth=1, max_worker_inflight=1),
+    )
+    monkeypatch.setattr('app.intelligence.workers.run_worker', lambda worker_name, payload: {'ok': True})
+    assert worker_queue._local_store.acquire(
+        'experiment', 'held-lease', lease_seconds=60, max_queue_depth=1, max_worker_inflight=1
+    ).admitted
+
+    monkeypatch.setattr(worker_queue.time, 'sleep', lambda seconds: pytest.fail('dispatch must not block'))
+    result = worker_queue.dispatch_worker_job('experiment', {'event_id': 'evt-1'})
+
+    assert result['error'] == 'backpressure_limit_exceeded'
+    assert result['retry_after_seconds'] > 0
+    assert worker_queue.queue_stats()['queue_depth'] == {'experiment': 1}
+
+    worker_queue.finish_worker_job('experiment', 'held-lease')
+    assert worker_queue.dispatch_worker_job('experiment', {'event_id': 'evt-1'})['status'] == 'succeeded'
+    assert worker_queue.queue_stats()['worker_inflight_jobs'] == {'experiment': 0}
+
+
+def test_expired_leases_stop_counting_against_limits() -> None:
+    now = [100.0]
+    store = InMemoryWorkerQueueStore(clock=lambda: now[0])
+    limits = {'lease_seconds': 30, 'max_queue_depth': 5, 'max_worker_inflight': 1}
+
+    assert store.acquire('learning', 'crashed', **limits).admitted
+    store.start('learning', 'crashed', lease_seconds=30)
+    assert store.acquire('learning', 'queued', **limits).admitted is False
+    assert store.counts() == {'learning': WorkerQueueCounts(depth=0, inflight=1)}
+
+    now[0] += 31
+
+    assert store.acquire('learning', 'queued', **limits).admitted
+    assert store.counts() == {'learning': WorkerQueueCounts(depth=1, inflight=0)}
+
+
+def test_shared_store_backs_stats_and_outage_falls_back_to_local(monkeypatch) -> None:
+    worker_queue.reset_queue_state()
+    fleet = InMemoryWorkerQueueStore()
+    fleet.acquire('learning', 'other-node', lease_seconds=60, max_queue_depth=5, max_worker_inflight=5)
+    monkeypatch.setattr(worker_queue, '_shared_queue_store', lambda: fleet)
+
+    stats = worker_queue.queue_stats()
+    assert stats['queue_depth'] == {'learning': 1}
+    assert stats['truth_scope']['multi_instance_safe'] is True
+
+    def _unavailable(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        raise WorkerQueueStoreUnavailable('down')
+
+    monkeypatch.setattr(fleet, 'counts', _unavailable)
+    monkeypatch.setattr(worker_queue, '_shared_store_retry_at', 0.0)
+
+    assert worker_queue.queue_stats()['queue_depth'] == {}
+    assert worker_queue._shared_store_retry_at > time.monotonic()
+
+
+def _rejected(worker_name: str, payload: dict[str, object]) -> dict[str, object]:
+    return {
+        'worker': worker_name,
+        'mode': 'rejected',
+        'status': 'failed',
+        'error': 'backpressure_limit_exceeded',
+        'retry_after_seconds': 0.25,
+    }
+
+
+def test_rejected_event_retries_inline_after_the_hint(monkeypatch) -> None:
+    outcomes = iter([_rejected, _rejected, lambda worker_name, payload: {'worker': worker_name, 'status': 'succeeded'}])
+    slept: list[float] = []
+    monkeypatch.setattr(worker_queue, 'get_settings', lambda: SimpleNamespace(app_env='test'))
+    monkeypatch.setattr(worker_queue, 'dispatch_worker_job', lambda worker_name, payload: next(outcomes)(worker_name, payload))
+    monkeypatch.setattr(worker_queue.time, 'sleep', slept.append)
+
+    result = enqueue_event(EventType.OUTCOME_RECORDED.value, {'campaign_id': 'c1'})
+
+    assert result['status'] == 'succeeded'
+    assert slept == [0.25, 0.25]
+
+
+def test_rejected_event_is_deferred_to_celery_then_dropped_and_counted(monkeypatch) -> None:
+    from app.core.metrics import worker_queue_dropped_events_total
+    from app.tasks import intelligence_tasks
+
+    scheduled: list[dict[str, object]] = []
+    monkeypatch.setattr(worker_queue, 'get_settings', lambda: SimpleNamespace(app_env='production'))
+    monkeypatch.setattr(worker_queue, 'dispatch_worker_job', _rejected)
+    monkeypatch.setattr(
+        intelligence_tasks.redispatch_worker_event_task,
+        'apply_async',
+        lambda **kwargs: scheduled.append(kwargs) or SimpleNamespace(id='task-1'),
+    )
+
+    deferred = enqueue_event(EventType.EXPERIMENT_COMPLETED.value, {'policy_id': 'p1'})
+
+    assert deferred['mode'] == 'deferred'
+    assert scheduled == [
+        {
+            'kwargs': {'event_type': EventType.EXPERIMENT_COMPLETED.value, 'payload': {'policy_id': 'p1'}, 'attempt': 2},
+            'countdown': 0.25,
+        }
+    ]
+
+    dropped_before = worker_queue_dropped_events_total.labels(worker_name='experiment')._value.get()
+    dropped = enqueue_event(
+        EventType.EXPERIMENT_COMPLETED.value,
+        {'policy_id': 'p1'},
+        attempt=worker_queue._MAX_EVENT_DISPATCH_ATTEMPTS,
+    )
+
+    assert dropped['dropped'] is True
+    assert len(scheduled) == 1
+    assert worker_queue_dropped_events_total.labels(worker_name='experiment')._value.get() == dropped_before + 1
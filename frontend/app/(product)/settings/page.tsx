@@ -1225,6 +1225,10 @@ function waitForBillingConfirmation(delayMs: number) {
   return new Promise<void>((resolve) => window.setTimeout(resolve, delayMs));
 }
 
+function waitForMigrationReview(delayMs: number) {
+  return new Promise<void>((resolve) => window.setTimeout(resolve, delayMs));
+}
+
 type MigrationReview = {
   mode: "dry_run";
   adapter: string;
@@ -1271,7 +1275,7 @@ type MigrationReview = {
 
 type MigrationUpload = {
   id: string;
-  status: "uploading" | "reviewed" | "applied";
+  status: "uploading" | "reviewing" | "review_failed" | "reviewed" | "applying" | "applied";
   total_chunks: number;
   received_chunks: number;
   received_chunk_indexes: number[];
@@ -4440,10 +4444,18 @@ export default function SettingsPage() {
         setMigrationUploadProgress(Math.round((received.size / chunks.length) * 100));
       }
     }
-    return (await platformApi(
-      `/organizations/${organizationId}/migration-imports/uploads/${upload.id}/review?page=1&page_size=100`,
-      { method: "POST" },
-    )) as MigrationReview;
+    const reviewPath = `/organizations/${organizationId}/migration-imports/uploads/${upload.id}/review?page=1&page_size=100`;
+    let review = (await platformApi(reviewPath, { method: "POST" })) as
+      | MigrationReview
+      | { upload: MigrationUpload };
+    // Large files are reviewed by a background job; ask again until it is done.
+    while ("upload" in review && review.upload.status === "reviewing") {
+      await waitForMigrationReview(3_000);
+      review = (await platformApi(reviewPath, { method: "POST" })) as
+        | MigrationReview
+        | { upload: MigrationUpload };
+    }
+    return review as MigrationReview;
   }
 
   async function reviewMigrationFile() {